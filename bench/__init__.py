@@ -0,0 +1,134 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under 
+## the terms of version 3 of the GNU Lesser General Public License as 
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for 
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+
+'''
+The bench package holds the benchmarks run by "setup.py bench".  Each module
+defines functions named bench_<scenario>, taking no arguments, that run the
+real command implementations from andbug.cmd against an andbug.sim
+Simulator and return a dict of results, usually from report().
+'''
+
+import os, json, resource
+from time import time, sleep
+import andbug.command, andbug.screed, andbug.vm
+
+andbug.command.load_commands()
+
+def context(sim):
+    'returns a shell Context with a session on sim that is collecting stats'
+    ctxt = andbug.command.Context()
+    ctxt.shell = True
+    ctxt.sess = andbug.vm.Session(sim.connect())
+    ctxt.sess.collectStats()
+    return ctxt
+
+def perform(ctxt, cmd, *args):
+    'runs a command with its arguments, as the shell would'
+    andbug.command.ACTION_MAP[cmd](ctxt, *args)
+
+def wait_events(ctxt, count, timeout=60):
+    'waits until count events have been received and dispatched'
+    stats = ctxt.sess.stats
+    seen, idle = 0, 0.0
+    while True:
+        total = sum(stats.events.values())
+        if total >= count and ctxt.sess.evtq.empty():
+            return
+        if total == seen:
+            idle += 0.01
+            if idle > timeout:
+                raise Exception('only %i of %i events arrived' % (total, count))
+        else:
+            seen, idle = total, 0.0
+        sleep(0.01)
+
+def report(ctxt, started, **extra):
+    '''
+    returns the wall time since started, the requests made and bytes sent
+    and received by the session, the events it received, and how often its
+    connection found a pooled buffer
+    '''
+    wall = time() - started
+    stats = ctxt.sess.stats
+    requests, sent, received = stats.totals()
+    res = dict(
+        wall=wall, requests=requests, sent=sent, received=received,
+        events=sum(stats.events.values()), pool_rate=stats.pool_rate
+    )
+    res.update(extra)
+    return res
+
+def run(func):
+    '''
+    runs a benchmark in a child process, so that every scenario starts from
+    the same state and its peak memory use is its own; returns its results
+    with peak_rss, in kilobytes, added
+    '''
+    rd, wr = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(rd)
+        status = 0
+        try:
+            andbug.screed.OUTPUT = andbug.screed.ascii(open(os.devnull, 'w'))
+            res = func()
+            res['peak_rss'] = resource.getrusage(
+                resource.RUSAGE_SELF
+            ).ru_maxrss
+        except Exception as exc:
+            res = dict(error='%s: %s' % (type(exc).__name__, exc))
+            status = 1
+        os.write(wr, json.dumps(res))
+        os._exit(status)
+
+    os.close(wr)
+    data = []
+    while True:
+        chunk = os.read(rd, 65536)
+        if not chunk: break
+        data.append(chunk)
+    os.close(rd)
+    os.waitpid(pid, 0)
+    return json.loads(''.join(data))
+
+def median(seq):
+    seq = sorted(seq)
+    mid = len(seq) // 2
+    if len(seq) % 2: return seq[mid]
+    return (seq[mid - 1] + seq[mid]) / 2.0
+
+def median_of(func, runs):
+    '''
+    runs a benchmark in runs child processes, as run does, and keeps the
+    median of each throughput and of the reference; a case can run at
+    different speeds in different processes, with the layout of their
+    memory, far more often than between rounds in one of them
+    '''
+    res = run(func)
+    if runs < 2 or 'error' in res: return res
+    seq = [res]
+    for i in range(1, runs):
+        more = run(func)
+        if 'error' in more: return more
+        seq.append(more)
+    if 'reference' in res:
+        res['reference'] = median(r['reference'] for r in seq)
+    if 'throughput' in res:
+        res['throughput'] = dict(
+            (key, median(r['throughput'][key] for r in seq))
+            for key in res['throughput']
+        )
+    res['peak_rss'] = max(r['peak_rss'] for r in seq)
+    return res
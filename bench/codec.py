@@ -0,0 +1,106 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under 
+## the terms of version 3 of the GNU Lesser General Public License as 
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for 
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+
+'''
+micro-benchmarks of the JdwpBuffer codec, in operations per second, for each
+format character and the formats andbug.vm uses most, under each of the ID
+size configurations in CONFIGS
+'''
+
+from time import time
+from andbug.jdwp import JdwpBuffer
+import struct
+
+## (fSz, mSz, oSz, tSz, sSz)
+CONFIGS = (
+    (1, 2, 2, 4, 8),
+    (8, 8, 8, 8, 8),
+    (4, 4, 4, 4, 4),
+)
+
+## a sample value for each format character; ids fit in a single byte, so
+## that every configuration can hold them.
+SAMPLES = {
+    '1': 0x5A, '2': 0x5A5A, '4': 0x5A5A5A5A, '8': 0x5A5A5A5A5A5A5A5A,
+    'i': -2, 'l': 0x1234, 'o': 0x5A, 't': 0x5A, 'f': 0x5A, 's': 0x5A,
+    'm': 0x5A, '$': 'Ljava/lang/Object;',
+}
+
+## Location, Slot, Method and Class, as unpacked by andbug.vm
+FORMATS = tuple(SAMPLES) + ('1tm8', 'l$$$ii', 'm$$$i', '1t$$i')
+
+COUNT = 50000
+REPEAT = 7
+
+def cases(config, fmt):
+    '''
+    returns functions that each make COUNT calls to JdwpBuffer.pack and
+    unpack, then to the compiled JdwpFormat pack and unpack
+    '''
+    buf = JdwpBuffer()
+    buf.config(*config)
+    args = tuple(SAMPLES[op] for op in fmt)
+    data = buf.pack(fmt, *args) * COUNT
+    seq = range(COUNT)
+
+    def pack():
+        for i in seq: buf.pack(fmt, *args)
+
+    def unpack():
+        buf.prepareUnpack(data)
+        for i in seq: buf.unpack(fmt)
+
+    compiled = buf.format(fmt)
+
+    def cpack():
+        for i in seq: compiled.pack(*args)
+
+    def cunpack():
+        buf.prepareUnpack(data)
+        for i in seq: compiled.unpack(buf)
+
+    return pack, unpack, cpack, cunpack
+
+def reference():
+    'COUNT calls to struct.pack, to gauge the speed of the machine'
+    for i in range(COUNT): struct.pack('>BQQQ', 1, 2, 3, 4)
+
+def bench_codec():
+    'packs and unpacks each format under each configuration'
+    funcs = []
+    for config in CONFIGS:
+        cfg = ','.join(str(sz) for sz in config)
+        for fmt in FORMATS:
+            pack, unpack, cpack, cunpack = cases(config, fmt)
+            funcs.append(('pack %s @%s' % (fmt, cfg), pack))
+            funcs.append(('unpack %s @%s' % (fmt, cfg), unpack))
+            funcs.append(('JdwpFormat.pack %s @%s' % (fmt, cfg), cpack))
+            funcs.append(('JdwpFormat.unpack %s @%s' % (fmt, cfg), cunpack))
+
+    # every case is run once per round, so that a burst of load on the
+    # machine is spread across cases instead of spoiling all runs of one.
+    # the reference is measured alongside, so that the comparison with the
+    # baseline can allow for a machine that is slower or busier overall.
+    funcs.append(('reference', reference))
+    throughput = dict((key, 0) for key, func in funcs)
+    for i in range(REPEAT):
+        for key, func in funcs:
+            started = time()
+            func()
+            rate = COUNT / max(time() - started, 1e-9)
+            throughput[key] = max(throughput[key], rate)
+    return dict(
+        reference=throughput.pop('reference'), throughput=throughput
+    )
@@ -0,0 +1,53 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under 
+## the terms of version 3 of the GNU Lesser General Public License as 
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for 
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+
+'benchmarks of andbug commands against large simulated processes'
+
+from time import time
+from andbug.sim import Simulator, OBJECT_BASE
+from bench import context, perform, report, wait_events
+
+def bench_classes():
+    'lists 20k classes'
+    ctxt = context(Simulator(classes=20000))
+    started = time()
+    perform(ctxt, 'classes')
+    return report(ctxt, started)
+
+def bench_threads():
+    'lists the stacks of 200 threads at a depth of 60, with their locals'
+    ctxt = context(Simulator(threads=200, depth=60))
+    started = time()
+    perform(ctxt, 'threads', 'verbose=3')
+    return report(ctxt, started)
+
+def bench_inspect():
+    'inspects an object holding a 1 MB byte array'
+    ctxt = context(Simulator(threads=1, depth=1, array_size=1 << 20))
+    started = time()
+    perform(ctxt, 'inspect', str(OBJECT_BASE))
+    return report(ctxt, started)
+
+TRACE_HITS = 10000
+
+def bench_method_trace():
+    'traces a method entered 10k times a second'
+    ctxt = context(Simulator(event_rate=10000, event_limit=TRACE_HITS))
+    started = time()
+    perform(ctxt, 'method-trace', 'sim.p0.C10.m1')
+    wait_events(ctxt, TRACE_HITS)
+    res = report(ctxt, started)
+    res['hits_per_second'] = TRACE_HITS / res['wall']
+    return res
@@ -0,0 +1,86 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under 
+## the terms of version 3 of the GNU Lesser General Public License as 
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for 
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+'''
+the memory taken by the elements andbug.vm creates in bulk, in bytes per
+element, measured from the growth of the peak resident set while COUNT of
+each kind are held, with their usual attributes loaded
+'''
+
+import gc, resource
+from andbug.vm import Location, Slot, Method, Field, Frame, Object
+
+COUNT = 100000
+
+def rss():
+    'the peak resident set of this process, in bytes'
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def location(i):
+    return Location(None, 0x1000, i, i * 4)
+
+def slot(i):
+    slot = Slot(None, 0x1000, 0x2000, i)
+    slot.firstLoc = 0
+    slot.locLength = 32
+    slot.name = 'v%i' % i
+    slot.jni = 'I'
+    slot.gen = ''
+    return slot
+
+def method(i):
+    method = Method(None, 0x1000, i)
+    method.name = 'm%i' % i
+    method.jni = '()V'
+    method.gen = ''
+    method.flags = 1
+    return method
+
+def field(i):
+    field = Field(None, i)
+    field.name = 'f%i' % i
+    field.jni = 'I'
+    field.gen = ''
+    field.flags = 1
+    return field
+
+def frame(i):
+    frame = Frame(None, i)
+    frame.tid = 0x3000
+    return frame
+
+def obj(i):
+    return Object(None, i + 1)
+
+KINDS = (
+    ('Location', location), ('Slot', slot), ('Method', method),
+    ('Field', field), ('Frame', frame), ('Object', obj),
+)
+
+def bench_memory():
+    'holds 100k of each kind of element'
+    per_element = {}
+    held = []
+    # collection is paused so that it does not run in the middle of a kind,
+    # and each kind is measured from a peak already reached by the last one
+    gc.disable()
+    try:
+        for name, make in KINDS:
+            before = rss()
+            seq = list(make(i) for i in xrange(COUNT))
+            per_element[name] = float(rss() - before) / COUNT
+            held.append(seq)
+    finally:
+        gc.enable()
+    return dict(per_element=per_element)
@@ -0,0 +1,403 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under
+## the terms of version 3 of the GNU Lesser General Public License as
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+'''
+The andbug.aio module is an alternative to the threaded andbug.proto
+Connection for controllers that drive many processes at once.  It provides
+an asyncore dispatcher that speaks the same handshake and ID size
+negotiation, and a session whose requests are generator coroutines, so any
+number of targets may share one event loop without any threads or queues.
+
+Coroutines yield Replies, lists of Replies, or other Tasks, and receive the
+response when it arrives; they supply a result by raising Return::
+
+    def thread_names(sess):
+        names = []
+        for tid in (yield sess.threads()):
+            names.append((yield sess.threadName(tid)))
+        raise Return(names)
+
+    task = spawn(thread_names(sess))
+    run(task)
+'''
+
+import asyncore, socket, sys
+from andbug.jdwp import JdwpBuffer
+from andbug.proto import (
+    Reply, EOF, HandshakeError, ProtocolError, HANDSHAKE_MSG, IDSZ_REQ,
+    HEADER_STRUCT
+)
+
+class RequestError(Exception):
+    'raised when a request for more information from the process fails'
+    def __init__(self, code):
+        Exception.__init__(self, 'request failed, code %s' % code)
+        self.code = code
+
+class Return(Exception):
+    'raised by a coroutine to supply its result to the Task running it'
+    def __init__(self, value=None):
+        Exception.__init__(self)
+        self.value = value
+
+class Task(Reply):
+    '''
+    A Task runs a generator coroutine, sending each yielded Reply's response
+    back into the coroutine when it arrives; a yielded list of Replies is
+    answered with a list of responses.  The Task is itself a Reply that is
+    filled in with the coroutine's result, so Tasks may wait on one another.
+    '''
+
+    def __init__(self, gen):
+        Reply.__init__(self, None, None, None)
+        self.gen = gen
+        self.exc_info = None
+
+    def __repr__(self):
+        return '<task %s%s>' % (
+            getattr(self.gen, '__name__', self.gen),
+            '' if self.done() else ', pending'
+        )
+
+    def step(self, value=None, exc_info=None):
+        'resumes the coroutine with a value or exception'
+        try:
+            if exc_info is None:
+                item = self.gen.send(value)
+            else:
+                item = self.gen.throw(*exc_info)
+        except Return as ret:
+            return self.put(ret.value)
+        except StopIteration:
+            return self.put(None)
+        except Exception:
+            self.exc_info = sys.exc_info()
+            return self.put(None)
+
+        if isinstance(item, Reply):
+            item.then(self.resume)
+        elif isinstance(item, (list, tuple)):
+            self.join(list(item))
+        else:
+            self.step(None, (TypeError, TypeError(
+                'coroutines may only yield replies, not %r' % (item,)
+            ), None))
+
+    def join(self, items):
+        'resumes the coroutine with every response once all have arrived'
+        remaining = [len(items)]
+        def done(reply):
+            remaining[0] -= 1
+            if remaining[0] != 0: return
+            try:
+                values = list(self.unwrap(item) for item in items)
+            except Exception:
+                return self.step(None, sys.exc_info())
+            self.step(values)
+        if not items:
+            return self.step([])
+        for item in items:
+            item.then(done)
+
+    def resume(self, reply):
+        'internal; passes a response, or a failed task, to the coroutine'
+        if isinstance(reply, Task) and reply.exc_info is not None:
+            return self.step(None, reply.exc_info)
+        self.step(reply.value)
+
+    @staticmethod
+    def unwrap(reply):
+        if isinstance(reply, Task) and reply.exc_info is not None:
+            raise reply.exc_info[0], reply.exc_info[1], reply.exc_info[2]
+        return reply.value
+
+    def result(self):
+        'returns the coroutine result, raising its exception if it failed'
+        return self.unwrap(self)
+
+def spawn(gen):
+    'starts running a coroutine, returning its Task'
+    task = Task(gen)
+    task.step()
+    return task
+
+def coroutine(func):
+    'decorates a generator function so that calling it spawns a Task'
+    def spawner(*args, **kwargs):
+        return spawn(func(*args, **kwargs))
+    spawner.__name__ = func.__name__
+    spawner.__doc__ = func.__doc__
+    return spawner
+
+def run(until=None, map=None, timeout=0.1):
+    '''
+    runs the asyncore loop until the until Task is done, or until there are
+    no more open connections; returns the result of until, if supplied
+    '''
+    if map is None:
+        map = asyncore.socket_map
+    while map and not (until is not None and until.done()):
+        asyncore.loop(timeout, False, map, 1)
+    if until is not None:
+        return until.result()
+
+def connect(addr, portno=None, map=None):
+    'connects to an AF_UNIX or AF_INET JDWP transport'
+    if addr and portno:
+        sock = socket.create_connection((addr, portno))
+    elif isinstance(addr, int):
+        sock = socket.create_connection(('127.0.0.1', addr))
+    else:
+        sock = socket.socket(socket.AF_UNIX)
+        sock.connect(addr)
+    return Connection(sock, map)
+
+class Connection(asyncore.dispatcher):
+    '''
+    The asynchronous JDWP Connection is an asyncore dispatcher that performs
+    the same handshake and ID size negotiation as andbug.proto.Connection,
+    then frames packets as they arrive.  Responses fill in the Reply returned
+    by request(); incoming requests, such as events, are passed to the
+    function registered for their code with hook().
+
+    The ready attribute is a Reply that is filled in with the ID sizes once
+    negotiation completes; requests made before then are held until it does.
+    '''
+
+    def __init__(self, sock, map=None):
+        asyncore.dispatcher.__init__(self, sock, map)
+        self.recvbuf = JdwpBuffer()
+        self.indata = bytearray()
+        self.outdata = bytearray(HANDSHAKE_MSG)
+        self.held = bytearray()
+        self.state = 'handshake'
+        self.sizes = None
+        self.next_id = 3
+        self.qmap = {}
+        self.rmap = {}
+        self.ready = Reply(self, 1, 0x0107)
+
+    def buffer(self):
+        'returns a JdwpBuffer configured for this connection'
+        buf = JdwpBuffer()
+        buf.config(*self.sizes)
+        return buf
+
+    def hook(self, code, func):
+        'when code requests are received, func(ident, buf) will be called'
+        self.rmap[code] = func
+
+    def request(self, code, data=''):
+        'queues a request for transmission; returns a Reply'
+        ident = self.next_id
+        self.next_id += 2
+        reply = Reply(self, ident, code)
+        self.qmap[ident] = reply
+
+        out = self.outdata if self.state == 'ready' else self.held
+        out += HEADER_STRUCT.pack(len(data) + 11, ident, 0, code)
+        out += data
+        return reply
+
+    ############################################### READING / PROCESSING PACKETS
+
+    def handle_read(self):
+        chunk = self.recv(65536)
+        if not chunk: return
+        # received data is appended in place, so that a large reply arriving
+        # over many reads is not copied again on each of them.
+        data = self.indata
+        data += chunk
+
+        # bodies are passed on as buffer objects over data, rather than
+        # copies; unlike memoryviews, they do not pin a bytearray's size.
+        ofs = 0
+        end = len(data)
+        while True:
+            if self.state == 'handshake':
+                sz = len(HANDSHAKE_MSG)
+                if end - ofs < sz: break
+                if data[ofs:ofs + sz] != HANDSHAKE_MSG:
+                    raise HandshakeError()
+                ofs += sz
+                self.state = 'idsizes'
+                self.outdata += IDSZ_REQ
+                continue
+
+            if end - ofs < 11: break
+            size, ident, flags, code = HEADER_STRUCT.unpack_from(data, ofs)
+            if end - ofs < size: break
+            self.processPacket(
+                ident, flags, code, buffer(data, ofs + 11, size - 11)
+            )
+            ofs += size
+
+        # only what follows the last complete packet is moved
+        if ofs: del data[:ofs]
+
+    def processPacket(self, ident, flags, code, body):
+        'internal; dispatches a complete packet'
+        if self.state == 'idsizes':
+            return self.processIdSzRes(ident, flags, body)
+
+        buf = JdwpBuffer()
+        buf.config(*self.sizes)
+        buf.prepareUnpack(body)
+
+        if flags == 0x80:
+            reply = self.qmap.pop(ident, None)
+            if reply is not None:
+                reply.put((code, buf))
+        else:
+            func = self.rmap.get(code)
+            if func is not None:
+                func(ident, buf)
+
+    def processIdSzRes(self, ident, flags, body):
+        'internal; processes the id size response and releases held requests'
+        if len(body) != 20:
+            raise ProtocolError('expected size of an idsize response')
+        if flags != 0x80:
+            raise ProtocolError(
+                'expected first server message to be a response'
+            )
+        if ident != 1:
+            raise ProtocolError('expected first server message to be 1')
+
+        self.sizes = self.recvbuf.unpack('iiiii', body)
+        self.state = 'ready'
+        self.outdata += self.held
+        self.held = bytearray()
+        self.ready.put(self.sizes)
+
+    ####################################################### TRANSMITTING PACKETS
+
+    def writable(self):
+        return len(self.outdata) > 0
+
+    def handle_write(self):
+        sent = self.send(self.outdata)
+        del self.outdata[:sent]
+
+    def handle_close(self):
+        self.close()
+        pending, self.qmap = self.qmap.values(), {}
+        for reply in pending:
+            reply.put(None)
+        if not self.ready.done():
+            self.ready.put(None)
+
+    def handle_error(self):
+        exc = sys.exc_info()[1]
+        self.handle_close()
+        if not isinstance(exc, (EOF, socket.error)):
+            raise
+
+class Session(object):
+    '''
+    An asynchronous counterpart to andbug.vm.Session, whose request methods
+    are coroutines returning Tasks.  Results are plain identifiers and tuples
+    rather than andbug.vm elements, since those issue blocking requests.
+    '''
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.emap = {}
+        conn.hook(0x4064, self.processEvent)
+
+    def processEvent(self, ident, buf):
+        'dispatches composite event location events to their hooks'
+        pol, ct = buf.unpack('1i')
+        for i in range(ct):
+            ek = buf.unpackU8()
+            if ek not in (2, 40, 41):
+                return
+            rid = buf.unpackInt()
+            tid = buf.unpackObjectId()
+            loc = tuple(buf.unpack('1tm8'))
+            func = self.emap.get(rid)
+            if func is not None:
+                func(rid, tid, loc)
+
+    def call(self, code, data=''):
+        'internal; waits for negotiation, then issues a request'
+        if not self.conn.ready.done():
+            yield self.conn.ready
+        res = yield self.conn.request(code, data)
+        if res is None:
+            raise EOF()
+        code, buf = res
+        if code != 0:
+            raise RequestError(code)
+        raise Return(buf)
+
+    @coroutine
+    def start(self):
+        'completes once the connection has negotiated its ID sizes'
+        sizes = yield self.conn.ready
+        if sizes is None:
+            raise EOF()
+        raise Return(sizes)
+
+    @coroutine
+    def suspend(self):
+        yield spawn(self.call(0x0108))
+
+    @coroutine
+    def resume(self):
+        yield spawn(self.call(0x0109))
+
+    @coroutine
+    def threads(self):
+        'returns the object ids of every thread in the process'
+        buf = yield spawn(self.call(0x0104))
+        ct = buf.unpackInt()
+        raise Return(list(buf.unpackObjectId() for i in range(ct)))
+
+    @coroutine
+    def threadName(self, tid):
+        yield self.start()
+        buf = yield spawn(self.call(0x0b01, self.conn.buffer().pack('o', tid)))
+        raise Return(buf.unpackStr())
+
+    @coroutine
+    def frames(self, tid):
+        'returns a list of (fid, (tag, tid, mid, loc)) for a suspended thread'
+        yield self.start()
+        buf = yield spawn(self.call(
+            0x0b06, self.conn.buffer().pack('oii', tid, 0, -1)
+        ))
+        ct = buf.unpackInt()
+        raise Return(list(
+            (buf.unpackFrameId(), tuple(buf.unpack('1tm8')))
+            for i in range(ct)
+        ))
+
+    @coroutine
+    def classes(self):
+        'returns a list of (tag, tid, jni, gen, flags) for every loaded class'
+        buf = yield spawn(self.call(0x0114))
+        ct = buf.unpackU32()
+        raise Return(list(tuple(buf.unpack('1t$$i')) for i in range(ct)))
+
+    @coroutine
+    def hook(self, data, func):
+        '''
+        sets an event request, packed as for EventRequest.Set, calling
+        func(rid, tid, loc) for each location event it produces
+        '''
+        buf = yield spawn(self.call(0x0f01, data))
+        rid = buf.unpackInt()
+        self.emap[rid] = func
+        raise Return(rid)
@@ -0,0 +1,127 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under
+## the terms of version 3 of the GNU Lesser General Public License as
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+'''
+The andbug.cache module keeps class metadata on disk between sessions, so
+that attaching again to the same build of an application does not fetch it
+all again.  A MetadataCache is opened for a directory and a build key, such
+as the package name and its version code or a hash of its signature, and is
+given to the session:
+
+    cache = andbug.cache.MetadataCache('~/.andbug', build_key(pkg, version))
+    sess = andbug.vm.connect(pid, cache=cache)
+
+Only metadata that does not mention JDWP identifiers is kept, since those
+differ from one process to the next: the line and variable tables of each
+method, stored by class signature and by method name and signature.  Each
+class has a file of its own; new entries are kept in memory until flush is
+called, which rewrites the file of each class with new entries once, so
+that a class whose methods are fetched together is not written per method.
+'''
+
+import os, os.path, tempfile
+import cPickle as pickle
+from hashlib import sha1
+from threading import Lock
+
+## bumped whenever the layout of the cached entries changes
+CACHE_VERSION = 1
+
+def build_key(package, version=None):
+    'returns a build key for a package name and a version code or hash'
+    if version is None:
+        return str(package)
+    return '%s@%s' % (package, version)
+
+class MetadataCache(object):
+    '''
+    A MetadataCache maps (class signature, kind, key) to the metadata
+    decoded by the session; kinds are 'lines' and 'slots', keyed by method
+    name and signature.  It may be shared by sessions in several threads.
+    '''
+
+    def __init__(self, root, build):
+        self.build = build
+        self.path = os.path.join(
+            os.path.expanduser(root),
+            'v%i' % CACHE_VERSION, sha1(build).hexdigest()
+        )
+        self.lock = Lock()
+        self.classes = {}
+        self.dirty = set()
+        self.hits = 0
+        self.misses = 0
+
+    def classPath(self, jni):
+        return os.path.join(self.path, sha1(jni).hexdigest())
+
+    def entries(self, jni):
+        'internal; returns the entries for a class, reading them once'
+        seq = self.classes.get(jni)
+        if seq is None:
+            try:
+                with open(self.classPath(jni), 'rb') as f:
+                    seq = pickle.load(f)
+            except (IOError, EOFError, pickle.UnpicklingError):
+                seq = {}
+            self.classes[jni] = seq
+        return seq
+
+    def get(self, jni, kind, key):
+        'returns the cached entry, or None'
+        with self.lock:
+            val = self.entries(jni).get((kind, key))
+            if val is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return val
+
+    def put(self, jni, kind, key, val):
+        'stores an entry, to be written by the next flush'
+        with self.lock:
+            self.entries(jni)[(kind, key)] = val
+            self.dirty.add(jni)
+
+    def flush(self):
+        'writes the file of each class with entries added since the last flush'
+        with self.lock:
+            while self.dirty:
+                jni = self.dirty.pop()
+                self.write(jni, self.classes[jni])
+
+    def write(self, jni, seq):
+        'internal; replaces a class file, so readers never see it partial'
+        if not os.path.isdir(self.path):
+            try:
+                os.makedirs(self.path)
+            except OSError:
+                if not os.path.isdir(self.path): raise
+        fd, tmp = tempfile.mkstemp(dir=self.path)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(seq, f, pickle.HIGHEST_PROTOCOL)
+            os.rename(tmp, self.classPath(jni))
+        except:
+            os.unlink(tmp)
+            raise
+
+    def clear(self):
+        'discards every entry for this build'
+        with self.lock:
+            self.classes = {}
+            self.dirty = set()
+            if os.path.isdir(self.path):
+                for name in os.listdir(self.path):
+                    os.unlink(os.path.join(self.path, name))
@@ -28,7 +28,9 @@ def report_hit(t):
             andbug.screed.item(name)
 
 def cmd_break_methods(ctxt, cpath, mpath):
-    for c in ctxt.sess.classes(cpath):
+    classes = ctxt.sess.classes(cpath)
+    ctxt.sess.prefetch(classes)
+    for c in classes:
         for m in c.methods(mpath):
             l = m.firstLoc
             if l.native:
@@ -43,7 +45,9 @@ def cmd_break_classes(ctxt, cpath):
         andbug.screed.item('Hooked %s' % h)
 
 def cmd_break_line(ctxt, cpath, mpath, line):
-    for c in ctxt.sess.classes(cpath):
+    classes = ctxt.sess.classes(cpath)
+    ctxt.sess.prefetch(classes)
+    for c in classes:
         for m in c.methods(mpath):
             l = m.lineTable
             if l is None or len(l) <= 0:
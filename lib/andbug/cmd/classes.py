@@ -14,22 +14,23 @@
 
 'implementation of the "classes" command'
 
-import andbug.command, andbug.screed
+import andbug.command, andbug.screed, andbug.options
 
 @andbug.command.action('[<partial class name>]')
 def classes(ctxt, expr=None):
-    'lists loaded classes. if no partial class name supplied, list all classes.'
+    'lists loaded classes. if no partial class name or glob (com.example.**) supplied, list all classes.'
+    table = ctxt.sess.classTable
+    if expr is None:
+        seq = table.signatures()
+    elif andbug.options.is_glob(expr):
+        seq = sorted(table.jnis[i] for i in table.match(
+            andbug.options.parse_cquery(expr)
+        ))
+    else:
+        expr = expr.replace('.', '/')
+        seq = (n for n in table.signatures() if expr in n)
+
     with andbug.screed.section('Loaded Classes'):
-        for c in ctxt.sess.classes():
-            n = c.jni
+        for n in seq:
             if n.startswith('L') and n.endswith(';'):
-                n = n[1:-1].replace('/', '.')
-            else:
-                continue
-
-            if expr is not None:
-                if n.find(expr) >= 0:
-                    andbug.screed.item(n)
-            else:
-                andbug.screed.item(n)
-
+                andbug.screed.item(n[1:-1].replace('/', '.'))
@@ -26,7 +26,9 @@ def find_last_method_line(source, first_line):
 def dump(ctxt, cpath, mquery=None):
     'dumps methods using original sources or apktool sources' 
     cpath, mname, mjni = andbug.options.parse_mquery(cpath, mquery)
-    for method in ctxt.sess.classes(cpath).methods(name=mname, jni=mjni):
+    classes = ctxt.sess.classes(cpath)
+    ctxt.sess.prefetch(classes)
+    for method in classes.methods(name=mname, jni=mjni):
         source = False
         klass = method.klass.name           
 
@@ -18,6 +18,8 @@ import andbug.command
 import os
 
 @andbug.command.action('', shell=True)
-def exit(name=None):
+def exit(ctxt):
     'terminates andbug with prejudice'
+    if ctxt.sess is not None:
+        ctxt.sess.flush()
     os._exit(0)
@@ -25,6 +25,8 @@ def report_hit(t):
             name = str(f.loc)
             if f.native:
             	name += ' <native>'
+            elif f.loc.line is not None:
+            	name += ' line %i' % f.loc.line
             with andbug.screed.item(name):
             	for k, v in f.values.items():
                 	andbug.screed.item( "%s=%s" %(k, v))
@@ -32,7 +34,9 @@ def report_hit(t):
         t.resume()
 
 def cmd_hook_methods(ctxt, cpath, mpath):
-    for c in ctxt.sess.classes(cpath):
+    classes = ctxt.sess.classes(cpath)
+    ctxt.sess.prefetch(classes)
+    for c in classes:
         for m in c.methods(mpath):
             l = m.firstLoc
             if l.native:
@@ -19,8 +19,10 @@ import andbug.command, andbug.options
 @andbug.command.action('<class-path>')
 def statics(ctxt, cpath):
     'lists the methods of a class'
-    cpath = andbug.options.parse_cpath(cpath)
-    for c in ctxt.sess.classes(cpath):
+    cpath = andbug.options.parse_cquery(cpath)
+    classes = ctxt.sess.classes(cpath)
+    ctxt.sess.prefetch(classes, methods=False, lines=False, fields=True)
+    for c in classes:
         andbug.screed.section("Static Fields, %s" % c)
         for k, v in c.statics.iteritems():
             andbug.screed.item("%s = %s" % (k, v))
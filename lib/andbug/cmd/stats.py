@@ -0,0 +1,77 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under 
+## the terms of version 3 of the GNU Lesser General Public License as 
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for 
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+'implementation of the "stats" command'
+
+import andbug.command, andbug.screed, andbug.stats, andbug.errors
+
+def show_stats(stats):
+    reqs, sent, received = stats.totals()
+    with andbug.screed.section(
+        'JDWP Statistics, %.1fs: %i requests, %i bytes sent, %i received'
+        % (stats.elapsed, reqs, sent, received)
+    ):
+        for cmd in stats.summary():
+            with andbug.screed.item(str(cmd)):
+                andbug.screed.text(
+                    '%i requests, %i bytes sent, %i received, '
+                    '%.1fms total, %.2fms mean' % (
+                        cmd.count, cmd.sent, cmd.received,
+                        cmd.latency * 1000, cmd.mean * 1000
+                    )
+                )
+                bounds = list('<%ims' % b for b in andbug.stats.LATENCY_BUCKETS)
+                bounds.append('slower')
+                andbug.screed.text(', '.join(
+                    '%s: %i' % (b, n)
+                    for b, n in zip(bounds, cmd.histogram) if n
+                ))
+
+    if stats.pool_rate is not None:
+        with andbug.screed.section('Buffers'):
+            andbug.screed.item(
+                '%i reused, %i allocated, %.0f%% hit rate' % (
+                    stats.pool_hits, stats.pool_misses, stats.pool_rate * 100
+                )
+            )
+
+    if stats.events:
+        with andbug.screed.section('Events'):
+            for kind, count in sorted(stats.events.items()):
+                andbug.screed.item(
+                    '%s: %i' % (andbug.stats.event_name(kind), count)
+                )
+
+@andbug.command.action('[on/off/reset]', shell=True)
+def stats(ctxt, mode=None):
+    'collects and shows JDWP request, traffic and latency statistics'
+    sess = ctxt.sess
+    if mode == 'on':
+        sess.collectStats()
+        return andbug.screed.section('Collecting Statistics')
+    elif mode == 'off':
+        sess.collectStats(False)
+        return andbug.screed.section('Not Collecting Statistics')
+    elif mode == 'reset':
+        if sess.stats is not None:
+            sess.stats.reset()
+        return andbug.screed.section('Statistics Reset')
+    elif mode is not None:
+        raise andbug.errors.OptionError('expected on, off or reset')
+
+    if sess.stats is None:
+        return andbug.screed.section(
+            'Statistics are not being collected; use "stats on"'
+        )
+    show_stats(sess.stats)
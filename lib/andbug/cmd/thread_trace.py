@@ -25,6 +25,8 @@ def report_hit(t):
                 name = str(f.loc)
                 if f.native:
                     name += ' <native>'
+                elif f.loc.line is not None:
+                    name += ' line %i' % f.loc.line
                 with andbug.screed.item(name):
                     for k, v in f.values.items():
                         andbug.screed.item( "%s=%s" %(k, v))
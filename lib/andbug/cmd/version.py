@@ -29,7 +29,7 @@ def version(ctxt):
     buf = conn.buffer()
 
     # 0x0101 = {1, 1} VirtualMachine.Version
-    code, ret = conn.request(0x0101, buf.data())
+    code, ret = conn.request(0x0101, buf)
     if code != 0:
         raise RequestError(code)
 
@@ -27,8 +27,8 @@ Commands for andbug are typically defined as ::
 
 '''
 
-import os, os.path, sys, getopt, inspect
-import andbug.vm, andbug.cmd, andbug.source, andbug.util
+import os, os.path, sys, getopt, inspect, atexit
+import andbug.vm, andbug.cmd, andbug.source, andbug.util, andbug.cache
 import traceback
 from time import sleep
 from andbug.errors import *
@@ -38,7 +38,8 @@ from andbug.errors import *
 OPTIONS = (
     ('pid', 'the process to be debugged, by pid or name'),
     ('dev', 'the device or emulator to be debugged (see adb)'),
-    ('src', 'adds a directory where .java or .smali files could be found')
+    ('src', 'adds a directory where .java or .smali files could be found'),
+    ('cache', 'a directory where metadata is kept between sessions')
 )
 
 class Context(object):
@@ -52,12 +53,23 @@ class Context(object):
         self.sess = None
         self.pid = None
         self.dev = None
+        self.cacheDir = None
         self.shell = False
     
     def connect(self):
         'connects using vm.connect to the process if not already connected'
         if self.sess is not None: return
-        self.sess = andbug.vm.connect(self.pid, self.dev)
+        cache = None
+        build = None
+        if self.cacheDir:
+            # without a version, metadata from another build could be reused
+            build = andbug.util.find_build(self.pid, self.dev)
+        if build is not None:
+            cache = andbug.cache.MetadataCache(
+                self.cacheDir, andbug.cache.build_key(*build)
+            )
+            atexit.register(cache.flush)
+        self.sess = andbug.vm.connect(self.pid, self.dev, cache=cache)
 
     def parseOpts(self, args, options=OPTIONS, proc=True):
         'parse command options in OPTIONS format'
@@ -76,6 +88,8 @@ class Context(object):
         for k, v in opts: 
             if k == 'src':
                 andbug.source.add_srcdir(v)
+            elif k == 'cache':
+                self.cacheDir = v
             else:
                 t[k] = v
         
@@ -13,6 +13,8 @@
 ## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
 
 from threading import Lock
+from weakref import KeyedRef
+from collections import deque
 
 class multidict(dict):
     '''
@@ -48,17 +50,88 @@ class pool(object):
         t2 = p(t,2)
         p(t,1)[1] = -1
         # t1[1] is now -1, not 1
+
+    objects are held weakly, except for about the cap most recently used,
+    which are kept in two generations of at most cap / 2 each; once an
+    object is collected, its ident and the number of times it was pooled
+    are passed to evict, in batches, from whichever thread next uses the
+    pool.  objects that cannot be weakly referenced are held forever.
     '''
-    def __init__(self):
+    def __init__(self, cap=None, evict=None):
         self.pools = {}
+        self.fixed = {}
+        self.young = {}
+        self.old = {}
+        self.half = (cap // 2) if cap is not None else None
+        self.evict = evict
+        self.dead = deque()
         self.lock = Lock()
+
+    def __len__(self):
+        return len(self.pools) + len(self.fixed)
+
     def __call__(self, *ident):
         with self.lock:
-            pool = self.pools.get(ident)
-            if pool is None:
-                pool = ident[0](*ident[1:])
-                self.pools[ident] = pool
-            return pool
+            gone = self.collect() if self.dead else None
+            item = self.find(ident)
+        if gone and self.evict is not None:
+            self.evict(gone)
+        return item
+
+    def many(self, idents):
+        'like calling the pool for each ident, but taking the lock only once'
+        with self.lock:
+            gone = self.collect() if self.dead else None
+            seq = list(self.find(ident) for ident in idents)
+        if gone and self.evict is not None:
+            self.evict(gone)
+        return seq
+
+    def find(self, ident):
+        'internal; must hold the lock'
+        ref = self.pools.get(ident)
+        item = ref() if ref is not None else None
+        if item is not None:
+            ref.count += 1
+        else:
+            item = self.fixed.get(ident)
+            if item is not None:
+                return item
+            item = ident[0](*ident[1:])
+            try:
+                new = PoolRef(item, self.dead.append, ident)
+            except TypeError:
+                self.fixed[ident] = item
+                return item
+            if ref is not None:
+                # collected, but not yet collect()ed, which will now skip
+                # it; its count must not be lost with it
+                new.count += ref.count
+            self.pools[ident] = new
+        young = self.young
+        young[ident] = item
+        if self.half is not None and len(young) > self.half:
+            self.old, self.young = young, {}
+        return item
+
+    def collect(self):
+        'internal; must hold the lock; forgets collected objects'
+        gone = []
+        while self.dead:
+            ref = self.dead.popleft()
+            ident = ref.key
+            if self.pools.get(ident) is ref:
+                del self.pools[ident]
+                gone.append((ident, ref.count))
+        return gone
+
+class PoolRef(KeyedRef):
+    'a weak reference to a pooled object, counting the times it was pooled'
+    __slots__ = ('count',)
+
+    def __init__(self, item, callback, key):
+        super(PoolRef, self).__init__(item, callback, key)
+        self.count = 1
 
 class view(object):
     '''
@@ -96,6 +169,31 @@ class view(object):
     def append(self, val):
         self.items.append(val)
 
+class lazyview(view):
+    '''
+    a view of the objects fetch(i) for each i in indices, where each object is
+    only fetched when it is used; len() and slicing do not fetch anything
+    '''
+
+    def __init__(self, indices, fetch):
+        self.indices = indices
+        self.fetch = fetch
+    @property
+    def items(self):
+        return list(self)
+    def __len__(self):
+        return len(self.indices)
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return lazyview(self.indices[index], self.fetch)
+        return self.fetch(self.indices[index])
+    def __iter__(self):
+        fetch = self.fetch
+        for i in self.indices:
+            yield fetch(i)
+    def append(self, val):
+        raise TypeError('a lazyview cannot be extended')
+
 def flatten(seq):
     for ss in seq:
         for s in ss:
@@ -109,29 +207,34 @@ def defer(func, name):
 
     unlike other deferral implementation, this one accepts the reality that the
     product of a single calculation may be multiple properties
+
+    the value is kept in the attribute '_' + name, so that a class with
+    __slots__ only has to declare that slot; until it is set, reading it
+    raises AttributeError, which marks the property as not yet loaded
     '''
+    slot = '_' + name
+
     def fget(obj, type=None):   
         try:
-            return obj.props[name]
-        except KeyError:
-            pass
+            return getattr(obj, slot)
         except AttributeError:
-            obj.props = {}
+            pass
 
-        obj.props[name] = None
+        setattr(obj, slot, None)
         func(obj)
-        return obj.props[name]
+        return getattr(obj, slot)
     
     def fset(obj, value):
-        try:
-            obj.props[name] = value
-        except AttributeError:
-            obj.props = {name : value}
+        setattr(obj, slot, value)
 
     fget.func_name = 'get_' + name
     fset.func_name = 'set_' + name
     return property(fget, fset)
 
+def loaded(obj, name):
+    'returns True if the deferred property name of obj has been loaded'
+    return hasattr(obj, '_' + name)
+
 if __name__ == '__main__':
     pool = pool()
 
@@ -12,7 +12,8 @@
 ## You should have received a copy of the GNU Lesser General Public License
 ## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
    
-import os, sys, time
+import os, sys, time, struct
+from threading import Lock
 from cStringIO import StringIO
 
 def blocks(seq, sz):
@@ -148,3 +149,66 @@ def read_log(path=None, file=None):
         else:
             reader = LogReader(file)
     return reader
+
+## Packet recordings are a compact binary alternative to the hex logs above,
+## holding every JDWP packet exchanged with a process.  The file starts with
+## PACKET_MAGIC, followed by records of a PACKET_RECORD header -- the time,
+## a direction byte of '<' (received) or '>' (sent), and the packet length --
+## and the packet itself, header and all.
+
+PACKET_MAGIC = 'AndBugPkt\x01'
+PACKET_RECORD = struct.Struct('>dcI')
+
+class PacketWriter(object):
+    'records packets to a file; safe to share between threads'
+
+    def __init__(self, file):
+        self.file = file
+        self.lock = Lock()
+        self.file.write(PACKET_MAGIC)
+
+    def writePacket(self, direction, data, now=None):
+        if now is None: now = time.time()
+        head = PACKET_RECORD.pack(now, direction, len(data))
+        with self.lock:
+            self.file.write(head)
+            self.file.write(data)
+
+    def flush(self):
+        with self.lock:
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+class PacketReader(object):
+    'reads (time, direction, data) tuples from a packet recording'
+
+    def __init__(self, file):
+        self.file = file
+        if file.read(len(PACKET_MAGIC)) != PACKET_MAGIC:
+            raise ValueError('not an andbug packet recording')
+
+    def readPacket(self):
+        head = self.file.read(PACKET_RECORD.size)
+        if len(head) < PACKET_RECORD.size: return None
+        now, direction, size = PACKET_RECORD.unpack(head)
+        data = self.file.read(size)
+        if len(data) < size: return None
+        return now, direction, data
+
+    def __iter__(self):
+        while True:
+            pkt = self.readPacket()
+            if pkt is None: return
+            yield pkt
+
+def record_packets(path):
+    'returns a PacketWriter recording to the file at path'
+    return PacketWriter(open(path, 'wb'))
+
+def read_packets(path):
+    'returns a list of the (time, direction, data) packets recorded at path'
+    with open(path, 'rb') as file:
+        return list(PacketReader(file))
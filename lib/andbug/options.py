@@ -12,6 +12,8 @@
 ## You should have received a copy of the GNU Lesser General Public License
 ## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
 
+import re
+
 class ParseError(Exception):
     def __init__(self, reason, option):
         self.reason = reason
@@ -28,6 +30,48 @@ def parse_cpath(path):
 	else:
 		return'L' + path.replace('.', '/') + ';'
 
+def is_glob(query):
+    'returns True if query is a glob, rather than a literal signature or name'
+    return '*' in query or '?' in query
+
+def compile_glob(pattern):
+    '''
+    compiles a glob over JNI signatures, where ** matches anything, * matches
+    anything within a package and ? matches one character, returning the
+    literal prefix of the glob and a regex matching the whole signature
+    '''
+    prefix = []
+    rx = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if pattern.startswith('**', i):
+            rx.append('.*')
+            i += 2
+            continue
+        elif ch == '*':
+            rx.append('[^/]*')
+        elif ch == '?':
+            rx.append('[^/]')
+        else:
+            rx.append(re.escape(ch))
+            if len(rx) == len(prefix) + 1:
+                prefix.append(ch)
+        i += 1
+    return ''.join(prefix), re.compile(''.join(rx) + '$')
+
+def parse_cquery(query):
+    '''
+    like parse_cpath, but also accepts globs such as com.example.** or
+    *Activity; a glob without a package that starts with * matches classes
+    in any package, as if it started with **
+    '''
+    if is_glob(query) and '/' not in query and not query.endswith(';'):
+        if query[:1] == '*' and query[:2] != '**' and '.' not in query:
+            query = '*' + query
+        return 'L' + query.replace('.', '/') + ';'
+    return parse_cpath(query)
+
 def parse_mspec(mspec):
     if (mspec == '*') or (not mspec):
         return None, None
@@ -40,7 +84,7 @@ def parse_mspec(mspec):
 
 def parse_mquery(cp, ms):
     #TODO: support class->method syntax.
-    cp = parse_cpath(cp)
+    cp = parse_cquery(cp)
     mn, mj = parse_mspec(ms)
     return cp, mn, mj
 
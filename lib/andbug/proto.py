@@ -18,9 +18,10 @@ manageable request/response API using an input worker thread in the
 background and a number of mutexes to control contests for output.
 '''
 
-import socket, tempfile
-import andbug.util
-from threading import Thread, Lock
+import socket, tempfile, struct
+from time import time
+import andbug.util, andbug.log
+from threading import Thread, Lock, Event, Semaphore, Condition
 from andbug.jdwp import JdwpBuffer
 from Queue import Queue, Empty as EmptyQueue
 
@@ -43,6 +44,7 @@ class ProtocolError(Exception):
 
 HANDSHAKE_MSG = 'JDWP-Handshake'
 HEADER_FORMAT = '4412'
+HEADER_STRUCT = struct.Struct('>IIBH')
 IDSZ_REQ = (
     '\x00\x00\x00\x0B' # Length
     '\x00\x00\x00\x01' # Identifier
@@ -50,6 +52,22 @@ IDSZ_REQ = (
     '\x01\x07'         # Command 1:7
 )
 
+# the default number of requests that may be awaiting a response at once
+MAX_INFLIGHT = 256
+
+# the initial size of the SocketReader receive buffer; grows to fit packets
+RECV_BUFFER_SIZE = 65536
+
+# packet bodies larger than this are received into a bytearray of their own,
+# which the connection unpacks in place instead of copying
+LARGE_PACKET_SIZE = 16384
+
+# the initial size of the Connection transmit buffer; grows to fit batches
+XMIT_BUFFER_SIZE = 65536
+
+# the most released JdwpBuffers a Connection keeps for reuse
+BUFFER_POOL_SIZE = 64
+
 def forward(pid, dev=None):
     'constructs an adb forward for the context to access the pid via jdwp'
     if dev:
@@ -61,8 +79,11 @@ def forward(pid, dev=None):
     andbug.util.adb(*cmd)
     return temp
 
-def connect(addr, portno = None, trace=False):
-    'connects to an AF_UNIX or AF_INET JDWP transport'
+def connect(addr, portno = None, trace=False, record=None):
+    '''
+    connects to an AF_UNIX or AF_INET JDWP transport; if record is a path,
+    every packet exchanged is recorded there for andbug.proto.replay
+    '''
     if addr and portno:
         conn = socket.create_connection((addr, portno))
     elif isinstance(addr, int):
@@ -70,33 +91,246 @@ def connect(addr, portno = None, trace=False):
     else:
         conn = socket.socket(socket.AF_UNIX)
         conn.connect(addr)
+    return attach(conn, trace, record)
+
+def attach(conn, trace=False, record=None):
+    'starts a Connection over a connected socket, as for connect()'
+    read = SocketReader(conn, trace)
 
-    def read(amt):
-        'read wrapper internal to andbug.proto.connect'
-        req = amt
-        buf = ''
-        while req:
-            pkt = conn.recv(req)
-            if not pkt: raise EOF()
-            buf += pkt
-            req -= len(pkt)
-        if trace:
-            print ":: RECV:", repr(buf)
-        return buf 
-    
     def write(data):
         'write wrapper internal to andbug.proto.connect'
         try:
             if trace:
-                print ":: XMIT:", repr(data)
+                print ":: XMIT:", repr(memoryview(data).tobytes())
             conn.sendall(data)
         except Exception as exc:
             raise EOF(exc)
         
     p = Connection(read, write)
+    if record:
+        p.recorder = andbug.log.record_packets(record)
     p.start()
     return p
 
+def replay(path, paced=True):
+    'returns a Connection that replays the packets recorded at path'
+    r = Replayer(andbug.log.read_packets(path), paced)
+    p = Connection(r, r.write)
+    p.start()
+    return p
+
+class Replayer(object):
+    '''
+    A Replayer is a fake transport that feeds a packet recording back through
+    a Connection; calling it reads the recorded incoming stream, beginning
+    with the handshake, while write accepts outgoing packets.  When paced,
+    each recorded incoming packet is held until the connection has sent as
+    many packets as had been sent before it was recorded, so that responses
+    arrive after their requests, as they did originally.
+    '''
+
+    def __init__(self, packets, paced=True):
+        self.inbound = []
+        sent = 0
+        for now, direction, data in packets:
+            if direction == '>':
+                sent += 1
+            else:
+                self.inbound.append((sent, data))
+        self.paced = paced
+        self.index = 0
+        self.pending = HANDSHAKE_MSG
+        self.skip = len(HANDSHAKE_MSG)
+        self.outdata = ''
+        self.sent = 0
+        self.cond = Condition()
+
+    def __call__(self, amt):
+        data = ''
+        while len(data) < amt:
+            if not self.pending:
+                if self.index >= len(self.inbound):
+                    return data # EOF at the end of the recording
+                need, self.pending = self.inbound[self.index]
+                self.index += 1
+                if self.paced:
+                    with self.cond:
+                        while self.sent < need:
+                            self.cond.wait()
+            take = self.pending[:amt - len(data)]
+            self.pending = self.pending[len(take):]
+            data += take
+        return data
+
+    def write(self, data):
+        data = memoryview(data).tobytes()
+        with self.cond:
+            if self.skip:
+                skip = min(self.skip, len(data))
+                self.skip -= skip
+                data = data[skip:]
+            self.outdata += data
+            while len(self.outdata) >= 4:
+                size = struct.unpack('>I', self.outdata[:4])[0]
+                if len(self.outdata) < size: break
+                self.outdata = self.outdata[size:]
+                self.sent += 1
+            self.cond.notifyAll()
+
+class SocketReader(object):
+    '''
+    A SocketReader receives from a socket into a single reusable bytearray
+    using recv_into, framing as many JDWP packets from each receive as are
+    available.  Calling the reader returns a string of the requested size,
+    as the read function supplied to a Connection; packet() returns the
+    next packet header and a memoryview of its body, which is only valid
+    until the next call to the reader.  Bodies larger than LARGE_PACKET_SIZE
+    are instead returned as a bytearray of their own, received directly
+    into it.
+    '''
+
+    def __init__(self, sock, trace=False, size=RECV_BUFFER_SIZE):
+        self.sock = sock
+        self.trace = trace
+        self.data = bytearray(size)
+        self.view = memoryview(self.data)
+        self.ofs = 0
+        self.end = 0
+
+    def fill(self, amt):
+        'receives until at least amt bytes are buffered'
+        if self.ofs + amt > len(self.data):
+            # compact unread data to the front, growing if it cannot fit
+            avail = self.end - self.ofs
+            if amt > len(self.data):
+                data = bytearray(max(amt, len(self.data) * 2))
+                data[:avail] = self.view[self.ofs:self.end]
+                self.data = data
+                self.view = memoryview(data)
+            else:
+                self.data[:avail] = self.data[self.ofs:self.end]
+            self.ofs = 0
+            self.end = avail
+
+        while self.end - self.ofs < amt:
+            ct = self.sock.recv_into(self.view[self.end:])
+            if not ct: raise EOF()
+            self.end += ct
+
+    def take(self, amt):
+        'consumes amt buffered bytes, returning them as a memoryview'
+        ofs = self.ofs
+        self.ofs += amt
+        if self.ofs == self.end:
+            self.ofs = self.end = 0
+        return self.view[ofs:ofs + amt]
+
+    def takeLarge(self, amt):
+        '''
+        consumes amt bytes into a new bytearray, taking what is buffered and
+        receiving the rest directly into it
+        '''
+        data = bytearray(amt)
+        view = memoryview(data)
+        ofs = min(self.end - self.ofs, amt)
+        view[:ofs] = self.view[self.ofs:self.ofs + ofs]
+        self.ofs += ofs
+        if self.ofs == self.end:
+            self.ofs = self.end = 0
+        while ofs < amt:
+            ct = self.sock.recv_into(view[ofs:])
+            if not ct: raise EOF()
+            ofs += ct
+        return data
+
+    def __call__(self, amt):
+        'read wrapper internal to andbug.proto.connect'
+        self.fill(amt)
+        data = self.take(amt).tobytes()
+        if self.trace:
+            print ":: RECV:", repr(data)
+        return data
+
+    def packet(self):
+        'reads a packet and returns (size, id, flags, code, body)'
+        self.fill(11)
+        size, ident, flags, code = HEADER_STRUCT.unpack_from(
+            self.data, self.ofs
+        )
+        if size < 11:
+            raise ProtocolError('packet size %s smaller than header' % size)
+        if size - 11 > LARGE_PACKET_SIZE:
+            self.ofs += 11
+            body = self.takeLarge(size - 11)
+        else:
+            self.fill(size)
+            self.ofs += 11
+            body = self.take(size - 11)
+        if self.trace:
+            print ":: RECV:", size, ident, flags, code, repr(
+                memoryview(body).tobytes()
+            )
+        return size - 11, ident, flags, code, body
+
+# guards the callbacks of every Reply; contention is rare and brief
+REPLY_LOCK = Lock()
+
+class Reply(object):
+    '''
+    A Reply is returned by Connection.request_async in place of the response
+    to a request; the input worker fills it in when the response arrives, and
+    any thread may wait on it using get(), or register a callback with then().
+    '''
+
+    # when the request was sent, if the connection is collecting stats
+    started = None
+
+    def __init__(self, conn, ident, code):
+        self.conn = conn
+        self.ident = ident
+        self.code = code
+        self.value = None
+        self.event = Event()
+        self.callbacks = []
+
+    def __repr__(self):
+        return '<reply %s for %04x%s>' % (
+            self.ident, self.code, '' if self.done() else ', pending'
+        )
+
+    def put(self, value):
+        'internal to the i/o thread; supplies the (code, buf) response'
+        self.value = value
+        with REPLY_LOCK:
+            self.event.set()
+            callbacks, self.callbacks = self.callbacks, ()
+        for func in callbacks:
+            func(self)
+
+    def then(self, func):
+        'calls func with this reply once the response arrives'
+        with REPLY_LOCK:
+            if not self.event.is_set():
+                return self.callbacks.append(func)
+        func(self)
+
+    def done(self):
+        'true if the response has arrived'
+        return self.event.is_set()
+
+    def get(self, timeout=None):
+        'waits for the response; returns (code, buf), or None on timeout'
+        if not self.event.wait(timeout):
+            return None
+        return self.value
+
+def gather(replies, timeout=None):
+    '''
+    waits for each of a sequence of replies, returning their responses in the
+    same order; responses that did not arrive within timeout will be None
+    '''
+    return list(reply.get(timeout) for reply in replies)
+
 class Connection(Thread):
     '''
     The JDWP Connection is a thread which abstracts the asynchronous JDWP protocol
@@ -111,13 +345,30 @@ class Connection(Thread):
     will be dispatched based on whether they are responses to a previous request,
     or events.  Responses to requests will cause the requesting thread to be
     unblocked, thus simulating a synchronous request.
+
+    Requests may also be pipelined using request_async, which returns a Reply
+    without waiting; at most inflight requests may be outstanding at a time,
+    after which further requests block until a response arrives.
+
+    Each packet is assembled, header and body, in a transmit buffer owned by
+    the connection and passed to the write function as a single memoryview;
+    request_batch assembles several packets to be written at once.  Request
+    bodies may be strings, or JdwpBuffers, which are copied straight into
+    the transmit buffer and then released to the pool kept by buffer().
+
+    If stats is set to an andbug.stats.Stats, each request, response and
+    incoming request is recorded there; if recorder is set to an
+    andbug.log.PacketWriter, every packet is written to it.
     '''
 
-    def __init__(self, read, write):
+    def __init__(self, read, write, inflight=MAX_INFLIGHT):
         Thread.__init__(self)
-        self.xmitbuf = JdwpBuffer()
+        self.xmitdata = bytearray(XMIT_BUFFER_SIZE)
+        self.xmitview = memoryview(self.xmitdata)
         self.recvbuf = JdwpBuffer()
+        self.buffers = []
         self._read = read
+        self._packet = getattr(read, 'packet', None)
         self.write = write
         self.initialized = False
         self.next_id = 3
@@ -125,6 +376,11 @@ class Connection(Thread):
         self.qmap = {}
         self.rmap = {}
         self.xmitlock = Lock()
+        self.window = inflight
+        self.inflight = Semaphore(inflight)
+        self.windowlock = Lock()
+        self.stats = None
+        self.recorder = None
 
     def read(self, sz):
         'read size bytes'
@@ -137,6 +393,8 @@ class Connection(Thread):
     
     def writeIdSzReq(self):
         'write an id size request'
+        if self.recorder is not None:
+            self.recorder.writePacket('>', IDSZ_REQ)
         return self.write(IDSZ_REQ)
 
     def readIdSzRes(self):
@@ -151,10 +409,14 @@ class Connection(Thread):
         if head[1] != 1:
             raise ProtocolError('expected first server message to be 1')
 
-        sizes = self.recvbuf.unpack( 'iiiii', self.read(20) )
+        data = self.read(20)
+        if self.recorder is not None:
+            self.recorder.writePacket('<', HEADER_STRUCT.pack(
+                31, head[1], head[2], head[3]
+            ) + data)
+        sizes = self.recvbuf.unpack( 'iiiii', data )
         self.sizes = sizes
         self.recvbuf.config(*sizes)
-        self.xmitbuf.config(*sizes)
         return None
 
     def readHandshake(self):
@@ -175,12 +437,22 @@ class Connection(Thread):
         data = self.recvbuf.unpack(HEADER_FORMAT, head)
         data[0] -= 11
         return data
+
+    def readPacket(self):
+        'reads a packet and returns [size, id, flags, event, data]'
+        if self._packet is not None:
+            return self._packet()
+        size, ident, flags, code = self.readHeader()
+        return size, ident, flags, code, self.read(size)
     
     def process(self):
         'invoked repeatedly by the processing thread'
 
-        size, ident, flags, code = self.readHeader() #TODO: HANDLE CLOSE
-        data = self.read(size) #TODO: HANDLE CLOSE
+        size, ident, flags, code, data = self.readPacket() #TODO: HANDLE CLOSE
+        if self.recorder is not None:
+            self.recorder.writePacket('<', HEADER_STRUCT.pack(
+                size + 11, ident, flags, code
+            ) + memoryview(data).tobytes())
         try: # We process binds after receiving messages to prevent a race
             while True:
                 self.processBind(*self.bindqueue.get(False))
@@ -198,26 +470,40 @@ class Connection(Thread):
         'internal to i/o thread; performs a query or request bind'
         if qr == 'q':
             self.qmap[ident] = chan
+        elif qr == 'u':
+            self.qmap.pop(ident, None)
         elif qr == 'r':
             self.rmap[ident] = chan
 
     def processRequest(self, ident, code, data):
         'internal to the i/o thread w/ recv ctrl; processes incoming request'
+        if self.stats is not None:
+            self.stats.received(code, len(data) + 11)
         chan = self.rmap.get(code)
         if not chan: return #TODO
-        buf = JdwpBuffer()
-        buf.config(*self.sizes)
-        buf.prepareUnpack(data)
-        return chan.put((ident, buf))
+        return chan.put((ident, self.unpacker(data)))
         
     def processResponse(self, ident, code, data):
         'internal to the i/o thread w/ recv ctrl; processes incoming response'
         chan = self.qmap.pop(ident, None)
         if not chan: return
-        buf = JdwpBuffer()
-        buf.config(*self.sizes)
-        buf.prepareUnpack(data)
-        return chan.put((code, buf))
+        self.inflight.release()
+        stats = self.stats
+        if stats is not None:
+            latency = (time() - chan.started) if chan.started else None
+            stats.received(chan.code, len(data) + 11, latency)
+        return chan.put((code, self.unpacker(data)))
+
+    def unpacker(self, data):
+        'internal to the i/o thread; returns a JdwpBuffer for a packet body'
+        buf = self.buffer()
+        # a memoryview is of the reader's receive buffer, and only valid
+        # until the next read; anything else is ours to unpack in place.
+        if isinstance(data, memoryview):
+            buf.prepareUnpack(data)
+        else:
+            buf.borrow(data)
+        return buf
 
     def hook(self, code, chan):
         '''
@@ -236,36 +522,138 @@ class Connection(Thread):
         self.next_id += 2
         return ident
 
+    def packContent(self, ofs, ident, flags, code, body):
+        '''
+        used internally by the processor; must have xmit control; assembles
+        a packet at ofs in the transmit buffer, returning the offset after it
+        '''
+
+        size = len(body) + 11
+        end = ofs + size
+        if end > len(self.xmitdata):
+            data = bytearray(max(end, len(self.xmitdata) * 2))
+            data[:ofs] = self.xmitview[:ofs]
+            self.xmitdata = data
+            self.xmitview = memoryview(data)
+
+        HEADER_STRUCT.pack_into(self.xmitdata, ofs, size, ident, flags, code)
+        if isinstance(body, JdwpBuffer):
+            body.writeInto(self.xmitdata, ofs + 11)
+        else:
+            self.xmitdata[ofs + 11:end] = body
+        if self.recorder is not None:
+            self.recorder.writePacket('>', self.xmitview[ofs:end].tobytes())
+        return end
+
     def writeContent(self, ident, flags, code, body):
         'used internally by the processor; must have xmit control'
+        end = self.packContent(0, ident, flags, code, body)
+        return self.write(self.xmitview[:end])
 
-        size = len(body) + 11
-        self.xmitbuf.preparePack(11)
-        data = self.xmitbuf.pack(
-            HEADER_FORMAT, size, ident, flags, code
-        )
-        self.write(data)
-        return self.write(body)
+    def abandon(self, replies, slots):
+        '''
+        used internally by the processor; must have xmit control; unbinds the
+        replies to requests that could not be sent, and frees their slots
+        '''
+        for reply in replies:
+            self.bindqueue.put(('u', reply.ident, reply))
+        for i in range(slots):
+            self.inflight.release()
 
     def request(self, code, data='', timeout=None):
         'send a request, then waits for a response; returns response'
-        queue = Queue()
+        return self.request_async(code, data).get(timeout)
+
+    def request_async(self, code, data=''):
+        'send a request without waiting for a response; returns a Reply'
+        self.inflight.acquire()
 
         with self.xmitlock:
             ident = self.acquireIdent()
-            self.bindqueue.put(('q', ident, queue))
-            self.writeContent(ident, 0x0, code, data)
-        
-        try:
-            return queue.get(1, timeout)
-        except EmptyQueue:
-            return None
+            reply = Reply(self, ident, code)
+            self.bindqueue.put(('q', ident, reply))
+            try:
+                if self.stats is not None:
+                    self.stats.sent(code, len(data) + 11)
+                    reply.started = time()
+                self.writeContent(ident, 0x0, code, data)
+            except:
+                self.abandon([reply], 1)
+                raise
+
+        if isinstance(data, JdwpBuffer):
+            self.release(data)
+
+        return reply
+
+    def request_batch(self, requests):
+        '''
+        send a sequence of (code, data) requests, assembling as many as the
+        inflight limit permits into each write; returns a list of Replies
+        '''
+        requests = list(requests)
+        replies = []
+        for i in range(0, len(requests), self.window):
+            batch = requests[i:i + self.window]
+
+            # slots for a batch are taken as a group, so that two batches
+            # cannot each hold part of the window waiting for the rest.
+            with self.windowlock:
+                for req in batch:
+                    self.inflight.acquire()
+
+            with self.xmitlock:
+                stats = self.stats
+                now = time()
+                end = 0
+                bound = []
+                try:
+                    for code, data in batch:
+                        ident = self.acquireIdent()
+                        reply = Reply(self, ident, code)
+                        self.bindqueue.put(('q', ident, reply))
+                        bound.append(reply)
+                        if stats is not None:
+                            stats.sent(code, len(data) + 11)
+                            reply.started = now
+                        end = self.packContent(end, ident, 0x0, code, data)
+                    self.write(self.xmitview[:end])
+                except:
+                    self.abandon(bound, len(batch))
+                    raise
+                replies.extend(bound)
+
+            for code, data in batch:
+                if isinstance(data, JdwpBuffer):
+                    self.release(data)
+
+        return replies
 
     def buffer(self):
-        'returns a JdwpBuffer configured for this connection'
-        buf = JdwpBuffer()
-        buf.config(*self.sizes)
+        '''
+        returns a JdwpBuffer configured for this connection, reusing one that
+        was released if any are pooled; responses are taken from the same pool
+        '''
+        try:
+            buf = self.buffers.pop()
+            hit = True
+        except IndexError:
+            buf = JdwpBuffer()
+            buf.config(*self.sizes)
+            hit = False
+        if self.stats is not None:
+            self.stats.buffer(hit)
         return buf
+
+    def release(self, buf):
+        '''
+        returns a buffer from buffer(), or a response, to the pool once the
+        caller is done with it; it must not be used afterwards.  Buffers that
+        are never released are simply collected.
+        '''
+        if len(self.buffers) < BUFFER_POOL_SIZE:
+            buf.reset()
+            self.buffers.append(buf)
         
     ################################################################# THREAD API
     
@@ -289,4 +677,7 @@ class Connection(Thread):
                 self.process()
         except EOF:
             return
+        finally:
+            if self.recorder is not None:
+                self.recorder.flush()
     
@@ -0,0 +1,724 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under
+## the terms of version 3 of the GNU Lesser General Public License as
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+'''
+The andbug.sim module is a stand-in for a Dalvik process, answering the
+subset of JDWP that andbug.vm uses from a synthetic model: any number of
+classes, each with the same shape of methods, line tables, variables and
+fields, and any number of threads with stacks of a given depth.  Breakpoint
+and method entry or exit requests produce a stream of events at a given rate,
+and every reply may be delayed to mimic a slow device.  Classes may be
+prepared or unloaded while connected, for the ClassPrepare and ClassUnload
+requests that have been set.
+
+A Simulator may listen on a localhost port, for andbug.proto.connect, or be
+attached directly to a Connection over a socket pair:
+
+    sim = Simulator(classes=20000, threads=200, depth=60, latency=0.002)
+    sess = andbug.vm.Session(sim.connect())
+
+The model is generated from indices as it is queried, so large processes
+cost little until their details are requested.  Events ignore suspension.
+'''
+
+import socket, struct
+from time import time, sleep
+from threading import Thread, Lock, Condition
+from Queue import Queue
+import andbug.proto
+from andbug.proto import SocketReader, EOF, HANDSHAKE_MSG, HEADER_STRUCT
+
+## Dalvik uses eight byte identifiers for everything; each kind of object
+## gets its own range so that a stray identifier is caught.
+ID_SIZE = 8
+CLASS_BASE = 0x10000000
+THREAD_BASE = 0x20000000
+OBJECT_BASE = 0x30000000
+STRING_BASE = 0x40000000
+FRAME_BASE = 0x50000000
+ARRAY_BASE = 0x60000000
+METHOD_BASE = 0x1000
+FIELD_BASE = 0x2000
+
+## the classes at the start of every simulated process; synthetic classes
+## follow them.
+SYSTEM_CLASSES = (
+    'Ljava/lang/Object;', 'Ljava/lang/String;', 'Ljava/lang/Thread;', '[B'
+)
+
+## local variables of every method; 'this' has the method's class type.
+SLOTS = (
+    ('this', None), ('count', 'I'), ('label', 'Ljava/lang/String;'),
+    ('flag', 'Z'),
+)
+
+## fields of every class, with their access flags.
+FIELDS = (
+    ('total', 'I', 0x0009), ('label', 'Ljava/lang/String;', 0x0001),
+    ('next', 'Ljava/lang/Object;', 0x0002), ('data', '[B', 0x0002),
+)
+
+## JDWP error codes used by the simulator
+INVALID_THREAD = 10
+INVALID_OBJECT = 20
+INVALID_CLASS = 21
+INVALID_METHOD = 23
+INVALID_FRAME = 30
+INVALID_INDEX = 503
+NOT_IMPLEMENTED = 99
+
+class SimError(Exception):
+    'raised by a request handler to reply with a JDWP error code'
+    def __init__(self, code):
+        Exception.__init__(self, 'simulated error %s' % code)
+        self.code = code
+
+def pack_str(s):
+    return struct.pack('>I', len(s)) + s
+
+def pack_loc(cid, mid, index):
+    return struct.pack('>BQQQ', 1, cid, mid, index)
+
+class Request(object):
+    'a cursor over the body of a request'
+
+    def __init__(self, data):
+        self.data = data
+        self.ofs = 0
+
+    def take(self, fmt):
+        vals = struct.unpack_from(fmt, self.data, self.ofs)
+        self.ofs += struct.calcsize(fmt)
+        return vals
+
+    def u8(self):
+        return self.take('>B')[0]
+
+    def int(self):
+        return self.take('>i')[0]
+
+    def id(self):
+        return self.take('>Q')[0]
+
+    def str(self):
+        sz = self.int()
+        data = self.data[self.ofs:self.ofs + sz]
+        self.ofs += sz
+        return data
+
+    def loc(self):
+        return self.take('>BQQQ')
+
+class Simulator(object):
+    '''
+    A Simulator describes the simulated process; each connection made to it
+    is served by a Channel of its own, sharing the model.
+
+    classes       -- the number of synthetic classes, beyond SYSTEM_CLASSES
+    methods       -- the number of methods in each class
+    lines         -- the number of lines in each method
+    threads       -- the number of threads
+    depth         -- the number of frames on each thread's stack
+    array_size    -- the length of the byte array in each object's data field
+    latency       -- seconds to wait before sending each reply
+    event_rate    -- events per second generated for each connection with a
+                     breakpoint or method entry or exit request set
+    event_limit   -- stops generating events after this many, if set
+    '''
+
+    def __init__(
+        self, classes=100, methods=4, lines=8, threads=10, depth=8,
+        array_size=1024, latency=0.0, event_rate=0, event_limit=None
+    ):
+        self.classCount = len(SYSTEM_CLASSES) + classes
+        self.methodCount = methods
+        self.lineCount = lines
+        self.threadCount = threads
+        self.depth = depth
+        self.arraySize = array_size
+        self.latency = latency
+        self.event_rate = event_rate
+        self.event_limit = event_limit
+        self.listener = None
+        self.channels = []
+        self.lock = Lock()
+        self.classTable = None
+        self.unloaded = set()
+
+    ################################################################## MODEL
+
+    def classJni(self, index):
+        if index < len(SYSTEM_CLASSES):
+            return SYSTEM_CLASSES[index]
+        return 'Lsim/p%i/C%i;' % (index // 100, index)
+
+    def classIndex(self, cid):
+        index = cid - CLASS_BASE
+        if not 0 <= index < self.classCount or index in self.unloaded:
+            raise SimError(INVALID_CLASS)
+        return index
+
+    def methodIndex(self, mid):
+        index = mid - METHOD_BASE
+        if not 0 <= index < self.methodCount:
+            raise SimError(INVALID_METHOD)
+        return index
+
+    def threadIndex(self, tid):
+        index = tid - THREAD_BASE
+        if not 0 <= index < self.threadCount:
+            raise SimError(INVALID_THREAD)
+        return index
+
+    def threadName(self, index):
+        return '<%i> %s' % (index + 1, 'main' if index == 0 else
+                            'Thread-%i' % index)
+
+    def frameLoc(self, thread, depth):
+        'returns the (class index, method index, code index) of a frame'
+        cls = (thread * 7 + depth * 13) % self.classCount
+        return cls, depth % self.methodCount, (depth % self.lineCount) * 4
+
+    def lastLoc(self):
+        return self.lineCount * 4 - 1
+
+    def allClasses(self):
+        'the body of an AllClassesWithGeneric reply, built once'
+        with self.lock:
+            if self.classTable is None:
+                live = list(
+                    i for i in range(self.classCount) if i not in self.unloaded
+                )
+                seq = [struct.pack('>I', len(live))]
+                for i in live:
+                    seq.append(
+                        struct.pack('>BQ', 1, CLASS_BASE + i) +
+                        pack_str(self.classJni(i)) + pack_str('') +
+                        struct.pack('>i', 7)
+                    )
+                self.classTable = ''.join(seq)
+            return self.classTable
+
+    def prepareClasses(self, count=1):
+        'adds count synthetic classes, notifying every channel'
+        with self.lock:
+            first = self.classCount
+            self.classCount += count
+            self.classTable = None
+            channels = list(self.channels)
+        for i in range(first, first + count):
+            data = struct.pack('>QBQ', THREAD_BASE, 1, CLASS_BASE + i) + \
+                pack_str(self.classJni(i)) + struct.pack('>i', 7)
+            for chan in channels:
+                chan.notify(8, data)
+
+    def unloadClass(self, index):
+        'unloads the class with the given index, notifying every channel'
+        with self.lock:
+            self.unloaded.add(index)
+            self.classTable = None
+            channels = list(self.channels)
+        for chan in channels:
+            chan.notify(9, pack_str(self.classJni(index)))
+
+    def objectClass(self, oid):
+        'returns the class index of an object id'
+        if STRING_BASE <= oid < STRING_BASE + self.classCount:
+            return 1
+        elif THREAD_BASE <= oid < THREAD_BASE + self.threadCount:
+            return 2
+        elif OBJECT_BASE <= oid < OBJECT_BASE + self.classCount:
+            return oid - OBJECT_BASE
+        elif ARRAY_BASE <= oid < ARRAY_BASE + self.classCount:
+            return 3
+        raise SimError(INVALID_OBJECT)
+
+    def value(self, jni, cls):
+        'returns a tagged value of type jni, owned by class index cls'
+        if jni == 'I':
+            return struct.pack('>Bi', ord('I'), cls)
+        elif jni == 'Z':
+            return struct.pack('>BB', ord('Z'), cls & 1)
+        elif jni == 'Ljava/lang/String;':
+            return struct.pack('>BQ', ord('s'), STRING_BASE + cls)
+        elif jni == '[B':
+            return struct.pack('>BQ', ord('['), ARRAY_BASE + cls)
+        else:
+            return struct.pack('>BQ', ord('L'), OBJECT_BASE + cls)
+
+    ############################################################## TRANSPORT
+
+    def connect(self, trace=False, record=None):
+        'returns an andbug.proto.Connection to a new Channel'
+        a, b = socket.socketpair()
+        self.serve(b)
+        return andbug.proto.attach(a, trace, record)
+
+    def listen(self, port=0, addr='127.0.0.1'):
+        'serves connections on a TCP port in the background; returns the port'
+        self.listener = socket.socket()
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((addr, port))
+        self.listener.listen(5)
+        t = Thread(target=self.accept, name='Simulator')
+        t.daemon = True
+        t.start()
+        return self.listener.getsockname()[1]
+
+    def accept(self):
+        'internal; accepts connections until the listener is closed'
+        while True:
+            try:
+                sock, addr = self.listener.accept()
+            except socket.error:
+                return
+            self.serve(sock)
+
+    def serve(self, sock):
+        'starts a Channel serving a connected socket; returns the Channel'
+        chan = Channel(self, sock)
+        with self.lock:
+            self.channels.append(chan)
+        chan.start()
+        return chan
+
+    def close(self):
+        'stops listening and closes every channel'
+        if self.listener is not None:
+            self.listener.close()
+            self.listener = None
+        with self.lock:
+            channels, self.channels = self.channels, []
+        for chan in channels:
+            chan.close()
+
+class Channel(object):
+    '''
+    A Channel serves one debugger connection: a reader thread answers
+    requests as they arrive, queueing replies for a writer thread that holds
+    each until its latency has passed, and an emitter thread generates events
+    for the breakpoints that have been set.
+    '''
+
+    def __init__(self, sim, sock):
+        self.sim = sim
+        self.sock = sock
+        self.read = SocketReader(sock)
+        self.outq = Queue()
+        self.closed = False
+        self.next_id = 2
+        self.next_rid = 1
+        self.suspends = 0
+        self.threadSuspends = {}
+        self.events = {}
+        self.classEvents = {}
+        self.disposed = []
+        self.cond = Condition()
+        self.handlers = {
+            0x0101: self.version,
+            0x0102: self.classesBySignature,
+            0x0104: self.allThreads,
+            0x0107: self.idSizes,
+            0x0108: self.suspend,
+            0x0109: self.resume,
+            0x010A: self.exit,
+            0x010E: self.disposeObjects,
+            0x0114: self.allClasses,
+            0x020d: self.signature,
+            0x020e: self.fields,
+            0x020f: self.methods,
+            0x0206: self.staticValues,
+            0x0601: self.lineTable,
+            0x0605: self.variableTable,
+            0x0901: self.referenceType,
+            0x0902: self.objectValues,
+            0x0A01: self.stringValue,
+            0x0d01: self.arrayLength,
+            0x0d02: self.arrayValues,
+            0x0b01: self.threadName,
+            0x0b02: self.threadSuspend,
+            0x0b03: self.threadResume,
+            0x0b04: self.threadStatus,
+            0x0b06: self.frames,
+            0x0b07: self.frameCount,
+            0x0f01: self.setEvent,
+            0x0f02: self.clearEvent,
+            0x1001: self.frameValues,
+        }
+
+    def start(self):
+        for target in (self.run, self.transmit, self.emit):
+            t = Thread(target=target, name='Channel')
+            t.daemon = True
+            t.start()
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notifyAll()
+        self.outq.put(None)
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+        self.sock.close()
+
+    def run(self):
+        'internal; answers requests until the debugger disconnects'
+        try:
+            if self.read(len(HANDSHAKE_MSG)) != HANDSHAKE_MSG:
+                return self.close()
+            self.outq.put((0, HANDSHAKE_MSG))
+            while True:
+                size, ident, flags, code, body = self.read.packet()
+                self.process(ident, code, body.tobytes())
+        except (EOF, socket.error):
+            pass
+        if not self.closed:
+            self.close()
+
+    def process(self, ident, code, data):
+        'internal; answers a request, queueing the reply'
+        func = self.handlers.get(code)
+        try:
+            if func is None:
+                raise SimError(NOT_IMPLEMENTED)
+            body, error = func(Request(data)), 0
+        except SimError as err:
+            body, error = '', err.code
+        except struct.error:
+            body, error = '', 103 # ILLEGAL_ARGUMENT
+        self.outq.put((
+            time() + self.sim.latency,
+            HEADER_STRUCT.pack(len(body) + 11, ident, 0x80, error) + body
+        ))
+
+    def transmit(self):
+        'internal; sends queued packets once they are due'
+        while True:
+            item = self.outq.get()
+            if item is None: return
+            due, data = item
+            delay = due - time()
+            if delay > 0:
+                sleep(delay)
+            try:
+                self.sock.sendall(data)
+            except socket.error:
+                return
+
+    def emit(self):
+        'internal; generates events at the simulator event rate'
+        sim = self.sim
+        rate = sim.event_rate
+        if not rate: return
+        sent = base = 0
+        started = None
+        while True:
+            with self.cond:
+                while not self.events and not self.closed:
+                    self.cond.wait()
+                    started = None
+                if self.closed: return
+                hooks = list(self.events.items())
+            if started is None:
+                started, base = time(), sent
+            due = base + int((time() - started) * rate)
+            if sim.event_limit is not None:
+                due = min(due, sim.event_limit)
+            while sent < due:
+                rid, (kind, cid, mid, index) = hooks[sent % len(hooks)]
+                tid = THREAD_BASE + sent % sim.threadCount
+                body = struct.pack('>BiBiQ', 0, 1, kind, rid, tid)
+                body += pack_loc(cid, mid, index)
+                self.outq.put((0, HEADER_STRUCT.pack(
+                    len(body) + 11, self.next_id, 0, 0x4064
+                ) + body))
+                self.next_id += 2
+                sent += 1
+            if sim.event_limit is not None and sent >= sim.event_limit:
+                return
+            sleep(0.005)
+
+    def notify(self, kind, data):
+        'internal; sends an event to every request set for its kind'
+        with self.cond:
+            rids = sorted(
+                rid for rid, k in self.classEvents.items() if k == kind
+            )
+            if not rids or self.closed: return
+            ident = self.next_id
+            self.next_id += 2
+        body = struct.pack('>Bi', 0, len(rids)) + ''.join(
+            struct.pack('>Bi', kind, rid) + data for rid in rids
+        )
+        self.outq.put((0, HEADER_STRUCT.pack(
+            len(body) + 11, ident, 0, 0x4064
+        ) + body))
+
+    ############################################################ VIRTUAL MACHINE
+
+    def version(self, req):
+        return (
+            pack_str('Simulated Dalvik') + struct.pack('>ii', 1, 6) +
+            pack_str('0') + pack_str('Dalvik')
+        )
+
+    def idSizes(self, req):
+        return struct.pack('>iiiii', *([ID_SIZE] * 5))
+
+    def classesBySignature(self, req):
+        jni = req.str()
+        sim = self.sim
+        seq = []
+        if jni.startswith('Lsim/'):
+            try:
+                index = int(jni[jni.rindex('/C') + 2:-1])
+            except ValueError:
+                index = None
+            if (index is not None and index < sim.classCount and
+                    index not in sim.unloaded and sim.classJni(index) == jni):
+                seq.append(index)
+        elif jni in SYSTEM_CLASSES:
+            seq.append(SYSTEM_CLASSES.index(jni))
+        return struct.pack('>i', len(seq)) + ''.join(
+            struct.pack('>BQi', 1, CLASS_BASE + i, 7) for i in seq
+        )
+
+    def allClasses(self, req):
+        return self.sim.allClasses()
+
+    def allThreads(self, req):
+        ct = self.sim.threadCount
+        return struct.pack('>i', ct) + ''.join(
+            struct.pack('>Q', THREAD_BASE + i) for i in range(ct)
+        )
+
+    def suspend(self, req):
+        self.suspends += 1
+        return ''
+
+    def resume(self, req):
+        if self.suspends > 0:
+            self.suspends -= 1
+        return ''
+
+    def exit(self, req):
+        return ''
+
+    def disposeObjects(self, req):
+        for i in range(req.int()):
+            self.disposed.append(req.take('>Qi'))
+        return ''
+
+    ############################################################ REFERENCE TYPES
+
+    def signature(self, req):
+        return pack_str(self.sim.classJni(self.sim.classIndex(req.id()))) + \
+            pack_str('')
+
+    def fields(self, req):
+        self.sim.classIndex(req.id())
+        return struct.pack('>i', len(FIELDS)) + ''.join(
+            struct.pack('>Q', FIELD_BASE + i) + pack_str(name) +
+            pack_str(jni) + pack_str('') + struct.pack('>i', flags)
+            for i, (name, jni, flags) in enumerate(FIELDS)
+        )
+
+    def methods(self, req):
+        self.sim.classIndex(req.id())
+        ct = self.sim.methodCount
+        return struct.pack('>i', ct) + ''.join(
+            struct.pack('>Q', METHOD_BASE + i) + pack_str('m%i' % i) +
+            pack_str('(IZ)V') + pack_str('') + struct.pack('>i', 1)
+            for i in range(ct)
+        )
+
+    def fieldValues(self, req, cls):
+        seq = []
+        for i in range(req.int()):
+            index = req.id() - FIELD_BASE
+            if not 0 <= index < len(FIELDS):
+                raise SimError(25) # INVALID_FIELDID
+            seq.append(self.sim.value(FIELDS[index][1], cls))
+        return struct.pack('>i', len(seq)) + ''.join(seq)
+
+    def staticValues(self, req):
+        return self.fieldValues(req, self.sim.classIndex(req.id()))
+
+    ##################################################################### METHODS
+
+    def lineTable(self, req):
+        sim = self.sim
+        sim.classIndex(req.id())
+        mth = sim.methodIndex(req.id())
+        ct = sim.lineCount
+        return struct.pack('>QQi', 0, sim.lastLoc(), ct) + ''.join(
+            struct.pack('>Qi', i * 4, mth * 100 + i + 1) for i in range(ct)
+        )
+
+    def variableTable(self, req):
+        sim = self.sim
+        cls = sim.classIndex(req.id())
+        sim.methodIndex(req.id())
+        seq = [struct.pack('>ii', 3, len(SLOTS))]
+        for i, (name, jni) in enumerate(SLOTS):
+            seq.append(
+                struct.pack('>Q', 0) + pack_str(name) +
+                pack_str(jni or sim.classJni(cls)) + pack_str('') +
+                struct.pack('>ii', sim.lastLoc() + 1, i)
+            )
+        return ''.join(seq)
+
+    ##################################################################### OBJECTS
+
+    def referenceType(self, req):
+        return struct.pack(
+            '>BQ', 1, CLASS_BASE + self.sim.objectClass(req.id())
+        )
+
+    def objectValues(self, req):
+        return self.fieldValues(req, self.sim.objectClass(req.id()))
+
+    def stringValue(self, req):
+        sid = req.id()
+        if not STRING_BASE <= sid < STRING_BASE + self.sim.classCount:
+            raise SimError(INVALID_OBJECT)
+        return pack_str('label %i' % (sid - STRING_BASE))
+
+    def arrayIndex(self, oid):
+        if not ARRAY_BASE <= oid < ARRAY_BASE + self.sim.classCount:
+            raise SimError(INVALID_OBJECT)
+        return oid - ARRAY_BASE
+
+    def arrayLength(self, req):
+        self.arrayIndex(req.id())
+        return struct.pack('>i', self.sim.arraySize)
+
+    def arrayValues(self, req):
+        'byte arrays count up from their index, wrapping at 256'
+        self.arrayIndex(req.id())
+        first, length = req.take('>ii')
+        if first < 0 or length < 0 or first + length > self.sim.arraySize:
+            raise SimError(INVALID_INDEX)
+        data = ''.join(chr(i) for i in range(256)) * (length // 256 + 2)
+        ofs = first % 256
+        return struct.pack('>Bi', ord('B'), length) + data[ofs:ofs + length]
+
+    ##################################################################### THREADS
+
+    def threadName(self, req):
+        return pack_str(self.sim.threadName(self.sim.threadIndex(req.id())))
+
+    def threadSuspend(self, req):
+        tid = req.id()
+        self.sim.threadIndex(tid)
+        self.threadSuspends[tid] = self.threadSuspends.get(tid, 0) + 1
+        return ''
+
+    def threadResume(self, req):
+        tid = req.id()
+        self.sim.threadIndex(tid)
+        if self.threadSuspends.get(tid):
+            self.threadSuspends[tid] -= 1
+        return ''
+
+    def threadStatus(self, req):
+        tid = req.id()
+        index = self.sim.threadIndex(tid)
+        suspended = self.suspends or self.threadSuspends.get(tid)
+        return struct.pack('>ii', 1 if index == 0 else 2, 1 if suspended else 0)
+
+    def frames(self, req):
+        sim = self.sim
+        thread = sim.threadIndex(req.id())
+        start, length = req.take('>ii')
+        if length < 0 or start + length > sim.depth:
+            length = sim.depth - start
+        if start < 0 or length < 0:
+            raise SimError(103) # ILLEGAL_ARGUMENT
+        seq = [struct.pack('>i', length)]
+        for depth in range(start, start + length):
+            cls, mth, index = sim.frameLoc(thread, depth)
+            seq.append(
+                struct.pack('>Q', FRAME_BASE + (thread << 16) + depth) +
+                pack_loc(CLASS_BASE + cls, METHOD_BASE + mth, index)
+            )
+        return ''.join(seq)
+
+    def frameCount(self, req):
+        self.sim.threadIndex(req.id())
+        return struct.pack('>i', self.sim.depth)
+
+    def frameValues(self, req):
+        sim = self.sim
+        thread = sim.threadIndex(req.id())
+        fid = req.id() - FRAME_BASE
+        depth = fid & 0xFFFF
+        if (fid >> 16) != thread or depth >= sim.depth:
+            raise SimError(INVALID_FRAME)
+        cls = sim.frameLoc(thread, depth)[0]
+        seq = []
+        for i in range(req.int()):
+            index, tag = req.take('>iB')
+            if not 0 <= index < len(SLOTS):
+                raise SimError(35) # INVALID_SLOT
+            seq.append(sim.value(SLOTS[index][1] or 'L', cls))
+        return struct.pack('>i', len(seq)) + ''.join(seq)
+
+    ###################################################################### EVENTS
+
+    def setEvent(self, req):
+        sim = self.sim
+        kind, policy, ct = req.take('>BBi')
+        loc = (CLASS_BASE + len(SYSTEM_CLASSES) % sim.classCount,
+               METHOD_BASE, 0)
+        for i in range(ct):
+            mod = req.u8()
+            if mod in (1, 2):   # Count, Conditional
+                req.int()
+            elif mod in (3, 11): # ThreadOnly, InstanceOnly
+                req.id()
+            elif mod == 4:      # ClassOnly
+                loc = (req.id(), METHOD_BASE, 0)
+            elif mod in (5, 6, 12): # ClassMatch, ClassExclude, SourceNameMatch
+                req.str()
+            elif mod == 7:      # LocationOnly
+                loc = req.loc()[1:]
+            elif mod == 8:      # ExceptionOnly
+                req.take('>QBB')
+            elif mod == 9:      # FieldOnly
+                req.take('>QQ')
+            elif mod == 10:     # Step
+                req.take('>Qii')
+            else:
+                raise SimError(103) # ILLEGAL_ARGUMENT
+
+        rid = self.next_rid
+        self.next_rid += 1
+        if kind in (2, 40, 41):
+            with self.cond:
+                self.events[rid] = (kind,) + tuple(loc)
+                self.cond.notifyAll()
+        elif kind in (8, 9): # ClassPrepare, ClassUnload
+            with self.cond:
+                self.classEvents[rid] = kind
+        return struct.pack('>i', rid)
+
+    def clearEvent(self, req):
+        kind, rid = req.take('>Bi')
+        with self.cond:
+            self.events.pop(rid, None)
+            self.classEvents.pop(rid, None)
+        return ''
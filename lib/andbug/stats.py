@@ -0,0 +1,199 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under
+## the terms of version 3 of the GNU Lesser General Public License as
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+'''
+The andbug.stats module accumulates traffic statistics for a JDWP connection:
+for each command, the number of requests, bytes sent and received, and a
+histogram of response latencies, along with a count of events by kind.  A
+Stats object is attached to a connection by assigning it to conn.stats.
+The connection also counts how often its pool of JdwpBuffers has one ready.
+'''
+
+from threading import Lock
+from time import time
+
+## Names for the command sets and commands andbug uses, for reports; the
+## codes are (command set << 8) | command, as in andbug.vm.
+COMMAND_NAMES = {
+    0x0101: 'VirtualMachine.Version',
+    0x0102: 'VirtualMachine.ClassesBySignature',
+    0x0104: 'VirtualMachine.AllThreads',
+    0x0107: 'VirtualMachine.IDSizes',
+    0x0108: 'VirtualMachine.Suspend',
+    0x0109: 'VirtualMachine.Resume',
+    0x010A: 'VirtualMachine.Exit',
+    0x010E: 'VirtualMachine.DisposeObjects',
+    0x0114: 'VirtualMachine.AllClassesWithGeneric',
+    0x020d: 'ReferenceType.SignatureWithGeneric',
+    0x020e: 'ReferenceType.FieldsWithGeneric',
+    0x020f: 'ReferenceType.MethodsWithGeneric',
+    0x0206: 'ReferenceType.GetValues',
+    0x0601: 'Method.LineTable',
+    0x0605: 'Method.VariableTableWithGeneric',
+    0x0901: 'ObjectReference.ReferenceType',
+    0x0902: 'ObjectReference.GetValues',
+    0x0903: 'ObjectReference.SetValues',
+    0x0A01: 'StringReference.Value',
+    0x0b01: 'ThreadReference.Name',
+    0x0b02: 'ThreadReference.Suspend',
+    0x0b03: 'ThreadReference.Resume',
+    0x0b04: 'ThreadReference.Status',
+    0x0b06: 'ThreadReference.Frames',
+    0x0b07: 'ThreadReference.FrameCount',
+    0x0d01: 'ArrayReference.Length',
+    0x0d02: 'ArrayReference.GetValues',
+    0x0f01: 'EventRequest.Set',
+    0x0f02: 'EventRequest.Clear',
+    0x1001: 'StackFrame.GetValues',
+    0x1002: 'StackFrame.SetValues',
+    0x4064: 'Event.Composite',
+}
+
+EVENT_NAMES = {
+    1: 'SingleStep',
+    2: 'Breakpoint',
+    4: 'Exception',
+    6: 'ThreadStart',
+    7: 'ThreadDeath',
+    8: 'ClassPrepare',
+    9: 'ClassUnload',
+    20: 'FieldAccess',
+    21: 'FieldModification',
+    40: 'MethodEntry',
+    41: 'MethodExit',
+    90: 'VMStart',
+    99: 'VMDeath',
+}
+
+## upper bounds of the latency histogram buckets, in milliseconds; the last
+## bucket collects everything slower.
+LATENCY_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+def command_name(code):
+    return COMMAND_NAMES.get(code, 'Command.%04x' % code)
+
+def event_name(kind):
+    return EVENT_NAMES.get(kind, 'Event.%i' % kind)
+
+class CommandStats(object):
+    'traffic accumulated for a single command code'
+
+    def __init__(self, code):
+        self.code = code
+        self.count = 0
+        self.sent = 0
+        self.received = 0
+        self.replies = 0
+        self.latency = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def __str__(self):
+        return '%04x %s' % (self.code, command_name(self.code))
+
+    @property
+    def mean(self):
+        'the mean latency of replies, in seconds'
+        return (self.latency / self.replies) if self.replies else 0.0
+
+    def record(self, latency):
+        self.replies += 1
+        self.latency += latency
+        ms = latency * 1000
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if ms < bound: break
+        else:
+            i = len(LATENCY_BUCKETS)
+        self.histogram[i] += 1
+
+class Stats(object):
+    '''
+    Stats is updated by the connection as requests are sent and responses
+    arrive, and by the session as events are dispatched; it may be read at
+    any time from any thread.
+    '''
+
+    def __init__(self):
+        self.lock = Lock()
+        self.reset()
+
+    def reset(self):
+        'discards everything collected so far'
+        with self.lock:
+            self.started = time()
+            self.commands = {}
+            self.events = {}
+            self.pool_hits = 0
+            self.pool_misses = 0
+
+    def command(self, code):
+        'internal; must hold the lock'
+        cmd = self.commands.get(code)
+        if cmd is None:
+            cmd = self.commands[code] = CommandStats(code)
+        return cmd
+
+    def sent(self, code, size):
+        'records a request of size bytes'
+        with self.lock:
+            cmd = self.command(code)
+            cmd.count += 1
+            cmd.sent += size
+
+    def received(self, code, size, latency=None):
+        'records a response or incoming request, and its latency if known'
+        with self.lock:
+            cmd = self.command(code)
+            cmd.received += size
+            if latency is not None:
+                cmd.record(latency)
+
+    def event(self, kind):
+        'records an event of the given kind'
+        with self.lock:
+            self.events[kind] = self.events.get(kind, 0) + 1
+
+    def buffer(self, hit):
+        'records a buffer taken from the pool, or allocated if it was empty'
+        with self.lock:
+            if hit:
+                self.pool_hits += 1
+            else:
+                self.pool_misses += 1
+
+    @property
+    def pool_rate(self):
+        'the fraction of buffers taken from the pool, or None if none were'
+        total = self.pool_hits + self.pool_misses
+        return (float(self.pool_hits) / total) if total else None
+
+    @property
+    def elapsed(self):
+        return time() - self.started
+
+    def summary(self):
+        'returns a list of CommandStats, busiest (by latency) first'
+        with self.lock:
+            seq = list(self.commands.values())
+        seq.sort(key=lambda cmd: (-cmd.latency, -cmd.count))
+        return seq
+
+    def totals(self):
+        'returns (requests, bytes sent, bytes received)'
+        with self.lock:
+            seq = list(self.commands.values())
+        return (
+            sum(cmd.count for cmd in seq),
+            sum(cmd.sent for cmd in seq),
+            sum(cmd.received for cmd in seq)
+        )
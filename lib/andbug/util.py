@@ -116,9 +116,8 @@ def find_dev(dev=None):
         
     return dev
 
-def find_pid(pid, dev=None):
-    'determines the process id for the command based on dev, pid and/or name'
-
+def list_procs(dev=None):
+    'returns (pid, name) for each process on the device'
     ps = ('-s', dev, 'shell', 'ps') if dev else ('shell', 'ps') 
     ps = adb(*ps)
     ps = ps.splitlines()
@@ -126,11 +125,16 @@ def find_pid(pid, dev=None):
     ps = (p.split() for p in ps[1:])
 
     if head.startswith('PID'):
-        ps = ((int(p[0]), p[-1]) for p in ps)
+        return list((int(p[0]), p[-1]) for p in ps)
     elif head.startswith('USER'):
-        ps = ((int(p[1]), p[-1]) for p in ps)
+        return list((int(p[1]), p[-1]) for p in ps)
     else:
         raise ConfigError('could not parse "adb shell ps" output')
+
+def find_pid(pid, dev=None):
+    'determines the process id for the command based on dev, pid and/or name'
+
+    ps = list_procs(dev)
     
     if RE_INT.match(str(pid)):
         pid = int(pid)
@@ -147,3 +151,27 @@ def find_pid(pid, dev=None):
         raise OptionError('process pid or name must be specified')
 
     return pid
+
+RE_VERSION = re.compile('versionCode=([0-9]+)')
+RE_UPDATED = re.compile('lastUpdateTime=([^\r\n]+)')
+
+def find_build(pid, dev=None):
+    '''
+    identifies the build of the package running as pid; returns its name and
+    a version made of its version code and the time it was last installed,
+    or None if dumpsys reports neither
+    '''
+    name = dict(list_procs(dev)).get(int(pid))
+    if name is None:
+        raise OptionError('could not find process %s' % pid)
+    name = name.split(':', 1)[0]
+    args = ('shell', 'dumpsys', 'package', name)
+    info = adb(*(('-s', dev) + args if dev else args))
+    version = RE_VERSION.search(info)
+    updated = RE_UPDATED.search(info)
+    if version is None and updated is None:
+        return None
+    return name, '%s/%s' % (
+        version.group(1) if version else '?',
+        updated.group(1).strip() if updated else '?'
+    )
@@ -12,9 +12,12 @@
 ## You should have received a copy of the GNU Lesser General Public License
 ## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
 
-import andbug, andbug.data, andbug.proto, andbug.errors
+import andbug, andbug.data, andbug.proto, andbug.errors, andbug.stats
+import andbug.options
 import threading, re
-from andbug.data import defer
+from bisect import bisect_left, bisect_right
+from array import array
+from andbug.data import defer, loaded
 from threading import Lock
 from Queue import Queue
 
@@ -38,7 +41,13 @@ class RequestError(Exception):
         Exception.__init__(self, 'request failed, code %s' % code)
         self.code = code
 
+## Elements are created by the hundred thousand while tracing, so each class
+## declares __slots__; a deferred property is kept in a slot named after it
+## with a leading underscore, as andbug.data.defer expects.
+
 class Element(object):
+    __slots__ = ('__weakref__',)
+
     def __repr__(self):
         return '<%s>' % self
 
@@ -46,6 +55,8 @@ class Element(object):
         return '%s:%s' % (type(self).__name__, id(self))
 
 class SessionElement(Element):
+    __slots__ = ('sess',)
+
     def __init__(self, sess):
         self.sess = sess
 
@@ -54,6 +65,8 @@ class SessionElement(Element):
         return self.sess.conn
 
 class Field(SessionElement):
+    __slots__ = ('fid', 'name', 'jni', 'gen', 'flags')
+
     def __init__(self, session, fid):
         SessionElement.__init__(self, session)
         self.fid = fid
@@ -91,6 +104,8 @@ class Field(SessionElement):
         return self.flags & 0x0080
     
 class Value(SessionElement):
+    __slots__ = ()
+
     @property
     def isPrimitive(self):
         return self.TAG in PRIMITIVE_TAGS
@@ -100,6 +115,8 @@ class Value(SessionElement):
         return self.TAG in OBJECT_TAGS
 
 class Frame(SessionElement):
+    __slots__ = ('fid', 'loc', 'tid')
+
     def __init__(self, sess, fid):
         SessionElement.__init__(self, sess)
         self.fid = fid
@@ -122,9 +139,11 @@ class Frame(SessionElement):
 
     @property
     def values(self):
+        if self.native: return {}
+        return self.sess.memo(('values', self.fid), self.load_values, self.tid)
+
+    def load_values(self):
         vals = {}
-        if self.native: return vals
-        
         sess = self.sess
         conn = self.conn
         buf = conn.buffer()
@@ -137,83 +156,75 @@ class Frame(SessionElement):
             buf.packInt(slot.index)
             buf.packU8(slot.tag) #TODO: GENERICS
 
-        code, buf = conn.request(0x1001, buf.data())
+        code, buf = conn.request(0x1001, buf)
         if code != 0:
             raise RequestError(code)
         ct = buf.unpackInt()
 
-        for x in range(0, ct):
-            s = slots[x]
-            vals[s.name] = unpack_value(sess, buf)
+        for s, val in zip(slots, unpack_values(sess, buf, ct)):
+            vals[s.name] = val
+        conn.release(buf)
 
         return vals
 
     def value(self, name):
         if self.native: return None
+        return self.sess.memo(
+            ('value', self.fid, name), lambda: self.load_value(name), self.tid
+        )
+
+    def load_value(self, name):
+        slot = self.loc.slot(name)
+        if slot is None:
+            return None
 
         sess = self.sess
         conn = self.conn
         buf = conn.buffer()
         buf.packObjectId(self.tid)
         buf.packFrameId(self.fid)
-        slots = self.loc.slots
         buf.packInt(1)
-
-        loc = None
-        for i in range(0, len(slots)):
-            if slots[i].name == name:
-                loc = i
-                break
-            else:
-                continue
-
-        if loc is None:
-            return None
-        slot = slots[loc]
         buf.packInt(slot.index)
         buf.packU8(slot.tag) #TODO: GENERICS
 
-        code, buf = conn.request(0x1001, buf.data())
+        code, buf = conn.request(0x1001, buf)
         if code != 0:
             raise RequestError(code)
         if buf.unpackInt() != 1:
             return None
 
-        return unpack_value(sess, buf)
+        val = unpack_value(sess, buf)
+        conn.release(buf)
+        return val
 
     def setValue(self, name, value):
         if self.native: return False
 
+        slot = self.loc.slot(name)
+        if slot is None:
+            return False
+
         sess = self.sess
         conn = self.conn
         buf = conn.buffer()
         buf.packObjectId(self.tid)
         buf.packFrameId(self.fid)
-        slots = self.loc.slots
         buf.packInt(1)
-
-        loc = None
-        for i in range(0, len(slots)):
-            if slots[i].name == name:
-                loc = i
-                break
-            else:
-                continue
-
-        if loc is None:
-            return False
-        slot = slots[loc]
         buf.packInt(slot.index)
         pack_value(sess, buf, value, slot.jni) #TODO: GENERICS
 
-        code, buf = conn.request(0x1002, buf.data())
+        code, buf = conn.request(0x1002, buf)
         if code != 0:
             raise RequestError(code)
+        conn.release(buf)
+        sess.forget(('values', self.fid), ('value', self.fid, name))
 
         return True
 
 class Thread(SessionElement):
     #TODO: promote to Value
+    __slots__ = ('tid',)
+
     def __init__(self, sess, tid):
         SessionElement.__init__(self, sess)
         self.tid = tid
@@ -226,17 +237,22 @@ class Thread(SessionElement):
         conn = self.conn
         buf = conn.buffer()
         buf.packObjectId(self.tid)
-        code, buf = conn.request(0x0b02, buf.data())
+        code, buf = conn.request(0x0b02, buf)
         if code != 0:
             raise RequestError(code)
+        conn.release(buf)
+        self.sess.suspended(self.tid)
 
     def resume(self):
+        self.sess.resumed(self.tid)
+        self.sess.dispose()
         conn = self.conn
         buf = conn.buffer()
         buf.packObjectId(self.tid)
-        code, buf = conn.request(0x0b03, buf.data())
+        code, buf = conn.request(0x0b03, buf)
         if code != 0:
             raise RequestError(code)
+        conn.release(buf)
 
     def packTo(self, buf):
         buf.packObjectId(self.tid)
@@ -246,10 +262,11 @@ class Thread(SessionElement):
         buf = conn.buffer()
         # 40:EK_METHOD_ENTRY, 1: SP_THREAD, 1 condition of type ClassRef (3), ThreadId
         buf.pack('11i1t', 40, 1, 1, 3, self.tid) 
-        code, buf = conn.request(0x0f01, buf.data())
+        code, buf = conn.request(0x0f01, buf)
         if code != 0:
             raise RequestError(code)
         eid = buf.unpackInt()
+        conn.release(buf)
         return self.sess.hook(eid, func, queue, self)
 
     @classmethod
@@ -259,12 +276,15 @@ class Thread(SessionElement):
 
     @property
     def frames(self):
+        return self.sess.memo(('frames', self.tid), self.load_frames, self.tid)
+
+    def load_frames(self):
         tid = self.tid
         sess = self.sess
         conn = self.conn
         buf = conn.buffer()
         buf.pack('oii', self.tid, 0, -1)
-        code, buf = conn.request(0x0b06, buf.data())
+        code, buf = conn.request(0x0b06, buf)
         if code != 0:
             raise RequestError(code)
         ct = buf.unpackInt()
@@ -275,39 +295,57 @@ class Thread(SessionElement):
             f.tid = tid
             return f
 
-        return andbug.data.view(load_frame() for i in range(0,ct))
+        frames = andbug.data.view(load_frame() for i in range(0,ct))
+        conn.release(buf)
+        return frames
 
     @property
     def frameCount(self):   
+        return self.sess.memo(
+            ('frameCount', self.tid), self.load_frameCount, self.tid
+        )
+
+    def load_frameCount(self):
         conn = self.conn
         buf = conn.buffer()
         buf.packObjectId(self.tid)
-        code, buf = conn.request(0x0b07, buf.data())
+        code, buf = conn.request(0x0b07, buf)
         if code != 0:
             raise RequestError(code)
-        return buf.unpackInt()
+        ct = buf.unpackInt()
+        conn.release(buf)
+        return ct
 
     @property
     def name(self): 
+        return self.sess.memo(('name', self.tid), self.load_name, self.tid)
+
+    def load_name(self):
         conn = self.conn
         buf = conn.buffer()
         buf.packObjectId(self.tid)
-        code, buf = conn.request(0x0b01, buf.data())
+        code, buf = conn.request(0x0b01, buf)
         if code != 0:
             raise RequestError(code)
-        return buf.unpackStr()
+        name = buf.unpackStr()
+        conn.release(buf)
+        return name
 
     @property
     def status(self):
+        return self.sess.memo(('status', self.tid), self.load_status, self.tid)
+
+    def load_status(self):
         conn = self.conn
         buf = conn.buffer()
         buf.packObjectId(self.tid)
-        code, buf = conn.request(0x0b04, buf.data())
+        code, buf = conn.request(0x0b04, buf)
         if code != 0:
             raise RequestError(code)
 
         threadStatus = buf.unpackInt()
         suspendStatus = buf.unpackInt()
+        conn.release(buf)
 
         return threadStatus, suspendStatus
 
@@ -328,12 +366,13 @@ class Thread(SessionElement):
         return szSS[sStatus]
 
 class Location(SessionElement):
+    __slots__ = ('tid', 'mid', 'loc')
+
     def __init__(self, sess, tid, mid, loc):
         SessionElement.__init__(self, sess)
         self.tid = tid
         self.mid = mid
         self.loc = loc
-        self.line = None
 
     def __str__(self):
         if self.loc >= 0:
@@ -366,10 +405,11 @@ class Location(SessionElement):
         buf.pack('11i1', eventKind, 1, 1, 7)
 
         self.packTo(buf)
-        code, buf = conn.request(0x0f01, buf.data())
+        code, buf = conn.request(0x0f01, buf)
         if code != 0:
             raise RequestError(code)
         eid = buf.unpackInt()
+        conn.release(buf)
         return self.sess.hook(eid, func, queue, self)
 
     @property
@@ -384,18 +424,33 @@ class Location(SessionElement):
     def klass(self):
         return self.sess.pool(Class, self.sess, self.tid)
 
+    @property
+    def line(self):
+        'the source line this location falls in, or None if it is unknown'
+        if self.native: return None
+        try:
+            table = self.method.lineTable
+        except RequestError:
+            return None
+        return table.line(self.loc)
+
     @property
     def slots(self):
-        l = self.loc
-        def filter_slots():
-            for slot in self.method.slots:
-                f = slot.firstLoc
-                if f > l: continue
-                if l - f > slot.locLength: continue
-                yield slot
-        return tuple() if self.native else tuple(filter_slots())
+        'the slots visible at this location'
+        if self.native: return ()
+        return self.method.slotTable.visible(self.loc)
+
+    def slot(self, name):
+        'returns the slot visible at this location with the name, or None'
+        if self.native: return None
+        return self.method.slotTable.named(self.loc, name)
 
 class Slot(SessionElement):
+    __slots__ = (
+        'tid', 'mid', 'index', '_firstLoc', '_locLength', '_name', '_jni',
+        '_gen'
+    )
+
     def __init__(self, sess, tid, mid, index):
         SessionElement.__init__(self, sess)
         self.tid = tid
@@ -423,6 +478,11 @@ class Slot(SessionElement):
         return ord(self.jni[0])
 
 class Method(SessionElement):
+    __slots__ = (
+        'tid', 'mid', '_name', '_jni', '_gen', '_flags', '_firstLoc',
+        '_lastLoc', '_lineTable', '_slots', '_slotTable'
+    )
+
     def __init__(self, sess, tid, mid):
         SessionElement.__init__(self, sess)
         self.tid = tid
@@ -440,36 +500,49 @@ class Method(SessionElement):
     def __repr__(self):
         return '<method %s>' % self
 
+    def fromCache(self, kind):
+        'returns the entry of the given kind for this method in the metadata cache'
+        cache = self.sess.cache
+        if cache is None: return None
+        return cache.get(self.klass.jni, kind, (self.name, self.jni))
+
+    def toCache(self, kind, table):
+        cache = self.sess.cache
+        if cache is None: return
+        cache.put(self.klass.jni, kind, (self.name, self.jni), table)
+
     def load_line_table(self):
+        table = self.fromCache('lines')
+        if table is not None:
+            return self.set_line_table(*table)
+
+        conn = self.conn
+        buf = conn.buffer()
+        buf.pack('om', self.tid, self.mid)
+        code, buf = conn.request(0x0601, buf)
+        if code != 0: raise RequestError(code)
+        self.unpackLineTable(buf)
+        conn.release(buf)
+
+    def unpackLineTable(self, buf):
+        'sets the line table from a Method.LineTable reply'
+        f, l, ct = buf.unpack('88i')
+        fmt = buf.format('8i')
+        locs = list(fmt.unpack(buf) for i in range(0,ct))
+        self.toCache('lines', (f, l, locs))
+        self.set_line_table(f, l, locs)
+
+    def set_line_table(self, f, l, locs):
+        'sets the line table from (code index, line) pairs'
         sess = self.sess
-        conn = sess.conn
         pool = sess.pool
         tid = self.tid
         mid = self.mid
-        data = conn.buffer().pack('om', tid, mid)
-        code, buf = conn.request(0x0601, data)
-        if code != 0: raise RequestError(code)
-        
-        f, l, ct = buf.unpack('88i')
-        if (f == -1) or (l == -1):             
-            self.firstLoc = None
-            self.lastLoc = None
-            self.lineTable = andbug.data.view([])
-            #TODO: How do we handle native methods?
- 
+        #TODO: How do we handle native methods?
+        # a native method has f and l of -1, and no entries
         self.firstLoc = pool(Location, sess, tid, mid, f)
         self.lastLoc = pool(Location, sess, tid, mid, l)
-
-        ll = {}
-        self.lineTable = ll
-        def line_loc():
-            loc, line  = buf.unpack('8i')
-            loc = pool(Location, sess, tid, mid, loc)
-            loc.line = line
-            ll[line] = loc
-
-        for i in range(0,ct):
-            line_loc()
+        self.lineTable = LineTable(self, locs)
     
     firstLoc = defer(load_line_table, 'firstLoc')
     lastLoc = defer(load_line_table, 'lastLoc')
@@ -484,20 +557,35 @@ class Method(SessionElement):
     flags = defer(load_method, 'flags' )
 
     def load_slot_table(self):
-        sess = self.sess
+        table = self.fromCache('slots')
+        if table is not None:
+            return self.set_slot_table(table)
+
         conn = self.conn
-        pool = sess.pool
-        tid = self.tid
-        mid = self.mid
-        data = conn.buffer().pack('om', tid, mid)
-        code, buf = conn.request(0x0605, data)
+        buf = conn.buffer()
+        buf.pack('om', self.tid, self.mid)
+        code, buf = conn.request(0x0605, buf)
         if code != 0: raise RequestError(code)
-    
+        self.unpackSlotTable(buf)
+        conn.release(buf)
+
+    def unpackSlotTable(self, buf):
+        'sets the slots from a Method.VariableTableWithGeneric reply'
         act, sct = buf.unpack('ii')
         #TODO: Do we care about the argCnt ?
+        fmt = buf.format('l$$$ii')
+        table = list(fmt.unpack(buf) for i in range(0,sct))
+        self.toCache('slots', table)
+        self.set_slot_table(table)
+
+    def set_slot_table(self, table):
+        'sets the slots from (code index, name, jni, gen, length, index)'
+        sess = self.sess
+        pool = sess.pool
+        tid = self.tid
+        mid = self.mid
          
-        def load_slot():
-            codeIndex, name, jni, gen, codeLen, index  = buf.unpack('l$$$ii')
+        def load_slot(codeIndex, name, jni, gen, codeLen, index):
             slot = pool(Slot, sess, tid, mid, index)
             slot.firstLoc = codeIndex
             slot.locLength = codeLen
@@ -507,11 +595,137 @@ class Method(SessionElement):
 
             return slot
 
-        self.slots = andbug.data.view(load_slot() for i in range(0,sct))
+        self.slots = andbug.data.view(load_slot(*row) for row in table)
+        self.slotTable = SlotTable(self.slots)
 
     slots = defer(load_slot_table, 'slots')
+    slotTable = defer(load_slot_table, 'slotTable')
+
+class LineTable(object):
+    '''
+    The line table of a method, kept as parallel columns of code indices and
+    line numbers sorted by code index, so that no Location is made for an
+    entry until one is asked for.  Code indices are held as native longs,
+    since this array module has no 'q'; dex code fits in 32 bits.  A code
+    index falls in the line of the last entry at or before it.  For
+    breakpoints, it also acts as a mapping from each line to the Location
+    of its first code index.
+    '''
+
+    __slots__ = ('method', 'codes', 'lines', 'byLine', 'lineCodes')
+
+    def __init__(self, method, locs):
+        locs = sorted(locs)
+        self.method = method
+        self.codes = array('l', (loc for loc, line in locs))
+        self.lines = array('i', (line for loc, line in locs))
+        self.byLine = None
+        self.lineCodes = None
+
+    def __len__(self):
+        return len(self.codes)
+
+    def line(self, loc):
+        'returns the line holding the code index loc, or None'
+        i = bisect_right(self.codes, loc) - 1
+        if i < 0: return None
+        return self.lines[i]
+
+    def index(self):
+        'internal; sorts the entries again by line, the first time needed'
+        if self.byLine is None:
+            order = sorted(
+                xrange(len(self.codes)),
+                key=lambda i: (self.lines[i], self.codes[i])
+            )
+            self.lineCodes = array('l', (self.codes[i] for i in order))
+            self.byLine = array('i', (self.lines[i] for i in order))
+
+    def codeIndices(self, line):
+        'returns the code indices that begin line, in order'
+        self.index()
+        i = bisect_left(self.byLine, line)
+        j = bisect_right(self.byLine, line, i)
+        return self.lineCodes[i:j]
+
+    def keys(self):
+        'returns the lines with an entry, in order'
+        self.index()
+        seq = []
+        for line in self.byLine:
+            if not seq or seq[-1] != line:
+                seq.append(line)
+        return seq
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __contains__(self, line):
+        return len(self.codeIndices(line)) > 0
+
+    def get(self, line, default=None):
+        'returns the Location of the first code index of line, or default'
+        codes = self.codeIndices(line)
+        if not codes: return default
+        m = self.method
+        return m.sess.pool(Location, m.sess, m.tid, m.mid, codes[0])
+
+    def __getitem__(self, line):
+        loc = self.get(line)
+        if loc is None: raise KeyError(line)
+        return loc
+
+class SlotTable(object):
+    '''
+    The slots of a method, divided into the intervals of code indices over
+    which the same slots are visible; a slot is visible from its firstLoc
+    through firstLoc + locLength.  Each interval keeps its slots, in the
+    order of the variable table, and a map of them by name, and the interval
+    found for a code index is remembered, so that the frames of a deep stack
+    share the work.
+    '''
+
+    __slots__ = ('bounds', 'spans', 'found')
+
+    def __init__(self, slots):
+        bounds = set()
+        for slot in slots:
+            bounds.add(slot.firstLoc)
+            bounds.add(slot.firstLoc + slot.locLength + 1)
+        self.bounds = array('l', sorted(bounds))
+        self.spans = []
+        for start in self.bounds:
+            seq = tuple(
+                slot for slot in slots
+                if slot.firstLoc <= start <= slot.firstLoc + slot.locLength
+            )
+            # the first slot with a name wins, as it did in a linear search
+            self.spans.append((seq, dict((s.name, s) for s in reversed(seq))))
+        self.found = {}
+
+    def span(self, loc):
+        'internal; returns (slots, slots by name) for the code index loc'
+        span = self.found.get(loc)
+        if span is None:
+            i = bisect_right(self.bounds, loc) - 1
+            span = self.spans[i] if i >= 0 else ((), {})
+            self.found[loc] = span
+        return span
+
+    def visible(self, loc):
+        'returns the slots visible at the code index loc'
+        return self.span(loc)[0]
+
+    def named(self, loc, name):
+        'returns the slot with the name visible at loc, or None'
+        return self.span(loc)[1].get(name)
 
 class RefType(SessionElement):
+    __slots__ = (
+        'tag', 'tid', 'flags', '_gen', '_jni', '_fieldList', '_methodList',
+        '_methodByJni', '_methodByName'
+    )
+
     def __init__(self, sess, tag, tid):
         SessionElement.__init__(self, sess)
         self.tag = tag
@@ -534,24 +748,29 @@ class RefType(SessionElement):
         conn = self.conn
         buf = conn.buffer()
         self.packTo(buf)
-        code, buf = conn.request(0x020d, buf.data())
+        code, buf = conn.request(0x020d, buf)
         if code != 0:
             raise RequestError(code)
         self.jni = buf.unpackStr()
         self.gen = buf.unpackStr()
+        conn.release(buf)
 
     gen = defer(load_signature, 'gen')
     jni = defer(load_signature, 'jni')
 
     def load_fields(self):
-        sess = self.sess
         conn = self.conn
         buf = conn.buffer()
         buf.pack("t", self.tid)
-        code, buf = conn.request(0x020e, buf.data())
+        code, buf = conn.request(0x020e, buf)
         if code != 0:
             raise RequestError(code)
+        self.unpackFields(buf)
+        conn.release(buf)
 
+    def unpackFields(self, buf):
+        'sets fieldList from a ReferenceType.FieldsWithGeneric reply'
+        sess = self.sess
         ct = buf.unpackU32()
 
         def load_field():
@@ -579,32 +798,37 @@ class RefType(SessionElement):
         buf.packInt(len(fields))
         for field in fields:
             buf.packFieldId(field.fid)
-        code, buf = conn.request(0x0206, buf.data())
+        code, buf = conn.request(0x0206, buf)
         if code != 0:
             raise RequestError(code)
         ct = buf.unpackInt()
 
         vals = {}
-        for x in range(ct):
-            f = fields[x]
-            vals[f.name] = unpack_value(sess, buf)
+        for f, val in zip(fields, unpack_values(sess, buf, ct)):
+            vals[f.name] = val
+        conn.release(buf)
         return vals
 
     def load_methods(self):
-        tid = self.tid
-        sess = self.sess
         conn = self.conn
-        pool = sess.pool
         buf = conn.buffer()
-        buf.pack("t", tid)
-        code, buf = conn.request(0x020f, buf.data())
+        buf.pack("t", self.tid)
+        code, buf = conn.request(0x020f, buf)
         if code != 0:
             raise RequestError(code)
+        self.unpackMethods(buf)
+        conn.release(buf)
 
+    def unpackMethods(self, buf):
+        'sets methodList and its indexes from a MethodsWithGeneric reply'
+        tid = self.tid
+        sess = self.sess
+        pool = sess.pool
         ct = buf.unpackU32()
+        fmt = buf.format('m$$$i')
                 
         def load_method():
-            mid, name, jni, gen, flags = buf.unpack('m$$$i')
+            mid, name, jni, gen, flags = fmt.unpack(buf)
             obj = pool(Method, sess, tid, mid)
             obj.name = name
             obj.jni = jni
@@ -632,12 +856,27 @@ class RefType(SessionElement):
     methodByJni = defer(load_methods, 'methodByJni')
     methodByName = defer(load_methods, 'methodByName')
 
+    def methodsNamed(self, query):
+        '''
+        returns the methods with names matching query, which may be a name,
+        a glob or a compiled regex
+        '''
+        if isinstance(query, basestring) and not andbug.options.is_glob(query):
+            return list(self.methodByName[query])
+        if isinstance(query, basestring):
+            query = andbug.options.compile_glob(query)[1]
+        seq = []
+        for name in sorted(self.methodByName.keys()):
+            if query.match(name):
+                seq.extend(self.methodByName[name])
+        return seq
+
     def methods(self, name=None, jni=None):
         if name and jni:
-            seq = self.methodByName[name]
-            seq = filter(x in seq, self.methodByJni[jni])
+            seq = self.methodsNamed(name)
+            seq = list(x for x in self.methodByJni[jni] if x in seq)
         elif name:
-            seq = andbug.data.view(self.methodByName[name])
+            seq = self.methodsNamed(name)
         elif jni:
             seq = self.methodByJni[jni]
         else:
@@ -653,6 +892,8 @@ class RefType(SessionElement):
         return name
 
 class Class(RefType): 
+    __slots__ = ()
+
     def __init__(self, sess, tid):
         RefType.__init__(self, sess, 'L', tid)
         
@@ -667,10 +908,11 @@ class Class(RefType):
         buf = conn.buffer()
         # 40:EK_METHOD_ENTRY, 1: SP_THREAD, 1 condition of type ClassRef (4)
         buf.pack('11i1t', 40, 1, 1, 4, self.tid) 
-        code, buf = conn.request(0x0f01, buf.data())
+        code, buf = conn.request(0x0f01, buf)
         if code != 0:
             raise RequestError(code)
         eid = buf.unpackInt()
+        conn.release(buf)
         return self.sess.hook(eid, func, queue, self)
         
     #def load_class(self):
@@ -683,6 +925,147 @@ class Class(RefType):
     #gen = defer(load_class, 'gen')
     #flags = defer(load_class, 'flags')
 
+class ClassTable(object):
+    '''
+    the classes loaded by the process, as decoded in bulk from a
+    VirtualMachine.AllClassesWithGeneric reply: parallel arrays of tags,
+    type ids and status flags, and a table of interned signatures.  Class
+    objects are only created for the entries that are used, and are then
+    kept by the table.  The session adds and removes entries as classes are
+    prepared and unloaded; a removed entry is only marked dead, so that the
+    indices held by views of the table stay valid.
+    '''
+
+    def __init__(self, sess, tags, tids, jnis, gens, flags):
+        self.sess = sess
+        self.tags = tags
+        self.tids = tids
+        self.jnis = jnis
+        self.gens = gens
+        self.flags = flags
+        self.items = [None] * len(tids)
+        self.dead = set()
+        self.index = None
+        self.order = None
+        self.keys = None
+
+    def __len__(self):
+        return len(self.items) - len(self.dead)
+
+    def __getitem__(self, i):
+        obj = self.items[i]
+        if obj is None:
+            sess = self.sess
+            tid = self.tids[i]
+            obj = sess.pool(Class, sess, tid)
+            obj.tag = self.tags[i]
+            obj.tid = tid
+            obj.jni = self.jnis[i]
+            gen = self.gens[i]
+            if gen is not None:
+                obj.gen = gen
+            obj.flags = self.flags[i]
+            self.items[i] = obj
+        return obj
+
+    def __iter__(self):
+        for i in self.live():
+            yield self[i]
+
+    def live(self):
+        'returns the indices of the entries that have not been removed'
+        dead = self.dead
+        if not dead:
+            return xrange(len(self.items))
+        return list(i for i in xrange(len(self.items)) if i not in dead)
+
+    def signatures(self):
+        'returns the signatures of the classes in the table'
+        jnis = self.jnis
+        return list(jnis[i] for i in self.live())
+
+    def find(self, jni):
+        'returns the indices of the classes with the signature jni'
+        index = self.index
+        if index is None:
+            index = {}
+            jnis = self.jnis
+            for i in self.live():
+                sig = jnis[i]
+                seq = index.get(sig)
+                if seq is None:
+                    index[sig] = [i]
+                else:
+                    seq.append(i)
+            self.index = index
+        return index.get(jni, ())
+
+    def lookup(self, jni):
+        'returns a list of the classes with the signature jni'
+        return list(self[i] for i in self.find(jni))
+
+    def sort(self):
+        'internal; orders the entries by signature, for prefix searches'
+        if self.order is None:
+            jnis = self.jnis
+            self.order = sorted(self.live(), key=jnis.__getitem__)
+            self.keys = list(jnis[i] for i in self.order)
+
+    def prefixed(self, prefix):
+        'returns the indices of the classes with signatures starting with prefix'
+        self.sort()
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + '\xff', lo)
+        return self.order[lo:hi]
+
+    def match(self, query):
+        '''
+        returns the indices of the classes matching query, a glob over
+        signatures as in andbug.options.compile_glob, or a compiled regex;
+        a glob only tests the classes sharing its literal prefix
+        '''
+        if isinstance(query, basestring):
+            prefix, query = andbug.options.compile_glob(query)
+            seq = self.prefixed(prefix)
+        else:
+            seq = self.live()
+        jnis = self.jnis
+        test = query.match
+        return list(i for i in seq if test(jnis[i]))
+
+    def select(self, indices):
+        'returns a view of the classes at indices, created as they are used'
+        return andbug.data.lazyview(indices, self.__getitem__)
+
+    def add(self, tag, tid, jni, gen, flags):
+        'appends a class, unless the table already has it'
+        for i in self.find(jni):
+            if self.tids[i] == tid: return
+        self.tags.append(tag)
+        self.tids.append(tid)
+        self.jnis.append(intern(jni))
+        self.gens.append(gen)
+        self.flags.append(flags)
+        self.items.append(None)
+        i = len(self.items) - 1
+        self.index.setdefault(self.jnis[i], []).append(i)
+        if self.order is not None:
+            pos = bisect_left(self.keys, self.jnis[i])
+            self.keys.insert(pos, self.jnis[i])
+            self.order.insert(pos, i)
+
+    def remove(self, jni):
+        'marks the classes with the signature jni dead'
+        seq = self.find(jni)
+        if not seq: return
+        self.dead.update(seq)
+        del self.index[jni]
+        if self.order is not None:
+            lo = bisect_left(self.keys, jni)
+            hi = lo + len(seq)
+            del self.keys[lo:hi]
+            del self.order[lo:hi]
+
 class Hook(SessionElement):
     def __init__(self, sess, ident, func = None, queue = None, origin = None):
         SessionElement.__init__(self, sess)
@@ -718,10 +1101,11 @@ class Hook(SessionElement):
         # 40:EK_METHOD_ENTRY
         buf.pack('1i', 40, int(self.ident))
         # 0x0f02 = {15, 2} EventRequest.Clear
-        code, unknown = conn.request(0x0f02, buf.data())
+        code, unknown = conn.request(0x0f02, buf)
         # fixme: check what a hell is the value stored in unknown
         if code != 0:
             raise RequestError(code)
+        conn.release(unknown)
 
         with self.sess.ectl:
             del self.sess.emap[self.ident]
@@ -742,10 +1126,9 @@ def unpack_events(sess, buf):
             yield im(sess, buf)
 
 def unpack_event_location(sess, buf):
-    rid = buf.unpackInt()
-    t = Thread.unpackFrom(sess, buf)
-    loc = Location.unpackFrom(sess, buf)
-    return rid, t, loc
+    rid, tid, tag, cid, mid, loc = buf.format('io1tm8').unpack(buf)
+    pool = sess.pool
+    return rid, pool(Thread, sess, tid), pool(Location, sess, cid, mid, loc)
 
 # Breakpoint
 register_unpack_impl(2, unpack_event_location)
@@ -754,13 +1137,43 @@ register_unpack_impl(40, unpack_event_location)
 # MothodExit
 register_unpack_impl(41, unpack_event_location)
 
+def unpack_event_class_prepare(sess, buf):
+    rid, tid, tag, cid, jni, flags = buf.format('io1t$i').unpack(buf)
+    return rid, tag, cid, jni, flags
+
+def unpack_event_class_unload(sess, buf):
+    return buf.unpack('i$')
+
+# ClassPrepare
+register_unpack_impl(8, unpack_event_class_prepare)
+# ClassUnload
+register_unpack_impl(9, unpack_event_class_unload)
+
+## the number of recently used elements a session keeps alive; older ones are
+## kept only as long as something else references them.
+POOL_SIZE = 8192
+
+## the ids of unused objects are disposed of in the process before the next
+## request for threads or classes once this many are queued, and on resume.
+DISPOSE_BATCH = 256
+
 class Session(object):
-    def __init__(self, conn):
-        self.pool = andbug.data.pool()
+    def __init__(self, conn, cache=None, poolSize=POOL_SIZE):
+        self.pool = andbug.data.pool(poolSize, self.evicted)
         self.conn = conn
+        self.cache = cache
+        self.disposals = []
+        self.dlock = Lock()
         self.emap = {}
         self.ectl = Lock()
         self.evtq = Queue()
+        self.clock = threading.RLock()
+        self.mlock = Lock()
+        self.epoch = None
+        self.suspends = 0
+        self.threadEpochs = {}
+        self.classCache = {}
+        self.classHooks = None
         conn.hook(0x4064, self.evtq)
         self.ethd = threading.Thread(
             name='Session', target=self.run
@@ -777,54 +1190,296 @@ class Session(object):
 
     def processEvent(self, ident, buf):
         pol, ct = buf.unpack('1i')
-
+        stats = self.conn.stats
+        evts = []
         for i in range(0,ct):
             ek = buf.unpackU8()
+            if stats is not None:
+                stats.event(ek)
             im = unpack_impl[ek]
             if im is None:
                 raise RequestError(ek)
-            evt = im(self, buf)
+            evts.append(im(self, buf))
+        self.conn.release(buf)
+
+        # each thread is suspended once by a composite, however many of its
+        # events it holds
+        if pol == 2: # SP_ALL
+            self.suspended()
+        elif pol == 1: # SP_EVENT_THREAD
+            tids = set(
+                evt[1].tid for evt in evts if isinstance(evt[1], Thread)
+            )
+            for tid in tids:
+                self.suspended(tid)
+
+        for evt in evts:
             with self.ectl:
                 hook = self.emap.get(evt[0])
             if hook is not None:
                 hook.put(evt[1:])
-                          
-    def load_classes(self):
-        code, buf = self.conn.request(0x0114)
-        if code != 0:
-            raise RequestError(code)
 
-        def load_class():
-            tag, tid, jni, gen, flags = buf.unpack('1t$$i')
-            obj = self.pool(Class, self, tid)
-            obj.tag = tag
-            obj.tid = tid
-            obj.jni = jni
-            obj.gen = gen
-            obj.flags = flags
-            return obj 
-                        
-        ct = buf.unpackU32()
+    def load_classes(self):
+        with self.clock:
+            self.watchClasses()
+            code, buf = self.conn.request(0x0114)
+            if code != 0:
+                raise RequestError(code)
+            ct = buf.unpackU32()
+            self.classTable = ClassTable(self, *buf.unpackClassTable(ct))
+            self.conn.release(buf)
+
+    classTable = defer(load_classes, 'classTable')
+
+    def loadedClassTable(self):
+        'returns the class table if it has been loaded, without loading it'
+        return getattr(self, '_classTable', None)
+
+    def watchClasses(self):
+        '''
+        sets ClassPrepare and ClassUnload requests, without suspension, so
+        the class table and the classes found by signature are kept current
+        '''
+        conn = self.conn
+        with self.clock:
+            if self.classHooks is not None: return
+            hooks = []
+            for kind, func in (
+                (8, self.classPrepared), (9, self.classUnloaded)
+            ):
+                buf = conn.buffer()
+                # 0: SP_NONE, no conditions
+                buf.pack('11i', kind, 0, 0)
+                code, buf = conn.request(0x0f01, buf)
+                if code != 0:
+                    raise RequestError(code)
+                hooks.append(self.hook(buf.unpackInt(), func, origin=self))
+                conn.release(buf)
+            self.classHooks = hooks
+
+    def classPrepared(self, evt):
+        tag, tid, jni, flags = evt
+        with self.clock:
+            table = self.loadedClassTable()
+            if table is not None:
+                table.add(tag, tid, jni, None, flags)
+            seq = self.classCache.get(jni)
+            if seq is not None and not any(c.tid == tid for c in seq):
+                seq.append(self.poolClass(tag, tid, jni, flags))
+
+    def classUnloaded(self, evt):
+        jni, = evt
+        with self.clock:
+            table = self.loadedClassTable()
+            if table is not None:
+                table.remove(jni)
+            self.classCache.pop(jni, None)
+
+    def poolClass(self, tag, tid, jni, flags):
+        obj = self.pool(Class, self, tid)
+        obj.tag = tag
+        obj.tid = tid
+        obj.jni = jni
+        obj.flags = flags
+        return obj
+
+    def classesBySignature(self, jni):
+        '''
+        returns a list of the classes with the signature jni, using
+        VirtualMachine.ClassesBySignature rather than loading every class
+        '''
+        conn = self.conn
+        with self.clock:
+            seq = self.classCache.get(jni)
+            if seq is not None:
+                return list(seq)
+            self.watchClasses()
+            buf = conn.buffer()
+            buf.packStr(jni)
+            code, buf = conn.request(0x0102, buf)
+            if code != 0:
+                raise RequestError(code)
+            ct = buf.unpackInt()
+            fmt = buf.format('1ti')
+            seq = []
+            for i in range(ct):
+                tag, tid, flags = fmt.unpack(buf)
+                seq.append(self.poolClass(tag, tid, jni, flags))
+            conn.release(buf)
+            self.classCache[jni] = seq
+            return list(seq)
 
-        self.classList = andbug.data.view(load_class() for i in range(0, ct))
-        self.classByJni = andbug.data.multidict()
-        for item in self.classList:
-            self.classByJni[item.jni] = item
+    @property
+    def classList(self):
+        'a view of every loaded class; this creates a Class for each'
+        return andbug.data.view(self.classTable)
 
-    classList = defer(load_classes, 'classList')
-    classByJni = defer(load_classes, 'classByJni')
+    @property
+    def stats(self):
+        'the andbug.stats.Stats collected for this session, or None'
+        return self.conn.stats
+
+    def collectStats(self, enable=True):
+        '''
+        starts collecting per-command and per-event statistics, or stops if
+        enable is False; returns the Stats object being collected
+        '''
+        if not enable:
+            self.conn.stats = None
+        elif self.conn.stats is None:
+            self.conn.stats = andbug.stats.Stats()
+        return self.conn.stats
 
     def classes(self, jni=None):
-        if jni:
-            seq = self.classByJni[jni]
-        else:
-            seq = self.classList
+        '''
+        returns a view of the classes with the signature jni, or matching it
+        if it is a glob such as 'Lcom/example/**;' or a compiled regex, or
+        of every class if jni is None
+        '''
+        self.settle()
+        if not jni:
+            return andbug.data.view(self.classTable)
+        if not isinstance(jni, basestring) or andbug.options.is_glob(jni):
+            with self.clock:
+                table = self.classTable
+                return table.select(table.match(jni))
+        with self.clock:
+            table = self.loadedClassTable()
+            if table is not None:
+                seq = table.lookup(jni)
+            else:
+                seq = self.classesBySignature(jni)
         return andbug.data.view(seq)
     
+    def evicted(self, gone):
+        'internal; queues the ids of collected objects for disposal'
+        seq = list(
+            (ident[2], count) for ident, count in gone
+            if issubclass(ident[0], (Object, Thread))
+        )
+        if not seq: return
+        with self.dlock:
+            self.disposals.extend(seq)
+
+    def settle(self):
+        '''
+        internal; disposes of the ids queued by the pool once there are
+        DISPOSE_BATCH of them; called before requests made for the user,
+        never from a pool lookup
+        '''
+        with self.dlock:
+            if len(self.disposals) < DISPOSE_BATCH: return
+        self.dispose()
+
+    def dispose(self, seq=None):
+        '''
+        tells the process, with VirtualMachine.DisposeObjects, that the
+        session holds no more references to the objects in seq, a list of
+        (object id, times received); by default, those queued by the pool
+        '''
+        if seq is None:
+            with self.dlock:
+                seq, self.disposals = self.disposals, []
+        if not seq: return
+        conn = self.conn
+        buf = conn.buffer()
+        buf.packInt(len(seq))
+        fmt = buf.format('oi')
+        for oid, count in seq:
+            fmt.packInto(buf, oid, count)
+        reply = conn.request_async(0x010E, buf)
+        reply.then(lambda reply: conn.release(reply.value[1]))
+
+    def memo(self, key, load, tid=None):
+        '''
+        returns load(), remembering the result under key until the current
+        suspend epoch ends: while the process is suspended, or thread tid is,
+        what is read from it cannot change, so it is read only once
+        '''
+        with self.mlock:
+            if tid is None:
+                epoch = self.epoch
+            else:
+                epoch = self.threadEpoch(tid)[1]
+        if epoch is None:
+            return load()
+        try:
+            return epoch[key]
+        except KeyError:
+            pass
+        val = load()
+        epoch[key] = val
+        return val
+
+    def forget(self, *keys):
+        'internal; drops values memoised under keys, after writing them'
+        with self.mlock:
+            epochs = [self.epoch] + list(e for c, e in self.threadEpochs.values())
+        for epoch in epochs:
+            if epoch is None: continue
+            for key in keys:
+                epoch.pop(key, None)
+
+    def threadEpoch(self, tid):
+        '''
+        internal; returns the suspend count of thread tid and its epoch, or
+        None if it is running; a thread first seen while the process is
+        suspended counts each suspension of the process.  Holds mlock.
+        '''
+        entry = self.threadEpochs.get(tid)
+        if entry is None:
+            if not self.suspends:
+                return 0, None
+            entry = self.threadEpochs[tid] = (self.suspends, {})
+        return entry
+
+    def suspended(self, tid=None):
+        '''
+        internal; starts or nests a suspend epoch for the process, which
+        suspends every thread once more, or for a thread
+        '''
+        with self.mlock:
+            if tid is None:
+                self.suspends += 1
+                if self.epoch is None:
+                    self.epoch = {}
+                tids = list(self.threadEpochs)
+            else:
+                tids = (tid,)
+            for tid in tids:
+                count, epoch = self.threadEpoch(tid)
+                if epoch is None:
+                    epoch = {}
+                self.threadEpochs[tid] = (count + 1, epoch)
+
+    def resumed(self, tid=None):
+        '''
+        internal; ends a level of suspension of the process, which resumes
+        every thread once, or of a thread, dropping the epochs that end
+        '''
+        with self.mlock:
+            if tid is None:
+                tids = list(self.threadEpochs)
+                self.suspends = max(0, self.suspends - 1)
+                if not self.suspends:
+                    self.epoch = None
+            else:
+                tids = (tid,)
+            for tid in tids:
+                count, epoch = self.threadEpoch(tid)
+                if count > 1:
+                    self.threadEpochs[tid] = (count - 1, epoch)
+                elif self.suspends:
+                    # keeps the thread running while the process is not
+                    self.threadEpochs[tid] = (0, None)
+                else:
+                    self.threadEpochs.pop(tid, None)
+
     def suspend(self):
         code, buf = self.conn.request(0x0108, '')
         if code != 0:
             raise RequestError(code)
+        self.suspended()
 
     @property
     def count(self):
@@ -833,6 +1488,8 @@ class Session(object):
             raise RequestError(code)
 
     def resume(self):
+        self.resumed()
+        self.dispose()
         code, buf = self.conn.request(0x0109, '')
         if code != 0:
             raise RequestError(code)
@@ -846,6 +1503,7 @@ class Session(object):
             raise RequestError(code)
 
     def threads(self, name=None):
+        self.settle()
         pool = self.pool
         code, buf = self.conn.request(0x0104, '')
         if code != 0:
@@ -856,19 +1514,105 @@ class Session(object):
             tid = buf.unpackObjectId()
             return pool(Thread, self, tid)
 
-        seq = (load_thread() for x in range(0,ct))
+        seq = list(load_thread() for x in range(0,ct))
+        self.conn.release(buf)
         if name is not None:
+            names = self.threadNames(seq)
             if rx_dalvik_tname.match(name):
-                seq = (t for t in seq if t.name == name)
+                seq = (t for t, n in zip(seq, names) if n == name)
             else:
                 name = str(name)
                 name = name if not re.match('^\d+$', name) else '<' + name + '>'
-                seq = (t for t in seq if name in t.name.split(' ',1))
+                seq = (t for t, n in zip(seq, names) if name in n.split(' ',1))
         return andbug.data.view(seq)
 
+    def prefetch(
+        self, classes, methods=True, lines=True, slots=False, fields=False
+    ):
+        '''
+        loads the metadata of many classes at once: their method lists and
+        fields, then the line and variable tables of their methods, each
+        kind sent as one pipelined burst of requests rather than a request
+        at a time.  The replies fill the same deferred properties that would
+        otherwise be loaded on first use; anything already loaded or in the
+        metadata cache is not requested again, and requests that fail are
+        left to fail when the property is used.
+        '''
+        classes = list(classes)
+        reqs = []
+        for c in classes:
+            if (methods or lines or slots) and not loaded(c, 'methodList'):
+                reqs.append((0x020f, (c.tid,), c.unpackMethods))
+            if fields and not loaded(c, 'fieldList'):
+                reqs.append((0x020e, (c.tid,), c.unpackFields))
+        self.fetch('t', reqs)
+
+        if not (lines or slots): return
+        reqs = []
+        for c in classes:
+            if not loaded(c, 'methodList'): continue
+            for m in c.methodList:
+                if lines and not loaded(m, 'lineTable'):
+                    table = m.fromCache('lines')
+                    if table is not None:
+                        m.set_line_table(*table)
+                    else:
+                        reqs.append((0x0601, (m.tid, m.mid), m.unpackLineTable))
+                if slots and not loaded(m, 'slots'):
+                    table = m.fromCache('slots')
+                    if table is not None:
+                        m.set_slot_table(table)
+                    else:
+                        reqs.append((0x0605, (m.tid, m.mid), m.unpackSlotTable))
+        self.fetch('om', reqs)
+        self.flush()
+
+    def flush(self):
+        'writes any metadata added to the cache of the session'
+        if self.cache is not None:
+            self.cache.flush()
+
+    def fetch(self, fmt, reqs):
+        '''
+        sends (code, args, func) requests as one pipelined batch, with args
+        packed using fmt, and passes each successful reply to its func
+        '''
+        if not reqs: return
+        conn = self.conn
+        buf = conn.buffer()
+        fmt = buf.format(fmt)
+        conn.release(buf)
+        replies = conn.request_batch(
+            (code, fmt.pack(*args)) for code, args, func in reqs
+        )
+        for (code, args, func), reply in zip(reqs, replies):
+            code, buf = reply.get()
+            if code == 0:
+                func(buf)
+            conn.release(buf)
+
+    def threadNames(self, threads):
+        'fetches the names of several threads using pipelined requests'
+        conn = self.conn
+        buf = conn.buffer()
+        fmt = buf.format('o')
+        replies = conn.request_batch(
+            (0x0b01, fmt.pack(t.tid)) for t in threads
+        )
+        conn.release(buf)
+        names = []
+        for code, buf in andbug.proto.gather(replies):
+            if code != 0:
+                raise RequestError(code)
+            names.append(buf.unpackStr())
+            conn.release(buf)
+        return names
+
 rx_dalvik_tname = re.compile('^<[0-9]+> .*$')
 
 class Object(Value):
+    __slots__ = ('oid', '_refType')
+
     def __init__(self, sess, oid):
         if oid == 0: raise andbug.errors.VoidError()
         SessionElement.__init__(self, sess)
@@ -905,10 +1649,11 @@ class Object(Value):
         conn = self.sess.conn
         buf = conn.buffer()
         self.packTo(buf)
-        code, buf = conn.request(0x0901, buf.data())
+        code, buf = conn.request(0x0901, buf)
         if code != 0:
             raise RequestError(code)
         self.refType = RefType.unpackFrom(self.sess, buf)
+        conn.release(buf)
     
     refType = defer(load_refType, 'refType')
 
@@ -923,6 +1668,9 @@ class Object(Value):
 
     @property
     def fields(self):
+        return self.sess.memo(('fields', self.oid), self.load_fields)
+
+    def load_fields(self):
         sess = self.sess
         conn = self.conn
         buf = conn.buffer()
@@ -931,18 +1679,23 @@ class Object(Value):
         buf.packInt(len(fields))
         for field in fields:
             buf.packFieldId(field.fid)
-        code, buf = conn.request(0x0902, buf.data())
+        code, buf = conn.request(0x0902, buf)
         if code != 0:
             raise RequestError(code)
         ct = buf.unpackInt()
         vals = {}
-        for x in range(ct):
-            f = fields[x]
-            vals[f.name] = unpack_value(sess, buf)
+        for f, val in zip(fields, unpack_values(sess, buf, ct)):
+            vals[f.name] = val
+        conn.release(buf)
 
         return vals
 
     def field(self, name):
+        return self.sess.memo(
+            ('field', self.oid, name), lambda: self.load_field(name)
+        )
+
+    def load_field(self, name):
         sess = self.sess
         conn = self.conn
         buf = conn.buffer()
@@ -962,12 +1715,14 @@ class Object(Value):
             return None
         field = fields[loc]
         buf.packFieldId(field.fid)
-        code, buf = conn.request(0x0902, buf.data())
+        code, buf = conn.request(0x0902, buf)
         if code != 0:
             raise RequestError(code)
         if buf.unpackInt() != 1:
             return None
-        return unpack_value(sess, buf)
+        val = unpack_value(sess, buf)
+        conn.release(buf)
+        return val
 
 
     def setField(self, name, value):
@@ -992,9 +1747,11 @@ class Object(Value):
         buf.packFieldId(field.fid)
         #TODO: WTF: ord(field.jni) !?
         pack_value(sess, buf, value, field.jni[0])
-        code, buf = conn.request(0x0903, buf.data())
+        code, buf = conn.request(0x0903, buf)
         if code != 0:
             raise RequestError(code)
+        conn.release(buf)
+        sess.forget(('fields', self.oid), ('field', self.oid, name))
         return True
 
 ## with andbug.screed.item(str(obj)):
@@ -1002,6 +1759,8 @@ class Object(Value):
 ##        obj.dump()
 
 class Array(Object):
+    __slots__ = ()
+
     def __repr__(self):
         data = self.getSlice()
 
@@ -1010,9 +1769,12 @@ class Array(Object):
         # different encoding implications.
 
         if self.jni == '[C':
-            return repr(''.join(data))
-        elif self.jni == '[B':
-            return repr(''.join(chr(c) for c in data))
+            return repr(u''.join(unichr(c) for c in data))
+        elif self.jni == '[Z':
+            return repr(tuple(c != '\0' for c in data))
+        elif isinstance(data, array):
+            # the typed container is an implementation detail
+            return repr(tuple(data))
         else:
             return repr(data)
 
@@ -1028,19 +1790,26 @@ class Array(Object):
     def __iter__(self): return iter(self.getSlice())
 
     def __str__(self):
-        return str(self.getSlice())
+        return repr(self)
         
     @property
     def length(self):
         conn = self.conn
         buf = conn.buffer()
         self.packTo(buf)
-        code, buf = conn.request(0x0d01, buf.data())        
+        code, buf = conn.request(0x0d01, buf)        
         if code != 0:
             raise RequestError(code)
-        return buf.unpackInt()
+        ct = buf.unpackInt()
+        conn.release(buf)
+        return ct
 
     def getSlice(self, first=0, last=-1):
+        '''
+        returns the elements from first to last; primitive elements are
+        returned as a string for byte and boolean arrays, and otherwise as an
+        array.array, while objects are returned as a tuple
+        '''
         length = self.length
         if first > length:
             raise IndexError('first offset (%s) past length of array' % first)
@@ -1058,14 +1827,21 @@ class Array(Object):
             first, last = last, first
         
         count = last - first
-        if not count: return []
-
         conn = self.conn
+        if not count:
+            tag = ord(self.jni[1])
+            if tag not in PRIMITIVE_TAGS: return ()
+            # an empty slice has the type of any other slice of this array
+            buf = conn.buffer()
+            data = buf.unpackArray(tag, 0)
+            conn.release(buf)
+            return data
+
         buf = conn.buffer()
         self.packTo(buf)
         buf.packInt(first)
         buf.packInt(count)
-        code, buf = conn.request(0x0d02, buf.data())
+        code, buf = conn.request(0x0d02, buf)
         if code != 0:
             raise RequestError(code)
         tag = buf.unpackU8()
@@ -1073,14 +1849,18 @@ class Array(Object):
         
         sess = self.sess
         if tag in OBJECT_TAGS:
-            return tuple(unpack_value(sess, buf) for i in range(ct))
+            data = tuple(unpack_value(sess, buf) for i in range(ct))
         else:
-            return tuple(unpack_value(sess, buf, tag) for i in range(ct))
+            data = buf.unpackArray(tag, ct)
+        conn.release(buf)
+        return data
 
 PRIMITIVE_TAGS = set(ord(c) for c in 'BCFDIJSVZ')
-OBJECT_TAGS = set(ord(c) for c in 'stglcL')
+OBJECT_TAGS = set(ord(c) for c in 'stglcL[')
 
 class String(Object):
+    __slots__ = ()
+
     def __repr__(self):
         return '#' + repr(str(self))
 
@@ -1089,27 +1869,41 @@ class String(Object):
 
     @property
     def data(self):
+        return self.sess.memo(('data', self.oid), self.load_data)
+
+    def load_data(self):
         conn = self.conn
         buf = conn.buffer()
         self.packTo(buf)
-        code, buf = conn.request(0x0A01, buf.data())
+        code, buf = conn.request(0x0A01, buf)
         if code != 0:
             raise RequestError(code)
-        return buf.unpackStr()
+        data = buf.unpackStr()
+        conn.release(buf)
+        return data
+
+def unpack_char(code):
+    return chr(code) if code < 256 else unichr(code)
+
+def unpack_byte(code):
+    return code - 0x100 if code & 0x80 else code
+
+def unpack_short(code):
+    return code - 0x10000 if code & 0x8000 else code
 
 unpack_value_impl = [None,] * 256
 def register_unpack_value(tag, func):
     for t in tag:
         unpack_value_impl[ord(t)] = func
 
-register_unpack_value('B', lambda p, b: b.unpackU8())
-register_unpack_value('C', lambda p, b: chr(b.unpackU8()))
-register_unpack_value('F', lambda p, b: b.unpackFloat()) #TODO: TEST
-register_unpack_value('D', lambda p, b: b.unpackDouble()) #TODO:TEST
+register_unpack_value('B', lambda p, b: unpack_byte(b.unpackU8()))
+register_unpack_value('C', lambda p, b: unpack_char(b.unpackU16()))
+register_unpack_value('F', lambda p, b: b.unpackFloat())
+register_unpack_value('D', lambda p, b: b.unpackDouble())
 register_unpack_value('I', lambda p, b: b.unpackInt())
 register_unpack_value('J', lambda p, b: b.unpackLong())
-register_unpack_value('S', lambda p, b: b.unpackShort()) #TODO: TEST
-register_unpack_value('V', lambda p, b: b.unpackVoid())
+register_unpack_value('S', lambda p, b: unpack_short(b.unpackU16()))
+register_unpack_value('V', lambda p, b: None)
 register_unpack_value('Z', lambda p, b: (True if b.unpackU8() else False))
 register_unpack_value('L', Object.unpackFrom)
 register_unpack_value('tglc', Object.unpackFrom) #TODO: IMPL
@@ -1124,12 +1918,40 @@ def unpack_value(sess, buf, tag = None):
     else:
         return fn(sess, buf)
 
+## the element class for each object tag, used by unpack_values
+value_types = dict((ord(t), Object) for t in 'tglcL')
+value_types[ord('s')] = String
+value_types[ord('[')] = Array
+
+def unpack_values(sess, buf, count):
+    '''
+    unpacks a run of count tagged values, such as the body of a GetValues
+    reply; the codec decodes the run in one call, and only nonzero object
+    ids are wrapped, in a single pass through the session pool
+    '''
+    seq = buf.unpackTaggedValues(count)
+    vals = []
+    idents = []
+    where = []
+    for tag, val in seq:
+        impl = value_types.get(tag)
+        if impl is not None:
+            if val:
+                where.append(len(vals))
+                idents.append((impl, sess, val))
+            val = None
+        vals.append(val)
+    if idents:
+        for i, obj in zip(where, sess.pool.many(idents)):
+            vals[i] = obj
+    return vals
+
 pack_value_impl = [None,] * 256
 def register_pack_value(tag, func):
     for t in tag:
         pack_value_impl[ord(t)] = func
 
-register_pack_value('B', lambda p, b, v: b.packU8(int(v)))
+register_pack_value('B', lambda p, b, v: b.packU8(int(v) & 0xFF))
 register_pack_value('F', lambda p, b, v: b.packFloat(float(v))) #TODO: TEST
 register_pack_value('D', lambda p, b, v: b.packDouble(float(v))) #TODO:TEST
 register_pack_value('I', lambda p, b, v: b.packInt(int(v)))
@@ -1152,8 +1974,15 @@ def pack_value(sess, buf, value, tag = None):
         buf.packU8(tag)
         return fn(sess, buf, value)
 
-def connect(pid, dev=None):
-    'connects using proto.forward() to the process associated with this context'
-    conn = andbug.proto.connect(andbug.proto.forward(pid, dev))
-    return andbug.vm.Session(conn)
+def connect(pid, dev=None, record=None, cache=None):
+    '''
+    connects using proto.forward() to the process associated with this
+    context; cache may be an andbug.cache.MetadataCache for its build
+    '''
+    conn = andbug.proto.connect(andbug.proto.forward(pid, dev), record=record)
+    return andbug.vm.Session(conn, cache)
+
+def replay(path, paced=True, cache=None):
+    'returns a Session replaying a recording made with connect(record=path)'
+    return andbug.vm.Session(andbug.proto.replay(path, paced), cache)
 
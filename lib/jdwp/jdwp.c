@@ -1,17 +1,20 @@
-/* Generated by Pyrex 0.9.9 on Tue Jun  7 11:35:03 2011 */
+/* Generated by Cython 0.29.37 */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
-#include "structmember.h"
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-#if PY_VERSION_HEX < 0x02050000
-  typedef int Py_ssize_t;
-  #define PY_SSIZE_T_MAX INT_MAX
-  #define PY_SSIZE_T_MIN INT_MIN
-  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
-  #define PyInt_AsSsize_t(o)	PyInt_AsLong(o)
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
 #endif
 #if !defined(WIN32) && !defined(MS_WINDOWS)
   #ifndef __stdcall
@@ -20,2133 +23,19440 @@
   #ifndef __cdecl
     #define __cdecl
   #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
 #endif
-#ifdef __cplusplus
-#define __PYX_EXTERN_C extern "C"
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
 #else
-#define __PYX_EXTERN_C extern
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
-#include "wire.h"
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
 
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
 
-typedef struct {PyObject **p; int i; char *s; long n;} __Pyx_StringTabEntry; /*proto*/
+#define __PYX_HAVE__jdwp
+#define __PYX_HAVE_API__jdwp
+/* Early includes */
+#include <string.h>
+#include <stdio.h>
+#include "wire.h"
+#include "arpa/inet.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
 
-static PyObject *__pyx_m;
-static PyObject *__pyx_b;
-static int __pyx_lineno;
-static char *__pyx_filename;
-static char **__pyx_f;
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
 
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
 
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
 
-static int __Pyx_GetStarArgs(PyObject **args, PyObject **kwds, char *kwd_list[],     Py_ssize_t nargs, PyObject **args2, PyObject **kwds2, char rqd_kwds[]); /*proto*/
 
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
 
-static int __Pyx_SetVtable(PyObject *dict, void *vtable); /*proto*/
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
 
-static PyObject *__Pyx_CreateClass(PyObject *bases, PyObject *dict, PyObject *name, char *modname); /*proto*/
 
-static void __Pyx_AddTraceback(char *funcname); /*proto*/
+static const char *__pyx_f[] = {
+  "jdwp.pyx",
+  "stringsource",
+  "type.pxd",
+};
 
-/* Declarations from jdwp */
+/*--- Type declarations ---*/
+struct __pyx_obj_4jdwp_JdwpFormat;
+struct __pyx_obj_4jdwp_JdwpBuffer;
 
+/* "jdwp.pyx":192
+ * 	return formats
+ * 
+ * cdef class JdwpFormat:             # <<<<<<<<<<<<<<
+ * 	'''
+ * 	A JdwpFormat is a format string compiled for a configuration of ID sizes,
+ */
+struct __pyx_obj_4jdwp_JdwpFormat {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_4jdwp_JdwpFormat *__pyx_vtab;
+  PyObject *format;
+  int size;
+  int count;
+  PyObject *widths;
+};
 
-/* Declarations from implementation of jdwp */
 
+/* "jdwp.pyx":348
+ * 		return self.decode(&buf.buf, 0)
+ * 
+ * cdef class JdwpBuffer:             # <<<<<<<<<<<<<<
+ * 	cdef jdwp_buffer buf
+ * 	cdef dict formats
+ */
 struct __pyx_obj_4jdwp_JdwpBuffer {
   PyObject_HEAD
   struct __pyx_vtabstruct_4jdwp_JdwpBuffer *__pyx_vtab;
   jdwp_buffer buf;
+  PyObject *formats;
+  Py_buffer view;
+  int viewing;
+};
+
+
+
+/* "jdwp.pyx":192
+ * 	return formats
+ * 
+ * cdef class JdwpFormat:             # <<<<<<<<<<<<<<
+ * 	'''
+ * 	A JdwpFormat is a format string compiled for a configuration of ID sizes,
+ */
+
+struct __pyx_vtabstruct_4jdwp_JdwpFormat {
+  Py_ssize_t (*measure)(struct __pyx_obj_4jdwp_JdwpFormat *, PyObject *);
+  int (*encode)(struct __pyx_obj_4jdwp_JdwpFormat *, unsigned char *, PyObject *);
+  PyObject *(*decode)(struct __pyx_obj_4jdwp_JdwpFormat *, jdwp_buffer *, int);
+  int (*append)(struct __pyx_obj_4jdwp_JdwpFormat *, struct __pyx_obj_4jdwp_JdwpBuffer *, PyObject *);
 };
+static struct __pyx_vtabstruct_4jdwp_JdwpFormat *__pyx_vtabptr_4jdwp_JdwpFormat;
+
 
+/* "jdwp.pyx":348
+ * 		return self.decode(&buf.buf, 0)
+ * 
+ * cdef class JdwpBuffer:             # <<<<<<<<<<<<<<
+ * 	cdef jdwp_buffer buf
+ * 	cdef dict formats
+ */
 
 struct __pyx_vtabstruct_4jdwp_JdwpBuffer {
-  PyObject *(*size)(struct __pyx_obj_4jdwp_JdwpBuffer *,PyObject *,PyObject *);
+  PyObject *(*unview)(struct __pyx_obj_4jdwp_JdwpBuffer *);
+  struct __pyx_obj_4jdwp_JdwpFormat *(*format)(struct __pyx_obj_4jdwp_JdwpBuffer *, PyObject *, int __pyx_skip_dispatch);
 };
 static struct __pyx_vtabstruct_4jdwp_JdwpBuffer *__pyx_vtabptr_4jdwp_JdwpBuffer;
 
-static PyTypeObject *__pyx_ptype_4jdwp_JdwpBuffer = 0;
-static PyObject *__pyx_f_4jdwp_einz(int); /*proto*/
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
-static char __pyx_k1[] = "code";
-static char __pyx_k2[] = "mesg";
-static char __pyx_k3[] = "jdwp-error (%s): %s";
-static char __pyx_k4[] = "JdwpError";
-static char __pyx_k5[] = "";
-static char __pyx_k6[] = "preparePack";
-static char __pyx_k7[] = "packStr";
-static char __pyx_k8[] = "prepareUnpack";
-static char __pyx_k9[] = "unpackStr";
-static char __pyx_k10[] = "jdwp";
-static char __pyx_k11[] = "__init__";
-static char __pyx_k12[] = "__str__";
-
-static PyObject *__pyx_n_JdwpError;
-static PyObject *__pyx_n___init__;
-static PyObject *__pyx_n___str__;
-static PyObject *__pyx_n_code;
-static PyObject *__pyx_n_jdwp;
-static PyObject *__pyx_n_mesg;
-static PyObject *__pyx_n_packStr;
-static PyObject *__pyx_n_preparePack;
-static PyObject *__pyx_n_prepareUnpack;
-static PyObject *__pyx_n_unpackStr;
-
-static PyObject *__pyx_k3p;
-static PyObject *__pyx_k5p;
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
 
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_n_JdwpError, 1, __pyx_k4, sizeof(__pyx_k4)},
-  {&__pyx_n___init__, 1, __pyx_k11, sizeof(__pyx_k11)},
-  {&__pyx_n___str__, 1, __pyx_k12, sizeof(__pyx_k12)},
-  {&__pyx_n_code, 1, __pyx_k1, sizeof(__pyx_k1)},
-  {&__pyx_n_jdwp, 1, __pyx_k10, sizeof(__pyx_k10)},
-  {&__pyx_n_mesg, 1, __pyx_k2, sizeof(__pyx_k2)},
-  {&__pyx_n_packStr, 1, __pyx_k7, sizeof(__pyx_k7)},
-  {&__pyx_n_preparePack, 1, __pyx_k6, sizeof(__pyx_k6)},
-  {&__pyx_n_prepareUnpack, 1, __pyx_k8, sizeof(__pyx_k8)},
-  {&__pyx_n_unpackStr, 1, __pyx_k9, sizeof(__pyx_k9)},
-  {&__pyx_k3p, 0, __pyx_k3, sizeof(__pyx_k3)},
-  {&__pyx_k5p, 0, __pyx_k5, sizeof(__pyx_k5)},
-  {0, 0, 0, 0}
-};
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
 
-static PyObject *__pyx_d1;
-static PyObject *__pyx_d2;
-static PyObject *__pyx_d3;
-static PyObject *__pyx_d4;
-static PyObject *__pyx_d5;
-static PyObject *__pyx_d6;
-static PyObject *__pyx_d7;
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
 
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
 
-/* Implementation of jdwp */
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
 
-static PyObject *__pyx_f_4jdwp_9JdwpError___init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4jdwp_9JdwpError___init__ = {"__init__", (PyCFunction)__pyx_f_4jdwp_9JdwpError___init__, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_f_4jdwp_9JdwpError___init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_v_code = 0;
-  PyObject *__pyx_r;
-  Py_ssize_t __pyx_1;
-  PyObject *__pyx_2 = 0;
-  static char *__pyx_argnames[] = {"self","code",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "OO", __pyx_argnames, &__pyx_v_self, &__pyx_v_code)) return 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_code);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":69 */
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_code, __pyx_v_code) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; goto __pyx_L1;}
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":70 */
-  __pyx_1 = PyInt_AsSsize_t(__pyx_v_code); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 70; goto __pyx_L1;}
-  __pyx_2 = PyString_FromString((jdwp_en_errors[__pyx_1])); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 70; goto __pyx_L1;}
-  if (PyObject_SetAttr(__pyx_v_self, __pyx_n_mesg, __pyx_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 70; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  __Pyx_AddTraceback("jdwp.JdwpError.__init__");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_code);
-  return __pyx_r;
-}
+/* PyObjectSetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
+#else
+#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
+#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
+#endif
 
-static PyObject *__pyx_f_4jdwp_9JdwpError___str__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_4jdwp_9JdwpError___str__ = {"__str__", (PyCFunction)__pyx_f_4jdwp_9JdwpError___str__, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_f_4jdwp_9JdwpError___str__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_self = 0;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  static char *__pyx_argnames[] = {"self",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O", __pyx_argnames, &__pyx_v_self)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_code); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; goto __pyx_L1;}
-  __pyx_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_mesg); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; goto __pyx_L1;}
-  __pyx_3 = PyTuple_New(2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; goto __pyx_L1;}
-  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_1);
-  PyTuple_SET_ITEM(__pyx_3, 1, __pyx_2);
-  __pyx_1 = 0;
-  __pyx_2 = 0;
-  __pyx_1 = PyNumber_Remainder(__pyx_k3p, __pyx_3); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 73; goto __pyx_L1;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  __Pyx_AddTraceback("jdwp.JdwpError.__str__");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
 }
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
 
-static PyObject *__pyx_f_4jdwp_einz(int __pyx_v_code) {
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":77 */
-  __pyx_1 = (__pyx_v_code == 0);
-  if (__pyx_1) {
-    __pyx_r = Py_None; Py_INCREF(Py_None);
-    goto __pyx_L0;
-    goto __pyx_L2;
-  }
-  __pyx_L2:;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":78 */
-  __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_n_JdwpError); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; goto __pyx_L1;}
-  __pyx_3 = PyInt_FromLong(__pyx_v_code); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; goto __pyx_L1;}
-  __pyx_4 = PyTuple_New(1); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; goto __pyx_L1;}
-  PyTuple_SET_ITEM(__pyx_4, 0, __pyx_3);
-  __pyx_3 = 0;
-  __pyx_3 = PyObject_CallObject(__pyx_2, __pyx_4); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-  __Pyx_Raise(__pyx_3, 0, 0);
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; goto __pyx_L1;}
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  __Pyx_AddTraceback("jdwp.einz");
-  __pyx_r = 0;
-  __pyx_L0:;
-  return __pyx_r;
-}
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
 
-static int __pyx_f_4jdwp_10JdwpBuffer___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_f_4jdwp_10JdwpBuffer___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return -1;
-  Py_INCREF(__pyx_v_self);
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":94 */
-  ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.data = NULL;
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
 
-  __pyx_r = 0;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
 
-static void __pyx_f_4jdwp_10JdwpBuffer___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_f_4jdwp_10JdwpBuffer___dealloc__(PyObject *__pyx_v_self) {
-  Py_INCREF(__pyx_v_self);
-  jdwp_purge((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf));
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
 
-  Py_DECREF(__pyx_v_self);
-}
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packU8(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packU8(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint8_t __pyx_v_byte;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"byte",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "B", __pyx_argnames, &__pyx_v_byte)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_u8((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_byte)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU8");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packU16(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packU16(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint16_t __pyx_v_word;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"word",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "H", __pyx_argnames, &__pyx_v_word)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_u16((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_word)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU16");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packU32(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packU32(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint32_t __pyx_v_quad;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"quad",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "I", __pyx_argnames, &__pyx_v_quad)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_u32((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_quad)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU32");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packU64(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packU64(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_octet;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"octet",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "K", __pyx_argnames, &__pyx_v_octet)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_u64((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_octet)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 106; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU64");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packInt(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packInt(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int32_t __pyx_v_i;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"i",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "i", __pyx_argnames, &__pyx_v_i)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_u32((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_i)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packInt");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* IncludeStringH.proto */
+#include <string.h>
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packLong(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packLong(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int64_t __pyx_v_l;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"l",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "L", __pyx_argnames, &__pyx_v_l)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_u64((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_l)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packLong");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* BytesEquals.proto */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packObjectId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packObjectId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_id;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"id",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "K", __pyx_argnames, &__pyx_v_id)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_object_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_id)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packObjectId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* UnicodeEquals.proto */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packFieldId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packFieldId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_id;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"id",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "K", __pyx_argnames, &__pyx_v_id)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_field_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_id)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packFieldId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* StrEquals.proto */
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyString_Equals __Pyx_PyUnicode_Equals
+#else
+#define __Pyx_PyString_Equals __Pyx_PyBytes_Equals
+#endif
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packMethodId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packMethodId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_id;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"id",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "K", __pyx_argnames, &__pyx_v_id)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_method_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_id)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packMethodId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* UnicodeAsUCS4.proto */
+static CYTHON_INLINE Py_UCS4 __Pyx_PyUnicode_AsPy_UCS4(PyObject*);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packTypeId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packTypeId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_id;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"id",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "K", __pyx_argnames, &__pyx_v_id)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_type_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_id)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packTypeId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* object_ord.proto */
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyObject_Ord(c)\
+    (likely(PyUnicode_Check(c)) ? (long)__Pyx_PyUnicode_AsPy_UCS4(c) : __Pyx__PyObject_Ord(c))
+#else
+#define __Pyx_PyObject_Ord(c) __Pyx__PyObject_Ord(c)
+#endif
+static long __Pyx__PyObject_Ord(PyObject* c);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packFrameId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packFrameId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_id;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"id",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "K", __pyx_argnames, &__pyx_v_id)) return 0;
-  Py_INCREF(__pyx_v_self);
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_frame_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_id)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 121; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packFrameId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
 }
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackU8(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackU8(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint8_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":125 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u8((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* KeywordStringCheck.proto */
+static int __Pyx_CheckKeywordStrings(PyObject *kwdict, const char* function_name, int kw_allowed);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":126 */
-  __pyx_1 = PyInt_FromLong(__pyx_v_x); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackU8");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackU16(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackU16(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint16_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":129 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u16((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":130 */
-  __pyx_1 = PyInt_FromLong(__pyx_v_x); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackU16");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackU32(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackU32(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint32_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":133 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u32((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":134 */
-  __pyx_1 = PyLong_FromUnsignedLong(__pyx_v_x); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackU32");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* PyIntCompare.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2, long intval, long inplace);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackU64(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackU64(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* ObjectGetItem.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key);
+#else
+#define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
+#endif
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":137 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u64((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 137; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":138 */
-  __pyx_1 = PyLong_FromUnsignedLongLong(__pyx_v_x); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 138; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* Intern.proto */
+static PyObject* __Pyx_Intern(PyObject* s);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackU64");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackInt(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackInt(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint32_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":141 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u32((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* UnpackUnboundCMethod.proto */
+typedef struct {
+    PyObject *type;
+    PyObject **method_name;
+    PyCFunction func;
+    PyObject *method;
+    int flag;
+} __Pyx_CachedCFunction;
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":142 */
-  __pyx_1 = PyInt_FromLong(((int32_t)__pyx_v_x)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* CallUnboundCMethod1.proto */
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#endif
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackInt");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
+/* CallUnboundCMethod2.proto */
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2);
+#else
+#define __Pyx_CallUnboundCMethod2(cfunc, self, arg1, arg2)  __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2)
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
 }
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackFloat(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackFloat(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint32_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":145 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u32((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":146 */
-  __pyx_1 = PyFloat_FromDouble(((float)__pyx_v_x)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 146; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackFloat");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackDouble(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackDouble(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint32_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":149 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u32((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 149; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":150 */
-  __pyx_1 = PyFloat_FromDouble(((double)__pyx_v_x)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackDouble");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackLong(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackLong(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":154 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u64((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* CalculateMetaclass.proto */
+static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":155 */
-  __pyx_1 = PyLong_FromLongLong(((int64_t)__pyx_v_x)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* FetchCommonType.proto */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackLong");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* CythonFunctionShared.proto */
+#define __Pyx_CyFunction_USED 1
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#define __Pyx_CyFunction_GetClassObj(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+    PyCFunctionObject func;
+#if PY_VERSION_HEX < 0x030500A0
+    PyObject *func_weakreflist;
+#endif
+    PyObject *func_dict;
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+    PyObject *func_classobj;
+    void *defaults;
+    int defaults_pyobjects;
+    size_t defaults_size;  // used by FusedFunction for copying defaults
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+} __pyx_CyFunctionObject;
+static PyTypeObject *__pyx_CyFunctionType = 0;
+#define __Pyx_CyFunction_Check(obj)  (__Pyx_TypeCheck(obj, __pyx_CyFunctionType))
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *self,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *m,
+                                                         size_t size,
+                                                         int pyobjects);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(void);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackObjectId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackObjectId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* CythonFunction.proto */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":159 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_object_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* SetNameInClass.proto */
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+#define __Pyx_SetNameInClass(ns, name, value)\
+    (likely(PyDict_CheckExact(ns)) ? _PyDict_SetItem_KnownHash(ns, name, value, ((PyASCIIObject *) name)->hash) : PyObject_SetItem(ns, name, value))
+#elif CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_SetNameInClass(ns, name, value)\
+    (likely(PyDict_CheckExact(ns)) ? PyDict_SetItem(ns, name, value) : PyObject_SetItem(ns, name, value))
+#else
+#define __Pyx_SetNameInClass(ns, name, value)  PyObject_SetItem(ns, name, value)
+#endif
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":160 */
-  __pyx_1 = PyLong_FromUnsignedLongLong(__pyx_v_x); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 160; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* Py3ClassCreate.proto */
+static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name, PyObject *qualname,
+                                           PyObject *mkw, PyObject *modname, PyObject *doc);
+static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases, PyObject *dict,
+                                      PyObject *mkw, int calculate_metaclass, int allow_py2_metaclass);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackObjectId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackMethodId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackMethodId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":163 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_method_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":164 */
-  __pyx_1 = PyLong_FromUnsignedLongLong(__pyx_v_x); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackMethodId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackFrameId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackFrameId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":167 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_frame_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* CIntFromPy.proto */
+static CYTHON_INLINE uint8_t __Pyx_PyInt_As_uint8_t(PyObject *);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":168 */
-  __pyx_1 = PyLong_FromUnsignedLongLong(__pyx_v_x); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* CIntFromPy.proto */
+static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackFrameId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* CIntFromPy.proto */
+static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackFieldId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackFieldId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* CIntFromPy.proto */
+static CYTHON_INLINE uint64_t __Pyx_PyInt_As_uint64_t(PyObject *);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":171 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_field_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* CIntFromPy.proto */
+static CYTHON_INLINE int32_t __Pyx_PyInt_As_int32_t(PyObject *);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":172 */
-  __pyx_1 = PyLong_FromUnsignedLongLong(__pyx_v_x); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 172; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* CIntFromPy.proto */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackFieldId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackTypeId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackTypeId(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint64_t __pyx_v_x;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":175 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_type_id((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_x))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint8_t(uint8_t value);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":176 */
-  __pyx_1 = PyLong_FromUnsignedLongLong(__pyx_v_x); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackTypeId");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint16_t(uint16_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint32_t(uint32_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint64_t(uint64_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int32_t(int32_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int8_t(int8_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int16_t(int16_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_char(unsigned char value);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static Py_ssize_t __pyx_f_4jdwp_10JdwpFormat_measure(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v_args); /* proto*/
+static int __pyx_f_4jdwp_10JdwpFormat_encode(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, unsigned char *__pyx_v_p, PyObject *__pyx_v_args); /* proto*/
+static PyObject *__pyx_f_4jdwp_10JdwpFormat_decode(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, jdwp_buffer *__pyx_v_buf, int __pyx_v_as_list); /* proto*/
+static int __pyx_f_4jdwp_10JdwpFormat_append(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_buf, PyObject *__pyx_v_args); /* proto*/
+static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unview(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto*/
+static struct __pyx_obj_4jdwp_JdwpFormat *__pyx_f_4jdwp_10JdwpBuffer_format(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt, int __pyx_skip_dispatch); /* proto*/
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.ref' */
+
+/* Module declarations from 'cpython.tuple' */
+
+/* Module declarations from 'cpython.list' */
+
+/* Module declarations from 'jdwp' */
+static PyTypeObject *__pyx_ptype_4jdwp_JdwpFormat = 0;
+static PyTypeObject *__pyx_ptype_4jdwp_JdwpBuffer = 0;
+static PyObject *__pyx_f_4jdwp_einz(int); /*proto*/
+static uint64_t __pyx_f_4jdwp_wrap64(PyObject *); /*proto*/
+static CYTHON_INLINE uint64_t __pyx_f_4jdwp_read_be(unsigned char *, int); /*proto*/
+static CYTHON_INLINE PyObject *__pyx_f_4jdwp_take_str(unsigned char **, unsigned char *); /*proto*/
+static CYTHON_INLINE void __pyx_f_4jdwp_write_be(unsigned char *, int, uint64_t); /*proto*/
+static PyObject *__pyx_f_4jdwp_format_cache(jdwp_buffer *); /*proto*/
+static PyObject *__pyx_f_4jdwp___pyx_unpickle_JdwpFormat__set_state(struct __pyx_obj_4jdwp_JdwpFormat *, PyObject *); /*proto*/
+#define __Pyx_MODULE_NAME "jdwp"
+extern int __pyx_module_is_main_jdwp;
+int __pyx_module_is_main_jdwp = 0;
+
+/* Implementation of 'jdwp' */
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_chr;
+static PyObject *__pyx_builtin_unichr;
+static const char __pyx_k_[] = "$";
+static const char __pyx_k_B[] = "B";
+static const char __pyx_k_H[] = "H";
+static const char __pyx_k_L[] = "L";
+static const char __pyx_k_d[] = "d";
+static const char __pyx_k_f[] = "f";
+static const char __pyx_k_h[] = "h";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_l[] = "l";
+static const char __pyx_k__2[] = "";
+static const char __pyx_k_iQ[] = "=%iQ";
+static const char __pyx_k_iq[] = ">%iq";
+static const char __pyx_k_sz[] = "sz";
+static const char __pyx_k_buf[] = "buf";
+static const char __pyx_k_chr[] = "chr";
+static const char __pyx_k_doc[] = "__doc__";
+static const char __pyx_k_fSz[] = "fSz";
+static const char __pyx_k_fmt[] = "fmt";
+static const char __pyx_k_get[] = "get";
+static const char __pyx_k_mSz[] = "mSz";
+static const char __pyx_k_new[] = "__new__";
+static const char __pyx_k_oSz[] = "oSz";
+static const char __pyx_k_sSz[] = "sSz";
+static const char __pyx_k_str[] = "__str__";
+static const char __pyx_k_sys[] = "sys";
+static const char __pyx_k_tSz[] = "tSz";
+static const char __pyx_k_tag[] = "tag";
+static const char __pyx_k_code[] = "code";
+static const char __pyx_k_data[] = "data";
+static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_init[] = "__init__";
+static const char __pyx_k_jdwp[] = "jdwp";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_mesg[] = "mesg";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_self[] = "self";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_array[] = "array";
+static const char __pyx_k_count[] = "count";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_format[] = "format";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_little[] = "little";
+static const char __pyx_k_module[] = "__module__";
+static const char __pyx_k_offset[] = "offset";
+static const char __pyx_k_pickle[] = "pickle";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_struct[] = "struct";
+static const char __pyx_k_target[] = "target";
+static const char __pyx_k_unichr[] = "unichr";
+static const char __pyx_k_unpack[] = "unpack";
+static const char __pyx_k_update[] = "update";
+static const char __pyx_k_prepare[] = "__prepare__";
+static const char __pyx_k_byteswap[] = "byteswap";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_itemsize[] = "itemsize";
+static const char __pyx_k_jdwp_pyx[] = "jdwp.pyx";
+static const char __pyx_k_pyx_type[] = "__pyx_type";
+static const char __pyx_k_qualname[] = "__qualname__";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_JdwpError[] = "JdwpError";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_byteorder[] = "byteorder";
+static const char __pyx_k_metaclass[] = "__metaclass__";
+static const char __pyx_k_pyx_state[] = "__pyx_state";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_JdwpBuffer[] = "JdwpBuffer";
+static const char __pyx_k_JdwpFormat[] = "JdwpFormat";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_fromstring[] = "fromstring";
+static const char __pyx_k_pyx_result[] = "__pyx_result";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_PickleError[] = "PickleError";
+static const char __pyx_k_ARRAY_WIDTHS[] = "ARRAY_WIDTHS";
+static const char __pyx_k_FORMAT_CACHE[] = "FORMAT_CACHE";
+static const char __pyx_k_JdwpFormat_r[] = "<JdwpFormat %r>";
+static const char __pyx_k_TID_TYPECODE[] = "TID_TYPECODE";
+static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
+static const char __pyx_k_stringsource[] = "stringsource";
+static const char __pyx_k_prepareUnpack[] = "prepareUnpack";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_ARRAY_BYTESWAP[] = "ARRAY_BYTESWAP";
+static const char __pyx_k_jdwp_error_s_s[] = "jdwp-error (%s): %s";
+static const char __pyx_k_ARRAY_TYPECODES[] = "ARRAY_TYPECODES";
+static const char __pyx_k_JdwpError___str[] = "JdwpError.__str__";
+static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_JdwpError___init[] = "JdwpError.__init__";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_pyx_unpickle_JdwpFormat[] = "__pyx_unpickle_JdwpFormat";
+static const char __pyx_k_r_expects_i_values_not_i[] = "%r expects %i values, not %i";
+static const char __pyx_k_i_bytes_do_not_fit_at_offset_i[] = "%i bytes do not fit at offset %i of %i";
+static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible checksums (0x%x vs (0x2c82c07, 0xb4a3a74, 0xa570970) = (count, format, size, widths))";
+static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
+static PyObject *__pyx_kp_s_;
+static PyObject *__pyx_n_s_ARRAY_BYTESWAP;
+static PyObject *__pyx_n_s_ARRAY_TYPECODES;
+static PyObject *__pyx_n_s_ARRAY_WIDTHS;
+static PyObject *__pyx_n_s_B;
+static PyObject *__pyx_n_s_FORMAT_CACHE;
+static PyObject *__pyx_n_s_H;
+static PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
+static PyObject *__pyx_n_s_JdwpBuffer;
+static PyObject *__pyx_n_s_JdwpError;
+static PyObject *__pyx_n_s_JdwpError___init;
+static PyObject *__pyx_n_s_JdwpError___str;
+static PyObject *__pyx_n_s_JdwpFormat;
+static PyObject *__pyx_kp_s_JdwpFormat_r;
+static PyObject *__pyx_n_s_L;
+static PyObject *__pyx_n_s_PickleError;
+static PyObject *__pyx_n_s_TID_TYPECODE;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_kp_s__2;
+static PyObject *__pyx_n_s_array;
+static PyObject *__pyx_n_s_buf;
+static PyObject *__pyx_n_s_byteorder;
+static PyObject *__pyx_n_s_byteswap;
+static PyObject *__pyx_n_s_chr;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_code;
+static PyObject *__pyx_n_s_count;
+static PyObject *__pyx_n_s_d;
+static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_doc;
+static PyObject *__pyx_n_s_f;
+static PyObject *__pyx_n_s_fSz;
+static PyObject *__pyx_n_s_fmt;
+static PyObject *__pyx_n_s_format;
+static PyObject *__pyx_n_s_fromstring;
+static PyObject *__pyx_n_s_get;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_h;
+static PyObject *__pyx_n_s_i;
+static PyObject *__pyx_kp_s_iQ;
+static PyObject *__pyx_kp_s_i_bytes_do_not_fit_at_offset_i;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_init;
+static PyObject *__pyx_kp_s_iq;
+static PyObject *__pyx_n_s_itemsize;
+static PyObject *__pyx_n_s_jdwp;
+static PyObject *__pyx_kp_s_jdwp_error_s_s;
+static PyObject *__pyx_kp_s_jdwp_pyx;
+static PyObject *__pyx_n_s_l;
+static PyObject *__pyx_n_s_little;
+static PyObject *__pyx_n_s_mSz;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_mesg;
+static PyObject *__pyx_n_s_metaclass;
+static PyObject *__pyx_n_s_module;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_new;
+static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
+static PyObject *__pyx_n_s_oSz;
+static PyObject *__pyx_n_s_offset;
+static PyObject *__pyx_n_s_pickle;
+static PyObject *__pyx_n_s_prepare;
+static PyObject *__pyx_n_s_prepareUnpack;
+static PyObject *__pyx_n_s_pyx_PickleError;
+static PyObject *__pyx_n_s_pyx_checksum;
+static PyObject *__pyx_n_s_pyx_result;
+static PyObject *__pyx_n_s_pyx_state;
+static PyObject *__pyx_n_s_pyx_type;
+static PyObject *__pyx_n_s_pyx_unpickle_JdwpFormat;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_qualname;
+static PyObject *__pyx_kp_s_r_expects_i_values_not_i;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_sSz;
+static PyObject *__pyx_n_s_self;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_str;
+static PyObject *__pyx_kp_s_stringsource;
+static PyObject *__pyx_n_s_struct;
+static PyObject *__pyx_n_s_sys;
+static PyObject *__pyx_n_s_sz;
+static PyObject *__pyx_n_s_tSz;
+static PyObject *__pyx_n_s_tag;
+static PyObject *__pyx_n_s_target;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_unichr;
+static PyObject *__pyx_n_s_unpack;
+static PyObject *__pyx_n_s_update;
+static PyObject *__pyx_pf_4jdwp_9JdwpError___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_code); /* proto */
+static PyObject *__pyx_pf_4jdwp_9JdwpError_2__str__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self); /* proto */
+static int __pyx_pf_4jdwp_10JdwpFormat___init__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v_fmt, PyObject *__pyx_v_fSz, PyObject *__pyx_v_mSz, PyObject *__pyx_v_oSz, PyObject *__pyx_v_tSz, PyObject *__pyx_v_sSz); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_2__repr__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_4pack(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v_args); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_6packInto(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_buf, PyObject *__pyx_v_args); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_8writeInto(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v_target, Py_ssize_t __pyx_v_offset, PyObject *__pyx_v_args); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_10unpack(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_buf); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_6format___get__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_4size___get__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_5count___get__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_12__reduce_cython__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_14__setstate_cython__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_4jdwp_10JdwpBuffer___cinit__(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static void __pyx_pf_4jdwp_10JdwpBuffer_2__dealloc__(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static Py_ssize_t __pyx_pf_4jdwp_10JdwpBuffer_4__len__(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_6packU8(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint8_t __pyx_v_byte); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_8packU16(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint16_t __pyx_v_word); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_10packU32(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint32_t __pyx_v_quad); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_12packU64(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_octet); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_14packInt(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, int32_t __pyx_v_i); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_16packLong(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, int64_t __pyx_v_l); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_18packObjectId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_20packFieldId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_22packMethodId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_24packTypeId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_26packFrameId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_28unpackU8(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_30unpackU16(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_32unpackU32(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_34unpackU64(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_36unpackInt(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_38unpackFloat(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_40unpackDouble(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_42unpackLong(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_44unpackObjectId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_46unpackMethodId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_48unpackFrameId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_50unpackFieldId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_52unpackTypeId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_54unpackArray(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_tag, uint32_t __pyx_v_count); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_56unpackTaggedValues(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint32_t __pyx_v_count); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_58unpackClassTable(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint32_t __pyx_v_count); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_60unpackStr(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_62packStr(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_str); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_64config(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fSz, PyObject *__pyx_v_mSz, PyObject *__pyx_v_oSz, PyObject *__pyx_v_tSz, PyObject *__pyx_v_sSz); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_66format(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_68data(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_70writeInto(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_target, Py_ssize_t __pyx_v_offset); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_72reset(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_74preparePack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_sz); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_76prepareUnpack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_78borrow(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_8borrowed___get__(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_80pack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt, PyObject *__pyx_v_args); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_82ipack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt, PyObject *__pyx_v_args); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_84unpack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_86__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_88__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_4jdwp___pyx_unpickle_JdwpFormat(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_4jdwp_JdwpFormat(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_4jdwp_JdwpBuffer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_get = {0, &__pyx_n_s_get, 0, 0, 0};
+static PyObject *__pyx_int_0;
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_4;
+static PyObject *__pyx_int_8;
+static PyObject *__pyx_int_66;
+static PyObject *__pyx_int_67;
+static PyObject *__pyx_int_68;
+static PyObject *__pyx_int_70;
+static PyObject *__pyx_int_73;
+static PyObject *__pyx_int_74;
+static PyObject *__pyx_int_83;
+static PyObject *__pyx_int_90;
+static PyObject *__pyx_int_1024;
+static PyObject *__pyx_int_46672903;
+static PyObject *__pyx_int_173476208;
+static PyObject *__pyx_int_189414004;
+static PyObject *__pyx_int_18446744073709551616;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_tuple__12;
+static PyObject *__pyx_codeobj__7;
+static PyObject *__pyx_codeobj__9;
+static PyObject *__pyx_codeobj__13;
+/* Late includes */
+
+/* "jdwp.pyx":82
+ * 
+ * class JdwpError(Exception):
+ * 	def __init__(self, code):             # <<<<<<<<<<<<<<
+ * 		self.code = code
+ * 		self.mesg = jdwp_en_errors[code]
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_9JdwpError_1__init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4jdwp_9JdwpError_1__init__ = {"__init__", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_9JdwpError_1__init__, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4jdwp_9JdwpError_1__init__(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_self = 0;
+  PyObject *__pyx_v_code = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_self,&__pyx_n_s_code,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_self)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_code)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, 1); __PYX_ERR(0, 82, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 82, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_self = values[0];
+    __pyx_v_code = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 82, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpError.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_9JdwpError___init__(__pyx_self, __pyx_v_self, __pyx_v_code);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackStr(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpackStr(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  uint32_t __pyx_v_sz;
-  char *__pyx_v_str;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
+static PyObject *__pyx_pf_4jdwp_9JdwpError___init__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self, PyObject *__pyx_v_code) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":181 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_unpack_str((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(&__pyx_v_sz),(&__pyx_v_str))); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+  /* "jdwp.pyx":83
+ * class JdwpError(Exception):
+ * 	def __init__(self, code):
+ * 		self.code = code             # <<<<<<<<<<<<<<
+ * 		self.mesg = jdwp_en_errors[code]
+ * 
+ */
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_code, __pyx_v_code) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":182 */
-  __pyx_1 = PyString_FromStringAndSize(__pyx_v_str,__pyx_v_sz); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; goto __pyx_L1;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
+  /* "jdwp.pyx":84
+ * 	def __init__(self, code):
+ * 		self.code = code
+ * 		self.mesg = jdwp_en_errors[code]             # <<<<<<<<<<<<<<
+ * 
+ * 	def __str__(self):
+ */
+  __pyx_t_1 = __Pyx_PyIndex_AsSsize_t(__pyx_v_code); if (unlikely((__pyx_t_1 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBytes_FromString((jdwp_en_errors[__pyx_t_1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 84, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_PyObject_SetAttrStr(__pyx_v_self, __pyx_n_s_mesg, __pyx_t_2) < 0) __PYX_ERR(0, 84, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":82
+ * 
+ * class JdwpError(Exception):
+ * 	def __init__(self, code):             # <<<<<<<<<<<<<<
+ * 		self.code = code
+ * 		self.mesg = jdwp_en_errors[code]
+ */
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackStr");
-  __pyx_r = 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("jdwp.JdwpError.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packStr(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_packStr(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_str = 0;
-  char *__pyx_v_cstr;
-  Py_ssize_t __pyx_v_sz;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  static char *__pyx_argnames[] = {"str",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O", __pyx_argnames, &__pyx_v_str)) return 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_str);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":187 */
-  __pyx_v_cstr = PyString_AsString(__pyx_v_str);
+/* "jdwp.pyx":86
+ * 		self.mesg = jdwp_en_errors[code]
+ * 
+ * 	def __str__(self):             # <<<<<<<<<<<<<<
+ * 		return "jdwp-error (%s): %s" % (self.code, self.mesg)
+ * 
+ */
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":188 */
-  __pyx_v_sz = PyString_Size(__pyx_v_str);
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_9JdwpError_3__str__(PyObject *__pyx_self, PyObject *__pyx_v_self); /*proto*/
+static PyMethodDef __pyx_mdef_4jdwp_9JdwpError_3__str__ = {"__str__", (PyCFunction)__pyx_pw_4jdwp_9JdwpError_3__str__, METH_O, 0};
+static PyObject *__pyx_pw_4jdwp_9JdwpError_3__str__(PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__str__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_9JdwpError_2__str__(__pyx_self, ((PyObject *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":189 */
-  __pyx_1 = __pyx_f_4jdwp_einz(jdwp_pack_str((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_sz,__pyx_v_cstr)); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
+static PyObject *__pyx_pf_4jdwp_9JdwpError_2__str__(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__str__", 0);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
+  /* "jdwp.pyx":87
+ * 
+ * 	def __str__(self):
+ * 		return "jdwp-error (%s): %s" % (self.code, self.mesg)             # <<<<<<<<<<<<<<
+ * 
+ * cdef einz(int code):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_code); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self, __pyx_n_s_mesg); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_jdwp_error_s_s, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.packStr");
-  __pyx_r = 0;
+
+  /* "jdwp.pyx":86
+ * 		self.mesg = jdwp_en_errors[code]
+ * 
+ * 	def __str__(self):             # <<<<<<<<<<<<<<
+ * 		return "jdwp-error (%s): %s" % (self.code, self.mesg)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("jdwp.JdwpError.__str__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_str);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_config(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_config(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_fSz = 0;
-  PyObject *__pyx_v_mSz = 0;
-  PyObject *__pyx_v_oSz = 0;
-  PyObject *__pyx_v_tSz = 0;
-  PyObject *__pyx_v_sSz = 0;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  uint8_t __pyx_2;
-  static char *__pyx_argnames[] = {"fSz","mSz","oSz","tSz","sSz",0};
-  __pyx_v_fSz = __pyx_d1;
-  __pyx_v_mSz = __pyx_d2;
-  __pyx_v_oSz = __pyx_d3;
-  __pyx_v_tSz = __pyx_d4;
-  __pyx_v_sSz = __pyx_d5;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "|OOOOO", __pyx_argnames, &__pyx_v_fSz, &__pyx_v_mSz, &__pyx_v_oSz, &__pyx_v_tSz, &__pyx_v_sSz)) return 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_fSz);
-  Py_INCREF(__pyx_v_mSz);
-  Py_INCREF(__pyx_v_oSz);
-  Py_INCREF(__pyx_v_tSz);
-  Py_INCREF(__pyx_v_sSz);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":193 */
-  __pyx_1 = __pyx_v_fSz != Py_None;
-  if (__pyx_1) {
-    __pyx_2 = PyInt_AsLong(__pyx_v_fSz); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; goto __pyx_L1;}
-    ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.fSz = __pyx_2;
-    goto __pyx_L2;
-  }
-  __pyx_L2:;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":194 */
-  __pyx_1 = __pyx_v_mSz != Py_None;
-  if (__pyx_1) {
-    __pyx_2 = PyInt_AsLong(__pyx_v_mSz); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; goto __pyx_L1;}
-    ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.mSz = __pyx_2;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
+/* "jdwp.pyx":89
+ * 		return "jdwp-error (%s): %s" % (self.code, self.mesg)
+ * 
+ * cdef einz(int code):             # <<<<<<<<<<<<<<
+ * 	"jdwp error if not zero"
+ * 	if code == 0: return
+ */
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":195 */
-  __pyx_1 = __pyx_v_oSz != Py_None;
-  if (__pyx_1) {
-    __pyx_2 = PyInt_AsLong(__pyx_v_oSz); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; goto __pyx_L1;}
-    ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.oSz = __pyx_2;
-    goto __pyx_L4;
-  }
-  __pyx_L4:;
+static PyObject *__pyx_f_4jdwp_einz(int __pyx_v_code) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("einz", 0);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":196 */
-  __pyx_1 = __pyx_v_tSz != Py_None;
-  if (__pyx_1) {
-    __pyx_2 = PyInt_AsLong(__pyx_v_tSz); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; goto __pyx_L1;}
-    ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.tSz = __pyx_2;
-    goto __pyx_L5;
+  /* "jdwp.pyx":91
+ * cdef einz(int code):
+ * 	"jdwp error if not zero"
+ * 	if code == 0: return             # <<<<<<<<<<<<<<
+ * 	raise JdwpError(code)
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_code == 0) != 0);
+  if (__pyx_t_1) {
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
   }
-  __pyx_L5:;
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":197 */
-  __pyx_1 = __pyx_v_sSz != Py_None;
-  if (__pyx_1) {
-    __pyx_2 = PyInt_AsLong(__pyx_v_sSz); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; goto __pyx_L1;}
-    ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.sSz = __pyx_2;
-    goto __pyx_L6;
+  /* "jdwp.pyx":92
+ * 	"jdwp error if not zero"
+ * 	if code == 0: return
+ * 	raise JdwpError(code)             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from "Python.h":
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_code); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
   }
-  __pyx_L6:;
+  __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __PYX_ERR(0, 92, __pyx_L1_error)
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.config");
+  /* "jdwp.pyx":89
+ * 		return "jdwp-error (%s): %s" % (self.code, self.mesg)
+ * 
+ * cdef einz(int code):             # <<<<<<<<<<<<<<
+ * 	"jdwp error if not zero"
+ * 	if code == 0: return
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("jdwp.einz", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_fSz);
-  Py_DECREF(__pyx_v_mSz);
-  Py_DECREF(__pyx_v_oSz);
-  Py_DECREF(__pyx_v_tSz);
-  Py_DECREF(__pyx_v_sSz);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_size(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self,PyObject *__pyx_v_fmt,PyObject *__pyx_v_args) {
-  int __pyx_v_i;
-  int __pyx_v_sz;
-  char __pyx_v_op;
-  char *__pyx_v_cfmt;
-  PyObject *__pyx_v_val;
-  PyObject *__pyx_v_inc;
-  PyObject *__pyx_r;
-  char *__pyx_1;
-  Py_ssize_t __pyx_2;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  int __pyx_5;
-  Py_ssize_t __pyx_6;
-  PyObject *__pyx_7 = 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_fmt);
-  Py_INCREF(__pyx_v_args);
-  __pyx_v_val = Py_None; Py_INCREF(Py_None);
-  __pyx_v_inc = Py_None; Py_INCREF(Py_None);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":204 */
-  __pyx_1 = PyString_AsString(__pyx_v_fmt); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; goto __pyx_L1;}
-  __pyx_v_cfmt = __pyx_1;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":206 */
-  __pyx_v_sz = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":208 */
-  __pyx_2 = PyObject_Length(__pyx_v_fmt); if (__pyx_2 == -1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; goto __pyx_L1;}
-  for (__pyx_v_i = 0; __pyx_v_i < __pyx_2; ++__pyx_v_i) {
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":209 */
-    __pyx_3 = PyInt_FromLong(__pyx_v_i); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; goto __pyx_L1;}
-    __pyx_4 = PyObject_GetItem(__pyx_v_args, __pyx_3); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; goto __pyx_L1;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    Py_DECREF(__pyx_v_val);
-    __pyx_v_val = __pyx_4;
-    __pyx_4 = 0;
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":210 */
-    __pyx_v_op = (__pyx_v_cfmt[__pyx_v_i]);
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":211 */
-    __pyx_5 = (__pyx_v_op == '$');
-    if (__pyx_5) {
-      __pyx_6 = PyObject_Length(__pyx_v_val); if (__pyx_6 == -1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; goto __pyx_L1;}
-      __pyx_v_sz += (4 + __pyx_6);
-      goto __pyx_L4;
-    }
-    /*else*/ {
+/* "jdwp.pyx":110
+ * 	void PyBuffer_Release(Py_buffer* view)
+ * 
+ * cdef uint64_t wrap64(object val) except? 0:             # <<<<<<<<<<<<<<
+ * 	# negative values, such as a frame count of -1, are packed as their two's
+ * 	# complement rather than overflowing the conversion to uint64_t.
+ */
+
+static uint64_t __pyx_f_4jdwp_wrap64(PyObject *__pyx_v_val) {
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  uint64_t __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("wrap64", 0);
+  __Pyx_INCREF(__pyx_v_val);
+
+  /* "jdwp.pyx":113
+ * 	# negative values, such as a frame count of -1, are packed as their two's
+ * 	# complement rather than overflowing the conversion to uint64_t.
+ * 	if val < 0:             # <<<<<<<<<<<<<<
+ * 		val = val + 0x10000000000000000
+ * 	return val
+ */
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_val, __pyx_int_0, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_2) {
+
+    /* "jdwp.pyx":114
+ * 	# complement rather than overflowing the conversion to uint64_t.
+ * 	if val < 0:
+ * 		val = val + 0x10000000000000000             # <<<<<<<<<<<<<<
+ * 	return val
+ * 
+ */
+    __pyx_t_1 = PyNumber_Add(__pyx_v_val, __pyx_int_18446744073709551616); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_val, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "jdwp.pyx":113
+ * 	# negative values, such as a frame count of -1, are packed as their two's
+ * 	# complement rather than overflowing the conversion to uint64_t.
+ * 	if val < 0:             # <<<<<<<<<<<<<<
+ * 		val = val + 0x10000000000000000
+ * 	return val
+ */
+  }
+
+  /* "jdwp.pyx":115
+ * 	if val < 0:
+ * 		val = val + 0x10000000000000000
+ * 	return val             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from "arpa/inet.h":
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_uint64_t(__pyx_v_val); if (unlikely((__pyx_t_3 == ((uint64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 115, __pyx_L1_error)
+  __pyx_r = __pyx_t_3;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":110
+ * 	void PyBuffer_Release(Py_buffer* view)
+ * 
+ * cdef uint64_t wrap64(object val) except? 0:             # <<<<<<<<<<<<<<
+ * 	# negative values, such as a frame count of -1, are packed as their two's
+ * 	# complement rather than overflowing the conversion to uint64_t.
+ */
 
-      /* "/Code/AndBug/lib/jdwp/jdwp.pyx":214 */
-      __pyx_3 = PyInt_FromLong(jdwp_size((&__pyx_v_self->buf),__pyx_v_op)); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; goto __pyx_L1;}
-      Py_DECREF(__pyx_v_inc);
-      __pyx_v_inc = __pyx_3;
-      __pyx_3 = 0;
-
-      /* "/Code/AndBug/lib/jdwp/jdwp.pyx":215 */
-      __pyx_4 = PyInt_FromLong(0); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; goto __pyx_L1;}
-      if (PyObject_Cmp(__pyx_v_inc, __pyx_4, &__pyx_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; goto __pyx_L1;}
-      __pyx_5 = __pyx_5 == 0;
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      if (__pyx_5) {
-        __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_n_JdwpError); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; goto __pyx_L1;}
-        __pyx_4 = PyInt_FromLong(2); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; goto __pyx_L1;}
-        __pyx_7 = PyTuple_New(1); if (!__pyx_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; goto __pyx_L1;}
-        PyTuple_SET_ITEM(__pyx_7, 0, __pyx_4);
-        __pyx_4 = 0;
-        __pyx_4 = PyObject_CallObject(__pyx_3, __pyx_7); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; goto __pyx_L1;}
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        Py_DECREF(__pyx_7); __pyx_7 = 0;
-        __Pyx_Raise(__pyx_4, 0, 0);
-        Py_DECREF(__pyx_4); __pyx_4 = 0;
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; goto __pyx_L1;}
-        goto __pyx_L5;
-      }
-      __pyx_L5:;
-
-      /* "/Code/AndBug/lib/jdwp/jdwp.pyx":217 */
-      __pyx_5 = PyInt_AsLong(__pyx_v_inc); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; goto __pyx_L1;}
-      __pyx_v_sz += __pyx_5;
-    }
-    __pyx_L4:;
-  }
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":219 */
-  __pyx_3 = PyInt_FromLong(__pyx_v_sz); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; goto __pyx_L1;}
-  __pyx_r = __pyx_3;
-  __pyx_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  Py_XDECREF(__pyx_7);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.size");
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.wrap64", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  Py_DECREF(__pyx_v_val);
-  Py_DECREF(__pyx_v_inc);
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_fmt);
-  Py_DECREF(__pyx_v_args);
+  __Pyx_XDECREF(__pyx_v_val);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_data(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_data(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  char *__pyx_v_str;
-  Py_ssize_t __pyx_v_len;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  static char *__pyx_argnames[] = {0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "", __pyx_argnames)) return 0;
-  Py_INCREF(__pyx_v_self);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":225 */
-  __pyx_v_str = ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.data;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":226 */
-  __pyx_1 = (__pyx_v_str == NULL);
-  if (__pyx_1) {
-    Py_INCREF(__pyx_k5p);
-    __pyx_r = __pyx_k5p;
+/* "jdwp.pyx":121
+ * 	uint32_t ntohl(uint32_t v)
+ * 
+ * cdef inline uint64_t read_be(unsigned char* p, int w):             # <<<<<<<<<<<<<<
+ * 	# the widths ids are negotiated at are read with a single load and byte
+ * 	# swap each, rather than a byte at a time
+ */
+
+static CYTHON_INLINE uint64_t __pyx_f_4jdwp_read_be(unsigned char *__pyx_v_p, int __pyx_v_w) {
+  uint16_t __pyx_v_v16;
+  uint32_t __pyx_v_v32;
+  uint64_t __pyx_v_v;
+  int __pyx_v_i;
+  uint64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  __Pyx_RefNannySetupContext("read_be", 0);
+
+  /* "jdwp.pyx":126
+ * 	cdef uint16_t v16
+ * 	cdef uint32_t v32
+ * 	cdef uint64_t v = 0             # <<<<<<<<<<<<<<
+ * 	cdef int i
+ * 	if w == 8:
+ */
+  __pyx_v_v = 0;
+
+  /* "jdwp.pyx":128
+ * 	cdef uint64_t v = 0
+ * 	cdef int i
+ * 	if w == 8:             # <<<<<<<<<<<<<<
+ * 		memcpy(&v32, p, 4)
+ * 		v = ntohl(v32)
+ */
+  switch (__pyx_v_w) {
+    case 8:
+
+    /* "jdwp.pyx":129
+ * 	cdef int i
+ * 	if w == 8:
+ * 		memcpy(&v32, p, 4)             # <<<<<<<<<<<<<<
+ * 		v = ntohl(v32)
+ * 		memcpy(&v32, p + 4, 4)
+ */
+    (void)(memcpy((&__pyx_v_v32), __pyx_v_p, 4));
+
+    /* "jdwp.pyx":130
+ * 	if w == 8:
+ * 		memcpy(&v32, p, 4)
+ * 		v = ntohl(v32)             # <<<<<<<<<<<<<<
+ * 		memcpy(&v32, p + 4, 4)
+ * 		return (v << 32) | ntohl(v32)
+ */
+    __pyx_v_v = ntohl(__pyx_v_v32);
+
+    /* "jdwp.pyx":131
+ * 		memcpy(&v32, p, 4)
+ * 		v = ntohl(v32)
+ * 		memcpy(&v32, p + 4, 4)             # <<<<<<<<<<<<<<
+ * 		return (v << 32) | ntohl(v32)
+ * 	elif w == 4:
+ */
+    (void)(memcpy((&__pyx_v_v32), (__pyx_v_p + 4), 4));
+
+    /* "jdwp.pyx":132
+ * 		v = ntohl(v32)
+ * 		memcpy(&v32, p + 4, 4)
+ * 		return (v << 32) | ntohl(v32)             # <<<<<<<<<<<<<<
+ * 	elif w == 4:
+ * 		memcpy(&v32, p, 4)
+ */
+    __pyx_r = ((__pyx_v_v << 32) | ntohl(__pyx_v_v32));
+    goto __pyx_L0;
+
+    /* "jdwp.pyx":128
+ * 	cdef uint64_t v = 0
+ * 	cdef int i
+ * 	if w == 8:             # <<<<<<<<<<<<<<
+ * 		memcpy(&v32, p, 4)
+ * 		v = ntohl(v32)
+ */
+    break;
+    case 4:
+
+    /* "jdwp.pyx":134
+ * 		return (v << 32) | ntohl(v32)
+ * 	elif w == 4:
+ * 		memcpy(&v32, p, 4)             # <<<<<<<<<<<<<<
+ * 		return ntohl(v32)
+ * 	elif w == 2:
+ */
+    (void)(memcpy((&__pyx_v_v32), __pyx_v_p, 4));
+
+    /* "jdwp.pyx":135
+ * 	elif w == 4:
+ * 		memcpy(&v32, p, 4)
+ * 		return ntohl(v32)             # <<<<<<<<<<<<<<
+ * 	elif w == 2:
+ * 		memcpy(&v16, p, 2)
+ */
+    __pyx_r = ntohl(__pyx_v_v32);
     goto __pyx_L0;
-    goto __pyx_L2;
+
+    /* "jdwp.pyx":133
+ * 		memcpy(&v32, p + 4, 4)
+ * 		return (v << 32) | ntohl(v32)
+ * 	elif w == 4:             # <<<<<<<<<<<<<<
+ * 		memcpy(&v32, p, 4)
+ * 		return ntohl(v32)
+ */
+    break;
+    case 2:
+
+    /* "jdwp.pyx":137
+ * 		return ntohl(v32)
+ * 	elif w == 2:
+ * 		memcpy(&v16, p, 2)             # <<<<<<<<<<<<<<
+ * 		return ntohs(v16)
+ * 	for i in range(w):
+ */
+    (void)(memcpy((&__pyx_v_v16), __pyx_v_p, 2));
+
+    /* "jdwp.pyx":138
+ * 	elif w == 2:
+ * 		memcpy(&v16, p, 2)
+ * 		return ntohs(v16)             # <<<<<<<<<<<<<<
+ * 	for i in range(w):
+ * 		v = (v << 8) | p[i]
+ */
+    __pyx_r = ntohs(__pyx_v_v16);
+    goto __pyx_L0;
+
+    /* "jdwp.pyx":136
+ * 		memcpy(&v32, p, 4)
+ * 		return ntohl(v32)
+ * 	elif w == 2:             # <<<<<<<<<<<<<<
+ * 		memcpy(&v16, p, 2)
+ * 		return ntohs(v16)
+ */
+    break;
+    default: break;
   }
-  __pyx_L2:;
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":228 */
-  __pyx_v_str = (__pyx_v_str + ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.ofs);
+  /* "jdwp.pyx":139
+ * 		memcpy(&v16, p, 2)
+ * 		return ntohs(v16)
+ * 	for i in range(w):             # <<<<<<<<<<<<<<
+ * 		v = (v << 8) | p[i]
+ * 	return v
+ */
+  __pyx_t_1 = __pyx_v_w;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":229 */
-  __pyx_v_len = ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.len;
+    /* "jdwp.pyx":140
+ * 		return ntohs(v16)
+ * 	for i in range(w):
+ * 		v = (v << 8) | p[i]             # <<<<<<<<<<<<<<
+ * 	return v
+ * 
+ */
+    __pyx_v_v = ((__pyx_v_v << 8) | (__pyx_v_p[__pyx_v_i]));
+  }
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":230 */
-  __pyx_2 = PyString_FromStringAndSize(__pyx_v_str,__pyx_v_len); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; goto __pyx_L1;}
-  __pyx_r = __pyx_2;
-  __pyx_2 = 0;
+  /* "jdwp.pyx":141
+ * 	for i in range(w):
+ * 		v = (v << 8) | p[i]
+ * 	return v             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object take_str(unsigned char** pp, unsigned char* end):
+ */
+  __pyx_r = __pyx_v_v;
   goto __pyx_L0;
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.data");
-  __pyx_r = 0;
-  __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  return __pyx_r;
-}
+  /* "jdwp.pyx":121
+ * 	uint32_t ntohl(uint32_t v)
+ * 
+ * cdef inline uint64_t read_be(unsigned char* p, int w):             # <<<<<<<<<<<<<<
+ * 	# the widths ids are negotiated at are read with a single load and byte
+ * 	# swap each, rather than a byte at a time
+ */
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_preparePack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_preparePack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_sz = 0;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  static char *__pyx_argnames[] = {"sz",0};
-  __pyx_v_sz = __pyx_d6;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "|O", __pyx_argnames, &__pyx_v_sz)) return 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_sz);
-  __pyx_1 = PyInt_AsLong(__pyx_v_sz); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; goto __pyx_L1;}
-  jdwp_prepare((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),NULL,__pyx_1);
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.preparePack");
-  __pyx_r = 0;
+  /* function exit code */
   __pyx_L0:;
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_sz);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_prepareUnpack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_prepareUnpack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_str = 0;
-  char *__pyx_v_cstr;
-  Py_ssize_t __pyx_v_sz;
-  PyObject *__pyx_r;
-  static char *__pyx_argnames[] = {"str",0};
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O", __pyx_argnames, &__pyx_v_str)) return 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_str);
+/* "jdwp.pyx":143
+ * 	return v
+ * 
+ * cdef inline object take_str(unsigned char** pp, unsigned char* end):             # <<<<<<<<<<<<<<
+ * 	# unpacks a length-prefixed string at *pp, advancing past it
+ * 	cdef unsigned char* p = pp[0]
+ */
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":239 */
-  __pyx_v_cstr = PyString_AsString(__pyx_v_str);
+static CYTHON_INLINE PyObject *__pyx_f_4jdwp_take_str(unsigned char **__pyx_v_pp, unsigned char *__pyx_v_end) {
+  unsigned char *__pyx_v_p;
+  uint32_t __pyx_v_n;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("take_str", 0);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":240 */
-  __pyx_v_sz = PyString_Size(__pyx_v_str);
+  /* "jdwp.pyx":145
+ * cdef inline object take_str(unsigned char** pp, unsigned char* end):
+ * 	# unpacks a length-prefixed string at *pp, advancing past it
+ * 	cdef unsigned char* p = pp[0]             # <<<<<<<<<<<<<<
+ * 	cdef uint32_t n
+ * 	if end - p < 4:
+ */
+  __pyx_v_p = (__pyx_v_pp[0]);
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":241 */
-  jdwp_prepare((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_cstr,__pyx_v_sz);
+  /* "jdwp.pyx":147
+ * 	cdef unsigned char* p = pp[0]
+ * 	cdef uint32_t n
+ * 	if end - p < 4:             # <<<<<<<<<<<<<<
+ * 		raise JdwpError(JDWP_NEED_LEN)
+ * 	n = read_be(p, 4)
+ */
+  __pyx_t_1 = (((__pyx_v_end - __pyx_v_p) < 4) != 0);
+  if (unlikely(__pyx_t_1)) {
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_str);
-  return __pyx_r;
-}
+    /* "jdwp.pyx":148
+ * 	cdef uint32_t n
+ * 	if end - p < 4:
+ * 		raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 	n = read_be(p, 4)
+ * 	p += 4
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 148, __pyx_L1_error)
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_pack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_pack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_fmt = 0;
-  PyObject *__pyx_v_args = 0;
-  char *__pyx_v_cfmt;
-  uint64_t __pyx_v_val;
-  int __pyx_v_i;
-  char __pyx_v_op;
-  PyObject *__pyx_v_sz;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  Py_ssize_t __pyx_4;
-  int __pyx_5;
-  uint64_t __pyx_6;
-  static char *__pyx_argnames[] = {"fmt",0};
-  if (__Pyx_GetStarArgs(&__pyx_args, &__pyx_kwds, __pyx_argnames, 1, &__pyx_v_args, 0, 0) < 0) return 0;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O", __pyx_argnames, &__pyx_v_fmt)) {
-    Py_XDECREF(__pyx_args);
-    Py_XDECREF(__pyx_kwds);
-    Py_XDECREF(__pyx_v_args);
-    return 0;
+    /* "jdwp.pyx":147
+ * 	cdef unsigned char* p = pp[0]
+ * 	cdef uint32_t n
+ * 	if end - p < 4:             # <<<<<<<<<<<<<<
+ * 		raise JdwpError(JDWP_NEED_LEN)
+ * 	n = read_be(p, 4)
+ */
   }
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_fmt);
-  __pyx_v_sz = Py_None; Py_INCREF(Py_None);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":249 */
-  __pyx_v_cfmt = PyString_AsString(__pyx_v_fmt);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":250 */
-  __pyx_1 = PyString_FromString(__pyx_v_cfmt); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; goto __pyx_L1;}
-  __pyx_2 = ((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->__pyx_vtab)->size(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self),__pyx_1,__pyx_v_args); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(__pyx_v_sz);
-  __pyx_v_sz = __pyx_2;
-  __pyx_2 = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":251 */
-  __pyx_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_preparePack); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; goto __pyx_L1;}
-  __pyx_2 = PyTuple_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; goto __pyx_L1;}
-  Py_INCREF(__pyx_v_sz);
-  PyTuple_SET_ITEM(__pyx_2, 0, __pyx_v_sz);
-  __pyx_3 = PyObject_CallObject(__pyx_1, __pyx_2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":252 */
-  __pyx_4 = PyObject_Length(__pyx_v_fmt); if (__pyx_4 == -1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 252; goto __pyx_L1;}
-  for (__pyx_v_i = 0; __pyx_v_i < __pyx_4; ++__pyx_v_i) {
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":253 */
-    __pyx_v_op = (__pyx_v_cfmt[__pyx_v_i]);
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":254 */
-    __pyx_5 = (__pyx_v_op == '$');
-    if (__pyx_5) {
-      __pyx_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_packStr); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; goto __pyx_L1;}
-      __pyx_2 = PyInt_FromLong(__pyx_v_i); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; goto __pyx_L1;}
-      __pyx_3 = PyObject_GetItem(__pyx_v_args, __pyx_2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_2 = PyTuple_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; goto __pyx_L1;}
-      PyTuple_SET_ITEM(__pyx_2, 0, __pyx_3);
-      __pyx_3 = 0;
-      __pyx_3 = PyObject_CallObject(__pyx_1, __pyx_2); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 255; goto __pyx_L1;}
-      Py_DECREF(__pyx_1); __pyx_1 = 0;
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      goto __pyx_L4;
-    }
-    /*else*/ {
 
-      /* "/Code/AndBug/lib/jdwp/jdwp.pyx":257 */
-      __pyx_1 = PyInt_FromLong(__pyx_v_i); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 257; goto __pyx_L1;}
-      __pyx_2 = PyObject_GetItem(__pyx_v_args, __pyx_1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 257; goto __pyx_L1;}
-      Py_DECREF(__pyx_1); __pyx_1 = 0;
-      __pyx_6 = PyInt_AsUnsignedLongLongMask(__pyx_2); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 257; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_v_val = __pyx_6;
+  /* "jdwp.pyx":149
+ * 	if end - p < 4:
+ * 		raise JdwpError(JDWP_NEED_LEN)
+ * 	n = read_be(p, 4)             # <<<<<<<<<<<<<<
+ * 	p += 4
+ * 	if <uint32_t>(end - p) < n:
+ */
+  __pyx_v_n = __pyx_f_4jdwp_read_be(__pyx_v_p, 4);
+
+  /* "jdwp.pyx":150
+ * 		raise JdwpError(JDWP_NEED_LEN)
+ * 	n = read_be(p, 4)
+ * 	p += 4             # <<<<<<<<<<<<<<
+ * 	if <uint32_t>(end - p) < n:
+ * 		raise JdwpError(JDWP_NEED_LEN)
+ */
+  __pyx_v_p = (__pyx_v_p + 4);
 
-      /* "/Code/AndBug/lib/jdwp/jdwp.pyx":258 */
-      jdwp_pack((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_op,__pyx_v_val);
+  /* "jdwp.pyx":151
+ * 	n = read_be(p, 4)
+ * 	p += 4
+ * 	if <uint32_t>(end - p) < n:             # <<<<<<<<<<<<<<
+ * 		raise JdwpError(JDWP_NEED_LEN)
+ * 	pp[0] = p + n
+ */
+  __pyx_t_1 = ((((uint32_t)(__pyx_v_end - __pyx_v_p)) < __pyx_v_n) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "jdwp.pyx":152
+ * 	p += 4
+ * 	if <uint32_t>(end - p) < n:
+ * 		raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 	pp[0] = p + n
+ * 	return PyString_FromStringAndSize(<char*>p, n)
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
     }
-    __pyx_L4:;
+    __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 152, __pyx_L1_error)
+
+    /* "jdwp.pyx":151
+ * 	n = read_be(p, 4)
+ * 	p += 4
+ * 	if <uint32_t>(end - p) < n:             # <<<<<<<<<<<<<<
+ * 		raise JdwpError(JDWP_NEED_LEN)
+ * 	pp[0] = p + n
+ */
   }
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":260 */
-  __pyx_4 = PyInt_AsSsize_t(__pyx_v_sz); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 260; goto __pyx_L1;}
-  __pyx_3 = PyString_FromStringAndSize(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.data,__pyx_4); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 260; goto __pyx_L1;}
-  __pyx_r = __pyx_3;
-  __pyx_3 = 0;
-  goto __pyx_L0;
+  /* "jdwp.pyx":153
+ * 	if <uint32_t>(end - p) < n:
+ * 		raise JdwpError(JDWP_NEED_LEN)
+ * 	pp[0] = p + n             # <<<<<<<<<<<<<<
+ * 	return PyString_FromStringAndSize(<char*>p, n)
+ * 
+ */
+  (__pyx_v_pp[0]) = (__pyx_v_p + __pyx_v_n);
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
+  /* "jdwp.pyx":154
+ * 		raise JdwpError(JDWP_NEED_LEN)
+ * 	pp[0] = p + n
+ * 	return PyString_FromStringAndSize(<char*>p, n)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void write_be(unsigned char* p, int w, uint64_t v):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyString_FromStringAndSize(((char *)__pyx_v_p), __pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 154, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.pack");
+
+  /* "jdwp.pyx":143
+ * 	return v
+ * 
+ * cdef inline object take_str(unsigned char** pp, unsigned char* end):             # <<<<<<<<<<<<<<
+ * 	# unpacks a length-prefixed string at *pp, advancing past it
+ * 	cdef unsigned char* p = pp[0]
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("jdwp.take_str", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  Py_XDECREF(__pyx_v_args);
-  Py_DECREF(__pyx_v_sz);
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_fmt);
-  Py_XDECREF(__pyx_args);
-  Py_XDECREF(__pyx_kwds);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_ipack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_ipack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_fmt = 0;
-  PyObject *__pyx_v_args = 0;
-  char *__pyx_v_cfmt;
-  uint64_t __pyx_v_val;
+/* "jdwp.pyx":156
+ * 	return PyString_FromStringAndSize(<char*>p, n)
+ * 
+ * cdef inline void write_be(unsigned char* p, int w, uint64_t v):             # <<<<<<<<<<<<<<
+ * 	cdef int i
+ * 	for i in range(w - 1, -1, -1):
+ */
+
+static CYTHON_INLINE void __pyx_f_4jdwp_write_be(unsigned char *__pyx_v_p, int __pyx_v_w, uint64_t __pyx_v_v) {
   int __pyx_v_i;
-  char __pyx_v_op;
-  PyObject *__pyx_v_sz;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  int __pyx_3;
-  Py_ssize_t __pyx_4;
-  PyObject *__pyx_5 = 0;
-  uint64_t __pyx_6;
-  static char *__pyx_argnames[] = {"fmt",0};
-  if (__Pyx_GetStarArgs(&__pyx_args, &__pyx_kwds, __pyx_argnames, 1, &__pyx_v_args, 0, 0) < 0) return 0;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O", __pyx_argnames, &__pyx_v_fmt)) {
-    Py_XDECREF(__pyx_args);
-    Py_XDECREF(__pyx_kwds);
-    Py_XDECREF(__pyx_v_args);
-    return 0;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("write_be", 0);
+
+  /* "jdwp.pyx":158
+ * cdef inline void write_be(unsigned char* p, int w, uint64_t v):
+ * 	cdef int i
+ * 	for i in range(w - 1, -1, -1):             # <<<<<<<<<<<<<<
+ * 		p[i] = v & 0xFF
+ * 		v >>= 8
+ */
+  for (__pyx_t_1 = (__pyx_v_w - 1); __pyx_t_1 > -1; __pyx_t_1-=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "jdwp.pyx":159
+ * 	cdef int i
+ * 	for i in range(w - 1, -1, -1):
+ * 		p[i] = v & 0xFF             # <<<<<<<<<<<<<<
+ * 		v >>= 8
+ * 
+ */
+    (__pyx_v_p[__pyx_v_i]) = (__pyx_v_v & 0xFF);
+
+    /* "jdwp.pyx":160
+ * 	for i in range(w - 1, -1, -1):
+ * 		p[i] = v & 0xFF
+ * 		v >>= 8             # <<<<<<<<<<<<<<
+ * 
+ * # compiled formats, by format string, for each configuration of ID sizes
+ */
+    __pyx_v_v = (__pyx_v_v >> 8);
   }
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_fmt);
-  __pyx_v_sz = Py_None; Py_INCREF(Py_None);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":268 */
-  __pyx_v_cfmt = PyString_AsString(__pyx_v_fmt);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":269 */
-  __pyx_1 = PyString_FromString(__pyx_v_cfmt); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; goto __pyx_L1;}
-  __pyx_2 = ((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->__pyx_vtab)->size(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self),__pyx_1,__pyx_v_args); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 269; goto __pyx_L1;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(__pyx_v_sz);
-  __pyx_v_sz = __pyx_2;
-  __pyx_2 = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":270 */
-  __pyx_3 = PyInt_AsLong(__pyx_v_sz); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 270; goto __pyx_L1;}
-  jdwp_expand((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_3);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":271 */
-  __pyx_4 = PyObject_Length(__pyx_v_fmt); if (__pyx_4 == -1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; goto __pyx_L1;}
-  for (__pyx_v_i = 0; __pyx_v_i < __pyx_4; ++__pyx_v_i) {
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":272 */
-    __pyx_v_op = (__pyx_v_cfmt[__pyx_v_i]);
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":273 */
-    __pyx_3 = (__pyx_v_op == '$');
-    if (__pyx_3) {
-      __pyx_1 = PyObject_GetAttr(__pyx_v_self, __pyx_n_packStr); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; goto __pyx_L1;}
-      __pyx_2 = PyInt_FromLong(__pyx_v_i); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; goto __pyx_L1;}
-      __pyx_5 = PyObject_GetItem(__pyx_v_args, __pyx_2); if (!__pyx_5) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_2 = PyTuple_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; goto __pyx_L1;}
-      PyTuple_SET_ITEM(__pyx_2, 0, __pyx_5);
-      __pyx_5 = 0;
-      __pyx_5 = PyObject_CallObject(__pyx_1, __pyx_2); if (!__pyx_5) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; goto __pyx_L1;}
-      Py_DECREF(__pyx_1); __pyx_1 = 0;
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      Py_DECREF(__pyx_5); __pyx_5 = 0;
-      goto __pyx_L4;
-    }
-    /*else*/ {
 
-      /* "/Code/AndBug/lib/jdwp/jdwp.pyx":276 */
-      __pyx_1 = PyInt_FromLong(__pyx_v_i); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; goto __pyx_L1;}
-      __pyx_2 = PyObject_GetItem(__pyx_v_args, __pyx_1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; goto __pyx_L1;}
-      Py_DECREF(__pyx_1); __pyx_1 = 0;
-      __pyx_6 = PyInt_AsUnsignedLongLongMask(__pyx_2); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_v_val = __pyx_6;
+  /* "jdwp.pyx":156
+ * 	return PyString_FromStringAndSize(<char*>p, n)
+ * 
+ * cdef inline void write_be(unsigned char* p, int w, uint64_t v):             # <<<<<<<<<<<<<<
+ * 	cdef int i
+ * 	for i in range(w - 1, -1, -1):
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "jdwp.pyx":185
+ * TID_TYPECODE = 'L' if array('L').itemsize == 8 else None
+ * 
+ * cdef dict format_cache(jdwp_buffer* buf):             # <<<<<<<<<<<<<<
+ * 	key = (buf.fSz, buf.mSz, buf.oSz, buf.tSz, buf.sSz)
+ * 	formats = FORMAT_CACHE.get(key)
+ */
+
+static PyObject *__pyx_f_4jdwp_format_cache(jdwp_buffer *__pyx_v_buf) {
+  PyObject *__pyx_v_key = NULL;
+  PyObject *__pyx_v_formats = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("format_cache", 0);
+
+  /* "jdwp.pyx":186
+ * 
+ * cdef dict format_cache(jdwp_buffer* buf):
+ * 	key = (buf.fSz, buf.mSz, buf.oSz, buf.tSz, buf.sSz)             # <<<<<<<<<<<<<<
+ * 	formats = FORMAT_CACHE.get(key)
+ * 	if formats is None:
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_uint8_t(__pyx_v_buf->fSz); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_uint8_t(__pyx_v_buf->mSz); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_uint8_t(__pyx_v_buf->oSz); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyInt_From_uint8_t(__pyx_v_buf->tSz); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyInt_From_uint8_t(__pyx_v_buf->sSz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_4);
+  PyTuple_SET_ITEM(__pyx_t_6, 3, __pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_6, 4, __pyx_t_5);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_v_key = __pyx_t_6;
+  __pyx_t_6 = 0;
 
-      /* "/Code/AndBug/lib/jdwp/jdwp.pyx":277 */
-      jdwp_pack((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),__pyx_v_op,__pyx_v_val);
+  /* "jdwp.pyx":187
+ * cdef dict format_cache(jdwp_buffer* buf):
+ * 	key = (buf.fSz, buf.mSz, buf.oSz, buf.tSz, buf.sSz)
+ * 	formats = FORMAT_CACHE.get(key)             # <<<<<<<<<<<<<<
+ * 	if formats is None:
+ * 		formats = FORMAT_CACHE[key] = {}
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_FORMAT_CACHE); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_get); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
     }
-    __pyx_L4:;
   }
+  __pyx_t_6 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_v_key) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_key);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_formats = __pyx_t_6;
+  __pyx_t_6 = 0;
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":279 */
-  __pyx_4 = PyInt_AsSsize_t(__pyx_v_sz); if (PyErr_Occurred()) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; goto __pyx_L1;}
-  __pyx_5 = PyString_FromStringAndSize(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf.data,__pyx_4); if (!__pyx_5) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; goto __pyx_L1;}
-  __pyx_r = __pyx_5;
-  __pyx_5 = 0;
-  goto __pyx_L0;
+  /* "jdwp.pyx":188
+ * 	key = (buf.fSz, buf.mSz, buf.oSz, buf.tSz, buf.sSz)
+ * 	formats = FORMAT_CACHE.get(key)
+ * 	if formats is None:             # <<<<<<<<<<<<<<
+ * 		formats = FORMAT_CACHE[key] = {}
+ * 	return formats
+ */
+  __pyx_t_7 = (__pyx_v_formats == Py_None);
+  __pyx_t_8 = (__pyx_t_7 != 0);
+  if (__pyx_t_8) {
+
+    /* "jdwp.pyx":189
+ * 	formats = FORMAT_CACHE.get(key)
+ * 	if formats is None:
+ * 		formats = FORMAT_CACHE[key] = {}             # <<<<<<<<<<<<<<
+ * 	return formats
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_6);
+    __Pyx_DECREF_SET(__pyx_v_formats, __pyx_t_6);
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_FORMAT_CACHE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (unlikely(PyObject_SetItem(__pyx_t_4, __pyx_v_key, __pyx_t_6) < 0)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+    /* "jdwp.pyx":188
+ * 	key = (buf.fSz, buf.mSz, buf.oSz, buf.tSz, buf.sSz)
+ * 	formats = FORMAT_CACHE.get(key)
+ * 	if formats is None:             # <<<<<<<<<<<<<<
+ * 		formats = FORMAT_CACHE[key] = {}
+ * 	return formats
+ */
+  }
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
+  /* "jdwp.pyx":190
+ * 	if formats is None:
+ * 		formats = FORMAT_CACHE[key] = {}
+ * 	return formats             # <<<<<<<<<<<<<<
+ * 
+ * cdef class JdwpFormat:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  if (!(likely(PyDict_CheckExact(__pyx_v_formats))||((__pyx_v_formats) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "dict", Py_TYPE(__pyx_v_formats)->tp_name), 0))) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_INCREF(__pyx_v_formats);
+  __pyx_r = ((PyObject*)__pyx_v_formats);
   goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_5);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.ipack");
+
+  /* "jdwp.pyx":185
+ * TID_TYPECODE = 'L' if array('L').itemsize == 8 else None
+ * 
+ * cdef dict format_cache(jdwp_buffer* buf):             # <<<<<<<<<<<<<<
+ * 	key = (buf.fSz, buf.mSz, buf.oSz, buf.tSz, buf.sSz)
+ * 	formats = FORMAT_CACHE.get(key)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("jdwp.format_cache", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  Py_XDECREF(__pyx_v_args);
-  Py_DECREF(__pyx_v_sz);
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_fmt);
-  Py_XDECREF(__pyx_args);
-  Py_XDECREF(__pyx_kwds);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XDECREF(__pyx_v_formats);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unpack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+/* "jdwp.pyx":204
+ * 	cdef bytes widths         # per field; zero for strings
+ * 
+ * 	def __init__(self, fmt, fSz=8, mSz=8, oSz=8, tSz=8, sSz=8):             # <<<<<<<<<<<<<<
+ * 		cdef jdwp_buffer cfg
+ * 		cdef int w
+ */
+
+/* Python wrapper */
+static int __pyx_pw_4jdwp_10JdwpFormat_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_4jdwp_10JdwpFormat_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_fmt = 0;
-  PyObject *__pyx_v_data = 0;
-  char *__pyx_v_cfmt;
-  uint64_t __pyx_v_v64;
-  int __pyx_v_imax;
-  int __pyx_v_i;
-  char __pyx_v_op;
-  PyObject *__pyx_v_val;
-  PyObject *__pyx_v_vals;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  Py_ssize_t __pyx_5;
-  static char *__pyx_argnames[] = {"fmt","data",0};
-  __pyx_v_data = __pyx_d7;
-  if (!PyArg_ParseTupleAndKeywords(__pyx_args, __pyx_kwds, "O|O", __pyx_argnames, &__pyx_v_fmt, &__pyx_v_data)) return 0;
-  Py_INCREF(__pyx_v_self);
-  Py_INCREF(__pyx_v_fmt);
-  Py_INCREF(__pyx_v_data);
-  __pyx_v_val = Py_None; Py_INCREF(Py_None);
-  __pyx_v_vals = Py_None; Py_INCREF(Py_None);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":290 */
-  __pyx_1 = __pyx_v_data != Py_None;
-  if (__pyx_1) {
-    __pyx_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_prepareUnpack); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 291; goto __pyx_L1;}
-    __pyx_3 = PyTuple_New(1); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 291; goto __pyx_L1;}
-    Py_INCREF(__pyx_v_data);
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_v_data);
-    __pyx_4 = PyObject_CallObject(__pyx_2, __pyx_3); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 291; goto __pyx_L1;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    goto __pyx_L2;
-  }
-  __pyx_L2:;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":293 */
-  __pyx_v_cfmt = PyString_AsString(__pyx_v_fmt);
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":294 */
-  __pyx_2 = PyList_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; goto __pyx_L1;}
-  Py_INCREF(Py_None);
-  PyList_SET_ITEM(__pyx_2, 0, Py_None);
-  __pyx_5 = PyObject_Length(__pyx_v_fmt); if (__pyx_5 == -1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; goto __pyx_L1;}
-  __pyx_3 = PyInt_FromSsize_t(__pyx_5); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; goto __pyx_L1;}
-  __pyx_4 = PyNumber_Multiply(__pyx_2, __pyx_3); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  Py_DECREF(__pyx_v_vals);
-  __pyx_v_vals = __pyx_4;
-  __pyx_4 = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":295 */
-  __pyx_v_imax = PyInt_GetMax();
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":297 */
-  __pyx_5 = PyObject_Length(__pyx_v_fmt); if (__pyx_5 == -1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; goto __pyx_L1;}
-  for (__pyx_v_i = 0; __pyx_v_i < __pyx_5; ++__pyx_v_i) {
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":298 */
-    __pyx_v_v64 = 0;
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":299 */
-    __pyx_v_op = (__pyx_v_cfmt[__pyx_v_i]);
-
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":300 */
-    __pyx_1 = (__pyx_v_op == '$');
-    if (__pyx_1) {
-      __pyx_2 = PyObject_GetAttr(__pyx_v_self, __pyx_n_unpackStr); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; goto __pyx_L1;}
-      __pyx_3 = PyObject_CallObject(__pyx_2, 0); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; goto __pyx_L1;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      Py_DECREF(__pyx_v_val);
-      __pyx_v_val = __pyx_3;
-      __pyx_3 = 0;
+  PyObject *__pyx_v_fSz = 0;
+  PyObject *__pyx_v_mSz = 0;
+  PyObject *__pyx_v_oSz = 0;
+  PyObject *__pyx_v_tSz = 0;
+  PyObject *__pyx_v_sSz = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fmt,&__pyx_n_s_fSz,&__pyx_n_s_mSz,&__pyx_n_s_oSz,&__pyx_n_s_tSz,&__pyx_n_s_sSz,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+    values[1] = ((PyObject *)__pyx_int_8);
+    values[2] = ((PyObject *)__pyx_int_8);
+    values[3] = ((PyObject *)__pyx_int_8);
+    values[4] = ((PyObject *)__pyx_int_8);
+    values[5] = ((PyObject *)__pyx_int_8);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_fmt)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_fSz);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mSz);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_oSz);
+          if (value) { values[3] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_tSz);
+          if (value) { values[4] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_sSz);
+          if (value) { values[5] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 204, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_fmt = values[0];
+    __pyx_v_fSz = values[1];
+    __pyx_v_mSz = values[2];
+    __pyx_v_oSz = values[3];
+    __pyx_v_tSz = values[4];
+    __pyx_v_sSz = values[5];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 204, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpFormat.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat___init__(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self), __pyx_v_fmt, __pyx_v_fSz, __pyx_v_mSz, __pyx_v_oSz, __pyx_v_tSz, __pyx_v_sSz);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_4jdwp_10JdwpFormat___init__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v_fmt, PyObject *__pyx_v_fSz, PyObject *__pyx_v_mSz, PyObject *__pyx_v_oSz, PyObject *__pyx_v_tSz, PyObject *__pyx_v_sSz) {
+  jdwp_buffer __pyx_v_cfg;
+  int __pyx_v_w;
+  PyObject *__pyx_v_widths = NULL;
+  PyObject *__pyx_v_op = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  uint8_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *(*__pyx_t_4)(PyObject *);
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  long __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "jdwp.pyx":207
+ * 		cdef jdwp_buffer cfg
+ * 		cdef int w
+ * 		cfg.fSz = fSz             # <<<<<<<<<<<<<<
+ * 		cfg.mSz = mSz
+ * 		cfg.oSz = oSz
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_uint8_t(__pyx_v_fSz); if (unlikely((__pyx_t_1 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 207, __pyx_L1_error)
+  __pyx_v_cfg.fSz = __pyx_t_1;
+
+  /* "jdwp.pyx":208
+ * 		cdef int w
+ * 		cfg.fSz = fSz
+ * 		cfg.mSz = mSz             # <<<<<<<<<<<<<<
+ * 		cfg.oSz = oSz
+ * 		cfg.tSz = tSz
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_uint8_t(__pyx_v_mSz); if (unlikely((__pyx_t_1 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 208, __pyx_L1_error)
+  __pyx_v_cfg.mSz = __pyx_t_1;
+
+  /* "jdwp.pyx":209
+ * 		cfg.fSz = fSz
+ * 		cfg.mSz = mSz
+ * 		cfg.oSz = oSz             # <<<<<<<<<<<<<<
+ * 		cfg.tSz = tSz
+ * 		cfg.sSz = sSz
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_uint8_t(__pyx_v_oSz); if (unlikely((__pyx_t_1 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 209, __pyx_L1_error)
+  __pyx_v_cfg.oSz = __pyx_t_1;
+
+  /* "jdwp.pyx":210
+ * 		cfg.mSz = mSz
+ * 		cfg.oSz = oSz
+ * 		cfg.tSz = tSz             # <<<<<<<<<<<<<<
+ * 		cfg.sSz = sSz
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_uint8_t(__pyx_v_tSz); if (unlikely((__pyx_t_1 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_v_cfg.tSz = __pyx_t_1;
+
+  /* "jdwp.pyx":211
+ * 		cfg.oSz = oSz
+ * 		cfg.tSz = tSz
+ * 		cfg.sSz = sSz             # <<<<<<<<<<<<<<
+ * 
+ * 		widths = []
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_uint8_t(__pyx_v_sSz); if (unlikely((__pyx_t_1 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 211, __pyx_L1_error)
+  __pyx_v_cfg.sSz = __pyx_t_1;
+
+  /* "jdwp.pyx":213
+ * 		cfg.sSz = sSz
+ * 
+ * 		widths = []             # <<<<<<<<<<<<<<
+ * 		self.size = 0
+ * 		for op in fmt:
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 213, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_widths = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":214
+ * 
+ * 		widths = []
+ * 		self.size = 0             # <<<<<<<<<<<<<<
+ * 		for op in fmt:
+ * 			if op == '$':
+ */
+  __pyx_v_self->size = 0;
+
+  /* "jdwp.pyx":215
+ * 		widths = []
+ * 		self.size = 0
+ * 		for op in fmt:             # <<<<<<<<<<<<<<
+ * 			if op == '$':
+ * 				w = 0
+ */
+  if (likely(PyList_CheckExact(__pyx_v_fmt)) || PyTuple_CheckExact(__pyx_v_fmt)) {
+    __pyx_t_2 = __pyx_v_fmt; __Pyx_INCREF(__pyx_t_2); __pyx_t_3 = 0;
+    __pyx_t_4 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_fmt); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 215, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_4)) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 215, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 215, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 215, __pyx_L1_error)
+        #else
+        __pyx_t_5 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 215, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
+    } else {
+      __pyx_t_5 = __pyx_t_4(__pyx_t_2);
+      if (unlikely(!__pyx_t_5)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 215, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_op, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "jdwp.pyx":216
+ * 		self.size = 0
+ * 		for op in fmt:
+ * 			if op == '$':             # <<<<<<<<<<<<<<
+ * 				w = 0
+ * 				self.size += 4
+ */
+    __pyx_t_6 = (__Pyx_PyString_Equals(__pyx_v_op, __pyx_kp_s_, Py_EQ)); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 216, __pyx_L1_error)
+    if (__pyx_t_6) {
+
+      /* "jdwp.pyx":217
+ * 		for op in fmt:
+ * 			if op == '$':
+ * 				w = 0             # <<<<<<<<<<<<<<
+ * 				self.size += 4
+ * 			else:
+ */
+      __pyx_v_w = 0;
+
+      /* "jdwp.pyx":218
+ * 			if op == '$':
+ * 				w = 0
+ * 				self.size += 4             # <<<<<<<<<<<<<<
+ * 			else:
+ * 				w = jdwp_size(&cfg, ord(op))
+ */
+      __pyx_v_self->size = (__pyx_v_self->size + 4);
+
+      /* "jdwp.pyx":216
+ * 		self.size = 0
+ * 		for op in fmt:
+ * 			if op == '$':             # <<<<<<<<<<<<<<
+ * 				w = 0
+ * 				self.size += 4
+ */
       goto __pyx_L5;
     }
+
+    /* "jdwp.pyx":220
+ * 				self.size += 4
+ * 			else:
+ * 				w = jdwp_size(&cfg, ord(op))             # <<<<<<<<<<<<<<
+ * 				if w == 0:
+ * 					raise JdwpError(JDWP_OP_UNSUPPORTED)
+ */
     /*else*/ {
+      __pyx_t_7 = __Pyx_PyObject_Ord(__pyx_v_op); if (unlikely(__pyx_t_7 == ((long)(long)(Py_UCS4)-1))) __PYX_ERR(0, 220, __pyx_L1_error)
+      __pyx_v_w = jdwp_size((&__pyx_v_cfg), __pyx_t_7);
+
+      /* "jdwp.pyx":221
+ * 			else:
+ * 				w = jdwp_size(&cfg, ord(op))
+ * 				if w == 0:             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 				if w not in (1, 2, 4, 8):
+ */
+      __pyx_t_6 = ((__pyx_v_w == 0) != 0);
+      if (unlikely(__pyx_t_6)) {
+
+        /* "jdwp.pyx":222
+ * 				w = jdwp_size(&cfg, ord(op))
+ * 				if w == 0:
+ * 					raise JdwpError(JDWP_OP_UNSUPPORTED)             # <<<<<<<<<<<<<<
+ * 				if w not in (1, 2, 4, 8):
+ * 					raise JdwpError(JDWP_SZ_UNSUPPORTED)
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 222, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_9 = __Pyx_PyInt_From_int(JDWP_OP_UNSUPPORTED); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 222, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_8))) {
+          __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_8);
+          if (likely(__pyx_t_10)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+            __Pyx_INCREF(__pyx_t_10);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_8, function);
+          }
+        }
+        __pyx_t_5 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_10, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_9);
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 222, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __PYX_ERR(0, 222, __pyx_L1_error)
+
+        /* "jdwp.pyx":221
+ * 			else:
+ * 				w = jdwp_size(&cfg, ord(op))
+ * 				if w == 0:             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 				if w not in (1, 2, 4, 8):
+ */
+      }
+
+      /* "jdwp.pyx":223
+ * 				if w == 0:
+ * 					raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 				if w not in (1, 2, 4, 8):             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_SZ_UNSUPPORTED)
+ * 				self.size += w
+ */
+      switch (__pyx_v_w) {
+        case 1:
+        case 2:
+        case 4:
+        case 8:
+        __pyx_t_6 = 0;
+        break;
+        default:
+        __pyx_t_6 = 1;
+        break;
+      }
+      __pyx_t_11 = (__pyx_t_6 != 0);
+      if (unlikely(__pyx_t_11)) {
+
+        /* "jdwp.pyx":224
+ * 					raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 				if w not in (1, 2, 4, 8):
+ * 					raise JdwpError(JDWP_SZ_UNSUPPORTED)             # <<<<<<<<<<<<<<
+ * 				self.size += w
+ * 			widths.append(w)
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 224, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_9 = __Pyx_PyInt_From_int(JDWP_SZ_UNSUPPORTED); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 224, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_9);
+        __pyx_t_10 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_8))) {
+          __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_8);
+          if (likely(__pyx_t_10)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+            __Pyx_INCREF(__pyx_t_10);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_8, function);
+          }
+        }
+        __pyx_t_5 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_10, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_9);
+        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
+        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+        if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 224, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __PYX_ERR(0, 224, __pyx_L1_error)
+
+        /* "jdwp.pyx":223
+ * 				if w == 0:
+ * 					raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 				if w not in (1, 2, 4, 8):             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_SZ_UNSUPPORTED)
+ * 				self.size += w
+ */
+      }
 
-      /* "/Code/AndBug/lib/jdwp/jdwp.pyx":303 */
-      jdwp_unpack((&((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self)->buf),(__pyx_v_cfmt[__pyx_v_i]),(&__pyx_v_v64));
-
-      /* "/Code/AndBug/lib/jdwp/jdwp.pyx":305 */
-      __pyx_1 = (__pyx_v_v64 > __pyx_v_imax);
-      if (__pyx_1) {
-        __pyx_4 = PyLong_FromLongLong(__pyx_v_v64); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; goto __pyx_L1;}
-        Py_DECREF(__pyx_v_val);
-        __pyx_v_val = __pyx_4;
-        __pyx_4 = 0;
-        goto __pyx_L6;
-      }
-      __pyx_1 = (__pyx_v_v64 < (-__pyx_v_imax));
-      if (__pyx_1) {
-        __pyx_2 = PyLong_FromLongLong(__pyx_v_v64); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; goto __pyx_L1;}
-        Py_DECREF(__pyx_v_val);
-        __pyx_v_val = __pyx_2;
-        __pyx_2 = 0;
-        goto __pyx_L6;
-      }
-      /*else*/ {
-        __pyx_3 = PyInt_FromLong(__pyx_v_v64); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 310; goto __pyx_L1;}
-        Py_DECREF(__pyx_v_val);
-        __pyx_v_val = __pyx_3;
-        __pyx_3 = 0;
-      }
-      __pyx_L6:;
+      /* "jdwp.pyx":225
+ * 				if w not in (1, 2, 4, 8):
+ * 					raise JdwpError(JDWP_SZ_UNSUPPORTED)
+ * 				self.size += w             # <<<<<<<<<<<<<<
+ * 			widths.append(w)
+ * 
+ */
+      __pyx_v_self->size = (__pyx_v_self->size + __pyx_v_w);
     }
     __pyx_L5:;
 
-    /* "/Code/AndBug/lib/jdwp/jdwp.pyx":312 */
-    __pyx_4 = PyInt_FromLong(__pyx_v_i); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 312; goto __pyx_L1;}
-    if (PyObject_SetItem(__pyx_v_vals, __pyx_4, __pyx_v_val) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 312; goto __pyx_L1;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
+    /* "jdwp.pyx":226
+ * 					raise JdwpError(JDWP_SZ_UNSUPPORTED)
+ * 				self.size += w
+ * 			widths.append(w)             # <<<<<<<<<<<<<<
+ * 
+ * 		self.format = fmt
+ */
+    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_w); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 226, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_12 = __Pyx_PyList_Append(__pyx_v_widths, __pyx_t_5); if (unlikely(__pyx_t_12 == ((int)-1))) __PYX_ERR(0, 226, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "jdwp.pyx":215
+ * 		widths = []
+ * 		self.size = 0
+ * 		for op in fmt:             # <<<<<<<<<<<<<<
+ * 			if op == '$':
+ * 				w = 0
+ */
   }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":314 */
-  Py_INCREF(__pyx_v_vals);
-  __pyx_r = __pyx_v_vals;
-  goto __pyx_L0;
+  /* "jdwp.pyx":228
+ * 			widths.append(w)
+ * 
+ * 		self.format = fmt             # <<<<<<<<<<<<<<
+ * 		self.count = len(fmt)
+ * 		self.widths = bytes(bytearray(widths))
+ */
+  __Pyx_INCREF(__pyx_v_fmt);
+  __Pyx_GIVEREF(__pyx_v_fmt);
+  __Pyx_GOTREF(__pyx_v_self->format);
+  __Pyx_DECREF(__pyx_v_self->format);
+  __pyx_v_self->format = __pyx_v_fmt;
 
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpack");
+  /* "jdwp.pyx":229
+ * 
+ * 		self.format = fmt
+ * 		self.count = len(fmt)             # <<<<<<<<<<<<<<
+ * 		self.widths = bytes(bytearray(widths))
+ * 
+ */
+  __pyx_t_3 = PyObject_Length(__pyx_v_fmt); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 229, __pyx_L1_error)
+  __pyx_v_self->count = __pyx_t_3;
+
+  /* "jdwp.pyx":230
+ * 		self.format = fmt
+ * 		self.count = len(fmt)
+ * 		self.widths = bytes(bytearray(widths))             # <<<<<<<<<<<<<<
+ * 
+ * 	def __repr__(self):
+ */
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_v_widths); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_t_2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 230, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_GIVEREF(__pyx_t_5);
+  __Pyx_GOTREF(__pyx_v_self->widths);
+  __Pyx_DECREF(__pyx_v_self->widths);
+  __pyx_v_self->widths = ((PyObject*)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "jdwp.pyx":204
+ * 	cdef bytes widths         # per field; zero for strings
+ * 
+ * 	def __init__(self, fmt, fSz=8, mSz=8, oSz=8, tSz=8, sSz=8):             # <<<<<<<<<<<<<<
+ * 		cdef jdwp_buffer cfg
+ * 		cdef int w
+ */
+
+  /* function exit code */
   __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
   __pyx_L0:;
-  Py_DECREF(__pyx_v_val);
-  Py_DECREF(__pyx_v_vals);
-  Py_DECREF(__pyx_v_self);
-  Py_DECREF(__pyx_v_fmt);
-  Py_DECREF(__pyx_v_data);
+  __Pyx_XDECREF(__pyx_v_widths);
+  __Pyx_XDECREF(__pyx_v_op);
+  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-static struct __pyx_vtabstruct_4jdwp_JdwpBuffer __pyx_vtable_4jdwp_JdwpBuffer;
 
-static PyObject *__pyx_tp_new_4jdwp_JdwpBuffer(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_4jdwp_JdwpBuffer *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_4jdwp_JdwpBuffer *)o);
-  *(struct __pyx_vtabstruct_4jdwp_JdwpBuffer **)&p->__pyx_vtab = __pyx_vtabptr_4jdwp_JdwpBuffer;
-  if (__pyx_f_4jdwp_10JdwpBuffer___cinit__(o, a, k) < 0) {
-    Py_DECREF(o); o = 0;
-  }
-  return o;
+/* "jdwp.pyx":232
+ * 		self.widths = bytes(bytearray(widths))
+ * 
+ * 	def __repr__(self):             # <<<<<<<<<<<<<<
+ * 		return '<JdwpFormat %r>' % self.format
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_3__repr__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_3__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_2__repr__(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static void __pyx_tp_dealloc_4jdwp_JdwpBuffer(PyObject *o) {
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++o->ob_refcnt;
-    __pyx_f_4jdwp_10JdwpBuffer___dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --o->ob_refcnt;
-    PyErr_Restore(etype, eval, etb);
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_2__repr__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "jdwp.pyx":233
+ * 
+ * 	def __repr__(self):
+ * 		return '<JdwpFormat %r>' % self.format             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef Py_ssize_t measure(self, tuple args) except -1:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyString_FormatSafe(__pyx_kp_s_JdwpFormat_r, __pyx_v_self->format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":232
+ * 		self.widths = bytes(bytearray(widths))
+ * 
+ * 	def __repr__(self):             # <<<<<<<<<<<<<<
+ * 		return '<JdwpFormat %r>' % self.format
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":235
+ * 		return '<JdwpFormat %r>' % self.format
+ * 
+ * 	cdef Py_ssize_t measure(self, tuple args) except -1:             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+ * 		cdef Py_ssize_t sz = self.size
+ */
+
+static Py_ssize_t __pyx_f_4jdwp_10JdwpFormat_measure(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v_args) {
+  unsigned char *__pyx_v_widths;
+  Py_ssize_t __pyx_v_sz;
+  int __pyx_v_i;
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("measure", 0);
+
+  /* "jdwp.pyx":236
+ * 
+ * 	cdef Py_ssize_t measure(self, tuple args) except -1:
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)             # <<<<<<<<<<<<<<
+ * 		cdef Py_ssize_t sz = self.size
+ * 		cdef int i
+ */
+  __pyx_t_1 = __pyx_v_self->widths;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_widths = ((unsigned char *)PyString_AS_STRING(__pyx_t_1));
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":237
+ * 	cdef Py_ssize_t measure(self, tuple args) except -1:
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+ * 		cdef Py_ssize_t sz = self.size             # <<<<<<<<<<<<<<
+ * 		cdef int i
+ * 		if len(args) != self.count:
+ */
+  __pyx_t_2 = __pyx_v_self->size;
+  __pyx_v_sz = __pyx_t_2;
+
+  /* "jdwp.pyx":239
+ * 		cdef Py_ssize_t sz = self.size
+ * 		cdef int i
+ * 		if len(args) != self.count:             # <<<<<<<<<<<<<<
+ * 			raise TypeError('%r expects %i values, not %i' % (
+ * 				self.format, self.count, len(args)
+ */
+  if (unlikely(__pyx_v_args == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 239, __pyx_L1_error)
   }
-  (*o->ob_type->tp_free)(o);
-}
-
-static struct PyMethodDef __pyx_methods_4jdwp_JdwpBuffer[] = {
-  {"packU8", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packU8, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packU16", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packU16, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packU32", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packU32, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packU64", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packU64, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packInt", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packInt, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packLong", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packLong, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packObjectId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packObjectId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packFieldId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packFieldId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packMethodId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packMethodId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packTypeId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packTypeId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packFrameId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packFrameId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackU8", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackU8, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackU16", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackU16, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackU32", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackU32, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackU64", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackU64, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackInt", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackInt, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackFloat", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackFloat, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackDouble", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackDouble, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackLong", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackLong, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackObjectId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackObjectId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackMethodId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackMethodId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackFrameId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackFrameId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackFieldId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackFieldId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackTypeId", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackTypeId, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpackStr", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpackStr, METH_VARARGS|METH_KEYWORDS, 0},
-  {"packStr", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_packStr, METH_VARARGS|METH_KEYWORDS, 0},
-  {"config", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_config, METH_VARARGS|METH_KEYWORDS, 0},
-  {"data", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_data, METH_VARARGS|METH_KEYWORDS, 0},
-  {"preparePack", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_preparePack, METH_VARARGS|METH_KEYWORDS, 0},
-  {"prepareUnpack", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_prepareUnpack, METH_VARARGS|METH_KEYWORDS, 0},
-  {"pack", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_pack, METH_VARARGS|METH_KEYWORDS, 0},
-  {"ipack", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_ipack, METH_VARARGS|METH_KEYWORDS, 0},
-  {"unpack", (PyCFunction)__pyx_f_4jdwp_10JdwpBuffer_unpack, METH_VARARGS|METH_KEYWORDS, 0},
-  {0, 0, 0, 0}
-};
+  __pyx_t_3 = PyTuple_GET_SIZE(__pyx_v_args); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 239, __pyx_L1_error)
+  __pyx_t_4 = ((__pyx_t_3 != __pyx_v_self->count) != 0);
+  if (unlikely(__pyx_t_4)) {
 
-static PyNumberMethods __pyx_tp_as_number_JdwpBuffer = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  0, /*nb_divide*/
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  0, /*nb_coerce*/
-  0, /*nb_int*/
-  0, /*nb_long*/
-  0, /*nb_float*/
-  0, /*nb_oct*/
-  0, /*nb_hex*/
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  0, /*nb_inplace_divide*/
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX
-  0, /*nb_index*/
-  #endif
-};
+    /* "jdwp.pyx":241
+ * 		if len(args) != self.count:
+ * 			raise TypeError('%r expects %i values, not %i' % (
+ * 				self.format, self.count, len(args)             # <<<<<<<<<<<<<<
+ * 			))
+ * 		for i in range(self.count):
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->count); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (unlikely(__pyx_v_args == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 241, __pyx_L1_error)
+    }
+    __pyx_t_3 = PyTuple_GET_SIZE(__pyx_v_args); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 241, __pyx_L1_error)
+    __pyx_t_5 = PyInt_FromSsize_t(__pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 241, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PyTuple_New(3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 241, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_v_self->format);
+    __Pyx_GIVEREF(__pyx_v_self->format);
+    PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_self->format);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_6, 2, __pyx_t_5);
+    __pyx_t_1 = 0;
+    __pyx_t_5 = 0;
 
-static PySequenceMethods __pyx_tp_as_sequence_JdwpBuffer = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
+    /* "jdwp.pyx":240
+ * 		cdef int i
+ * 		if len(args) != self.count:
+ * 			raise TypeError('%r expects %i values, not %i' % (             # <<<<<<<<<<<<<<
+ * 				self.format, self.count, len(args)
+ * 			))
+ */
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_r_expects_i_values_not_i, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 240, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 240, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __PYX_ERR(0, 240, __pyx_L1_error)
 
-static PyMappingMethods __pyx_tp_as_mapping_JdwpBuffer = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
+    /* "jdwp.pyx":239
+ * 		cdef Py_ssize_t sz = self.size
+ * 		cdef int i
+ * 		if len(args) != self.count:             # <<<<<<<<<<<<<<
+ * 			raise TypeError('%r expects %i values, not %i' % (
+ * 				self.format, self.count, len(args)
+ */
+  }
 
-static PyBufferProcs __pyx_tp_as_buffer_JdwpBuffer = {
-  0, /*bf_getreadbuffer*/
-  0, /*bf_getwritebuffer*/
-  0, /*bf_getsegcount*/
-  0, /*bf_getcharbuffer*/
-};
+  /* "jdwp.pyx":243
+ * 				self.format, self.count, len(args)
+ * 			))
+ * 		for i in range(self.count):             # <<<<<<<<<<<<<<
+ * 			if widths[i] == 0:
+ * 				sz += PyString_Size(args[i])
+ */
+  __pyx_t_2 = __pyx_v_self->count;
+  __pyx_t_7 = __pyx_t_2;
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_i = __pyx_t_8;
 
-PyTypeObject __pyx_type_4jdwp_JdwpBuffer = {
-  PyObject_HEAD_INIT(0)
-  0, /*ob_size*/
-  "jdwp.JdwpBuffer", /*tp_name*/
-  sizeof(struct __pyx_obj_4jdwp_JdwpBuffer), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_4jdwp_JdwpBuffer, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_JdwpBuffer, /*tp_as_number*/
-  &__pyx_tp_as_sequence_JdwpBuffer, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_JdwpBuffer, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_JdwpBuffer, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_4jdwp_JdwpBuffer, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_4jdwp_JdwpBuffer, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-};
+    /* "jdwp.pyx":244
+ * 			))
+ * 		for i in range(self.count):
+ * 			if widths[i] == 0:             # <<<<<<<<<<<<<<
+ * 				sz += PyString_Size(args[i])
+ * 		return sz
+ */
+    __pyx_t_4 = (((__pyx_v_widths[__pyx_v_i]) == 0) != 0);
+    if (__pyx_t_4) {
 
-static struct PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
+      /* "jdwp.pyx":245
+ * 		for i in range(self.count):
+ * 			if widths[i] == 0:
+ * 				sz += PyString_Size(args[i])             # <<<<<<<<<<<<<<
+ * 		return sz
+ * 
+ */
+      if (unlikely(__pyx_v_args == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 245, __pyx_L1_error)
+      }
+      __pyx_t_6 = __Pyx_GetItemInt_Tuple(__pyx_v_args, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 245, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_v_sz = (__pyx_v_sz + PyString_Size(__pyx_t_6));
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-static void __pyx_init_filenames(void); /*proto*/
-
-PyMODINIT_FUNC initjdwp(void); /*proto*/
-PyMODINIT_FUNC initjdwp(void) {
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  __pyx_init_filenames();
-  __pyx_m = Py_InitModule4("jdwp", __pyx_methods, 0, 0, PYTHON_API_VERSION);
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; goto __pyx_L1;};
-  Py_INCREF(__pyx_m);
-  __pyx_b = PyImport_AddModule("__builtin__");
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; goto __pyx_L1;};
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; goto __pyx_L1;};
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; goto __pyx_L1;};
-  __pyx_vtabptr_4jdwp_JdwpBuffer = &__pyx_vtable_4jdwp_JdwpBuffer;
-  *(void(**)(void))&__pyx_vtable_4jdwp_JdwpBuffer.size = (void(*)(void))__pyx_f_4jdwp_10JdwpBuffer_size;
-  if (PyType_Ready(&__pyx_type_4jdwp_JdwpBuffer) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; goto __pyx_L1;}
-  if (__Pyx_SetVtable(__pyx_type_4jdwp_JdwpBuffer.tp_dict, __pyx_vtabptr_4jdwp_JdwpBuffer) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; goto __pyx_L1;}
-  if (PyObject_SetAttrString(__pyx_m, "JdwpBuffer", (PyObject *)&__pyx_type_4jdwp_JdwpBuffer) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; goto __pyx_L1;}
-  __pyx_ptype_4jdwp_JdwpBuffer = &__pyx_type_4jdwp_JdwpBuffer;
+      /* "jdwp.pyx":244
+ * 			))
+ * 		for i in range(self.count):
+ * 			if widths[i] == 0:             # <<<<<<<<<<<<<<
+ * 				sz += PyString_Size(args[i])
+ * 		return sz
+ */
+    }
+  }
 
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":67 */
-  __pyx_1 = PyDict_New(); if (!__pyx_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; goto __pyx_L1;}
-  __pyx_2 = PyTuple_New(1); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; goto __pyx_L1;}
-  Py_INCREF(PyExc_Exception);
-  PyTuple_SET_ITEM(__pyx_2, 0, PyExc_Exception);
-  __pyx_3 = __Pyx_CreateClass(__pyx_2, __pyx_1, __pyx_n_JdwpError, "jdwp"); if (!__pyx_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":68 */
-  __pyx_2 = PyCFunction_NewEx(&__pyx_mdef_4jdwp_9JdwpError___init__, 0, __pyx_n_jdwp); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; goto __pyx_L1;}
-  __pyx_4 = PyMethod_New(__pyx_2, 0, __pyx_3); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  if (PyObject_SetAttr(__pyx_3, __pyx_n___init__, __pyx_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; goto __pyx_L1;}
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":72 */
-  __pyx_2 = PyCFunction_NewEx(&__pyx_mdef_4jdwp_9JdwpError___str__, 0, __pyx_n_jdwp); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; goto __pyx_L1;}
-  __pyx_4 = PyMethod_New(__pyx_2, 0, __pyx_3); if (!__pyx_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; goto __pyx_L1;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  if (PyObject_SetAttr(__pyx_3, __pyx_n___str__, __pyx_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; goto __pyx_L1;}
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_JdwpError, __pyx_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; goto __pyx_L1;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":192 */
-  Py_INCREF(Py_None);
-  __pyx_d1 = Py_None;
-  Py_INCREF(Py_None);
-  __pyx_d2 = Py_None;
-  Py_INCREF(Py_None);
-  __pyx_d3 = Py_None;
-  Py_INCREF(Py_None);
-  __pyx_d4 = Py_None;
-  Py_INCREF(Py_None);
-  __pyx_d5 = Py_None;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":232 */
-  __pyx_2 = PyInt_FromLong(1024); if (!__pyx_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; goto __pyx_L1;}
-  __pyx_d6 = __pyx_2;
-  __pyx_2 = 0;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":281 */
-  Py_INCREF(Py_None);
-  __pyx_d7 = Py_None;
-
-  /* "/Code/AndBug/lib/jdwp/jdwp.pyx":356 */
-  return;
-  __pyx_L1:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  __Pyx_AddTraceback("jdwp");
+  /* "jdwp.pyx":246
+ * 			if widths[i] == 0:
+ * 				sz += PyString_Size(args[i])
+ * 		return sz             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef int encode(self, unsigned char* p, tuple args) except -1:
+ */
+  __pyx_r = __pyx_v_sz;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":235
+ * 		return '<JdwpFormat %r>' % self.format
+ * 
+ * 	cdef Py_ssize_t measure(self, tuple args) except -1:             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+ * 		cdef Py_ssize_t sz = self.size
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.measure", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1L;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static char *__pyx_filenames[] = {
-  "jdwp.pyx",
-};
+/* "jdwp.pyx":248
+ * 		return sz
+ * 
+ * 	cdef int encode(self, unsigned char* p, tuple args) except -1:             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+ * 		cdef int i, w
+ */
 
-/* Runtime support code */
+static int __pyx_f_4jdwp_10JdwpFormat_encode(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, unsigned char *__pyx_v_p, PyObject *__pyx_v_args) {
+  unsigned char *__pyx_v_widths;
+  int __pyx_v_i;
+  int __pyx_v_w;
+  Py_ssize_t __pyx_v_n;
+  PyObject *__pyx_v_val = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  uint64_t __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("encode", 0);
 
-static void __pyx_init_filenames(void) {
-  __pyx_f = __pyx_filenames;
-}
+  /* "jdwp.pyx":249
+ * 
+ * 	cdef int encode(self, unsigned char* p, tuple args) except -1:
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)             # <<<<<<<<<<<<<<
+ * 		cdef int i, w
+ * 		cdef Py_ssize_t n
+ */
+  __pyx_t_1 = __pyx_v_self->widths;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_widths = ((unsigned char *)PyString_AS_STRING(__pyx_t_1));
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result)
-        PyErr_SetObject(PyExc_NameError, name);
-    return result;
-}
+  /* "jdwp.pyx":252
+ * 		cdef int i, w
+ * 		cdef Py_ssize_t n
+ * 		for i in range(self.count):             # <<<<<<<<<<<<<<
+ * 			w = widths[i]
+ * 			val = args[i]
+ */
+  __pyx_t_2 = __pyx_v_self->count;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
 
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
+    /* "jdwp.pyx":253
+ * 		cdef Py_ssize_t n
+ * 		for i in range(self.count):
+ * 			w = widths[i]             # <<<<<<<<<<<<<<
+ * 			val = args[i]
+ * 			if w == 0:
+ */
+    __pyx_v_w = (__pyx_v_widths[__pyx_v_i]);
+
+    /* "jdwp.pyx":254
+ * 		for i in range(self.count):
+ * 			w = widths[i]
+ * 			val = args[i]             # <<<<<<<<<<<<<<
+ * 			if w == 0:
+ * 				n = PyString_Size(val)
+ */
+    if (unlikely(__pyx_v_args == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 254, __pyx_L1_error)
+    }
+    __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v_args, __pyx_v_i, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "jdwp.pyx":255
+ * 			w = widths[i]
+ * 			val = args[i]
+ * 			if w == 0:             # <<<<<<<<<<<<<<
+ * 				n = PyString_Size(val)
+ * 				write_be(p, 4, n)
+ */
+    __pyx_t_5 = ((__pyx_v_w == 0) != 0);
+    if (__pyx_t_5) {
+
+      /* "jdwp.pyx":256
+ * 			val = args[i]
+ * 			if w == 0:
+ * 				n = PyString_Size(val)             # <<<<<<<<<<<<<<
+ * 				write_be(p, 4, n)
+ * 				memcpy(p + 4, PyString_AS_STRING(val), n)
+ */
+      __pyx_v_n = PyString_Size(__pyx_v_val);
+
+      /* "jdwp.pyx":257
+ * 			if w == 0:
+ * 				n = PyString_Size(val)
+ * 				write_be(p, 4, n)             # <<<<<<<<<<<<<<
+ * 				memcpy(p + 4, PyString_AS_STRING(val), n)
+ * 				p += 4 + n
+ */
+      __pyx_f_4jdwp_write_be(__pyx_v_p, 4, __pyx_v_n);
+
+      /* "jdwp.pyx":258
+ * 				n = PyString_Size(val)
+ * 				write_be(p, 4, n)
+ * 				memcpy(p + 4, PyString_AS_STRING(val), n)             # <<<<<<<<<<<<<<
+ * 				p += 4 + n
+ * 			else:
+ */
+      (void)(memcpy((__pyx_v_p + 4), PyString_AS_STRING(__pyx_v_val), __pyx_v_n));
+
+      /* "jdwp.pyx":259
+ * 				write_be(p, 4, n)
+ * 				memcpy(p + 4, PyString_AS_STRING(val), n)
+ * 				p += 4 + n             # <<<<<<<<<<<<<<
+ * 			else:
+ * 				write_be(p, w, wrap64(val))
+ */
+      __pyx_v_p = (__pyx_v_p + (4 + __pyx_v_n));
+
+      /* "jdwp.pyx":255
+ * 			w = widths[i]
+ * 			val = args[i]
+ * 			if w == 0:             # <<<<<<<<<<<<<<
+ * 				n = PyString_Size(val)
+ * 				write_be(p, 4, n)
+ */
+      goto __pyx_L5;
+    }
+
+    /* "jdwp.pyx":261
+ * 				p += 4 + n
+ * 			else:
+ * 				write_be(p, w, wrap64(val))             # <<<<<<<<<<<<<<
+ * 				p += w
+ * 		return 0
+ */
+    /*else*/ {
+      __pyx_t_6 = __pyx_f_4jdwp_wrap64(__pyx_v_val); if (unlikely(__pyx_t_6 == ((uint64_t)0) && PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L1_error)
+      __pyx_f_4jdwp_write_be(__pyx_v_p, __pyx_v_w, __pyx_t_6);
+
+      /* "jdwp.pyx":262
+ * 			else:
+ * 				write_be(p, w, wrap64(val))
+ * 				p += w             # <<<<<<<<<<<<<<
+ * 		return 0
+ * 
+ */
+      __pyx_v_p = (__pyx_v_p + __pyx_v_w);
+    }
+    __pyx_L5:;
+  }
+
+  /* "jdwp.pyx":263
+ * 				write_be(p, w, wrap64(val))
+ * 				p += w
+ * 		return 0             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef decode(self, jdwp_buffer* buf, bint as_list):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":248
+ * 		return sz
+ * 
+ * 	cdef int encode(self, unsigned char* p, tuple args) except -1:             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+ * 		cdef int i, w
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.encode", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_val);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":265
+ * 		return 0
+ * 
+ * 	cdef decode(self, jdwp_buffer* buf, bint as_list):             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+ * 		cdef unsigned char* p
+ */
+
+static PyObject *__pyx_f_4jdwp_10JdwpFormat_decode(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, jdwp_buffer *__pyx_v_buf, int __pyx_v_as_list) {
+  unsigned char *__pyx_v_widths;
+  unsigned char *__pyx_v_p;
+  unsigned char *__pyx_v_end;
+  int __pyx_v_i;
+  int __pyx_v_w;
+  uint64_t __pyx_v_n;
+  PyObject *__pyx_v_vals = NULL;
+  PyObject *__pyx_v_val = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("decode", 0);
+
+  /* "jdwp.pyx":266
+ * 
+ * 	cdef decode(self, jdwp_buffer* buf, bint as_list):
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char* p
+ * 		cdef unsigned char* end
+ */
+  __pyx_t_1 = __pyx_v_self->widths;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_widths = ((unsigned char *)PyString_AS_STRING(__pyx_t_1));
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":272
+ * 		cdef uint64_t n
+ * 
+ * 		if buf.data == NULL:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		p = <unsigned char*>buf.data + buf.ofs
+ */
+  __pyx_t_2 = ((__pyx_v_buf->data == NULL) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "jdwp.pyx":273
+ * 
+ * 		if buf.data == NULL:
+ * 			raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 		p = <unsigned char*>buf.data + buf.ofs
+ * 		end = <unsigned char*>buf.data + buf.len
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 273, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 273, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 273, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 273, __pyx_L1_error)
+
+    /* "jdwp.pyx":272
+ * 		cdef uint64_t n
+ * 
+ * 		if buf.data == NULL:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		p = <unsigned char*>buf.data + buf.ofs
+ */
+  }
+
+  /* "jdwp.pyx":274
+ * 		if buf.data == NULL:
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		p = <unsigned char*>buf.data + buf.ofs             # <<<<<<<<<<<<<<
+ * 		end = <unsigned char*>buf.data + buf.len
+ * 		if end - p < self.size:
+ */
+  __pyx_v_p = (((unsigned char *)__pyx_v_buf->data) + __pyx_v_buf->ofs);
+
+  /* "jdwp.pyx":275
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		p = <unsigned char*>buf.data + buf.ofs
+ * 		end = <unsigned char*>buf.data + buf.len             # <<<<<<<<<<<<<<
+ * 		if end - p < self.size:
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ */
+  __pyx_v_end = (((unsigned char *)__pyx_v_buf->data) + __pyx_v_buf->len);
+
+  /* "jdwp.pyx":276
+ * 		p = <unsigned char*>buf.data + buf.ofs
+ * 		end = <unsigned char*>buf.data + buf.len
+ * 		if end - p < self.size:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 
+ */
+  __pyx_t_2 = (((__pyx_v_end - __pyx_v_p) < __pyx_v_self->size) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "jdwp.pyx":277
+ * 		end = <unsigned char*>buf.data + buf.len
+ * 		if end - p < self.size:
+ * 			raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 
+ * 		vals = PyList_New(self.count) if as_list else PyTuple_New(self.count)
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 277, __pyx_L1_error)
+
+    /* "jdwp.pyx":276
+ * 		p = <unsigned char*>buf.data + buf.ofs
+ * 		end = <unsigned char*>buf.data + buf.len
+ * 		if end - p < self.size:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 
+ */
+  }
+
+  /* "jdwp.pyx":279
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 
+ * 		vals = PyList_New(self.count) if as_list else PyTuple_New(self.count)             # <<<<<<<<<<<<<<
+ * 		for i in range(self.count):
+ * 			w = widths[i]
+ */
+  if ((__pyx_v_as_list != 0)) {
+    __pyx_t_3 = PyList_New(__pyx_v_self->count); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_t_3 = 0;
+  } else {
+    __pyx_t_3 = PyTuple_New(__pyx_v_self->count); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_t_3 = 0;
+  }
+  __pyx_v_vals = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":280
+ * 
+ * 		vals = PyList_New(self.count) if as_list else PyTuple_New(self.count)
+ * 		for i in range(self.count):             # <<<<<<<<<<<<<<
+ * 			w = widths[i]
+ * 			if w == 0:
+ */
+  __pyx_t_6 = __pyx_v_self->count;
+  __pyx_t_7 = __pyx_t_6;
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_i = __pyx_t_8;
+
+    /* "jdwp.pyx":281
+ * 		vals = PyList_New(self.count) if as_list else PyTuple_New(self.count)
+ * 		for i in range(self.count):
+ * 			w = widths[i]             # <<<<<<<<<<<<<<
+ * 			if w == 0:
+ * 				if end - p < 4:
+ */
+    __pyx_v_w = (__pyx_v_widths[__pyx_v_i]);
+
+    /* "jdwp.pyx":282
+ * 		for i in range(self.count):
+ * 			w = widths[i]
+ * 			if w == 0:             # <<<<<<<<<<<<<<
+ * 				if end - p < 4:
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ */
+    __pyx_t_2 = ((__pyx_v_w == 0) != 0);
+    if (__pyx_t_2) {
+
+      /* "jdwp.pyx":283
+ * 			w = widths[i]
+ * 			if w == 0:
+ * 				if end - p < 4:             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				n = read_be(p, 4)
+ */
+      __pyx_t_2 = (((__pyx_v_end - __pyx_v_p) < 4) != 0);
+      if (unlikely(__pyx_t_2)) {
+
+        /* "jdwp.pyx":284
+ * 			if w == 0:
+ * 				if end - p < 4:
+ * 					raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 				n = read_be(p, 4)
+ * 				p += 4
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 284, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 284, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 284, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __PYX_ERR(0, 284, __pyx_L1_error)
+
+        /* "jdwp.pyx":283
+ * 			w = widths[i]
+ * 			if w == 0:
+ * 				if end - p < 4:             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				n = read_be(p, 4)
+ */
+      }
+
+      /* "jdwp.pyx":285
+ * 				if end - p < 4:
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				n = read_be(p, 4)             # <<<<<<<<<<<<<<
+ * 				p += 4
+ * 				if <uint64_t>(end - p) < n:
+ */
+      __pyx_v_n = __pyx_f_4jdwp_read_be(__pyx_v_p, 4);
+
+      /* "jdwp.pyx":286
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				n = read_be(p, 4)
+ * 				p += 4             # <<<<<<<<<<<<<<
+ * 				if <uint64_t>(end - p) < n:
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ */
+      __pyx_v_p = (__pyx_v_p + 4);
+
+      /* "jdwp.pyx":287
+ * 				n = read_be(p, 4)
+ * 				p += 4
+ * 				if <uint64_t>(end - p) < n:             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				val = PyString_FromStringAndSize(<char*>p, n)
+ */
+      __pyx_t_2 = ((((uint64_t)(__pyx_v_end - __pyx_v_p)) < __pyx_v_n) != 0);
+      if (unlikely(__pyx_t_2)) {
+
+        /* "jdwp.pyx":288
+ * 				p += 4
+ * 				if <uint64_t>(end - p) < n:
+ * 					raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 				val = PyString_FromStringAndSize(<char*>p, n)
+ * 				p += n
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 288, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 288, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 288, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __PYX_ERR(0, 288, __pyx_L1_error)
+
+        /* "jdwp.pyx":287
+ * 				n = read_be(p, 4)
+ * 				p += 4
+ * 				if <uint64_t>(end - p) < n:             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				val = PyString_FromStringAndSize(<char*>p, n)
+ */
+      }
+
+      /* "jdwp.pyx":289
+ * 				if <uint64_t>(end - p) < n:
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				val = PyString_FromStringAndSize(<char*>p, n)             # <<<<<<<<<<<<<<
+ * 				p += n
+ * 			else:
+ */
+      __pyx_t_1 = PyString_FromStringAndSize(((char *)__pyx_v_p), __pyx_v_n); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 289, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "jdwp.pyx":290
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				val = PyString_FromStringAndSize(<char*>p, n)
+ * 				p += n             # <<<<<<<<<<<<<<
+ * 			else:
+ * 				if end - p < w:
+ */
+      __pyx_v_p = (__pyx_v_p + __pyx_v_n);
+
+      /* "jdwp.pyx":282
+ * 		for i in range(self.count):
+ * 			w = widths[i]
+ * 			if w == 0:             # <<<<<<<<<<<<<<
+ * 				if end - p < 4:
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ */
+      goto __pyx_L7;
+    }
+
+    /* "jdwp.pyx":292
+ * 				p += n
+ * 			else:
+ * 				if end - p < w:             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				val = <long long>read_be(p, w)
+ */
+    /*else*/ {
+      __pyx_t_2 = (((__pyx_v_end - __pyx_v_p) < __pyx_v_w) != 0);
+      if (unlikely(__pyx_t_2)) {
+
+        /* "jdwp.pyx":293
+ * 			else:
+ * 				if end - p < w:
+ * 					raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 				val = <long long>read_be(p, w)
+ * 				p += w
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 293, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 293, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 293, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __PYX_ERR(0, 293, __pyx_L1_error)
+
+        /* "jdwp.pyx":292
+ * 				p += n
+ * 			else:
+ * 				if end - p < w:             # <<<<<<<<<<<<<<
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				val = <long long>read_be(p, w)
+ */
+      }
+
+      /* "jdwp.pyx":294
+ * 				if end - p < w:
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				val = <long long>read_be(p, w)             # <<<<<<<<<<<<<<
+ * 				p += w
+ * 			Py_INCREF(val)
+ */
+      __pyx_t_1 = __Pyx_PyInt_From_PY_LONG_LONG(((PY_LONG_LONG)__pyx_f_4jdwp_read_be(__pyx_v_p, __pyx_v_w))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 294, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_1);
+      __pyx_t_1 = 0;
+
+      /* "jdwp.pyx":295
+ * 					raise JdwpError(JDWP_NEED_LEN)
+ * 				val = <long long>read_be(p, w)
+ * 				p += w             # <<<<<<<<<<<<<<
+ * 			Py_INCREF(val)
+ * 			if as_list:
+ */
+      __pyx_v_p = (__pyx_v_p + __pyx_v_w);
+    }
+    __pyx_L7:;
+
+    /* "jdwp.pyx":296
+ * 				val = <long long>read_be(p, w)
+ * 				p += w
+ * 			Py_INCREF(val)             # <<<<<<<<<<<<<<
+ * 			if as_list:
+ * 				PyList_SET_ITEM(vals, i, val)
+ */
+    Py_INCREF(__pyx_v_val);
+
+    /* "jdwp.pyx":297
+ * 				p += w
+ * 			Py_INCREF(val)
+ * 			if as_list:             # <<<<<<<<<<<<<<
+ * 				PyList_SET_ITEM(vals, i, val)
+ * 			else:
+ */
+    __pyx_t_2 = (__pyx_v_as_list != 0);
+    if (__pyx_t_2) {
+
+      /* "jdwp.pyx":298
+ * 			Py_INCREF(val)
+ * 			if as_list:
+ * 				PyList_SET_ITEM(vals, i, val)             # <<<<<<<<<<<<<<
+ * 			else:
+ * 				PyTuple_SET_ITEM(vals, i, val)
+ */
+      PyList_SET_ITEM(__pyx_v_vals, __pyx_v_i, __pyx_v_val);
+
+      /* "jdwp.pyx":297
+ * 				p += w
+ * 			Py_INCREF(val)
+ * 			if as_list:             # <<<<<<<<<<<<<<
+ * 				PyList_SET_ITEM(vals, i, val)
+ * 			else:
+ */
+      goto __pyx_L11;
+    }
+
+    /* "jdwp.pyx":300
+ * 				PyList_SET_ITEM(vals, i, val)
+ * 			else:
+ * 				PyTuple_SET_ITEM(vals, i, val)             # <<<<<<<<<<<<<<
+ * 
+ * 		buf.ofs = p - <unsigned char*>buf.data
+ */
+    /*else*/ {
+      PyTuple_SET_ITEM(__pyx_v_vals, __pyx_v_i, __pyx_v_val);
+    }
+    __pyx_L11:;
+  }
+
+  /* "jdwp.pyx":302
+ * 				PyTuple_SET_ITEM(vals, i, val)
+ * 
+ * 		buf.ofs = p - <unsigned char*>buf.data             # <<<<<<<<<<<<<<
+ * 		return vals
+ * 
+ */
+  __pyx_v_buf->ofs = (__pyx_v_p - ((unsigned char *)__pyx_v_buf->data));
+
+  /* "jdwp.pyx":303
+ * 
+ * 		buf.ofs = p - <unsigned char*>buf.data
+ * 		return vals             # <<<<<<<<<<<<<<
+ * 
+ * 	def pack(self, *args):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_vals);
+  __pyx_r = __pyx_v_vals;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":265
+ * 		return 0
+ * 
+ * 	cdef decode(self, jdwp_buffer* buf, bint as_list):             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+ * 		cdef unsigned char* p
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.decode", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_vals);
+  __Pyx_XDECREF(__pyx_v_val);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":305
+ * 		return vals
+ * 
+ * 	def pack(self, *args):             # <<<<<<<<<<<<<<
+ * 		'returns the values packed as a string'
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_5pack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpFormat_4pack[] = "returns the values packed as a string";
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_5pack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_args = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pack (wrapper)", 0);
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "pack", 0))) return NULL;
+  __Pyx_INCREF(__pyx_args);
+  __pyx_v_args = __pyx_args;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_4pack(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self), __pyx_v_args);
+
+  /* function exit code */
+  __Pyx_XDECREF(__pyx_v_args);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_4pack(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v_args) {
+  Py_ssize_t __pyx_v_sz;
+  PyObject *__pyx_v_data = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack", 0);
+
+  /* "jdwp.pyx":307
+ * 	def pack(self, *args):
+ * 		'returns the values packed as a string'
+ * 		cdef Py_ssize_t sz = self.measure(args)             # <<<<<<<<<<<<<<
+ * 		data = PyString_FromStringAndSize(NULL, sz)
+ * 		self.encode(<unsigned char*>PyString_AS_STRING(data), args)
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)__pyx_v_self->__pyx_vtab)->measure(__pyx_v_self, __pyx_v_args); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1L))) __PYX_ERR(0, 307, __pyx_L1_error)
+  __pyx_v_sz = __pyx_t_1;
+
+  /* "jdwp.pyx":308
+ * 		'returns the values packed as a string'
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ * 		data = PyString_FromStringAndSize(NULL, sz)             # <<<<<<<<<<<<<<
+ * 		self.encode(<unsigned char*>PyString_AS_STRING(data), args)
+ * 		return data
+ */
+  __pyx_t_2 = PyString_FromStringAndSize(NULL, __pyx_v_sz); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 308, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_data = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":309
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ * 		data = PyString_FromStringAndSize(NULL, sz)
+ * 		self.encode(<unsigned char*>PyString_AS_STRING(data), args)             # <<<<<<<<<<<<<<
+ * 		return data
+ * 
+ */
+  __pyx_t_3 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)__pyx_v_self->__pyx_vtab)->encode(__pyx_v_self, ((unsigned char *)PyString_AS_STRING(__pyx_v_data)), __pyx_v_args); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 309, __pyx_L1_error)
+
+  /* "jdwp.pyx":310
+ * 		data = PyString_FromStringAndSize(NULL, sz)
+ * 		self.encode(<unsigned char*>PyString_AS_STRING(data), args)
+ * 		return data             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef int append(self, JdwpBuffer buf, tuple args) except -1:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_data);
+  __pyx_r = __pyx_v_data;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":305
+ * 		return vals
+ * 
+ * 	def pack(self, *args):             # <<<<<<<<<<<<<<
+ * 		'returns the values packed as a string'
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":312
+ * 		return data
+ * 
+ * 	cdef int append(self, JdwpBuffer buf, tuple args) except -1:             # <<<<<<<<<<<<<<
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ * 		if buf.buf.data == NULL:
+ */
+
+static int __pyx_f_4jdwp_10JdwpFormat_append(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_buf, PyObject *__pyx_v_args) {
+  Py_ssize_t __pyx_v_sz;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("append", 0);
+
+  /* "jdwp.pyx":313
+ * 
+ * 	cdef int append(self, JdwpBuffer buf, tuple args) except -1:
+ * 		cdef Py_ssize_t sz = self.measure(args)             # <<<<<<<<<<<<<<
+ * 		if buf.buf.data == NULL:
+ * 			einz( jdwp_prepare(&buf.buf, NULL, sz) )
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)__pyx_v_self->__pyx_vtab)->measure(__pyx_v_self, __pyx_v_args); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1L))) __PYX_ERR(0, 313, __pyx_L1_error)
+  __pyx_v_sz = __pyx_t_1;
+
+  /* "jdwp.pyx":314
+ * 	cdef int append(self, JdwpBuffer buf, tuple args) except -1:
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ * 		if buf.buf.data == NULL:             # <<<<<<<<<<<<<<
+ * 			einz( jdwp_prepare(&buf.buf, NULL, sz) )
+ * 		else:
+ */
+  __pyx_t_2 = ((__pyx_v_buf->buf.data == NULL) != 0);
+  if (__pyx_t_2) {
+
+    /* "jdwp.pyx":315
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ * 		if buf.buf.data == NULL:
+ * 			einz( jdwp_prepare(&buf.buf, NULL, sz) )             # <<<<<<<<<<<<<<
+ * 		else:
+ * 			einz( jdwp_expand(&buf.buf, sz) )
+ */
+    __pyx_t_3 = __pyx_f_4jdwp_einz(jdwp_prepare((&__pyx_v_buf->buf), NULL, __pyx_v_sz)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 315, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "jdwp.pyx":314
+ * 	cdef int append(self, JdwpBuffer buf, tuple args) except -1:
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ * 		if buf.buf.data == NULL:             # <<<<<<<<<<<<<<
+ * 			einz( jdwp_prepare(&buf.buf, NULL, sz) )
+ * 		else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "jdwp.pyx":317
+ * 			einz( jdwp_prepare(&buf.buf, NULL, sz) )
+ * 		else:
+ * 			einz( jdwp_expand(&buf.buf, sz) )             # <<<<<<<<<<<<<<
+ * 		self.encode(<unsigned char*>buf.buf.data + buf.buf.len, args)
+ * 		buf.buf.len += sz
+ */
+  /*else*/ {
+    __pyx_t_3 = __pyx_f_4jdwp_einz(jdwp_expand((&__pyx_v_buf->buf), __pyx_v_sz)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 317, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_L3:;
+
+  /* "jdwp.pyx":318
+ * 		else:
+ * 			einz( jdwp_expand(&buf.buf, sz) )
+ * 		self.encode(<unsigned char*>buf.buf.data + buf.buf.len, args)             # <<<<<<<<<<<<<<
+ * 		buf.buf.len += sz
+ * 		return 0
+ */
+  __pyx_t_4 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)__pyx_v_self->__pyx_vtab)->encode(__pyx_v_self, (((unsigned char *)__pyx_v_buf->buf.data) + __pyx_v_buf->buf.len), __pyx_v_args); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 318, __pyx_L1_error)
+
+  /* "jdwp.pyx":319
+ * 			einz( jdwp_expand(&buf.buf, sz) )
+ * 		self.encode(<unsigned char*>buf.buf.data + buf.buf.len, args)
+ * 		buf.buf.len += sz             # <<<<<<<<<<<<<<
+ * 		return 0
+ * 
+ */
+  __pyx_v_buf->buf.len = (__pyx_v_buf->buf.len + __pyx_v_sz);
+
+  /* "jdwp.pyx":320
+ * 		self.encode(<unsigned char*>buf.buf.data + buf.buf.len, args)
+ * 		buf.buf.len += sz
+ * 		return 0             # <<<<<<<<<<<<<<
+ * 
+ * 	def packInto(self, JdwpBuffer buf, *args):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":312
+ * 		return data
+ * 
+ * 	cdef int append(self, JdwpBuffer buf, tuple args) except -1:             # <<<<<<<<<<<<<<
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ * 		if buf.buf.data == NULL:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.append", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":322
+ * 		return 0
+ * 
+ * 	def packInto(self, JdwpBuffer buf, *args):             # <<<<<<<<<<<<<<
+ * 		'appends the values to the contents of buf'
+ * 		self.append(buf, args)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_7packInto(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpFormat_6packInto[] = "appends the values to the contents of buf";
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_7packInto(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_buf = 0;
+  PyObject *__pyx_v_args = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packInto (wrapper)", 0);
+  if (PyTuple_GET_SIZE(__pyx_args) > 1) {
+    __pyx_v_args = PyTuple_GetSlice(__pyx_args, 1, PyTuple_GET_SIZE(__pyx_args));
+    if (unlikely(!__pyx_v_args)) {
+      __Pyx_RefNannyFinishContext();
+      return NULL;
+    }
+    __Pyx_GOTREF(__pyx_v_args);
+  } else {
+    __pyx_v_args = __pyx_empty_tuple; __Pyx_INCREF(__pyx_empty_tuple);
+  }
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_buf,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        default:
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_buf)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t used_pos_args = (pos_args < 1) ? pos_args : 1;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, used_pos_args, "packInto") < 0)) __PYX_ERR(0, 322, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) < 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_buf = ((struct __pyx_obj_4jdwp_JdwpBuffer *)values[0]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("packInto", 0, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 322, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_args); __pyx_v_args = 0;
+  __Pyx_AddTraceback("jdwp.JdwpFormat.packInto", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_buf), __pyx_ptype_4jdwp_JdwpBuffer, 1, "buf", 0))) __PYX_ERR(0, 322, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_6packInto(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self), __pyx_v_buf, __pyx_v_args);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_args);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_6packInto(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_buf, PyObject *__pyx_v_args) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packInto", 0);
+
+  /* "jdwp.pyx":324
+ * 	def packInto(self, JdwpBuffer buf, *args):
+ * 		'appends the values to the contents of buf'
+ * 		self.append(buf, args)             # <<<<<<<<<<<<<<
+ * 
+ * 	def writeInto(self, target, Py_ssize_t offset, *args):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)__pyx_v_self->__pyx_vtab)->append(__pyx_v_self, __pyx_v_buf, __pyx_v_args); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 324, __pyx_L1_error)
+
+  /* "jdwp.pyx":322
+ * 		return 0
+ * 
+ * 	def packInto(self, JdwpBuffer buf, *args):             # <<<<<<<<<<<<<<
+ * 		'appends the values to the contents of buf'
+ * 		self.append(buf, args)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("jdwp.JdwpFormat.packInto", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":326
+ * 		self.append(buf, args)
+ * 
+ * 	def writeInto(self, target, Py_ssize_t offset, *args):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		packs the values into the writable buffer target at offset, like
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_9writeInto(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpFormat_8writeInto[] = "\n\t\tpacks the values into the writable buffer target at offset, like\n\t\tstruct.Struct.pack_into; returns the offset after them\n\t\t";
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_9writeInto(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_target = 0;
+  Py_ssize_t __pyx_v_offset;
+  PyObject *__pyx_v_args = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("writeInto (wrapper)", 0);
+  if (PyTuple_GET_SIZE(__pyx_args) > 2) {
+    __pyx_v_args = PyTuple_GetSlice(__pyx_args, 2, PyTuple_GET_SIZE(__pyx_args));
+    if (unlikely(!__pyx_v_args)) {
+      __Pyx_RefNannyFinishContext();
+      return NULL;
+    }
+    __Pyx_GOTREF(__pyx_v_args);
+  } else {
+    __pyx_v_args = __pyx_empty_tuple; __Pyx_INCREF(__pyx_empty_tuple);
+  }
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_target,&__pyx_n_s_offset,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        default:
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_target)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("writeInto", 0, 2, 2, 1); __PYX_ERR(0, 326, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t used_pos_args = (pos_args < 2) ? pos_args : 2;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, used_pos_args, "writeInto") < 0)) __PYX_ERR(0, 326, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) < 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_target = values[0];
+    __pyx_v_offset = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_offset == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 326, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeInto", 0, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 326, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_args); __pyx_v_args = 0;
+  __Pyx_AddTraceback("jdwp.JdwpFormat.writeInto", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_8writeInto(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self), __pyx_v_target, __pyx_v_offset, __pyx_v_args);
+
+  /* function exit code */
+  __Pyx_XDECREF(__pyx_v_args);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_8writeInto(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v_target, Py_ssize_t __pyx_v_offset, PyObject *__pyx_v_args) {
+  Py_buffer __pyx_v_view;
+  Py_ssize_t __pyx_v_sz;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  char const *__pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("writeInto", 0);
+
+  /* "jdwp.pyx":332
+ * 		'''
+ * 		cdef Py_buffer view
+ * 		cdef Py_ssize_t sz = self.measure(args)             # <<<<<<<<<<<<<<
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+ * 		try:
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)__pyx_v_self->__pyx_vtab)->measure(__pyx_v_self, __pyx_v_args); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1L))) __PYX_ERR(0, 332, __pyx_L1_error)
+  __pyx_v_sz = __pyx_t_1;
+
+  /* "jdwp.pyx":333
+ * 		cdef Py_buffer view
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)             # <<<<<<<<<<<<<<
+ * 		try:
+ * 			if offset < 0 or view.len - offset < sz:
+ */
+  __pyx_t_2 = PyObject_GetBuffer(__pyx_v_target, (&__pyx_v_view), PyBUF_WRITABLE); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 333, __pyx_L1_error)
+
+  /* "jdwp.pyx":334
+ * 		cdef Py_ssize_t sz = self.measure(args)
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+ * 		try:             # <<<<<<<<<<<<<<
+ * 			if offset < 0 or view.len - offset < sz:
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+ */
+  /*try:*/ {
+
+    /* "jdwp.pyx":335
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+ * 		try:
+ * 			if offset < 0 or view.len - offset < sz:             # <<<<<<<<<<<<<<
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+ * 					sz, offset, view.len
+ */
+    __pyx_t_4 = ((__pyx_v_offset < 0) != 0);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_3 = __pyx_t_4;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_4 = (((__pyx_v_view.len - __pyx_v_offset) < __pyx_v_sz) != 0);
+    __pyx_t_3 = __pyx_t_4;
+    __pyx_L7_bool_binop_done:;
+    if (unlikely(__pyx_t_3)) {
+
+      /* "jdwp.pyx":337
+ * 			if offset < 0 or view.len - offset < sz:
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+ * 					sz, offset, view.len             # <<<<<<<<<<<<<<
+ * 				))
+ * 			self.encode(<unsigned char*>view.buf + offset, args)
+ */
+      __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_sz); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 337, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = PyInt_FromSsize_t(__pyx_v_offset); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 337, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = PyInt_FromSsize_t(__pyx_v_view.len); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 337, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 337, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_6);
+      __Pyx_GIVEREF(__pyx_t_7);
+      PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_7);
+      __pyx_t_5 = 0;
+      __pyx_t_6 = 0;
+      __pyx_t_7 = 0;
+
+      /* "jdwp.pyx":336
+ * 		try:
+ * 			if offset < 0 or view.len - offset < sz:
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (             # <<<<<<<<<<<<<<
+ * 					sz, offset, view.len
+ * 				))
+ */
+      __pyx_t_7 = __Pyx_PyString_Format(__pyx_kp_s_i_bytes_do_not_fit_at_offset_i, __pyx_t_8); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 336, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 336, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(0, 336, __pyx_L4_error)
+
+      /* "jdwp.pyx":335
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+ * 		try:
+ * 			if offset < 0 or view.len - offset < sz:             # <<<<<<<<<<<<<<
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+ * 					sz, offset, view.len
+ */
+    }
+
+    /* "jdwp.pyx":339
+ * 					sz, offset, view.len
+ * 				))
+ * 			self.encode(<unsigned char*>view.buf + offset, args)             # <<<<<<<<<<<<<<
+ * 		finally:
+ * 			PyBuffer_Release(&view)
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)__pyx_v_self->__pyx_vtab)->encode(__pyx_v_self, (((unsigned char *)__pyx_v_view.buf) + __pyx_v_offset), __pyx_v_args); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 339, __pyx_L4_error)
+  }
+
+  /* "jdwp.pyx":341
+ * 			self.encode(<unsigned char*>view.buf + offset, args)
+ * 		finally:
+ * 			PyBuffer_Release(&view)             # <<<<<<<<<<<<<<
+ * 		return offset + sz
+ * 
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_view));
+      goto __pyx_L5;
+    }
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13) < 0)) __Pyx_ErrFetch(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __Pyx_XGOTREF(__pyx_t_15);
+      __Pyx_XGOTREF(__pyx_t_16);
+      __pyx_t_2 = __pyx_lineno; __pyx_t_9 = __pyx_clineno; __pyx_t_10 = __pyx_filename;
+      {
+        PyBuffer_Release((&__pyx_v_view));
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_XGIVEREF(__pyx_t_15);
+        __Pyx_XGIVEREF(__pyx_t_16);
+        __Pyx_ExceptionReset(__pyx_t_14, __pyx_t_15, __pyx_t_16);
+      }
+      __Pyx_XGIVEREF(__pyx_t_11);
+      __Pyx_XGIVEREF(__pyx_t_12);
+      __Pyx_XGIVEREF(__pyx_t_13);
+      __Pyx_ErrRestore(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+      __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0;
+      __pyx_lineno = __pyx_t_2; __pyx_clineno = __pyx_t_9; __pyx_filename = __pyx_t_10;
+      goto __pyx_L1_error;
+    }
+    __pyx_L5:;
+  }
+
+  /* "jdwp.pyx":342
+ * 		finally:
+ * 			PyBuffer_Release(&view)
+ * 		return offset + sz             # <<<<<<<<<<<<<<
+ * 
+ * 	def unpack(self, JdwpBuffer buf):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_8 = PyInt_FromSsize_t((__pyx_v_offset + __pyx_v_sz)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 342, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":326
+ * 		self.append(buf, args)
+ * 
+ * 	def writeInto(self, target, Py_ssize_t offset, *args):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		packs the values into the writable buffer target at offset, like
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.writeInto", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":344
+ * 		return offset + sz
+ * 
+ * 	def unpack(self, JdwpBuffer buf):             # <<<<<<<<<<<<<<
+ * 		'returns a tuple of values unpacked from buf, advancing past them'
+ * 		return self.decode(&buf.buf, 0)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_11unpack(PyObject *__pyx_v_self, PyObject *__pyx_v_buf); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpFormat_10unpack[] = "returns a tuple of values unpacked from buf, advancing past them";
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_11unpack(PyObject *__pyx_v_self, PyObject *__pyx_v_buf) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpack (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_buf), __pyx_ptype_4jdwp_JdwpBuffer, 1, "buf", 0))) __PYX_ERR(0, 344, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_10unpack(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self), ((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_buf));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_10unpack(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_buf) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpack", 0);
+
+  /* "jdwp.pyx":346
+ * 	def unpack(self, JdwpBuffer buf):
+ * 		'returns a tuple of values unpacked from buf, advancing past them'
+ * 		return self.decode(&buf.buf, 0)             # <<<<<<<<<<<<<<
+ * 
+ * cdef class JdwpBuffer:
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)__pyx_v_self->__pyx_vtab)->decode(__pyx_v_self, (&__pyx_v_buf->buf), 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 346, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":344
+ * 		return offset + sz
+ * 
+ * 	def unpack(self, JdwpBuffer buf):             # <<<<<<<<<<<<<<
+ * 		'returns a tuple of values unpacked from buf, advancing past them'
+ * 		return self.decode(&buf.buf, 0)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.unpack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":199
+ * 	JdwpBuffer.format returns the compiled format for a buffer's sizes.
+ * 	'''
+ * 	cdef readonly object format             # <<<<<<<<<<<<<<
+ * 	cdef readonly int size    # of the fixed fields; strings add their length
+ * 	cdef readonly int count
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_6format_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_6format_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_6format___get__(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_6format___get__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->format);
+  __pyx_r = __pyx_v_self->format;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":200
+ * 	'''
+ * 	cdef readonly object format
+ * 	cdef readonly int size    # of the fixed fields; strings add their length             # <<<<<<<<<<<<<<
+ * 	cdef readonly int count
+ * 	cdef bytes widths         # per field; zero for strings
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_4size_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_4size_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_4size___get__(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_4size___get__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.size.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":201
+ * 	cdef readonly object format
+ * 	cdef readonly int size    # of the fixed fields; strings add their length
+ * 	cdef readonly int count             # <<<<<<<<<<<<<<
+ * 	cdef bytes widths         # per field; zero for strings
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_5count_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_5count_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_5count___get__(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_5count___get__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->count); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 201, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.count.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_12__reduce_cython__(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_12__reduce_cython__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self) {
+  PyObject *__pyx_v_state = 0;
+  PyObject *__pyx_v__dict = 0;
+  int __pyx_v_use_setstate;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":5
+ *     cdef object _dict
+ *     cdef bint use_setstate
+ *     state = (self.count, self.format, self.size, self.widths)             # <<<<<<<<<<<<<<
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->count); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_self->size); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 5, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
+  __Pyx_INCREF(__pyx_v_self->format);
+  __Pyx_GIVEREF(__pyx_v_self->format);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_self->format);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_2);
+  __Pyx_INCREF(__pyx_v_self->widths);
+  __Pyx_GIVEREF(__pyx_v_self->widths);
+  PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_v_self->widths);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_v_state = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":6
+ *     cdef bint use_setstate
+ *     state = (self.count, self.format, self.size, self.widths)
+ *     _dict = getattr(self, '__dict__', None)             # <<<<<<<<<<<<<<
+ *     if _dict is not None:
+ *         state += (_dict,)
+ */
+  __pyx_t_3 = __Pyx_GetAttr3(((PyObject *)__pyx_v_self), __pyx_n_s_dict, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 6, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v__dict = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "(tree fragment)":7
+ *     state = (self.count, self.format, self.size, self.widths)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+  __pyx_t_4 = (__pyx_v__dict != Py_None);
+  __pyx_t_5 = (__pyx_t_4 != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":8
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:
+ *         state += (_dict,)             # <<<<<<<<<<<<<<
+ *         use_setstate = True
+ *     else:
+ */
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_v__dict);
+    __Pyx_GIVEREF(__pyx_v__dict);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v__dict);
+    __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_v_state, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 8, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "(tree fragment)":9
+ *     if _dict is not None:
+ *         state += (_dict,)
+ *         use_setstate = True             # <<<<<<<<<<<<<<
+ *     else:
+ *         use_setstate = self.format is not None or self.widths is not None
+ */
+    __pyx_v_use_setstate = 1;
+
+    /* "(tree fragment)":7
+ *     state = (self.count, self.format, self.size, self.widths)
+ *     _dict = getattr(self, '__dict__', None)
+ *     if _dict is not None:             # <<<<<<<<<<<<<<
+ *         state += (_dict,)
+ *         use_setstate = True
+ */
+    goto __pyx_L3;
+  }
+
+  /* "(tree fragment)":11
+ *         use_setstate = True
+ *     else:
+ *         use_setstate = self.format is not None or self.widths is not None             # <<<<<<<<<<<<<<
+ *     if use_setstate:
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, None), state
+ */
+  /*else*/ {
+    __pyx_t_4 = (__pyx_v_self->format != Py_None);
+    __pyx_t_6 = (__pyx_t_4 != 0);
+    if (!__pyx_t_6) {
+    } else {
+      __pyx_t_5 = __pyx_t_6;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_6 = (__pyx_v_self->widths != ((PyObject*)Py_None));
+    __pyx_t_4 = (__pyx_t_6 != 0);
+    __pyx_t_5 = __pyx_t_4;
+    __pyx_L4_bool_binop_done:;
+    __pyx_v_use_setstate = __pyx_t_5;
+  }
+  __pyx_L3:;
+
+  /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.format is not None or self.widths is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, None), state
+ *     else:
+ */
+  __pyx_t_5 = (__pyx_v_use_setstate != 0);
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":13
+ *         use_setstate = self.format is not None or self.widths is not None
+ *     if use_setstate:
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, None), state             # <<<<<<<<<<<<<<
+ *     else:
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, state)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_pyx_unpickle_JdwpFormat); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_46672903);
+    __Pyx_GIVEREF(__pyx_int_46672903);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_46672903);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, Py_None);
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 13, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_3);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_state);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "(tree fragment)":12
+ *     else:
+ *         use_setstate = self.format is not None or self.widths is not None
+ *     if use_setstate:             # <<<<<<<<<<<<<<
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, None), state
+ *     else:
+ */
+  }
+
+  /* "(tree fragment)":15
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, None), state
+ *     else:
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, state)             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_JdwpFormat__set_state(self, __pyx_state)
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_pyx_unpickle_JdwpFormat); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_INCREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_GIVEREF(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)Py_TYPE(((PyObject *)__pyx_v_self))));
+    __Pyx_INCREF(__pyx_int_46672903);
+    __Pyx_GIVEREF(__pyx_int_46672903);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_int_46672903);
+    __Pyx_INCREF(__pyx_v_state);
+    __Pyx_GIVEREF(__pyx_v_state);
+    PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_state);
+    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 15, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
+    __pyx_t_1 = 0;
+    __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     cdef tuple state
+ *     cdef object _dict
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_state);
+  __Pyx_XDECREF(__pyx_v__dict);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_JdwpFormat__set_state(self, __pyx_state)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpFormat_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpFormat_14__setstate_cython__(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpFormat_14__setstate_cython__(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":17
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, state)
+ * def __setstate_cython__(self, __pyx_state):
+ *     __pyx_unpickle_JdwpFormat__set_state(self, __pyx_state)             # <<<<<<<<<<<<<<
+ */
+  if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4jdwp___pyx_unpickle_JdwpFormat__set_state(__pyx_v_self, ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "(tree fragment)":16
+ *     else:
+ *         return __pyx_unpickle_JdwpFormat, (type(self), 0x2c82c07, state)
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_unpickle_JdwpFormat__set_state(self, __pyx_state)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpFormat.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":354
+ * 	cdef bint viewing
+ * 
+ * 	def __cinit__(self):             # <<<<<<<<<<<<<<
+ * 		self.buf.data = NULL;
+ * 		self.formats = format_cache(&self.buf)
+ */
+
+/* Python wrapper */
+static int __pyx_pw_4jdwp_10JdwpBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_4jdwp_10JdwpBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer___cinit__(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_4jdwp_10JdwpBuffer___cinit__(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "jdwp.pyx":355
+ * 
+ * 	def __cinit__(self):
+ * 		self.buf.data = NULL;             # <<<<<<<<<<<<<<
+ * 		self.formats = format_cache(&self.buf)
+ * 
+ */
+  __pyx_v_self->buf.data = NULL;
+
+  /* "jdwp.pyx":356
+ * 	def __cinit__(self):
+ * 		self.buf.data = NULL;
+ * 		self.formats = format_cache(&self.buf)             # <<<<<<<<<<<<<<
+ * 
+ * 	def __dealloc__(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_format_cache((&__pyx_v_self->buf)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 356, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->formats);
+  __Pyx_DECREF(__pyx_v_self->formats);
+  __pyx_v_self->formats = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":354
+ * 	cdef bint viewing
+ * 
+ * 	def __cinit__(self):             # <<<<<<<<<<<<<<
+ * 		self.buf.data = NULL;
+ * 		self.formats = format_cache(&self.buf)
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":358
+ * 		self.formats = format_cache(&self.buf)
+ * 
+ * 	def __dealloc__(self):             # <<<<<<<<<<<<<<
+ * 		jdwp_purge(&self.buf)
+ * 		self.unview()
+ */
+
+/* Python wrapper */
+static void __pyx_pw_4jdwp_10JdwpBuffer_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_4jdwp_10JdwpBuffer_3__dealloc__(PyObject *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_pf_4jdwp_10JdwpBuffer_2__dealloc__(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_4jdwp_10JdwpBuffer_2__dealloc__(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__dealloc__", 0);
+
+  /* "jdwp.pyx":359
+ * 
+ * 	def __dealloc__(self):
+ * 		jdwp_purge(&self.buf)             # <<<<<<<<<<<<<<
+ * 		self.unview()
+ * 
+ */
+  jdwp_purge((&__pyx_v_self->buf));
+
+  /* "jdwp.pyx":360
+ * 	def __dealloc__(self):
+ * 		jdwp_purge(&self.buf)
+ * 		self.unview()             # <<<<<<<<<<<<<<
+ * 
+ * 	def __len__(self):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)__pyx_v_self->__pyx_vtab)->unview(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":358
+ * 		self.formats = format_cache(&self.buf)
+ * 
+ * 	def __dealloc__(self):             # <<<<<<<<<<<<<<
+ * 		jdwp_purge(&self.buf)
+ * 		self.unview()
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_WriteUnraisable("jdwp.JdwpBuffer.__dealloc__", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "jdwp.pyx":362
+ * 		self.unview()
+ * 
+ * 	def __len__(self):             # <<<<<<<<<<<<<<
+ * 		return self.buf.len - self.buf.ofs
+ * 
+ */
+
+/* Python wrapper */
+static Py_ssize_t __pyx_pw_4jdwp_10JdwpBuffer_5__len__(PyObject *__pyx_v_self); /*proto*/
+static Py_ssize_t __pyx_pw_4jdwp_10JdwpBuffer_5__len__(PyObject *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__len__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_4__len__(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static Py_ssize_t __pyx_pf_4jdwp_10JdwpBuffer_4__len__(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__len__", 0);
+
+  /* "jdwp.pyx":363
+ * 
+ * 	def __len__(self):
+ * 		return self.buf.len - self.buf.ofs             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef unview(self):
+ */
+  __pyx_r = (__pyx_v_self->buf.len - __pyx_v_self->buf.ofs);
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":362
+ * 		self.unview()
+ * 
+ * 	def __len__(self):             # <<<<<<<<<<<<<<
+ * 		return self.buf.len - self.buf.ofs
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":365
+ * 		return self.buf.len - self.buf.ofs
+ * 
+ * 	cdef unview(self):             # <<<<<<<<<<<<<<
+ * 		if self.viewing:
+ * 			self.viewing = 0
+ */
+
+static PyObject *__pyx_f_4jdwp_10JdwpBuffer_unview(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("unview", 0);
+
+  /* "jdwp.pyx":366
+ * 
+ * 	cdef unview(self):
+ * 		if self.viewing:             # <<<<<<<<<<<<<<
+ * 			self.viewing = 0
+ * 			PyBuffer_Release(&self.view)
+ */
+  __pyx_t_1 = (__pyx_v_self->viewing != 0);
+  if (__pyx_t_1) {
+
+    /* "jdwp.pyx":367
+ * 	cdef unview(self):
+ * 		if self.viewing:
+ * 			self.viewing = 0             # <<<<<<<<<<<<<<
+ * 			PyBuffer_Release(&self.view)
+ * 
+ */
+    __pyx_v_self->viewing = 0;
+
+    /* "jdwp.pyx":368
+ * 		if self.viewing:
+ * 			self.viewing = 0
+ * 			PyBuffer_Release(&self.view)             # <<<<<<<<<<<<<<
+ * 
+ * 	def packU8( self, uint8_t byte):
+ */
+    PyBuffer_Release((&__pyx_v_self->view));
+
+    /* "jdwp.pyx":366
+ * 
+ * 	cdef unview(self):
+ * 		if self.viewing:             # <<<<<<<<<<<<<<
+ * 			self.viewing = 0
+ * 			PyBuffer_Release(&self.view)
+ */
+  }
+
+  /* "jdwp.pyx":365
+ * 		return self.buf.len - self.buf.ofs
+ * 
+ * 	cdef unview(self):             # <<<<<<<<<<<<<<
+ * 		if self.viewing:
+ * 			self.viewing = 0
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":370
+ * 			PyBuffer_Release(&self.view)
+ * 
+ * 	def packU8( self, uint8_t byte):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u8(&self.buf, byte) )
+ * 	def packU16( self, uint16_t word ):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_7packU8(PyObject *__pyx_v_self, PyObject *__pyx_arg_byte); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_7packU8(PyObject *__pyx_v_self, PyObject *__pyx_arg_byte) {
+  uint8_t __pyx_v_byte;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packU8 (wrapper)", 0);
+  assert(__pyx_arg_byte); {
+    __pyx_v_byte = __Pyx_PyInt_As_uint8_t(__pyx_arg_byte); if (unlikely((__pyx_v_byte == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 370, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU8", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_6packU8(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint8_t)__pyx_v_byte));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_6packU8(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint8_t __pyx_v_byte) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packU8", 0);
+
+  /* "jdwp.pyx":371
+ * 
+ * 	def packU8( self, uint8_t byte):
+ * 		einz( jdwp_pack_u8(&self.buf, byte) )             # <<<<<<<<<<<<<<
+ * 	def packU16( self, uint16_t word ):
+ * 		einz( jdwp_pack_u16(&self.buf, word) )
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_u8((&__pyx_v_self->buf), __pyx_v_byte)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":370
+ * 			PyBuffer_Release(&self.view)
+ * 
+ * 	def packU8( self, uint8_t byte):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u8(&self.buf, byte) )
+ * 	def packU16( self, uint16_t word ):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU8", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":372
+ * 	def packU8( self, uint8_t byte):
+ * 		einz( jdwp_pack_u8(&self.buf, byte) )
+ * 	def packU16( self, uint16_t word ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u16(&self.buf, word) )
+ * 	def packU32( self, uint32_t quad ):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_9packU16(PyObject *__pyx_v_self, PyObject *__pyx_arg_word); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_9packU16(PyObject *__pyx_v_self, PyObject *__pyx_arg_word) {
+  uint16_t __pyx_v_word;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packU16 (wrapper)", 0);
+  assert(__pyx_arg_word); {
+    __pyx_v_word = __Pyx_PyInt_As_uint16_t(__pyx_arg_word); if (unlikely((__pyx_v_word == ((uint16_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 372, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU16", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_8packU16(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint16_t)__pyx_v_word));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_8packU16(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint16_t __pyx_v_word) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packU16", 0);
+
+  /* "jdwp.pyx":373
+ * 		einz( jdwp_pack_u8(&self.buf, byte) )
+ * 	def packU16( self, uint16_t word ):
+ * 		einz( jdwp_pack_u16(&self.buf, word) )             # <<<<<<<<<<<<<<
+ * 	def packU32( self, uint32_t quad ):
+ * 		einz( jdwp_pack_u32(&self.buf, quad) )
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_u16((&__pyx_v_self->buf), __pyx_v_word)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 373, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":372
+ * 	def packU8( self, uint8_t byte):
+ * 		einz( jdwp_pack_u8(&self.buf, byte) )
+ * 	def packU16( self, uint16_t word ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u16(&self.buf, word) )
+ * 	def packU32( self, uint32_t quad ):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU16", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":374
+ * 	def packU16( self, uint16_t word ):
+ * 		einz( jdwp_pack_u16(&self.buf, word) )
+ * 	def packU32( self, uint32_t quad ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u32(&self.buf, quad) )
+ * 	def packU64( self, uint64_t octet ):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_11packU32(PyObject *__pyx_v_self, PyObject *__pyx_arg_quad); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_11packU32(PyObject *__pyx_v_self, PyObject *__pyx_arg_quad) {
+  uint32_t __pyx_v_quad;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packU32 (wrapper)", 0);
+  assert(__pyx_arg_quad); {
+    __pyx_v_quad = __Pyx_PyInt_As_uint32_t(__pyx_arg_quad); if (unlikely((__pyx_v_quad == ((uint32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 374, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU32", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_10packU32(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint32_t)__pyx_v_quad));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_10packU32(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint32_t __pyx_v_quad) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packU32", 0);
+
+  /* "jdwp.pyx":375
+ * 		einz( jdwp_pack_u16(&self.buf, word) )
+ * 	def packU32( self, uint32_t quad ):
+ * 		einz( jdwp_pack_u32(&self.buf, quad) )             # <<<<<<<<<<<<<<
+ * 	def packU64( self, uint64_t octet ):
+ * 		einz( jdwp_pack_u64(&self.buf, octet) )
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_u32((&__pyx_v_self->buf), __pyx_v_quad)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 375, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":374
+ * 	def packU16( self, uint16_t word ):
+ * 		einz( jdwp_pack_u16(&self.buf, word) )
+ * 	def packU32( self, uint32_t quad ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u32(&self.buf, quad) )
+ * 	def packU64( self, uint64_t octet ):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU32", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":376
+ * 	def packU32( self, uint32_t quad ):
+ * 		einz( jdwp_pack_u32(&self.buf, quad) )
+ * 	def packU64( self, uint64_t octet ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u64(&self.buf, octet) )
+ * 	def packInt(self, int32_t i):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_13packU64(PyObject *__pyx_v_self, PyObject *__pyx_arg_octet); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_13packU64(PyObject *__pyx_v_self, PyObject *__pyx_arg_octet) {
+  uint64_t __pyx_v_octet;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packU64 (wrapper)", 0);
+  assert(__pyx_arg_octet); {
+    __pyx_v_octet = __Pyx_PyInt_As_uint64_t(__pyx_arg_octet); if (unlikely((__pyx_v_octet == ((uint64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 376, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU64", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_12packU64(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint64_t)__pyx_v_octet));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_12packU64(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_octet) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packU64", 0);
+
+  /* "jdwp.pyx":377
+ * 		einz( jdwp_pack_u32(&self.buf, quad) )
+ * 	def packU64( self, uint64_t octet ):
+ * 		einz( jdwp_pack_u64(&self.buf, octet) )             # <<<<<<<<<<<<<<
+ * 	def packInt(self, int32_t i):
+ * 		einz( jdwp_pack_u32(&self.buf, i) )
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_u64((&__pyx_v_self->buf), __pyx_v_octet)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":376
+ * 	def packU32( self, uint32_t quad ):
+ * 		einz( jdwp_pack_u32(&self.buf, quad) )
+ * 	def packU64( self, uint64_t octet ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u64(&self.buf, octet) )
+ * 	def packInt(self, int32_t i):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packU64", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":378
+ * 	def packU64( self, uint64_t octet ):
+ * 		einz( jdwp_pack_u64(&self.buf, octet) )
+ * 	def packInt(self, int32_t i):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u32(&self.buf, i) )
+ * 	def packLong(self, int64_t l):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_15packInt(PyObject *__pyx_v_self, PyObject *__pyx_arg_i); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_15packInt(PyObject *__pyx_v_self, PyObject *__pyx_arg_i) {
+  int32_t __pyx_v_i;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packInt (wrapper)", 0);
+  assert(__pyx_arg_i); {
+    __pyx_v_i = __Pyx_PyInt_As_int32_t(__pyx_arg_i); if (unlikely((__pyx_v_i == ((int32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 378, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packInt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_14packInt(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((int32_t)__pyx_v_i));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_14packInt(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, int32_t __pyx_v_i) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packInt", 0);
+
+  /* "jdwp.pyx":379
+ * 		einz( jdwp_pack_u64(&self.buf, octet) )
+ * 	def packInt(self, int32_t i):
+ * 		einz( jdwp_pack_u32(&self.buf, i) )             # <<<<<<<<<<<<<<
+ * 	def packLong(self, int64_t l):
+ * 		einz( jdwp_pack_u64(&self.buf, l) )
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_u32((&__pyx_v_self->buf), __pyx_v_i)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 379, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":378
+ * 	def packU64( self, uint64_t octet ):
+ * 		einz( jdwp_pack_u64(&self.buf, octet) )
+ * 	def packInt(self, int32_t i):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u32(&self.buf, i) )
+ * 	def packLong(self, int64_t l):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packInt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":380
+ * 	def packInt(self, int32_t i):
+ * 		einz( jdwp_pack_u32(&self.buf, i) )
+ * 	def packLong(self, int64_t l):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u64(&self.buf, l) )
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_17packLong(PyObject *__pyx_v_self, PyObject *__pyx_arg_l); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_17packLong(PyObject *__pyx_v_self, PyObject *__pyx_arg_l) {
+  int64_t __pyx_v_l;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packLong (wrapper)", 0);
+  assert(__pyx_arg_l); {
+    __pyx_v_l = __Pyx_PyInt_As_int64_t(__pyx_arg_l); if (unlikely((__pyx_v_l == ((int64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 380, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packLong", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_16packLong(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((int64_t)__pyx_v_l));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_16packLong(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, int64_t __pyx_v_l) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packLong", 0);
+
+  /* "jdwp.pyx":381
+ * 		einz( jdwp_pack_u32(&self.buf, i) )
+ * 	def packLong(self, int64_t l):
+ * 		einz( jdwp_pack_u64(&self.buf, l) )             # <<<<<<<<<<<<<<
+ * 
+ * 	def packObjectId( self, uint64_t id ):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_u64((&__pyx_v_self->buf), __pyx_v_l)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 381, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":380
+ * 	def packInt(self, int32_t i):
+ * 		einz( jdwp_pack_u32(&self.buf, i) )
+ * 	def packLong(self, int64_t l):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_u64(&self.buf, l) )
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packLong", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":383
+ * 		einz( jdwp_pack_u64(&self.buf, l) )
+ * 
+ * 	def packObjectId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_object_id( &self.buf, id ) )
+ * 	def packFieldId( self, uint64_t id ):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_19packObjectId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_19packObjectId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id) {
+  uint64_t __pyx_v_id;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packObjectId (wrapper)", 0);
+  assert(__pyx_arg_id); {
+    __pyx_v_id = __Pyx_PyInt_As_uint64_t(__pyx_arg_id); if (unlikely((__pyx_v_id == ((uint64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 383, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packObjectId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_18packObjectId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint64_t)__pyx_v_id));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_18packObjectId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packObjectId", 0);
+
+  /* "jdwp.pyx":384
+ * 
+ * 	def packObjectId( self, uint64_t id ):
+ * 		einz( jdwp_pack_object_id( &self.buf, id ) )             # <<<<<<<<<<<<<<
+ * 	def packFieldId( self, uint64_t id ):
+ * 		einz( jdwp_pack_field_id( &self.buf, id ) )
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_object_id((&__pyx_v_self->buf), __pyx_v_id)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":383
+ * 		einz( jdwp_pack_u64(&self.buf, l) )
+ * 
+ * 	def packObjectId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_object_id( &self.buf, id ) )
+ * 	def packFieldId( self, uint64_t id ):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packObjectId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":385
+ * 	def packObjectId( self, uint64_t id ):
+ * 		einz( jdwp_pack_object_id( &self.buf, id ) )
+ * 	def packFieldId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_field_id( &self.buf, id ) )
+ * 	def packMethodId( self, uint64_t id ):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_21packFieldId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_21packFieldId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id) {
+  uint64_t __pyx_v_id;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packFieldId (wrapper)", 0);
+  assert(__pyx_arg_id); {
+    __pyx_v_id = __Pyx_PyInt_As_uint64_t(__pyx_arg_id); if (unlikely((__pyx_v_id == ((uint64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 385, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packFieldId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_20packFieldId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint64_t)__pyx_v_id));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_20packFieldId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packFieldId", 0);
+
+  /* "jdwp.pyx":386
+ * 		einz( jdwp_pack_object_id( &self.buf, id ) )
+ * 	def packFieldId( self, uint64_t id ):
+ * 		einz( jdwp_pack_field_id( &self.buf, id ) )             # <<<<<<<<<<<<<<
+ * 	def packMethodId( self, uint64_t id ):
+ * 		einz( jdwp_pack_method_id( &self.buf, id ) )
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_field_id((&__pyx_v_self->buf), __pyx_v_id)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 386, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":385
+ * 	def packObjectId( self, uint64_t id ):
+ * 		einz( jdwp_pack_object_id( &self.buf, id ) )
+ * 	def packFieldId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_field_id( &self.buf, id ) )
+ * 	def packMethodId( self, uint64_t id ):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packFieldId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":387
+ * 	def packFieldId( self, uint64_t id ):
+ * 		einz( jdwp_pack_field_id( &self.buf, id ) )
+ * 	def packMethodId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_method_id( &self.buf, id ) )
+ * 	def packTypeId( self, uint64_t id ):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_23packMethodId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_23packMethodId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id) {
+  uint64_t __pyx_v_id;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packMethodId (wrapper)", 0);
+  assert(__pyx_arg_id); {
+    __pyx_v_id = __Pyx_PyInt_As_uint64_t(__pyx_arg_id); if (unlikely((__pyx_v_id == ((uint64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 387, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packMethodId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_22packMethodId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint64_t)__pyx_v_id));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_22packMethodId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packMethodId", 0);
+
+  /* "jdwp.pyx":388
+ * 		einz( jdwp_pack_field_id( &self.buf, id ) )
+ * 	def packMethodId( self, uint64_t id ):
+ * 		einz( jdwp_pack_method_id( &self.buf, id ) )             # <<<<<<<<<<<<<<
+ * 	def packTypeId( self, uint64_t id ):
+ * 		einz( jdwp_pack_type_id( &self.buf, id ) )
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_method_id((&__pyx_v_self->buf), __pyx_v_id)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 388, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":387
+ * 	def packFieldId( self, uint64_t id ):
+ * 		einz( jdwp_pack_field_id( &self.buf, id ) )
+ * 	def packMethodId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_method_id( &self.buf, id ) )
+ * 	def packTypeId( self, uint64_t id ):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packMethodId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":389
+ * 	def packMethodId( self, uint64_t id ):
+ * 		einz( jdwp_pack_method_id( &self.buf, id ) )
+ * 	def packTypeId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_type_id( &self.buf, id ) )
+ * 	def packFrameId( self, uint64_t id ):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_25packTypeId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_25packTypeId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id) {
+  uint64_t __pyx_v_id;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packTypeId (wrapper)", 0);
+  assert(__pyx_arg_id); {
+    __pyx_v_id = __Pyx_PyInt_As_uint64_t(__pyx_arg_id); if (unlikely((__pyx_v_id == ((uint64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 389, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packTypeId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_24packTypeId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint64_t)__pyx_v_id));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_24packTypeId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packTypeId", 0);
+
+  /* "jdwp.pyx":390
+ * 		einz( jdwp_pack_method_id( &self.buf, id ) )
+ * 	def packTypeId( self, uint64_t id ):
+ * 		einz( jdwp_pack_type_id( &self.buf, id ) )             # <<<<<<<<<<<<<<
+ * 	def packFrameId( self, uint64_t id ):
+ * 		einz( jdwp_pack_frame_id( &self.buf, id ) )
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_type_id((&__pyx_v_self->buf), __pyx_v_id)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 390, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":389
+ * 	def packMethodId( self, uint64_t id ):
+ * 		einz( jdwp_pack_method_id( &self.buf, id ) )
+ * 	def packTypeId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_type_id( &self.buf, id ) )
+ * 	def packFrameId( self, uint64_t id ):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packTypeId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":391
+ * 	def packTypeId( self, uint64_t id ):
+ * 		einz( jdwp_pack_type_id( &self.buf, id ) )
+ * 	def packFrameId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_frame_id( &self.buf, id ) )
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_27packFrameId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_27packFrameId(PyObject *__pyx_v_self, PyObject *__pyx_arg_id) {
+  uint64_t __pyx_v_id;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packFrameId (wrapper)", 0);
+  assert(__pyx_arg_id); {
+    __pyx_v_id = __Pyx_PyInt_As_uint64_t(__pyx_arg_id); if (unlikely((__pyx_v_id == ((uint64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 391, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packFrameId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_26packFrameId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint64_t)__pyx_v_id));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_26packFrameId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint64_t __pyx_v_id) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packFrameId", 0);
+
+  /* "jdwp.pyx":392
+ * 		einz( jdwp_pack_type_id( &self.buf, id ) )
+ * 	def packFrameId( self, uint64_t id ):
+ * 		einz( jdwp_pack_frame_id( &self.buf, id ) )             # <<<<<<<<<<<<<<
+ * 
+ * 	def unpackU8(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_frame_id((&__pyx_v_self->buf), __pyx_v_id)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":391
+ * 	def packTypeId( self, uint64_t id ):
+ * 		einz( jdwp_pack_type_id( &self.buf, id ) )
+ * 	def packFrameId( self, uint64_t id ):             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_frame_id( &self.buf, id ) )
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packFrameId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":394
+ * 		einz( jdwp_pack_frame_id( &self.buf, id ) )
+ * 
+ * 	def unpackU8(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint8_t x
+ * 		einz( jdwp_unpack_u8(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_29unpackU8(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_29unpackU8(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackU8 (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_28unpackU8(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_28unpackU8(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint8_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackU8", 0);
+
+  /* "jdwp.pyx":396
+ * 	def unpackU8(self):
+ * 		cdef uint8_t x
+ * 		einz( jdwp_unpack_u8(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return x
+ * 	def unpackU16(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u8((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 396, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":397
+ * 		cdef uint8_t x
+ * 		einz( jdwp_unpack_u8(&self.buf, &x) )
+ * 		return x             # <<<<<<<<<<<<<<
+ * 	def unpackU16(self):
+ * 		cdef uint16_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint8_t(__pyx_v_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 397, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":394
+ * 		einz( jdwp_pack_frame_id( &self.buf, id ) )
+ * 
+ * 	def unpackU8(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint8_t x
+ * 		einz( jdwp_unpack_u8(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackU8", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":398
+ * 		einz( jdwp_unpack_u8(&self.buf, &x) )
+ * 		return x
+ * 	def unpackU16(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint16_t x
+ * 		einz( jdwp_unpack_u16(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_31unpackU16(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_31unpackU16(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackU16 (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_30unpackU16(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_30unpackU16(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint16_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackU16", 0);
+
+  /* "jdwp.pyx":400
+ * 	def unpackU16(self):
+ * 		cdef uint16_t x
+ * 		einz( jdwp_unpack_u16(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return x
+ * 	def unpackU32(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u16((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":401
+ * 		cdef uint16_t x
+ * 		einz( jdwp_unpack_u16(&self.buf, &x) )
+ * 		return x             # <<<<<<<<<<<<<<
+ * 	def unpackU32(self):
+ * 		cdef uint32_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint16_t(__pyx_v_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 401, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":398
+ * 		einz( jdwp_unpack_u8(&self.buf, &x) )
+ * 		return x
+ * 	def unpackU16(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint16_t x
+ * 		einz( jdwp_unpack_u16(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackU16", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":402
+ * 		einz( jdwp_unpack_u16(&self.buf, &x) )
+ * 		return x
+ * 	def unpackU32(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint32_t x
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_33unpackU32(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_33unpackU32(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackU32 (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_32unpackU32(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_32unpackU32(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint32_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackU32", 0);
+
+  /* "jdwp.pyx":404
+ * 	def unpackU32(self):
+ * 		cdef uint32_t x
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return x
+ * 	def unpackU64(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u32((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 404, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":405
+ * 		cdef uint32_t x
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ * 		return x             # <<<<<<<<<<<<<<
+ * 	def unpackU64(self):
+ * 		cdef uint64_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint32_t(__pyx_v_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 405, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":402
+ * 		einz( jdwp_unpack_u16(&self.buf, &x) )
+ * 		return x
+ * 	def unpackU32(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint32_t x
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackU32", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":406
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ * 		return x
+ * 	def unpackU64(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_35unpackU64(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_35unpackU64(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackU64 (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_34unpackU64(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_34unpackU64(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint64_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackU64", 0);
+
+  /* "jdwp.pyx":408
+ * 	def unpackU64(self):
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return x
+ * 	def unpackInt(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u64((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 408, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":409
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ * 		return x             # <<<<<<<<<<<<<<
+ * 	def unpackInt(self):
+ * 		cdef uint32_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint64_t(__pyx_v_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":406
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ * 		return x
+ * 	def unpackU64(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackU64", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":410
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ * 		return x
+ * 	def unpackInt(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint32_t x
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_37unpackInt(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_37unpackInt(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackInt (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_36unpackInt(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_36unpackInt(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint32_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackInt", 0);
+
+  /* "jdwp.pyx":412
+ * 	def unpackInt(self):
+ * 		cdef uint32_t x
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return <int32_t>x
+ * 	def unpackFloat(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u32((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":413
+ * 		cdef uint32_t x
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ * 		return <int32_t>x             # <<<<<<<<<<<<<<
+ * 	def unpackFloat(self):
+ * 		cdef uint32_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int32_t(((int32_t)__pyx_v_x)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 413, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":410
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ * 		return x
+ * 	def unpackInt(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint32_t x
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackInt", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":414
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ * 		return <int32_t>x
+ * 	def unpackFloat(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint32_t x
+ * 		cdef float f
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_39unpackFloat(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_39unpackFloat(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackFloat (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_38unpackFloat(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_38unpackFloat(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint32_t __pyx_v_x;
+  float __pyx_v_f;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackFloat", 0);
+
+  /* "jdwp.pyx":417
+ * 		cdef uint32_t x
+ * 		cdef float f
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		memcpy(&f, &x, 4)
+ * 		return f
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u32((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":418
+ * 		cdef float f
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ * 		memcpy(&f, &x, 4)             # <<<<<<<<<<<<<<
+ * 		return f
+ * 	def unpackDouble(self):
+ */
+  (void)(memcpy((&__pyx_v_f), (&__pyx_v_x), 4));
+
+  /* "jdwp.pyx":419
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ * 		memcpy(&f, &x, 4)
+ * 		return f             # <<<<<<<<<<<<<<
+ * 	def unpackDouble(self):
+ * 		cdef uint64_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_f); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 419, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":414
+ * 		einz( jdwp_unpack_u32(&self.buf, &x) )
+ * 		return <int32_t>x
+ * 	def unpackFloat(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint32_t x
+ * 		cdef float f
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackFloat", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":420
+ * 		memcpy(&f, &x, 4)
+ * 		return f
+ * 	def unpackDouble(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		cdef double d
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_41unpackDouble(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_41unpackDouble(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackDouble (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_40unpackDouble(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_40unpackDouble(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint64_t __pyx_v_x;
+  double __pyx_v_d;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackDouble", 0);
+
+  /* "jdwp.pyx":423
+ * 		cdef uint64_t x
+ * 		cdef double d
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		memcpy(&d, &x, 8)
+ * 		return d
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u64((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":424
+ * 		cdef double d
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ * 		memcpy(&d, &x, 8)             # <<<<<<<<<<<<<<
+ * 		return d
+ * 
+ */
+  (void)(memcpy((&__pyx_v_d), (&__pyx_v_x), 8));
+
+  /* "jdwp.pyx":425
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ * 		memcpy(&d, &x, 8)
+ * 		return d             # <<<<<<<<<<<<<<
+ * 
+ * 	def unpackLong(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_d); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 425, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":420
+ * 		memcpy(&f, &x, 4)
+ * 		return f
+ * 	def unpackDouble(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		cdef double d
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackDouble", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":427
+ * 		return d
+ * 
+ * 	def unpackLong(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_43unpackLong(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_43unpackLong(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackLong (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_42unpackLong(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_42unpackLong(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint64_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackLong", 0);
+
+  /* "jdwp.pyx":429
+ * 	def unpackLong(self):
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return <int64_t>x
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_u64((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 429, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":430
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ * 		return <int64_t>x             # <<<<<<<<<<<<<<
+ * 
+ * 	def unpackObjectId(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int64_t(((int64_t)__pyx_v_x)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 430, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":427
+ * 		return d
+ * 
+ * 	def unpackLong(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_u64(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackLong", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":432
+ * 		return <int64_t>x
+ * 
+ * 	def unpackObjectId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_object_id(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_45unpackObjectId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_45unpackObjectId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackObjectId (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_44unpackObjectId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_44unpackObjectId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint64_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackObjectId", 0);
+
+  /* "jdwp.pyx":434
+ * 	def unpackObjectId(self):
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_object_id(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return x
+ * 	def unpackMethodId(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_object_id((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 434, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":435
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_object_id(&self.buf, &x) )
+ * 		return x             # <<<<<<<<<<<<<<
+ * 	def unpackMethodId(self):
+ * 		cdef uint64_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint64_t(__pyx_v_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 435, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":432
+ * 		return <int64_t>x
+ * 
+ * 	def unpackObjectId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_object_id(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackObjectId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":436
+ * 		einz( jdwp_unpack_object_id(&self.buf, &x) )
+ * 		return x
+ * 	def unpackMethodId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_method_id(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_47unpackMethodId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_47unpackMethodId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackMethodId (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_46unpackMethodId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_46unpackMethodId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint64_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackMethodId", 0);
+
+  /* "jdwp.pyx":438
+ * 	def unpackMethodId(self):
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_method_id(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return x
+ * 	def unpackFrameId(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_method_id((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 438, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":439
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_method_id(&self.buf, &x) )
+ * 		return x             # <<<<<<<<<<<<<<
+ * 	def unpackFrameId(self):
+ * 		cdef uint64_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint64_t(__pyx_v_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 439, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":436
+ * 		einz( jdwp_unpack_object_id(&self.buf, &x) )
+ * 		return x
+ * 	def unpackMethodId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_method_id(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackMethodId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":440
+ * 		einz( jdwp_unpack_method_id(&self.buf, &x) )
+ * 		return x
+ * 	def unpackFrameId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_frame_id(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_49unpackFrameId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_49unpackFrameId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackFrameId (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_48unpackFrameId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_48unpackFrameId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint64_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackFrameId", 0);
+
+  /* "jdwp.pyx":442
+ * 	def unpackFrameId(self):
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_frame_id(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return x
+ * 	def unpackFieldId(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_frame_id((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 442, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":443
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_frame_id(&self.buf, &x) )
+ * 		return x             # <<<<<<<<<<<<<<
+ * 	def unpackFieldId(self):
+ * 		cdef uint64_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint64_t(__pyx_v_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":440
+ * 		einz( jdwp_unpack_method_id(&self.buf, &x) )
+ * 		return x
+ * 	def unpackFrameId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_frame_id(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackFrameId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":444
+ * 		einz( jdwp_unpack_frame_id(&self.buf, &x) )
+ * 		return x
+ * 	def unpackFieldId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_field_id(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_51unpackFieldId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_51unpackFieldId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackFieldId (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_50unpackFieldId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_50unpackFieldId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint64_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackFieldId", 0);
+
+  /* "jdwp.pyx":446
+ * 	def unpackFieldId(self):
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_field_id(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return x
+ * 	def unpackTypeId(self):
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_field_id((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":447
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_field_id(&self.buf, &x) )
+ * 		return x             # <<<<<<<<<<<<<<
+ * 	def unpackTypeId(self):
+ * 		cdef uint64_t x
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint64_t(__pyx_v_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":444
+ * 		einz( jdwp_unpack_frame_id(&self.buf, &x) )
+ * 		return x
+ * 	def unpackFieldId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_field_id(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackFieldId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":448
+ * 		einz( jdwp_unpack_field_id(&self.buf, &x) )
+ * 		return x
+ * 	def unpackTypeId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_type_id(&self.buf, &x) )
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_53unpackTypeId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_53unpackTypeId(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackTypeId (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_52unpackTypeId(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_52unpackTypeId(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint64_t __pyx_v_x;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackTypeId", 0);
+
+  /* "jdwp.pyx":450
+ * 	def unpackTypeId(self):
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_type_id(&self.buf, &x) )             # <<<<<<<<<<<<<<
+ * 		return x
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_type_id((&__pyx_v_self->buf), (&__pyx_v_x))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":451
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_type_id(&self.buf, &x) )
+ * 		return x             # <<<<<<<<<<<<<<
+ * 
+ * 	def unpackArray(self, tag, uint32_t count):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint64_t(__pyx_v_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 451, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":448
+ * 		einz( jdwp_unpack_field_id(&self.buf, &x) )
+ * 		return x
+ * 	def unpackTypeId(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint64_t x
+ * 		einz( jdwp_unpack_type_id(&self.buf, &x) )
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackTypeId", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":453
+ * 		return x
+ * 
+ * 	def unpackArray(self, tag, uint32_t count):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		unpacks count untagged primitives of the type tag, as found in an
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_55unpackArray(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_54unpackArray[] = "\n\t\tunpacks count untagged primitives of the type tag, as found in an\n\t\tArrayReference.GetValues reply; byte and boolean elements are\n\t\treturned as a string, others as an array.array\n\t\t";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_55unpackArray(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_tag = 0;
+  uint32_t __pyx_v_count;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackArray (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_tag,&__pyx_n_s_count,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_tag)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_count)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("unpackArray", 1, 2, 2, 1); __PYX_ERR(0, 453, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "unpackArray") < 0)) __PYX_ERR(0, 453, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_tag = values[0];
+    __pyx_v_count = __Pyx_PyInt_As_uint32_t(values[1]); if (unlikely((__pyx_v_count == ((uint32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 453, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("unpackArray", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 453, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackArray", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_54unpackArray(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), __pyx_v_tag, __pyx_v_count);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_54unpackArray(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_tag, uint32_t __pyx_v_count) {
+  Py_ssize_t __pyx_v_sz;
+  PyObject *__pyx_v_w = NULL;
+  PyObject *__pyx_v_raw = NULL;
+  PyObject *__pyx_v_code = NULL;
+  PyObject *__pyx_v_arr = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  long __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackArray", 0);
+  __Pyx_INCREF(__pyx_v_tag);
+
+  /* "jdwp.pyx":460
+ * 		'''
+ * 		cdef Py_ssize_t sz
+ * 		if not isinstance(tag, (int, long)):             # <<<<<<<<<<<<<<
+ * 			tag = ord(tag)
+ * 		w = ARRAY_WIDTHS.get(tag)
+ */
+  __pyx_t_2 = PyInt_Check(__pyx_v_tag); 
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = PyLong_Check(__pyx_v_tag); 
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "jdwp.pyx":461
+ * 		cdef Py_ssize_t sz
+ * 		if not isinstance(tag, (int, long)):
+ * 			tag = ord(tag)             # <<<<<<<<<<<<<<
+ * 		w = ARRAY_WIDTHS.get(tag)
+ * 		if w is None:
+ */
+    __pyx_t_4 = __Pyx_PyObject_Ord(__pyx_v_tag); if (unlikely(__pyx_t_4 == ((long)(long)(Py_UCS4)-1))) __PYX_ERR(0, 461, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyInt_From_long(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 461, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF_SET(__pyx_v_tag, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "jdwp.pyx":460
+ * 		'''
+ * 		cdef Py_ssize_t sz
+ * 		if not isinstance(tag, (int, long)):             # <<<<<<<<<<<<<<
+ * 			tag = ord(tag)
+ * 		w = ARRAY_WIDTHS.get(tag)
+ */
+  }
+
+  /* "jdwp.pyx":462
+ * 		if not isinstance(tag, (int, long)):
+ * 			tag = ord(tag)
+ * 		w = ARRAY_WIDTHS.get(tag)             # <<<<<<<<<<<<<<
+ * 		if w is None:
+ * 			raise JdwpError(JDWP_OP_UNSUPPORTED)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_ARRAY_WIDTHS); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 462, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_get); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 462, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_7, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_6, __pyx_v_tag) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_v_tag);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 462, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_v_w = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "jdwp.pyx":463
+ * 			tag = ord(tag)
+ * 		w = ARRAY_WIDTHS.get(tag)
+ * 		if w is None:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 		sz = count * w
+ */
+  __pyx_t_2 = (__pyx_v_w == Py_None);
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "jdwp.pyx":464
+ * 		w = ARRAY_WIDTHS.get(tag)
+ * 		if w is None:
+ * 			raise JdwpError(JDWP_OP_UNSUPPORTED)             # <<<<<<<<<<<<<<
+ * 		sz = count * w
+ * 		if self.buf.len - self.buf.ofs < sz:
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 464, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_6 = __Pyx_PyInt_From_int(JDWP_OP_UNSUPPORTED); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 464, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_7, __pyx_t_8, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_7, __pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 464, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __PYX_ERR(0, 464, __pyx_L1_error)
+
+    /* "jdwp.pyx":463
+ * 			tag = ord(tag)
+ * 		w = ARRAY_WIDTHS.get(tag)
+ * 		if w is None:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 		sz = count * w
+ */
+  }
+
+  /* "jdwp.pyx":465
+ * 		if w is None:
+ * 			raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 		sz = count * w             # <<<<<<<<<<<<<<
+ * 		if self.buf.len - self.buf.ofs < sz:
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ */
+  __pyx_t_5 = __Pyx_PyInt_From_uint32_t(__pyx_v_count); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 465, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_7 = PyNumber_Multiply(__pyx_t_5, __pyx_v_w); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 465, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_9 = __Pyx_PyIndex_AsSsize_t(__pyx_t_7); if (unlikely((__pyx_t_9 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 465, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_v_sz = __pyx_t_9;
+
+  /* "jdwp.pyx":466
+ * 			raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 		sz = count * w
+ * 		if self.buf.len - self.buf.ofs < sz:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		raw = PyString_FromStringAndSize(self.buf.data + self.buf.ofs, sz)
+ */
+  __pyx_t_1 = (((__pyx_v_self->buf.len - __pyx_v_self->buf.ofs) < __pyx_v_sz) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "jdwp.pyx":467
+ * 		sz = count * w
+ * 		if self.buf.len - self.buf.ofs < sz:
+ * 			raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 		raw = PyString_FromStringAndSize(self.buf.data + self.buf.ofs, sz)
+ * 		self.buf.ofs += sz
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 467, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 467, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_7 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_8, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 467, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_7, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __PYX_ERR(0, 467, __pyx_L1_error)
+
+    /* "jdwp.pyx":466
+ * 			raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 		sz = count * w
+ * 		if self.buf.len - self.buf.ofs < sz:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		raw = PyString_FromStringAndSize(self.buf.data + self.buf.ofs, sz)
+ */
+  }
+
+  /* "jdwp.pyx":468
+ * 		if self.buf.len - self.buf.ofs < sz:
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		raw = PyString_FromStringAndSize(self.buf.data + self.buf.ofs, sz)             # <<<<<<<<<<<<<<
+ * 		self.buf.ofs += sz
+ * 		if w == 1:
+ */
+  __pyx_t_7 = PyString_FromStringAndSize((__pyx_v_self->buf.data + __pyx_v_self->buf.ofs), __pyx_v_sz); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 468, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_v_raw = __pyx_t_7;
+  __pyx_t_7 = 0;
+
+  /* "jdwp.pyx":469
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		raw = PyString_FromStringAndSize(self.buf.data + self.buf.ofs, sz)
+ * 		self.buf.ofs += sz             # <<<<<<<<<<<<<<
+ * 		if w == 1:
+ * 			return raw
+ */
+  __pyx_v_self->buf.ofs = (__pyx_v_self->buf.ofs + __pyx_v_sz);
+
+  /* "jdwp.pyx":470
+ * 		raw = PyString_FromStringAndSize(self.buf.data + self.buf.ofs, sz)
+ * 		self.buf.ofs += sz
+ * 		if w == 1:             # <<<<<<<<<<<<<<
+ * 			return raw
+ * 
+ */
+  __pyx_t_7 = __Pyx_PyInt_EqObjC(__pyx_v_w, __pyx_int_1, 1, 0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 470, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 470, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (__pyx_t_1) {
+
+    /* "jdwp.pyx":471
+ * 		self.buf.ofs += sz
+ * 		if w == 1:
+ * 			return raw             # <<<<<<<<<<<<<<
+ * 
+ * 		code = ARRAY_TYPECODES[tag]
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_raw);
+    __pyx_r = __pyx_v_raw;
+    goto __pyx_L0;
+
+    /* "jdwp.pyx":470
+ * 		raw = PyString_FromStringAndSize(self.buf.data + self.buf.ofs, sz)
+ * 		self.buf.ofs += sz
+ * 		if w == 1:             # <<<<<<<<<<<<<<
+ * 			return raw
+ * 
+ */
+  }
+
+  /* "jdwp.pyx":473
+ * 			return raw
+ * 
+ * 		code = ARRAY_TYPECODES[tag]             # <<<<<<<<<<<<<<
+ * 		if code is None:
+ * 			return struct.unpack('>%iq' % count, raw)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_ARRAY_TYPECODES); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_7, __pyx_v_tag); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_v_code = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "jdwp.pyx":474
+ * 
+ * 		code = ARRAY_TYPECODES[tag]
+ * 		if code is None:             # <<<<<<<<<<<<<<
+ * 			return struct.unpack('>%iq' % count, raw)
+ * 		arr = array(code)
+ */
+  __pyx_t_1 = (__pyx_v_code == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "jdwp.pyx":475
+ * 		code = ARRAY_TYPECODES[tag]
+ * 		if code is None:
+ * 			return struct.unpack('>%iq' % count, raw)             # <<<<<<<<<<<<<<
+ * 		arr = array(code)
+ * 		arr.fromstring(raw)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_struct); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 475, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_unpack); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 475, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_7 = __Pyx_PyInt_From_uint32_t(__pyx_v_count); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 475, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyString_Format(__pyx_kp_s_iq, __pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 475, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_7 = NULL;
+    __pyx_t_10 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+        __pyx_t_10 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_6)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_t_8, __pyx_v_raw};
+      __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 475, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_t_8, __pyx_v_raw};
+      __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 475, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_11 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 475, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      if (__pyx_t_7) {
+        __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_7); __pyx_t_7 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_8);
+      PyTuple_SET_ITEM(__pyx_t_11, 0+__pyx_t_10, __pyx_t_8);
+      __Pyx_INCREF(__pyx_v_raw);
+      __Pyx_GIVEREF(__pyx_v_raw);
+      PyTuple_SET_ITEM(__pyx_t_11, 1+__pyx_t_10, __pyx_v_raw);
+      __pyx_t_8 = 0;
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_11, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 475, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_r = __pyx_t_5;
+    __pyx_t_5 = 0;
+    goto __pyx_L0;
+
+    /* "jdwp.pyx":474
+ * 
+ * 		code = ARRAY_TYPECODES[tag]
+ * 		if code is None:             # <<<<<<<<<<<<<<
+ * 			return struct.unpack('>%iq' % count, raw)
+ * 		arr = array(code)
+ */
+  }
+
+  /* "jdwp.pyx":476
+ * 		if code is None:
+ * 			return struct.unpack('>%iq' % count, raw)
+ * 		arr = array(code)             # <<<<<<<<<<<<<<
+ * 		arr.fromstring(raw)
+ * 		if ARRAY_BYTESWAP:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_array); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_11 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_11)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_11);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_11) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_11, __pyx_v_code) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_code);
+  __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 476, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_arr = __pyx_t_5;
+  __pyx_t_5 = 0;
+
+  /* "jdwp.pyx":477
+ * 			return struct.unpack('>%iq' % count, raw)
+ * 		arr = array(code)
+ * 		arr.fromstring(raw)             # <<<<<<<<<<<<<<
+ * 		if ARRAY_BYTESWAP:
+ * 			arr.byteswap()
+ */
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_arr, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_11 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_11)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_11);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+    }
+  }
+  __pyx_t_5 = (__pyx_t_11) ? __Pyx_PyObject_Call2Args(__pyx_t_6, __pyx_t_11, __pyx_v_raw) : __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_v_raw);
+  __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 477, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "jdwp.pyx":478
+ * 		arr = array(code)
+ * 		arr.fromstring(raw)
+ * 		if ARRAY_BYTESWAP:             # <<<<<<<<<<<<<<
+ * 			arr.byteswap()
+ * 		return arr
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_ARRAY_BYTESWAP); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 478, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 478, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (__pyx_t_2) {
+
+    /* "jdwp.pyx":479
+ * 		arr.fromstring(raw)
+ * 		if ARRAY_BYTESWAP:
+ * 			arr.byteswap()             # <<<<<<<<<<<<<<
+ * 		return arr
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_arr, __pyx_n_s_byteswap); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 479, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_11 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_11)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_11);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_11) ? __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_11) : __Pyx_PyObject_CallNoArg(__pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 479, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "jdwp.pyx":478
+ * 		arr = array(code)
+ * 		arr.fromstring(raw)
+ * 		if ARRAY_BYTESWAP:             # <<<<<<<<<<<<<<
+ * 			arr.byteswap()
+ * 		return arr
+ */
+  }
+
+  /* "jdwp.pyx":480
+ * 		if ARRAY_BYTESWAP:
+ * 			arr.byteswap()
+ * 		return arr             # <<<<<<<<<<<<<<
+ * 
+ * 	def unpackTaggedValues(self, uint32_t count):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_arr);
+  __pyx_r = __pyx_v_arr;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":453
+ * 		return x
+ * 
+ * 	def unpackArray(self, tag, uint32_t count):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		unpacks count untagged primitives of the type tag, as found in an
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackArray", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_w);
+  __Pyx_XDECREF(__pyx_v_raw);
+  __Pyx_XDECREF(__pyx_v_code);
+  __Pyx_XDECREF(__pyx_v_arr);
+  __Pyx_XDECREF(__pyx_v_tag);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":482
+ * 		return arr
+ * 
+ * 	def unpackTaggedValues(self, uint32_t count):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		unpacks count tagged values, as found in GetValues replies, returning
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_57unpackTaggedValues(PyObject *__pyx_v_self, PyObject *__pyx_arg_count); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_56unpackTaggedValues[] = "\n\t\tunpacks count tagged values, as found in GetValues replies, returning\n\t\ta list of (tag, value) tuples; primitives are decoded to Python\n\t\tvalues, while objects of every kind are left as their object ids\n\t\t";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_57unpackTaggedValues(PyObject *__pyx_v_self, PyObject *__pyx_arg_count) {
+  uint32_t __pyx_v_count;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackTaggedValues (wrapper)", 0);
+  assert(__pyx_arg_count); {
+    __pyx_v_count = __Pyx_PyInt_As_uint32_t(__pyx_arg_count); if (unlikely((__pyx_v_count == ((uint32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 482, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackTaggedValues", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_56unpackTaggedValues(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint32_t)__pyx_v_count));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_56unpackTaggedValues(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint32_t __pyx_v_count) {
+  unsigned char *__pyx_v_p;
+  unsigned char *__pyx_v_end;
+  unsigned char __pyx_v_tag;
+  uint32_t __pyx_v_i;
+  uint32_t __pyx_v_w;
+  uint64_t __pyx_v_v;
+  float __pyx_v_f;
+  double __pyx_v_d;
+  uint32_t __pyx_v_v32;
+  PyObject *__pyx_v_vals = NULL;
+  PyObject *__pyx_v_val = NULL;
+  PyObject *__pyx_v_item = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  uint32_t __pyx_t_6;
+  uint32_t __pyx_t_7;
+  uint32_t __pyx_t_8;
+  uint8_t __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackTaggedValues", 0);
+
+  /* "jdwp.pyx":488
+ * 		values, while objects of every kind are left as their object ids
+ * 		'''
+ * 		cdef unsigned char* p = <unsigned char*>self.buf.data + self.buf.ofs             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char* end = <unsigned char*>self.buf.data + self.buf.len
+ * 		cdef unsigned char tag
+ */
+  __pyx_v_p = (((unsigned char *)__pyx_v_self->buf.data) + __pyx_v_self->buf.ofs);
+
+  /* "jdwp.pyx":489
+ * 		'''
+ * 		cdef unsigned char* p = <unsigned char*>self.buf.data + self.buf.ofs
+ * 		cdef unsigned char* end = <unsigned char*>self.buf.data + self.buf.len             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char tag
+ * 		cdef uint32_t i, w
+ */
+  __pyx_v_end = (((unsigned char *)__pyx_v_self->buf.data) + __pyx_v_self->buf.len);
+
+  /* "jdwp.pyx":497
+ * 		cdef uint32_t v32
+ * 
+ * 		if self.buf.data == NULL:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		vals = PyList_New(count)
+ */
+  __pyx_t_1 = ((__pyx_v_self->buf.data == NULL) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "jdwp.pyx":498
+ * 
+ * 		if self.buf.data == NULL:
+ * 			raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 		vals = PyList_New(count)
+ * 		for i in range(count):
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 498, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 498, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 498, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 498, __pyx_L1_error)
+
+    /* "jdwp.pyx":497
+ * 		cdef uint32_t v32
+ * 
+ * 		if self.buf.data == NULL:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		vals = PyList_New(count)
+ */
+  }
+
+  /* "jdwp.pyx":499
+ * 		if self.buf.data == NULL:
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		vals = PyList_New(count)             # <<<<<<<<<<<<<<
+ * 		for i in range(count):
+ * 			if p >= end:
+ */
+  __pyx_t_2 = PyList_New(__pyx_v_count); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 499, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_vals = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":500
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		vals = PyList_New(count)
+ * 		for i in range(count):             # <<<<<<<<<<<<<<
+ * 			if p >= end:
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ */
+  __pyx_t_6 = __pyx_v_count;
+  __pyx_t_7 = __pyx_t_6;
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_i = __pyx_t_8;
+
+    /* "jdwp.pyx":501
+ * 		vals = PyList_New(count)
+ * 		for i in range(count):
+ * 			if p >= end:             # <<<<<<<<<<<<<<
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			tag = p[0]
+ */
+    __pyx_t_1 = ((__pyx_v_p >= __pyx_v_end) != 0);
+    if (unlikely(__pyx_t_1)) {
+
+      /* "jdwp.pyx":502
+ * 		for i in range(count):
+ * 			if p >= end:
+ * 				raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 			tag = p[0]
+ * 			p += 1
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 502, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 502, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+        }
+      }
+      __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 502, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 502, __pyx_L1_error)
+
+      /* "jdwp.pyx":501
+ * 		vals = PyList_New(count)
+ * 		for i in range(count):
+ * 			if p >= end:             # <<<<<<<<<<<<<<
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			tag = p[0]
+ */
+    }
+
+    /* "jdwp.pyx":503
+ * 			if p >= end:
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			tag = p[0]             # <<<<<<<<<<<<<<
+ * 			p += 1
+ * 			if tag == c'B' or tag == c'Z':
+ */
+    __pyx_v_tag = (__pyx_v_p[0]);
+
+    /* "jdwp.pyx":504
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			tag = p[0]
+ * 			p += 1             # <<<<<<<<<<<<<<
+ * 			if tag == c'B' or tag == c'Z':
+ * 				w = 1
+ */
+    __pyx_v_p = (__pyx_v_p + 1);
+
+    /* "jdwp.pyx":505
+ * 			tag = p[0]
+ * 			p += 1
+ * 			if tag == c'B' or tag == c'Z':             # <<<<<<<<<<<<<<
+ * 				w = 1
+ * 			elif tag == c'C' or tag == c'S':
+ */
+    switch (__pyx_v_tag) {
+      case 'B':
+      case 'Z':
+
+      /* "jdwp.pyx":506
+ * 			p += 1
+ * 			if tag == c'B' or tag == c'Z':
+ * 				w = 1             # <<<<<<<<<<<<<<
+ * 			elif tag == c'C' or tag == c'S':
+ * 				w = 2
+ */
+      __pyx_v_w = 1;
+
+      /* "jdwp.pyx":505
+ * 			tag = p[0]
+ * 			p += 1
+ * 			if tag == c'B' or tag == c'Z':             # <<<<<<<<<<<<<<
+ * 				w = 1
+ * 			elif tag == c'C' or tag == c'S':
+ */
+      break;
+      case 'C':
+
+      /* "jdwp.pyx":507
+ * 			if tag == c'B' or tag == c'Z':
+ * 				w = 1
+ * 			elif tag == c'C' or tag == c'S':             # <<<<<<<<<<<<<<
+ * 				w = 2
+ * 			elif tag == c'I' or tag == c'F':
+ */
+      case 'S':
+
+      /* "jdwp.pyx":508
+ * 				w = 1
+ * 			elif tag == c'C' or tag == c'S':
+ * 				w = 2             # <<<<<<<<<<<<<<
+ * 			elif tag == c'I' or tag == c'F':
+ * 				w = 4
+ */
+      __pyx_v_w = 2;
+
+      /* "jdwp.pyx":507
+ * 			if tag == c'B' or tag == c'Z':
+ * 				w = 1
+ * 			elif tag == c'C' or tag == c'S':             # <<<<<<<<<<<<<<
+ * 				w = 2
+ * 			elif tag == c'I' or tag == c'F':
+ */
+      break;
+      case 'I':
+
+      /* "jdwp.pyx":509
+ * 			elif tag == c'C' or tag == c'S':
+ * 				w = 2
+ * 			elif tag == c'I' or tag == c'F':             # <<<<<<<<<<<<<<
+ * 				w = 4
+ * 			elif tag == c'J' or tag == c'D':
+ */
+      case 'F':
+
+      /* "jdwp.pyx":510
+ * 				w = 2
+ * 			elif tag == c'I' or tag == c'F':
+ * 				w = 4             # <<<<<<<<<<<<<<
+ * 			elif tag == c'J' or tag == c'D':
+ * 				w = 8
+ */
+      __pyx_v_w = 4;
+
+      /* "jdwp.pyx":509
+ * 			elif tag == c'C' or tag == c'S':
+ * 				w = 2
+ * 			elif tag == c'I' or tag == c'F':             # <<<<<<<<<<<<<<
+ * 				w = 4
+ * 			elif tag == c'J' or tag == c'D':
+ */
+      break;
+      case 'J':
+
+      /* "jdwp.pyx":511
+ * 			elif tag == c'I' or tag == c'F':
+ * 				w = 4
+ * 			elif tag == c'J' or tag == c'D':             # <<<<<<<<<<<<<<
+ * 				w = 8
+ * 			elif tag == c'V':
+ */
+      case 'D':
+
+      /* "jdwp.pyx":512
+ * 				w = 4
+ * 			elif tag == c'J' or tag == c'D':
+ * 				w = 8             # <<<<<<<<<<<<<<
+ * 			elif tag == c'V':
+ * 				w = 0
+ */
+      __pyx_v_w = 8;
+
+      /* "jdwp.pyx":511
+ * 			elif tag == c'I' or tag == c'F':
+ * 				w = 4
+ * 			elif tag == c'J' or tag == c'D':             # <<<<<<<<<<<<<<
+ * 				w = 8
+ * 			elif tag == c'V':
+ */
+      break;
+      case 'V':
+
+      /* "jdwp.pyx":514
+ * 				w = 8
+ * 			elif tag == c'V':
+ * 				w = 0             # <<<<<<<<<<<<<<
+ * 			elif (tag == c'L' or tag == c's' or tag == c'[' or tag == c't' or
+ * 					tag == c'g' or tag == c'l' or tag == c'c'):
+ */
+      __pyx_v_w = 0;
+
+      /* "jdwp.pyx":513
+ * 			elif tag == c'J' or tag == c'D':
+ * 				w = 8
+ * 			elif tag == c'V':             # <<<<<<<<<<<<<<
+ * 				w = 0
+ * 			elif (tag == c'L' or tag == c's' or tag == c'[' or tag == c't' or
+ */
+      break;
+      case 'L':
+
+      /* "jdwp.pyx":515
+ * 			elif tag == c'V':
+ * 				w = 0
+ * 			elif (tag == c'L' or tag == c's' or tag == c'[' or tag == c't' or             # <<<<<<<<<<<<<<
+ * 					tag == c'g' or tag == c'l' or tag == c'c'):
+ * 				w = self.buf.oSz
+ */
+      case 's':
+      case '[':
+      case 't':
+      case 'g':
+
+      /* "jdwp.pyx":516
+ * 				w = 0
+ * 			elif (tag == c'L' or tag == c's' or tag == c'[' or tag == c't' or
+ * 					tag == c'g' or tag == c'l' or tag == c'c'):             # <<<<<<<<<<<<<<
+ * 				w = self.buf.oSz
+ * 			else:
+ */
+      case 'l':
+      case 'c':
+
+      /* "jdwp.pyx":517
+ * 			elif (tag == c'L' or tag == c's' or tag == c'[' or tag == c't' or
+ * 					tag == c'g' or tag == c'l' or tag == c'c'):
+ * 				w = self.buf.oSz             # <<<<<<<<<<<<<<
+ * 			else:
+ * 				raise JdwpError(JDWP_OP_UNSUPPORTED)
+ */
+      __pyx_t_9 = __pyx_v_self->buf.oSz;
+      __pyx_v_w = __pyx_t_9;
+
+      /* "jdwp.pyx":515
+ * 			elif tag == c'V':
+ * 				w = 0
+ * 			elif (tag == c'L' or tag == c's' or tag == c'[' or tag == c't' or             # <<<<<<<<<<<<<<
+ * 					tag == c'g' or tag == c'l' or tag == c'c'):
+ * 				w = self.buf.oSz
+ */
+      break;
+      default:
+
+      /* "jdwp.pyx":519
+ * 				w = self.buf.oSz
+ * 			else:
+ * 				raise JdwpError(JDWP_OP_UNSUPPORTED)             # <<<<<<<<<<<<<<
+ * 			if <uint32_t>(end - p) < w:
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 519, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_OP_UNSUPPORTED); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 519, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+        }
+      }
+      __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 519, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 519, __pyx_L1_error)
+      break;
+    }
+
+    /* "jdwp.pyx":520
+ * 			else:
+ * 				raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 			if <uint32_t>(end - p) < w:             # <<<<<<<<<<<<<<
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			v = read_be(p, w)
+ */
+    __pyx_t_1 = ((((uint32_t)(__pyx_v_end - __pyx_v_p)) < __pyx_v_w) != 0);
+    if (unlikely(__pyx_t_1)) {
+
+      /* "jdwp.pyx":521
+ * 				raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 			if <uint32_t>(end - p) < w:
+ * 				raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 			v = read_be(p, w)
+ * 			p += w
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 521, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 521, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+        }
+      }
+      __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 521, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 521, __pyx_L1_error)
+
+      /* "jdwp.pyx":520
+ * 			else:
+ * 				raise JdwpError(JDWP_OP_UNSUPPORTED)
+ * 			if <uint32_t>(end - p) < w:             # <<<<<<<<<<<<<<
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			v = read_be(p, w)
+ */
+    }
+
+    /* "jdwp.pyx":522
+ * 			if <uint32_t>(end - p) < w:
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			v = read_be(p, w)             # <<<<<<<<<<<<<<
+ * 			p += w
+ * 
+ */
+    __pyx_v_v = __pyx_f_4jdwp_read_be(__pyx_v_p, __pyx_v_w);
+
+    /* "jdwp.pyx":523
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			v = read_be(p, w)
+ * 			p += w             # <<<<<<<<<<<<<<
+ * 
+ * 			if tag == c'B':
+ */
+    __pyx_v_p = (__pyx_v_p + __pyx_v_w);
+
+    /* "jdwp.pyx":525
+ * 			p += w
+ * 
+ * 			if tag == c'B':             # <<<<<<<<<<<<<<
+ * 				val = <int8_t>v
+ * 			elif tag == c'Z':
+ */
+    switch (__pyx_v_tag) {
+      case 'B':
+
+      /* "jdwp.pyx":526
+ * 
+ * 			if tag == c'B':
+ * 				val = <int8_t>v             # <<<<<<<<<<<<<<
+ * 			elif tag == c'Z':
+ * 				val = v != 0
+ */
+      __pyx_t_2 = __Pyx_PyInt_From_int8_t(((int8_t)__pyx_v_v)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 526, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "jdwp.pyx":525
+ * 			p += w
+ * 
+ * 			if tag == c'B':             # <<<<<<<<<<<<<<
+ * 				val = <int8_t>v
+ * 			elif tag == c'Z':
+ */
+      break;
+      case 'Z':
+
+      /* "jdwp.pyx":528
+ * 				val = <int8_t>v
+ * 			elif tag == c'Z':
+ * 				val = v != 0             # <<<<<<<<<<<<<<
+ * 			elif tag == c'C':
+ * 				val = chr(v) if v < 256 else unichr(v)
+ */
+      __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_v != 0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 528, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "jdwp.pyx":527
+ * 			if tag == c'B':
+ * 				val = <int8_t>v
+ * 			elif tag == c'Z':             # <<<<<<<<<<<<<<
+ * 				val = v != 0
+ * 			elif tag == c'C':
+ */
+      break;
+      case 'C':
+
+      /* "jdwp.pyx":530
+ * 				val = v != 0
+ * 			elif tag == c'C':
+ * 				val = chr(v) if v < 256 else unichr(v)             # <<<<<<<<<<<<<<
+ * 			elif tag == c'S':
+ * 				val = <int16_t>v
+ */
+      if (((__pyx_v_v < 0x100) != 0)) {
+        __pyx_t_3 = __Pyx_PyInt_From_uint64_t(__pyx_v_v); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 530, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_chr, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 530, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_2 = __pyx_t_4;
+        __pyx_t_4 = 0;
+      } else {
+        __pyx_t_4 = __Pyx_PyInt_From_uint64_t(__pyx_v_v); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 530, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_unichr, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 530, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_2 = __pyx_t_3;
+        __pyx_t_3 = 0;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "jdwp.pyx":529
+ * 			elif tag == c'Z':
+ * 				val = v != 0
+ * 			elif tag == c'C':             # <<<<<<<<<<<<<<
+ * 				val = chr(v) if v < 256 else unichr(v)
+ * 			elif tag == c'S':
+ */
+      break;
+      case 'S':
+
+      /* "jdwp.pyx":532
+ * 				val = chr(v) if v < 256 else unichr(v)
+ * 			elif tag == c'S':
+ * 				val = <int16_t>v             # <<<<<<<<<<<<<<
+ * 			elif tag == c'I':
+ * 				val = <int32_t>v
+ */
+      __pyx_t_2 = __Pyx_PyInt_From_int16_t(((int16_t)__pyx_v_v)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 532, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "jdwp.pyx":531
+ * 			elif tag == c'C':
+ * 				val = chr(v) if v < 256 else unichr(v)
+ * 			elif tag == c'S':             # <<<<<<<<<<<<<<
+ * 				val = <int16_t>v
+ * 			elif tag == c'I':
+ */
+      break;
+      case 'I':
+
+      /* "jdwp.pyx":534
+ * 				val = <int16_t>v
+ * 			elif tag == c'I':
+ * 				val = <int32_t>v             # <<<<<<<<<<<<<<
+ * 			elif tag == c'F':
+ * 				v32 = <uint32_t>v
+ */
+      __pyx_t_2 = __Pyx_PyInt_From_int32_t(((int32_t)__pyx_v_v)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 534, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "jdwp.pyx":533
+ * 			elif tag == c'S':
+ * 				val = <int16_t>v
+ * 			elif tag == c'I':             # <<<<<<<<<<<<<<
+ * 				val = <int32_t>v
+ * 			elif tag == c'F':
+ */
+      break;
+      case 'F':
+
+      /* "jdwp.pyx":536
+ * 				val = <int32_t>v
+ * 			elif tag == c'F':
+ * 				v32 = <uint32_t>v             # <<<<<<<<<<<<<<
+ * 				memcpy(&f, &v32, 4)
+ * 				val = f
+ */
+      __pyx_v_v32 = ((uint32_t)__pyx_v_v);
+
+      /* "jdwp.pyx":537
+ * 			elif tag == c'F':
+ * 				v32 = <uint32_t>v
+ * 				memcpy(&f, &v32, 4)             # <<<<<<<<<<<<<<
+ * 				val = f
+ * 			elif tag == c'J':
+ */
+      (void)(memcpy((&__pyx_v_f), (&__pyx_v_v32), 4));
+
+      /* "jdwp.pyx":538
+ * 				v32 = <uint32_t>v
+ * 				memcpy(&f, &v32, 4)
+ * 				val = f             # <<<<<<<<<<<<<<
+ * 			elif tag == c'J':
+ * 				val = <int64_t>v
+ */
+      __pyx_t_2 = PyFloat_FromDouble(__pyx_v_f); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 538, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "jdwp.pyx":535
+ * 			elif tag == c'I':
+ * 				val = <int32_t>v
+ * 			elif tag == c'F':             # <<<<<<<<<<<<<<
+ * 				v32 = <uint32_t>v
+ * 				memcpy(&f, &v32, 4)
+ */
+      break;
+      case 'J':
+
+      /* "jdwp.pyx":540
+ * 				val = f
+ * 			elif tag == c'J':
+ * 				val = <int64_t>v             # <<<<<<<<<<<<<<
+ * 			elif tag == c'D':
+ * 				memcpy(&d, &v, 8)
+ */
+      __pyx_t_2 = __Pyx_PyInt_From_int64_t(((int64_t)__pyx_v_v)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 540, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "jdwp.pyx":539
+ * 				memcpy(&f, &v32, 4)
+ * 				val = f
+ * 			elif tag == c'J':             # <<<<<<<<<<<<<<
+ * 				val = <int64_t>v
+ * 			elif tag == c'D':
+ */
+      break;
+      case 'D':
+
+      /* "jdwp.pyx":542
+ * 				val = <int64_t>v
+ * 			elif tag == c'D':
+ * 				memcpy(&d, &v, 8)             # <<<<<<<<<<<<<<
+ * 				val = d
+ * 			elif tag == c'V':
+ */
+      (void)(memcpy((&__pyx_v_d), (&__pyx_v_v), 8));
+
+      /* "jdwp.pyx":543
+ * 			elif tag == c'D':
+ * 				memcpy(&d, &v, 8)
+ * 				val = d             # <<<<<<<<<<<<<<
+ * 			elif tag == c'V':
+ * 				val = None
+ */
+      __pyx_t_2 = PyFloat_FromDouble(__pyx_v_d); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 543, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_2);
+      __pyx_t_2 = 0;
+
+      /* "jdwp.pyx":541
+ * 			elif tag == c'J':
+ * 				val = <int64_t>v
+ * 			elif tag == c'D':             # <<<<<<<<<<<<<<
+ * 				memcpy(&d, &v, 8)
+ * 				val = d
+ */
+      break;
+      case 'V':
+
+      /* "jdwp.pyx":545
+ * 				val = d
+ * 			elif tag == c'V':
+ * 				val = None             # <<<<<<<<<<<<<<
+ * 			else:
+ * 				val = v
+ */
+      __Pyx_INCREF(Py_None);
+      __Pyx_XDECREF_SET(__pyx_v_val, Py_None);
+
+      /* "jdwp.pyx":544
+ * 				memcpy(&d, &v, 8)
+ * 				val = d
+ * 			elif tag == c'V':             # <<<<<<<<<<<<<<
+ * 				val = None
+ * 			else:
+ */
+      break;
+      default:
+
+      /* "jdwp.pyx":547
+ * 				val = None
+ * 			else:
+ * 				val = v             # <<<<<<<<<<<<<<
+ * 
+ * 			item = (tag, val)
+ */
+      __pyx_t_2 = __Pyx_PyInt_From_uint64_t(__pyx_v_v); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 547, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_2);
+      __pyx_t_2 = 0;
+      break;
+    }
+
+    /* "jdwp.pyx":549
+ * 				val = v
+ * 
+ * 			item = (tag, val)             # <<<<<<<<<<<<<<
+ * 			Py_INCREF(item)
+ * 			PyList_SET_ITEM(vals, i, item)
+ */
+    __pyx_t_2 = __Pyx_PyInt_From_unsigned_char(__pyx_v_tag); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 549, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 549, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
+    __Pyx_INCREF(__pyx_v_val);
+    __Pyx_GIVEREF(__pyx_v_val);
+    PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_val);
+    __pyx_t_2 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_item, ((PyObject*)__pyx_t_3));
+    __pyx_t_3 = 0;
+
+    /* "jdwp.pyx":550
+ * 
+ * 			item = (tag, val)
+ * 			Py_INCREF(item)             # <<<<<<<<<<<<<<
+ * 			PyList_SET_ITEM(vals, i, item)
+ * 
+ */
+    Py_INCREF(__pyx_v_item);
+
+    /* "jdwp.pyx":551
+ * 			item = (tag, val)
+ * 			Py_INCREF(item)
+ * 			PyList_SET_ITEM(vals, i, item)             # <<<<<<<<<<<<<<
+ * 
+ * 		self.buf.ofs = p - <unsigned char*>self.buf.data
+ */
+    PyList_SET_ITEM(__pyx_v_vals, __pyx_v_i, __pyx_v_item);
+  }
+
+  /* "jdwp.pyx":553
+ * 			PyList_SET_ITEM(vals, i, item)
+ * 
+ * 		self.buf.ofs = p - <unsigned char*>self.buf.data             # <<<<<<<<<<<<<<
+ * 		return vals
+ * 
+ */
+  __pyx_v_self->buf.ofs = (__pyx_v_p - ((unsigned char *)__pyx_v_self->buf.data));
+
+  /* "jdwp.pyx":554
+ * 
+ * 		self.buf.ofs = p - <unsigned char*>self.buf.data
+ * 		return vals             # <<<<<<<<<<<<<<
+ * 
+ * 	def unpackClassTable(self, uint32_t count):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_vals);
+  __pyx_r = __pyx_v_vals;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":482
+ * 		return arr
+ * 
+ * 	def unpackTaggedValues(self, uint32_t count):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		unpacks count tagged values, as found in GetValues replies, returning
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackTaggedValues", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_vals);
+  __Pyx_XDECREF(__pyx_v_val);
+  __Pyx_XDECREF(__pyx_v_item);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":556
+ * 		return vals
+ * 
+ * 	def unpackClassTable(self, uint32_t count):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		unpacks count class records, as in an AllClassesWithGeneric reply,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_59unpackClassTable(PyObject *__pyx_v_self, PyObject *__pyx_arg_count); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_58unpackClassTable[] = "\n\t\tunpacks count class records, as in an AllClassesWithGeneric reply,\n\t\tinto the parallel sequences (tags, tids, jnis, gens, flags); tags,\n\t\tflags and, where an unsigned long holds them, type ids are returned\n\t\tas array.arrays, and signatures are interned\n\t\t";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_59unpackClassTable(PyObject *__pyx_v_self, PyObject *__pyx_arg_count) {
+  uint32_t __pyx_v_count;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackClassTable (wrapper)", 0);
+  assert(__pyx_arg_count); {
+    __pyx_v_count = __Pyx_PyInt_As_uint32_t(__pyx_arg_count); if (unlikely((__pyx_v_count == ((uint32_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 556, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackClassTable", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_58unpackClassTable(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((uint32_t)__pyx_v_count));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_58unpackClassTable(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, uint32_t __pyx_v_count) {
+  unsigned char *__pyx_v_p;
+  unsigned char *__pyx_v_end;
+  int __pyx_v_tsz;
+  uint32_t __pyx_v_i;
+  char *__pyx_v_ctags;
+  uint64_t *__pyx_v_ctids;
+  int32_t *__pyx_v_cflags;
+  PyObject *__pyx_v_rawtags = NULL;
+  PyObject *__pyx_v_rawtids = NULL;
+  PyObject *__pyx_v_rawflags = NULL;
+  PyObject *__pyx_v_jnis = NULL;
+  PyObject *__pyx_v_gens = NULL;
+  PyObject *__pyx_v_val = NULL;
+  PyObject *__pyx_v_tags = NULL;
+  PyObject *__pyx_v_flags = NULL;
+  PyObject *__pyx_v_tids = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  uint8_t __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  uint32_t __pyx_t_7;
+  uint32_t __pyx_t_8;
+  uint32_t __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackClassTable", 0);
+
+  /* "jdwp.pyx":563
+ * 		as array.arrays, and signatures are interned
+ * 		'''
+ * 		cdef unsigned char* p = <unsigned char*>self.buf.data + self.buf.ofs             # <<<<<<<<<<<<<<
+ * 		cdef unsigned char* end = <unsigned char*>self.buf.data + self.buf.len
+ * 		cdef int tsz = self.buf.tSz
+ */
+  __pyx_v_p = (((unsigned char *)__pyx_v_self->buf.data) + __pyx_v_self->buf.ofs);
+
+  /* "jdwp.pyx":564
+ * 		'''
+ * 		cdef unsigned char* p = <unsigned char*>self.buf.data + self.buf.ofs
+ * 		cdef unsigned char* end = <unsigned char*>self.buf.data + self.buf.len             # <<<<<<<<<<<<<<
+ * 		cdef int tsz = self.buf.tSz
+ * 		cdef uint32_t i
+ */
+  __pyx_v_end = (((unsigned char *)__pyx_v_self->buf.data) + __pyx_v_self->buf.len);
+
+  /* "jdwp.pyx":565
+ * 		cdef unsigned char* p = <unsigned char*>self.buf.data + self.buf.ofs
+ * 		cdef unsigned char* end = <unsigned char*>self.buf.data + self.buf.len
+ * 		cdef int tsz = self.buf.tSz             # <<<<<<<<<<<<<<
+ * 		cdef uint32_t i
+ * 		cdef char* ctags
+ */
+  __pyx_t_1 = __pyx_v_self->buf.tSz;
+  __pyx_v_tsz = __pyx_t_1;
+
+  /* "jdwp.pyx":571
+ * 		cdef int32_t* cflags
+ * 
+ * 		if self.buf.data == NULL:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		if end - p < <int64_t>count * (tsz + 13):
+ */
+  __pyx_t_2 = ((__pyx_v_self->buf.data == NULL) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "jdwp.pyx":572
+ * 
+ * 		if self.buf.data == NULL:
+ * 			raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 		if end - p < <int64_t>count * (tsz + 13):
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 572, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 572, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 572, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 572, __pyx_L1_error)
+
+    /* "jdwp.pyx":571
+ * 		cdef int32_t* cflags
+ * 
+ * 		if self.buf.data == NULL:             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		if end - p < <int64_t>count * (tsz + 13):
+ */
+  }
+
+  /* "jdwp.pyx":573
+ * 		if self.buf.data == NULL:
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		if end - p < <int64_t>count * (tsz + 13):             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 
+ */
+  __pyx_t_2 = (((__pyx_v_end - __pyx_v_p) < (((int64_t)__pyx_v_count) * (__pyx_v_tsz + 13))) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "jdwp.pyx":574
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		if end - p < <int64_t>count * (tsz + 13):
+ * 			raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 
+ * 		rawtags = PyString_FromStringAndSize(NULL, count)
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 574, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 574, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 574, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 574, __pyx_L1_error)
+
+    /* "jdwp.pyx":573
+ * 		if self.buf.data == NULL:
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 		if end - p < <int64_t>count * (tsz + 13):             # <<<<<<<<<<<<<<
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 
+ */
+  }
+
+  /* "jdwp.pyx":576
+ * 			raise JdwpError(JDWP_NEED_LEN)
+ * 
+ * 		rawtags = PyString_FromStringAndSize(NULL, count)             # <<<<<<<<<<<<<<
+ * 		rawtids = PyString_FromStringAndSize(NULL, count * 8)
+ * 		rawflags = PyString_FromStringAndSize(NULL, count * 4)
+ */
+  __pyx_t_3 = PyString_FromStringAndSize(NULL, __pyx_v_count); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 576, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_rawtags = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "jdwp.pyx":577
+ * 
+ * 		rawtags = PyString_FromStringAndSize(NULL, count)
+ * 		rawtids = PyString_FromStringAndSize(NULL, count * 8)             # <<<<<<<<<<<<<<
+ * 		rawflags = PyString_FromStringAndSize(NULL, count * 4)
+ * 		ctags = PyString_AS_STRING(rawtags)
+ */
+  __pyx_t_3 = PyString_FromStringAndSize(NULL, (__pyx_v_count * 8)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 577, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_rawtids = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "jdwp.pyx":578
+ * 		rawtags = PyString_FromStringAndSize(NULL, count)
+ * 		rawtids = PyString_FromStringAndSize(NULL, count * 8)
+ * 		rawflags = PyString_FromStringAndSize(NULL, count * 4)             # <<<<<<<<<<<<<<
+ * 		ctags = PyString_AS_STRING(rawtags)
+ * 		ctids = <uint64_t*>PyString_AS_STRING(rawtids)
+ */
+  __pyx_t_3 = PyString_FromStringAndSize(NULL, (__pyx_v_count * 4)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 578, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_rawflags = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "jdwp.pyx":579
+ * 		rawtids = PyString_FromStringAndSize(NULL, count * 8)
+ * 		rawflags = PyString_FromStringAndSize(NULL, count * 4)
+ * 		ctags = PyString_AS_STRING(rawtags)             # <<<<<<<<<<<<<<
+ * 		ctids = <uint64_t*>PyString_AS_STRING(rawtids)
+ * 		cflags = <int32_t*>PyString_AS_STRING(rawflags)
+ */
+  __pyx_v_ctags = PyString_AS_STRING(__pyx_v_rawtags);
+
+  /* "jdwp.pyx":580
+ * 		rawflags = PyString_FromStringAndSize(NULL, count * 4)
+ * 		ctags = PyString_AS_STRING(rawtags)
+ * 		ctids = <uint64_t*>PyString_AS_STRING(rawtids)             # <<<<<<<<<<<<<<
+ * 		cflags = <int32_t*>PyString_AS_STRING(rawflags)
+ * 		jnis = PyList_New(count)
+ */
+  __pyx_v_ctids = ((uint64_t *)PyString_AS_STRING(__pyx_v_rawtids));
+
+  /* "jdwp.pyx":581
+ * 		ctags = PyString_AS_STRING(rawtags)
+ * 		ctids = <uint64_t*>PyString_AS_STRING(rawtids)
+ * 		cflags = <int32_t*>PyString_AS_STRING(rawflags)             # <<<<<<<<<<<<<<
+ * 		jnis = PyList_New(count)
+ * 		gens = PyList_New(count)
+ */
+  __pyx_v_cflags = ((int32_t *)PyString_AS_STRING(__pyx_v_rawflags));
+
+  /* "jdwp.pyx":582
+ * 		ctids = <uint64_t*>PyString_AS_STRING(rawtids)
+ * 		cflags = <int32_t*>PyString_AS_STRING(rawflags)
+ * 		jnis = PyList_New(count)             # <<<<<<<<<<<<<<
+ * 		gens = PyList_New(count)
+ * 
+ */
+  __pyx_t_3 = PyList_New(__pyx_v_count); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 582, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_jnis = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "jdwp.pyx":583
+ * 		cflags = <int32_t*>PyString_AS_STRING(rawflags)
+ * 		jnis = PyList_New(count)
+ * 		gens = PyList_New(count)             # <<<<<<<<<<<<<<
+ * 
+ * 		for i in range(count):
+ */
+  __pyx_t_3 = PyList_New(__pyx_v_count); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 583, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_v_gens = ((PyObject*)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "jdwp.pyx":585
+ * 		gens = PyList_New(count)
+ * 
+ * 		for i in range(count):             # <<<<<<<<<<<<<<
+ * 			if end - p < tsz + 5:
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ */
+  __pyx_t_7 = __pyx_v_count;
+  __pyx_t_8 = __pyx_t_7;
+  for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+    __pyx_v_i = __pyx_t_9;
+
+    /* "jdwp.pyx":586
+ * 
+ * 		for i in range(count):
+ * 			if end - p < tsz + 5:             # <<<<<<<<<<<<<<
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			ctags[i] = p[0]
+ */
+    __pyx_t_2 = (((__pyx_v_end - __pyx_v_p) < (__pyx_v_tsz + 5)) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "jdwp.pyx":587
+ * 		for i in range(count):
+ * 			if end - p < tsz + 5:
+ * 				raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 			ctags[i] = p[0]
+ * 			ctids[i] = read_be(p + 1, tsz)
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 587, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 587, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+        if (likely(__pyx_t_6)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_6);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_4, function);
+        }
+      }
+      __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 587, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 587, __pyx_L1_error)
+
+      /* "jdwp.pyx":586
+ * 
+ * 		for i in range(count):
+ * 			if end - p < tsz + 5:             # <<<<<<<<<<<<<<
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			ctags[i] = p[0]
+ */
+    }
+
+    /* "jdwp.pyx":588
+ * 			if end - p < tsz + 5:
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			ctags[i] = p[0]             # <<<<<<<<<<<<<<
+ * 			ctids[i] = read_be(p + 1, tsz)
+ * 			p += tsz + 1
+ */
+    (__pyx_v_ctags[__pyx_v_i]) = (__pyx_v_p[0]);
+
+    /* "jdwp.pyx":589
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			ctags[i] = p[0]
+ * 			ctids[i] = read_be(p + 1, tsz)             # <<<<<<<<<<<<<<
+ * 			p += tsz + 1
+ * 			val = intern(take_str(&p, end))
+ */
+    (__pyx_v_ctids[__pyx_v_i]) = __pyx_f_4jdwp_read_be((__pyx_v_p + 1), __pyx_v_tsz);
+
+    /* "jdwp.pyx":590
+ * 			ctags[i] = p[0]
+ * 			ctids[i] = read_be(p + 1, tsz)
+ * 			p += tsz + 1             # <<<<<<<<<<<<<<
+ * 			val = intern(take_str(&p, end))
+ * 			Py_INCREF(val)
+ */
+    __pyx_v_p = (__pyx_v_p + (__pyx_v_tsz + 1));
+
+    /* "jdwp.pyx":591
+ * 			ctids[i] = read_be(p + 1, tsz)
+ * 			p += tsz + 1
+ * 			val = intern(take_str(&p, end))             # <<<<<<<<<<<<<<
+ * 			Py_INCREF(val)
+ * 			PyList_SET_ITEM(jnis, i, val)
+ */
+    __pyx_t_3 = __pyx_f_4jdwp_take_str((&__pyx_v_p), __pyx_v_end); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 591, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_Intern(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 591, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "jdwp.pyx":592
+ * 			p += tsz + 1
+ * 			val = intern(take_str(&p, end))
+ * 			Py_INCREF(val)             # <<<<<<<<<<<<<<
+ * 			PyList_SET_ITEM(jnis, i, val)
+ * 			val = take_str(&p, end)
+ */
+    Py_INCREF(__pyx_v_val);
+
+    /* "jdwp.pyx":593
+ * 			val = intern(take_str(&p, end))
+ * 			Py_INCREF(val)
+ * 			PyList_SET_ITEM(jnis, i, val)             # <<<<<<<<<<<<<<
+ * 			val = take_str(&p, end)
+ * 			Py_INCREF(val)
+ */
+    PyList_SET_ITEM(__pyx_v_jnis, __pyx_v_i, __pyx_v_val);
+
+    /* "jdwp.pyx":594
+ * 			Py_INCREF(val)
+ * 			PyList_SET_ITEM(jnis, i, val)
+ * 			val = take_str(&p, end)             # <<<<<<<<<<<<<<
+ * 			Py_INCREF(val)
+ * 			PyList_SET_ITEM(gens, i, val)
+ */
+    __pyx_t_4 = __pyx_f_4jdwp_take_str((&__pyx_v_p), __pyx_v_end); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 594, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF_SET(__pyx_v_val, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "jdwp.pyx":595
+ * 			PyList_SET_ITEM(jnis, i, val)
+ * 			val = take_str(&p, end)
+ * 			Py_INCREF(val)             # <<<<<<<<<<<<<<
+ * 			PyList_SET_ITEM(gens, i, val)
+ * 			if end - p < 4:
+ */
+    Py_INCREF(__pyx_v_val);
+
+    /* "jdwp.pyx":596
+ * 			val = take_str(&p, end)
+ * 			Py_INCREF(val)
+ * 			PyList_SET_ITEM(gens, i, val)             # <<<<<<<<<<<<<<
+ * 			if end - p < 4:
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ */
+    PyList_SET_ITEM(__pyx_v_gens, __pyx_v_i, __pyx_v_val);
+
+    /* "jdwp.pyx":597
+ * 			Py_INCREF(val)
+ * 			PyList_SET_ITEM(gens, i, val)
+ * 			if end - p < 4:             # <<<<<<<<<<<<<<
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			cflags[i] = <int32_t>read_be(p, 4)
+ */
+    __pyx_t_2 = (((__pyx_v_end - __pyx_v_p) < 4) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "jdwp.pyx":598
+ * 			PyList_SET_ITEM(gens, i, val)
+ * 			if end - p < 4:
+ * 				raise JdwpError(JDWP_NEED_LEN)             # <<<<<<<<<<<<<<
+ * 			cflags[i] = <int32_t>read_be(p, 4)
+ * 			p += 4
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_JdwpError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 598, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = __Pyx_PyInt_From_int(JDWP_NEED_LEN); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 598, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_6)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_6);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+        }
+      }
+      __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 598, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 598, __pyx_L1_error)
+
+      /* "jdwp.pyx":597
+ * 			Py_INCREF(val)
+ * 			PyList_SET_ITEM(gens, i, val)
+ * 			if end - p < 4:             # <<<<<<<<<<<<<<
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			cflags[i] = <int32_t>read_be(p, 4)
+ */
+    }
+
+    /* "jdwp.pyx":599
+ * 			if end - p < 4:
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			cflags[i] = <int32_t>read_be(p, 4)             # <<<<<<<<<<<<<<
+ * 			p += 4
+ * 
+ */
+    (__pyx_v_cflags[__pyx_v_i]) = ((int32_t)__pyx_f_4jdwp_read_be(__pyx_v_p, 4));
+
+    /* "jdwp.pyx":600
+ * 				raise JdwpError(JDWP_NEED_LEN)
+ * 			cflags[i] = <int32_t>read_be(p, 4)
+ * 			p += 4             # <<<<<<<<<<<<<<
+ * 
+ * 		self.buf.ofs = p - <unsigned char*>self.buf.data
+ */
+    __pyx_v_p = (__pyx_v_p + 4);
+  }
+
+  /* "jdwp.pyx":602
+ * 			p += 4
+ * 
+ * 		self.buf.ofs = p - <unsigned char*>self.buf.data             # <<<<<<<<<<<<<<
+ * 		tags = array('B')
+ * 		tags.fromstring(rawtags)
+ */
+  __pyx_v_self->buf.ofs = (__pyx_v_p - ((unsigned char *)__pyx_v_self->buf.data));
+
+  /* "jdwp.pyx":603
+ * 
+ * 		self.buf.ofs = p - <unsigned char*>self.buf.data
+ * 		tags = array('B')             # <<<<<<<<<<<<<<
+ * 		tags.fromstring(rawtags)
+ * 		flags = array('i')
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_array); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 603, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_n_s_B) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_s_B);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 603, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_tags = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "jdwp.pyx":604
+ * 		self.buf.ofs = p - <unsigned char*>self.buf.data
+ * 		tags = array('B')
+ * 		tags.fromstring(rawtags)             # <<<<<<<<<<<<<<
+ * 		flags = array('i')
+ * 		flags.fromstring(rawflags)
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_tags, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 604, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_v_rawtags) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_rawtags);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 604, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "jdwp.pyx":605
+ * 		tags = array('B')
+ * 		tags.fromstring(rawtags)
+ * 		flags = array('i')             # <<<<<<<<<<<<<<
+ * 		flags.fromstring(rawflags)
+ * 		if TID_TYPECODE is None:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_array); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 605, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_n_s_i) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_n_s_i);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 605, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_flags = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "jdwp.pyx":606
+ * 		tags.fromstring(rawtags)
+ * 		flags = array('i')
+ * 		flags.fromstring(rawflags)             # <<<<<<<<<<<<<<
+ * 		if TID_TYPECODE is None:
+ * 			tids = list(struct.unpack('=%iQ' % count, rawtids))
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_flags, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 606, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_v_rawflags) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_rawflags);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 606, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "jdwp.pyx":607
+ * 		flags = array('i')
+ * 		flags.fromstring(rawflags)
+ * 		if TID_TYPECODE is None:             # <<<<<<<<<<<<<<
+ * 			tids = list(struct.unpack('=%iQ' % count, rawtids))
+ * 		else:
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_TID_TYPECODE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 607, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = (__pyx_t_4 == Py_None);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_10 = (__pyx_t_2 != 0);
+  if (__pyx_t_10) {
+
+    /* "jdwp.pyx":608
+ * 		flags.fromstring(rawflags)
+ * 		if TID_TYPECODE is None:
+ * 			tids = list(struct.unpack('=%iQ' % count, rawtids))             # <<<<<<<<<<<<<<
+ * 		else:
+ * 			tids = array(TID_TYPECODE)
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_struct); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 608, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_unpack); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 608, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_PyInt_From_uint32_t(__pyx_v_count); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 608, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_6 = __Pyx_PyString_Format(__pyx_kp_s_iQ, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 608, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = NULL;
+    __pyx_t_11 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __pyx_t_11 = 1;
+      }
+    }
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_t_6, __pyx_v_rawtids};
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 608, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_t_6, __pyx_v_rawtids};
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_11, 2+__pyx_t_11); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 608, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_12 = PyTuple_New(2+__pyx_t_11); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 608, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      if (__pyx_t_3) {
+        __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_3); __pyx_t_3 = NULL;
+      }
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_12, 0+__pyx_t_11, __pyx_t_6);
+      __Pyx_INCREF(__pyx_v_rawtids);
+      __Pyx_GIVEREF(__pyx_v_rawtids);
+      PyTuple_SET_ITEM(__pyx_t_12, 1+__pyx_t_11, __pyx_v_rawtids);
+      __pyx_t_6 = 0;
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_12, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 608, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_5 = PySequence_List(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 608, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_tids = __pyx_t_5;
+    __pyx_t_5 = 0;
+
+    /* "jdwp.pyx":607
+ * 		flags = array('i')
+ * 		flags.fromstring(rawflags)
+ * 		if TID_TYPECODE is None:             # <<<<<<<<<<<<<<
+ * 			tids = list(struct.unpack('=%iQ' % count, rawtids))
+ * 		else:
+ */
+    goto __pyx_L9;
+  }
+
+  /* "jdwp.pyx":610
+ * 			tids = list(struct.unpack('=%iQ' % count, rawtids))
+ * 		else:
+ * 			tids = array(TID_TYPECODE)             # <<<<<<<<<<<<<<
+ * 			tids.fromstring(rawtids)
+ * 		return tags, tids, jnis, gens, flags
+ */
+  /*else*/ {
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_array); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 610, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_TID_TYPECODE); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 610, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_t_12) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_12);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 610, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_v_tids = __pyx_t_5;
+    __pyx_t_5 = 0;
+
+    /* "jdwp.pyx":611
+ * 		else:
+ * 			tids = array(TID_TYPECODE)
+ * 			tids.fromstring(rawtids)             # <<<<<<<<<<<<<<
+ * 		return tags, tids, jnis, gens, flags
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_tids, __pyx_n_s_fromstring); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 611, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_12 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_12 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_12)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_12);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_5 = (__pyx_t_12) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_12, __pyx_v_rawtids) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_rawtids);
+    __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 611, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __pyx_L9:;
+
+  /* "jdwp.pyx":612
+ * 			tids = array(TID_TYPECODE)
+ * 			tids.fromstring(rawtids)
+ * 		return tags, tids, jnis, gens, flags             # <<<<<<<<<<<<<<
+ * 
+ * 	def unpackStr(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyTuple_New(5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 612, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(__pyx_v_tags);
+  __Pyx_GIVEREF(__pyx_v_tags);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_tags);
+  __Pyx_INCREF(__pyx_v_tids);
+  __Pyx_GIVEREF(__pyx_v_tids);
+  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_v_tids);
+  __Pyx_INCREF(__pyx_v_jnis);
+  __Pyx_GIVEREF(__pyx_v_jnis);
+  PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_v_jnis);
+  __Pyx_INCREF(__pyx_v_gens);
+  __Pyx_GIVEREF(__pyx_v_gens);
+  PyTuple_SET_ITEM(__pyx_t_5, 3, __pyx_v_gens);
+  __Pyx_INCREF(__pyx_v_flags);
+  __Pyx_GIVEREF(__pyx_v_flags);
+  PyTuple_SET_ITEM(__pyx_t_5, 4, __pyx_v_flags);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":556
+ * 		return vals
+ * 
+ * 	def unpackClassTable(self, uint32_t count):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		unpacks count class records, as in an AllClassesWithGeneric reply,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackClassTable", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_rawtags);
+  __Pyx_XDECREF(__pyx_v_rawtids);
+  __Pyx_XDECREF(__pyx_v_rawflags);
+  __Pyx_XDECREF(__pyx_v_jnis);
+  __Pyx_XDECREF(__pyx_v_gens);
+  __Pyx_XDECREF(__pyx_v_val);
+  __Pyx_XDECREF(__pyx_v_tags);
+  __Pyx_XDECREF(__pyx_v_flags);
+  __Pyx_XDECREF(__pyx_v_tids);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":614
+ * 		return tags, tids, jnis, gens, flags
+ * 
+ * 	def unpackStr(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint32_t sz
+ * 		cdef char* str
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_61unpackStr(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_61unpackStr(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpackStr (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_60unpackStr(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_60unpackStr(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  uint32_t __pyx_v_sz;
+  char *__pyx_v_str;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpackStr", 0);
+
+  /* "jdwp.pyx":617
+ * 		cdef uint32_t sz
+ * 		cdef char* str
+ * 		einz( jdwp_unpack_str(&self.buf, &sz, &str) )             # <<<<<<<<<<<<<<
+ * 		return PyString_FromStringAndSize(str, sz)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_unpack_str((&__pyx_v_self->buf), (&__pyx_v_sz), (&__pyx_v_str))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 617, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":618
+ * 		cdef char* str
+ * 		einz( jdwp_unpack_str(&self.buf, &sz, &str) )
+ * 		return PyString_FromStringAndSize(str, sz)             # <<<<<<<<<<<<<<
+ * 
+ * 	def packStr(self, str):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyString_FromStringAndSize(__pyx_v_str, __pyx_v_sz); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 618, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":614
+ * 		return tags, tids, jnis, gens, flags
+ * 
+ * 	def unpackStr(self):             # <<<<<<<<<<<<<<
+ * 		cdef uint32_t sz
+ * 		cdef char* str
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpackStr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":620
+ * 		return PyString_FromStringAndSize(str, sz)
+ * 
+ * 	def packStr(self, str):             # <<<<<<<<<<<<<<
+ * 		cdef char* cstr
+ * 		cdef Py_ssize_t sz
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_63packStr(PyObject *__pyx_v_self, PyObject *__pyx_v_str); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_63packStr(PyObject *__pyx_v_self, PyObject *__pyx_v_str) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("packStr (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_62packStr(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((PyObject *)__pyx_v_str));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_62packStr(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_str) {
+  char *__pyx_v_cstr;
+  Py_ssize_t __pyx_v_sz;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("packStr", 0);
+
+  /* "jdwp.pyx":623
+ * 		cdef char* cstr
+ * 		cdef Py_ssize_t sz
+ * 		cstr = PyString_AsString(str)             # <<<<<<<<<<<<<<
+ * 		sz = PyString_Size(str)
+ * 		einz( jdwp_pack_str(&self.buf, sz, cstr) )
+ */
+  __pyx_v_cstr = PyString_AsString(__pyx_v_str);
+
+  /* "jdwp.pyx":624
+ * 		cdef Py_ssize_t sz
+ * 		cstr = PyString_AsString(str)
+ * 		sz = PyString_Size(str)             # <<<<<<<<<<<<<<
+ * 		einz( jdwp_pack_str(&self.buf, sz, cstr) )
+ * 
+ */
+  __pyx_v_sz = PyString_Size(__pyx_v_str);
+
+  /* "jdwp.pyx":625
+ * 		cstr = PyString_AsString(str)
+ * 		sz = PyString_Size(str)
+ * 		einz( jdwp_pack_str(&self.buf, sz, cstr) )             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4jdwp_einz(jdwp_pack_str((&__pyx_v_self->buf), __pyx_v_sz, __pyx_v_cstr)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 625, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":620
+ * 		return PyString_FromStringAndSize(str, sz)
+ * 
+ * 	def packStr(self, str):             # <<<<<<<<<<<<<<
+ * 		cdef char* cstr
+ * 		cdef Py_ssize_t sz
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.packStr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":628
+ * 
+ * 
+ * 	def config(self, fSz = None, mSz = None, oSz = None, tSz = None, sSz = None):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		sets the id sizes; sizes that are omitted are unchanged.  The codec
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_65config(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_64config[] = "\n\t\tsets the id sizes; sizes that are omitted are unchanged.  The codec\n\t\tchooses id decoders specialised for the sizes here, once, rather\n\t\tthan on every id unpacked\n\t\t";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_65config(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_fSz = 0;
+  PyObject *__pyx_v_mSz = 0;
+  PyObject *__pyx_v_oSz = 0;
+  PyObject *__pyx_v_tSz = 0;
+  PyObject *__pyx_v_sSz = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("config (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fSz,&__pyx_n_s_mSz,&__pyx_n_s_oSz,&__pyx_n_s_tSz,&__pyx_n_s_sSz,0};
+    PyObject* values[5] = {0,0,0,0,0};
+    values[0] = ((PyObject *)Py_None);
+    values[1] = ((PyObject *)Py_None);
+    values[2] = ((PyObject *)Py_None);
+    values[3] = ((PyObject *)Py_None);
+    values[4] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_fSz);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_mSz);
+          if (value) { values[1] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_oSz);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_tSz);
+          if (value) { values[3] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_sSz);
+          if (value) { values[4] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "config") < 0)) __PYX_ERR(0, 628, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_fSz = values[0];
+    __pyx_v_mSz = values[1];
+    __pyx_v_oSz = values[2];
+    __pyx_v_tSz = values[3];
+    __pyx_v_sSz = values[4];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("config", 0, 0, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 628, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.config", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_64config(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), __pyx_v_fSz, __pyx_v_mSz, __pyx_v_oSz, __pyx_v_tSz, __pyx_v_sSz);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_64config(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fSz, PyObject *__pyx_v_mSz, PyObject *__pyx_v_oSz, PyObject *__pyx_v_tSz, PyObject *__pyx_v_sSz) {
+  jdwp_buffer *__pyx_v_b;
+  int __pyx_v_code;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  uint8_t __pyx_t_1;
+  int __pyx_t_2;
+  uint8_t __pyx_t_3;
+  uint8_t __pyx_t_4;
+  uint8_t __pyx_t_5;
+  uint8_t __pyx_t_6;
+  uint8_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("config", 0);
+
+  /* "jdwp.pyx":634
+ * 		than on every id unpacked
+ * 		'''
+ * 		cdef jdwp_buffer* b = &self.buf             # <<<<<<<<<<<<<<
+ * 		code = jdwp_config(
+ * 			b, b.fSz if fSz is None else fSz, b.mSz if mSz is None else mSz,
+ */
+  __pyx_v_b = (&__pyx_v_self->buf);
+
+  /* "jdwp.pyx":636
+ * 		cdef jdwp_buffer* b = &self.buf
+ * 		code = jdwp_config(
+ * 			b, b.fSz if fSz is None else fSz, b.mSz if mSz is None else mSz,             # <<<<<<<<<<<<<<
+ * 			b.oSz if oSz is None else oSz, b.tSz if tSz is None else tSz,
+ * 			b.sSz if sSz is None else sSz
+ */
+  __pyx_t_2 = (__pyx_v_fSz == Py_None);
+  if ((__pyx_t_2 != 0)) {
+    __pyx_t_1 = __pyx_v_b->fSz;
+  } else {
+    __pyx_t_3 = __Pyx_PyInt_As_uint8_t(__pyx_v_fSz); if (unlikely((__pyx_t_3 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 636, __pyx_L1_error)
+    __pyx_t_1 = __pyx_t_3;
+  }
+  __pyx_t_2 = (__pyx_v_mSz == Py_None);
+  if ((__pyx_t_2 != 0)) {
+    __pyx_t_3 = __pyx_v_b->mSz;
+  } else {
+    __pyx_t_4 = __Pyx_PyInt_As_uint8_t(__pyx_v_mSz); if (unlikely((__pyx_t_4 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 636, __pyx_L1_error)
+    __pyx_t_3 = __pyx_t_4;
+  }
+
+  /* "jdwp.pyx":637
+ * 		code = jdwp_config(
+ * 			b, b.fSz if fSz is None else fSz, b.mSz if mSz is None else mSz,
+ * 			b.oSz if oSz is None else oSz, b.tSz if tSz is None else tSz,             # <<<<<<<<<<<<<<
+ * 			b.sSz if sSz is None else sSz
+ * 		)
+ */
+  __pyx_t_2 = (__pyx_v_oSz == Py_None);
+  if ((__pyx_t_2 != 0)) {
+    __pyx_t_4 = __pyx_v_b->oSz;
+  } else {
+    __pyx_t_5 = __Pyx_PyInt_As_uint8_t(__pyx_v_oSz); if (unlikely((__pyx_t_5 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 637, __pyx_L1_error)
+    __pyx_t_4 = __pyx_t_5;
+  }
+  __pyx_t_2 = (__pyx_v_tSz == Py_None);
+  if ((__pyx_t_2 != 0)) {
+    __pyx_t_5 = __pyx_v_b->tSz;
+  } else {
+    __pyx_t_6 = __Pyx_PyInt_As_uint8_t(__pyx_v_tSz); if (unlikely((__pyx_t_6 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 637, __pyx_L1_error)
+    __pyx_t_5 = __pyx_t_6;
+  }
+
+  /* "jdwp.pyx":638
+ * 			b, b.fSz if fSz is None else fSz, b.mSz if mSz is None else mSz,
+ * 			b.oSz if oSz is None else oSz, b.tSz if tSz is None else tSz,
+ * 			b.sSz if sSz is None else sSz             # <<<<<<<<<<<<<<
+ * 		)
+ * 		self.formats = format_cache(&self.buf)
+ */
+  __pyx_t_2 = (__pyx_v_sSz == Py_None);
+  if ((__pyx_t_2 != 0)) {
+    __pyx_t_6 = __pyx_v_b->sSz;
+  } else {
+    __pyx_t_7 = __Pyx_PyInt_As_uint8_t(__pyx_v_sSz); if (unlikely((__pyx_t_7 == ((uint8_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 638, __pyx_L1_error)
+    __pyx_t_6 = __pyx_t_7;
+  }
+
+  /* "jdwp.pyx":635
+ * 		'''
+ * 		cdef jdwp_buffer* b = &self.buf
+ * 		code = jdwp_config(             # <<<<<<<<<<<<<<
+ * 			b, b.fSz if fSz is None else fSz, b.mSz if mSz is None else mSz,
+ * 			b.oSz if oSz is None else oSz, b.tSz if tSz is None else tSz,
+ */
+  __pyx_v_code = jdwp_config(__pyx_v_b, __pyx_t_1, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6);
+
+  /* "jdwp.pyx":640
+ * 			b.sSz if sSz is None else sSz
+ * 		)
+ * 		self.formats = format_cache(&self.buf)             # <<<<<<<<<<<<<<
+ * 		einz( code )
+ * 
+ */
+  __pyx_t_8 = __pyx_f_4jdwp_format_cache((&__pyx_v_self->buf)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 640, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_8);
+  __Pyx_GOTREF(__pyx_v_self->formats);
+  __Pyx_DECREF(__pyx_v_self->formats);
+  __pyx_v_self->formats = ((PyObject*)__pyx_t_8);
+  __pyx_t_8 = 0;
+
+  /* "jdwp.pyx":641
+ * 		)
+ * 		self.formats = format_cache(&self.buf)
+ * 		einz( code )             # <<<<<<<<<<<<<<
+ * 
+ * 	cpdef JdwpFormat format(self, fmt):
+ */
+  __pyx_t_8 = __pyx_f_4jdwp_einz(__pyx_v_code); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 641, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+  /* "jdwp.pyx":628
+ * 
+ * 
+ * 	def config(self, fSz = None, mSz = None, oSz = None, tSz = None, sSz = None):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		sets the id sizes; sizes that are omitted are unchanged.  The codec
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.config", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":643
+ * 		einz( code )
+ * 
+ * 	cpdef JdwpFormat format(self, fmt):             # <<<<<<<<<<<<<<
+ * 		'returns fmt compiled for the ID sizes of this buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ */
+
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_67format(PyObject *__pyx_v_self, PyObject *__pyx_v_fmt); /*proto*/
+static struct __pyx_obj_4jdwp_JdwpFormat *__pyx_f_4jdwp_10JdwpBuffer_format(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt, int __pyx_skip_dispatch) {
+  struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_f = 0;
+  struct __pyx_obj_4jdwp_JdwpFormat *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("format", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_format); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 643, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_4jdwp_10JdwpBuffer_67format)) {
+        __Pyx_XDECREF(((PyObject *)__pyx_r));
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_fmt) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_fmt);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 643, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_4jdwp_JdwpFormat))))) __PYX_ERR(0, 643, __pyx_L1_error)
+        __pyx_r = ((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_t_2);
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "jdwp.pyx":645
+ * 	cpdef JdwpFormat format(self, fmt):
+ * 		'returns fmt compiled for the ID sizes of this buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)             # <<<<<<<<<<<<<<
+ * 		if f is None:
+ * 			f = JdwpFormat(
+ */
+  if (unlikely(__pyx_v_self->formats == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 645, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyDict_GetItemDefault(__pyx_v_self->formats, __pyx_v_fmt, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 645, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_4jdwp_JdwpFormat))))) __PYX_ERR(0, 645, __pyx_L1_error)
+  __pyx_v_f = ((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":646
+ * 		'returns fmt compiled for the ID sizes of this buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ * 		if f is None:             # <<<<<<<<<<<<<<
+ * 			f = JdwpFormat(
+ * 				fmt, self.buf.fSz, self.buf.mSz, self.buf.oSz, self.buf.tSz,
+ */
+  __pyx_t_5 = (((PyObject *)__pyx_v_f) == Py_None);
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  if (__pyx_t_6) {
+
+    /* "jdwp.pyx":648
+ * 		if f is None:
+ * 			f = JdwpFormat(
+ * 				fmt, self.buf.fSz, self.buf.mSz, self.buf.oSz, self.buf.tSz,             # <<<<<<<<<<<<<<
+ * 				self.buf.sSz
+ * 			)
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_uint8_t(__pyx_v_self->buf.fSz); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 648, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_PyInt_From_uint8_t(__pyx_v_self->buf.mSz); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 648, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyInt_From_uint8_t(__pyx_v_self->buf.oSz); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 648, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_uint8_t(__pyx_v_self->buf.tSz); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 648, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+
+    /* "jdwp.pyx":649
+ * 			f = JdwpFormat(
+ * 				fmt, self.buf.fSz, self.buf.mSz, self.buf.oSz, self.buf.tSz,
+ * 				self.buf.sSz             # <<<<<<<<<<<<<<
+ * 			)
+ * 			self.formats[fmt] = f
+ */
+    __pyx_t_7 = __Pyx_PyInt_From_uint8_t(__pyx_v_self->buf.sSz); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 649, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+
+    /* "jdwp.pyx":647
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ * 		if f is None:
+ * 			f = JdwpFormat(             # <<<<<<<<<<<<<<
+ * 				fmt, self.buf.fSz, self.buf.mSz, self.buf.oSz, self.buf.tSz,
+ * 				self.buf.sSz
+ */
+    __pyx_t_8 = PyTuple_New(6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 647, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_INCREF(__pyx_v_fmt);
+    __Pyx_GIVEREF(__pyx_v_fmt);
+    PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_fmt);
+    __Pyx_GIVEREF(__pyx_t_1);
+    PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_8, 3, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_8, 4, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_8, 5, __pyx_t_7);
+    __pyx_t_1 = 0;
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_7 = 0;
+    __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_4jdwp_JdwpFormat), __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 647, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF_SET(__pyx_v_f, ((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_t_7));
+    __pyx_t_7 = 0;
+
+    /* "jdwp.pyx":651
+ * 				self.buf.sSz
+ * 			)
+ * 			self.formats[fmt] = f             # <<<<<<<<<<<<<<
+ * 		return f
+ * 
+ */
+    if (unlikely(__pyx_v_self->formats == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 651, __pyx_L1_error)
+    }
+    if (unlikely(PyDict_SetItem(__pyx_v_self->formats, __pyx_v_fmt, ((PyObject *)__pyx_v_f)) < 0)) __PYX_ERR(0, 651, __pyx_L1_error)
+
+    /* "jdwp.pyx":646
+ * 		'returns fmt compiled for the ID sizes of this buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ * 		if f is None:             # <<<<<<<<<<<<<<
+ * 			f = JdwpFormat(
+ * 				fmt, self.buf.fSz, self.buf.mSz, self.buf.oSz, self.buf.tSz,
+ */
+  }
+
+  /* "jdwp.pyx":652
+ * 			)
+ * 			self.formats[fmt] = f
+ * 		return f             # <<<<<<<<<<<<<<
+ * 
+ * 	def data(self):
+ */
+  __Pyx_XDECREF(((PyObject *)__pyx_r));
+  __Pyx_INCREF(((PyObject *)__pyx_v_f));
+  __pyx_r = __pyx_v_f;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":643
+ * 		einz( code )
+ * 
+ * 	cpdef JdwpFormat format(self, fmt):             # <<<<<<<<<<<<<<
+ * 		'returns fmt compiled for the ID sizes of this buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.format", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_f);
+  __Pyx_XGIVEREF((PyObject *)__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_67format(PyObject *__pyx_v_self, PyObject *__pyx_v_fmt); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_66format[] = "returns fmt compiled for the ID sizes of this buffer";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_67format(PyObject *__pyx_v_self, PyObject *__pyx_v_fmt) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("format (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_66format(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((PyObject *)__pyx_v_fmt));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_66format(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("format", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((PyObject *)__pyx_f_4jdwp_10JdwpBuffer_format(__pyx_v_self, __pyx_v_fmt, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 643, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.format", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":654
+ * 		return f
+ * 
+ * 	def data(self):             # <<<<<<<<<<<<<<
+ * 		cdef char* str
+ * 		cdef Py_ssize_t len
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_69data(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_69data(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("data (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_68data(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_68data(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  char *__pyx_v_str;
+  Py_ssize_t __pyx_v_len;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  char *__pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("data", 0);
+
+  /* "jdwp.pyx":658
+ * 		cdef Py_ssize_t len
+ * 
+ * 		str = self.buf.data             # <<<<<<<<<<<<<<
+ * 		if str == NULL:
+ * 			return ''
+ */
+  __pyx_t_1 = __pyx_v_self->buf.data;
+  __pyx_v_str = __pyx_t_1;
+
+  /* "jdwp.pyx":659
+ * 
+ * 		str = self.buf.data
+ * 		if str == NULL:             # <<<<<<<<<<<<<<
+ * 			return ''
+ * 		str = str + self.buf.ofs
+ */
+  __pyx_t_2 = ((__pyx_v_str == NULL) != 0);
+  if (__pyx_t_2) {
+
+    /* "jdwp.pyx":660
+ * 		str = self.buf.data
+ * 		if str == NULL:
+ * 			return ''             # <<<<<<<<<<<<<<
+ * 		str = str + self.buf.ofs
+ * 		len = self.buf.len
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_kp_s__2);
+    __pyx_r = __pyx_kp_s__2;
+    goto __pyx_L0;
+
+    /* "jdwp.pyx":659
+ * 
+ * 		str = self.buf.data
+ * 		if str == NULL:             # <<<<<<<<<<<<<<
+ * 			return ''
+ * 		str = str + self.buf.ofs
+ */
+  }
+
+  /* "jdwp.pyx":661
+ * 		if str == NULL:
+ * 			return ''
+ * 		str = str + self.buf.ofs             # <<<<<<<<<<<<<<
+ * 		len = self.buf.len
+ * 		return PyString_FromStringAndSize(str, len)
+ */
+  __pyx_v_str = (__pyx_v_str + __pyx_v_self->buf.ofs);
+
+  /* "jdwp.pyx":662
+ * 			return ''
+ * 		str = str + self.buf.ofs
+ * 		len = self.buf.len             # <<<<<<<<<<<<<<
+ * 		return PyString_FromStringAndSize(str, len)
+ * 
+ */
+  __pyx_t_3 = __pyx_v_self->buf.len;
+  __pyx_v_len = __pyx_t_3;
+
+  /* "jdwp.pyx":663
+ * 		str = str + self.buf.ofs
+ * 		len = self.buf.len
+ * 		return PyString_FromStringAndSize(str, len)             # <<<<<<<<<<<<<<
+ * 
+ * 	def writeInto(self, target, Py_ssize_t offset = 0):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_4 = PyString_FromStringAndSize(__pyx_v_str, __pyx_v_len); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 663, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":654
+ * 		return f
+ * 
+ * 	def data(self):             # <<<<<<<<<<<<<<
+ * 		cdef char* str
+ * 		cdef Py_ssize_t len
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.data", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":665
+ * 		return PyString_FromStringAndSize(str, len)
+ * 
+ * 	def writeInto(self, target, Py_ssize_t offset = 0):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		copies the contents of the buffer into the writable buffer target at
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_71writeInto(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_70writeInto[] = "\n\t\tcopies the contents of the buffer into the writable buffer target at\n\t\toffset, without an intermediate string; returns the offset after them\n\t\t";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_71writeInto(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_target = 0;
+  Py_ssize_t __pyx_v_offset;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("writeInto (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_target,&__pyx_n_s_offset,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_target)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_offset);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writeInto") < 0)) __PYX_ERR(0, 665, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_target = values[0];
+    if (values[1]) {
+      __pyx_v_offset = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_offset == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 665, __pyx_L3_error)
+    } else {
+      __pyx_v_offset = ((Py_ssize_t)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("writeInto", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 665, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.writeInto", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_70writeInto(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), __pyx_v_target, __pyx_v_offset);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_70writeInto(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_target, Py_ssize_t __pyx_v_offset) {
+  Py_buffer __pyx_v_view;
+  Py_ssize_t __pyx_v_sz;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  char const *__pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("writeInto", 0);
+
+  /* "jdwp.pyx":671
+ * 		'''
+ * 		cdef Py_buffer view
+ * 		cdef Py_ssize_t sz = self.buf.len - self.buf.ofs             # <<<<<<<<<<<<<<
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+ * 		try:
+ */
+  __pyx_v_sz = (__pyx_v_self->buf.len - __pyx_v_self->buf.ofs);
+
+  /* "jdwp.pyx":672
+ * 		cdef Py_buffer view
+ * 		cdef Py_ssize_t sz = self.buf.len - self.buf.ofs
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)             # <<<<<<<<<<<<<<
+ * 		try:
+ * 			if offset < 0 or view.len - offset < sz:
+ */
+  __pyx_t_1 = PyObject_GetBuffer(__pyx_v_target, (&__pyx_v_view), PyBUF_WRITABLE); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 672, __pyx_L1_error)
+
+  /* "jdwp.pyx":673
+ * 		cdef Py_ssize_t sz = self.buf.len - self.buf.ofs
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+ * 		try:             # <<<<<<<<<<<<<<
+ * 			if offset < 0 or view.len - offset < sz:
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+ */
+  /*try:*/ {
+
+    /* "jdwp.pyx":674
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+ * 		try:
+ * 			if offset < 0 or view.len - offset < sz:             # <<<<<<<<<<<<<<
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+ * 					sz, offset, view.len
+ */
+    __pyx_t_3 = ((__pyx_v_offset < 0) != 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_3 = (((__pyx_v_view.len - __pyx_v_offset) < __pyx_v_sz) != 0);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L7_bool_binop_done:;
+    if (unlikely(__pyx_t_2)) {
+
+      /* "jdwp.pyx":676
+ * 			if offset < 0 or view.len - offset < sz:
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+ * 					sz, offset, view.len             # <<<<<<<<<<<<<<
+ * 				))
+ * 			if sz:
+ */
+      __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_sz); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 676, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = PyInt_FromSsize_t(__pyx_v_offset); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 676, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = PyInt_FromSsize_t(__pyx_v_view.len); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 676, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 676, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4);
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_5);
+      __Pyx_GIVEREF(__pyx_t_6);
+      PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_6);
+      __pyx_t_4 = 0;
+      __pyx_t_5 = 0;
+      __pyx_t_6 = 0;
+
+      /* "jdwp.pyx":675
+ * 		try:
+ * 			if offset < 0 or view.len - offset < sz:
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (             # <<<<<<<<<<<<<<
+ * 					sz, offset, view.len
+ * 				))
+ */
+      __pyx_t_6 = __Pyx_PyString_Format(__pyx_kp_s_i_bytes_do_not_fit_at_offset_i, __pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 675, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_7 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 675, __pyx_L4_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_Raise(__pyx_t_7, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __PYX_ERR(0, 675, __pyx_L4_error)
+
+      /* "jdwp.pyx":674
+ * 		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+ * 		try:
+ * 			if offset < 0 or view.len - offset < sz:             # <<<<<<<<<<<<<<
+ * 				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+ * 					sz, offset, view.len
+ */
+    }
+
+    /* "jdwp.pyx":678
+ * 					sz, offset, view.len
+ * 				))
+ * 			if sz:             # <<<<<<<<<<<<<<
+ * 				memcpy(<char*>view.buf + offset, self.buf.data + self.buf.ofs, sz)
+ * 		finally:
+ */
+    __pyx_t_2 = (__pyx_v_sz != 0);
+    if (__pyx_t_2) {
+
+      /* "jdwp.pyx":679
+ * 				))
+ * 			if sz:
+ * 				memcpy(<char*>view.buf + offset, self.buf.data + self.buf.ofs, sz)             # <<<<<<<<<<<<<<
+ * 		finally:
+ * 			PyBuffer_Release(&view)
+ */
+      (void)(memcpy((((char *)__pyx_v_view.buf) + __pyx_v_offset), (__pyx_v_self->buf.data + __pyx_v_self->buf.ofs), __pyx_v_sz));
+
+      /* "jdwp.pyx":678
+ * 					sz, offset, view.len
+ * 				))
+ * 			if sz:             # <<<<<<<<<<<<<<
+ * 				memcpy(<char*>view.buf + offset, self.buf.data + self.buf.ofs, sz)
+ * 		finally:
+ */
+    }
+  }
+
+  /* "jdwp.pyx":681
+ * 				memcpy(<char*>view.buf + offset, self.buf.data + self.buf.ofs, sz)
+ * 		finally:
+ * 			PyBuffer_Release(&view)             # <<<<<<<<<<<<<<
+ * 		return offset + sz
+ * 
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_view));
+      goto __pyx_L5;
+    }
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0;
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12) < 0)) __Pyx_ErrFetch(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __Pyx_XGOTREF(__pyx_t_15);
+      __pyx_t_1 = __pyx_lineno; __pyx_t_8 = __pyx_clineno; __pyx_t_9 = __pyx_filename;
+      {
+        PyBuffer_Release((&__pyx_v_view));
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_13);
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_XGIVEREF(__pyx_t_15);
+        __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
+      }
+      __Pyx_XGIVEREF(__pyx_t_10);
+      __Pyx_XGIVEREF(__pyx_t_11);
+      __Pyx_XGIVEREF(__pyx_t_12);
+      __Pyx_ErrRestore(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+      __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0;
+      __pyx_lineno = __pyx_t_1; __pyx_clineno = __pyx_t_8; __pyx_filename = __pyx_t_9;
+      goto __pyx_L1_error;
+    }
+    __pyx_L5:;
+  }
+
+  /* "jdwp.pyx":682
+ * 		finally:
+ * 			PyBuffer_Release(&view)
+ * 		return offset + sz             # <<<<<<<<<<<<<<
+ * 
+ * 	def reset(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_7 = PyInt_FromSsize_t((__pyx_v_offset + __pyx_v_sz)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 682, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_r = __pyx_t_7;
+  __pyx_t_7 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":665
+ * 		return PyString_FromStringAndSize(str, len)
+ * 
+ * 	def writeInto(self, target, Py_ssize_t offset = 0):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		copies the contents of the buffer into the writable buffer target at
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.writeInto", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":684
+ * 		return offset + sz
+ * 
+ * 	def reset(self):             # <<<<<<<<<<<<<<
+ * 		'empties the buffer for reuse, keeping its memory unless borrowed'
+ * 		if self.buf.borrowed:
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_73reset(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_72reset[] = "empties the buffer for reuse, keeping its memory unless borrowed";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_73reset(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("reset (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_72reset(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_72reset(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("reset", 0);
+
+  /* "jdwp.pyx":686
+ * 	def reset(self):
+ * 		'empties the buffer for reuse, keeping its memory unless borrowed'
+ * 		if self.buf.borrowed:             # <<<<<<<<<<<<<<
+ * 			jdwp_purge(&self.buf)
+ * 		self.buf.ofs = 0
+ */
+  __pyx_t_1 = (__pyx_v_self->buf.borrowed != 0);
+  if (__pyx_t_1) {
+
+    /* "jdwp.pyx":687
+ * 		'empties the buffer for reuse, keeping its memory unless borrowed'
+ * 		if self.buf.borrowed:
+ * 			jdwp_purge(&self.buf)             # <<<<<<<<<<<<<<
+ * 		self.buf.ofs = 0
+ * 		self.buf.len = 0
+ */
+    jdwp_purge((&__pyx_v_self->buf));
+
+    /* "jdwp.pyx":686
+ * 	def reset(self):
+ * 		'empties the buffer for reuse, keeping its memory unless borrowed'
+ * 		if self.buf.borrowed:             # <<<<<<<<<<<<<<
+ * 			jdwp_purge(&self.buf)
+ * 		self.buf.ofs = 0
+ */
+  }
+
+  /* "jdwp.pyx":688
+ * 		if self.buf.borrowed:
+ * 			jdwp_purge(&self.buf)
+ * 		self.buf.ofs = 0             # <<<<<<<<<<<<<<
+ * 		self.buf.len = 0
+ * 		self.unview()
+ */
+  __pyx_v_self->buf.ofs = 0;
+
+  /* "jdwp.pyx":689
+ * 			jdwp_purge(&self.buf)
+ * 		self.buf.ofs = 0
+ * 		self.buf.len = 0             # <<<<<<<<<<<<<<
+ * 		self.unview()
+ * 
+ */
+  __pyx_v_self->buf.len = 0;
+
+  /* "jdwp.pyx":690
+ * 		self.buf.ofs = 0
+ * 		self.buf.len = 0
+ * 		self.unview()             # <<<<<<<<<<<<<<
+ * 
+ * 	def preparePack(self, sz = 1024):
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)__pyx_v_self->__pyx_vtab)->unview(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 690, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":684
+ * 		return offset + sz
+ * 
+ * 	def reset(self):             # <<<<<<<<<<<<<<
+ * 		'empties the buffer for reuse, keeping its memory unless borrowed'
+ * 		if self.buf.borrowed:
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.reset", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":692
+ * 		self.unview()
+ * 
+ * 	def preparePack(self, sz = 1024):             # <<<<<<<<<<<<<<
+ * 		jdwp_prepare(&self.buf, NULL, sz)
+ * 		self.unview()
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_75preparePack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_75preparePack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_sz = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("preparePack (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_sz,0};
+    PyObject* values[1] = {0};
+    values[0] = ((PyObject *)__pyx_int_1024);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_sz);
+          if (value) { values[0] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "preparePack") < 0)) __PYX_ERR(0, 692, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_sz = values[0];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("preparePack", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 692, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.preparePack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_74preparePack(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), __pyx_v_sz);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_74preparePack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_sz) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("preparePack", 0);
+
+  /* "jdwp.pyx":693
+ * 
+ * 	def preparePack(self, sz = 1024):
+ * 		jdwp_prepare(&self.buf, NULL, sz)             # <<<<<<<<<<<<<<
+ * 		self.unview()
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_sz); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 693, __pyx_L1_error)
+  (void)(jdwp_prepare((&__pyx_v_self->buf), NULL, __pyx_t_1));
+
+  /* "jdwp.pyx":694
+ * 	def preparePack(self, sz = 1024):
+ * 		jdwp_prepare(&self.buf, NULL, sz)
+ * 		self.unview()             # <<<<<<<<<<<<<<
+ * 
+ * 	def prepareUnpack(self, data):
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)__pyx_v_self->__pyx_vtab)->unview(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 694, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":692
+ * 		self.unview()
+ * 
+ * 	def preparePack(self, sz = 1024):             # <<<<<<<<<<<<<<
+ * 		jdwp_prepare(&self.buf, NULL, sz)
+ * 		self.unview()
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.preparePack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":696
+ * 		self.unview()
+ * 
+ * 	def prepareUnpack(self, data):             # <<<<<<<<<<<<<<
+ * 		cdef Py_buffer view
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_77prepareUnpack(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_77prepareUnpack(PyObject *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("prepareUnpack (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_76prepareUnpack(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((PyObject *)__pyx_v_data));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_76prepareUnpack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_data) {
+  Py_buffer __pyx_v_view;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  char const *__pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("prepareUnpack", 0);
+
+  /* "jdwp.pyx":701
+ * 		# accepts strings, bytearrays, memoryviews or any other object
+ * 		# supporting the buffer protocol, without an intermediate string.
+ * 		PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)             # <<<<<<<<<<<<<<
+ * 		try:
+ * 			einz( jdwp_prepare(&self.buf, <char*>view.buf, view.len) )
+ */
+  __pyx_t_1 = PyObject_GetBuffer(__pyx_v_data, (&__pyx_v_view), PyBUF_SIMPLE); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 701, __pyx_L1_error)
+
+  /* "jdwp.pyx":702
+ * 		# supporting the buffer protocol, without an intermediate string.
+ * 		PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+ * 		try:             # <<<<<<<<<<<<<<
+ * 			einz( jdwp_prepare(&self.buf, <char*>view.buf, view.len) )
+ * 		finally:
+ */
+  /*try:*/ {
+
+    /* "jdwp.pyx":703
+ * 		PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+ * 		try:
+ * 			einz( jdwp_prepare(&self.buf, <char*>view.buf, view.len) )             # <<<<<<<<<<<<<<
+ * 		finally:
+ * 			PyBuffer_Release(&view)
+ */
+    __pyx_t_2 = __pyx_f_4jdwp_einz(jdwp_prepare((&__pyx_v_self->buf), ((char *)__pyx_v_view.buf), __pyx_v_view.len)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 703, __pyx_L4_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+
+  /* "jdwp.pyx":705
+ * 			einz( jdwp_prepare(&self.buf, <char*>view.buf, view.len) )
+ * 		finally:
+ * 			PyBuffer_Release(&view)             # <<<<<<<<<<<<<<
+ * 		self.unview()
+ * 
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      PyBuffer_Release((&__pyx_v_view));
+      goto __pyx_L5;
+    }
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_5 = 0; __pyx_t_6 = 0; __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0)) __Pyx_ErrFetch(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_5);
+      __Pyx_XGOTREF(__pyx_t_6);
+      __Pyx_XGOTREF(__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __pyx_t_1 = __pyx_lineno; __pyx_t_3 = __pyx_clineno; __pyx_t_4 = __pyx_filename;
+      {
+        PyBuffer_Release((&__pyx_v_view));
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_8);
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_XGIVEREF(__pyx_t_10);
+        __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+      }
+      __Pyx_XGIVEREF(__pyx_t_5);
+      __Pyx_XGIVEREF(__pyx_t_6);
+      __Pyx_XGIVEREF(__pyx_t_7);
+      __Pyx_ErrRestore(__pyx_t_5, __pyx_t_6, __pyx_t_7);
+      __pyx_t_5 = 0; __pyx_t_6 = 0; __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0;
+      __pyx_lineno = __pyx_t_1; __pyx_clineno = __pyx_t_3; __pyx_filename = __pyx_t_4;
+      goto __pyx_L1_error;
+    }
+    __pyx_L5:;
+  }
+
+  /* "jdwp.pyx":706
+ * 		finally:
+ * 			PyBuffer_Release(&view)
+ * 		self.unview()             # <<<<<<<<<<<<<<
+ * 
+ * 	def borrow(self, data):
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)__pyx_v_self->__pyx_vtab)->unview(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 706, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":696
+ * 		self.unview()
+ * 
+ * 	def prepareUnpack(self, data):             # <<<<<<<<<<<<<<
+ * 		cdef Py_buffer view
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.prepareUnpack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":708
+ * 		self.unview()
+ * 
+ * 	def borrow(self, data):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		like prepareUnpack, but unpacks from the memory of data in place,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_79borrow(PyObject *__pyx_v_self, PyObject *__pyx_v_data); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_78borrow[] = "\n\t\tlike prepareUnpack, but unpacks from the memory of data in place,\n\t\tholding a reference to it rather than copying it; data must not be\n\t\tchanged while the buffer uses it, and is copied if the buffer is\n\t\tlater packed into\n\t\t";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_79borrow(PyObject *__pyx_v_self, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("borrow (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_78borrow(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((PyObject *)__pyx_v_data));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_78borrow(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_data) {
+  Py_buffer __pyx_v_view;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("borrow", 0);
+
+  /* "jdwp.pyx":716
+ * 		'''
+ * 		cdef Py_buffer view
+ * 		PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)             # <<<<<<<<<<<<<<
+ * 		jdwp_borrow(&self.buf, <char*>view.buf, view.len)
+ * 		self.unview()
+ */
+  __pyx_t_1 = PyObject_GetBuffer(__pyx_v_data, (&__pyx_v_view), PyBUF_SIMPLE); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 716, __pyx_L1_error)
+
+  /* "jdwp.pyx":717
+ * 		cdef Py_buffer view
+ * 		PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+ * 		jdwp_borrow(&self.buf, <char*>view.buf, view.len)             # <<<<<<<<<<<<<<
+ * 		self.unview()
+ * 		self.view = view
+ */
+  (void)(jdwp_borrow((&__pyx_v_self->buf), ((char *)__pyx_v_view.buf), __pyx_v_view.len));
+
+  /* "jdwp.pyx":718
+ * 		PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+ * 		jdwp_borrow(&self.buf, <char*>view.buf, view.len)
+ * 		self.unview()             # <<<<<<<<<<<<<<
+ * 		self.view = view
+ * 		self.viewing = 1
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)__pyx_v_self->__pyx_vtab)->unview(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 718, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":719
+ * 		jdwp_borrow(&self.buf, <char*>view.buf, view.len)
+ * 		self.unview()
+ * 		self.view = view             # <<<<<<<<<<<<<<
+ * 		self.viewing = 1
+ * 
+ */
+  __pyx_v_self->view = __pyx_v_view;
+
+  /* "jdwp.pyx":720
+ * 		self.unview()
+ * 		self.view = view
+ * 		self.viewing = 1             # <<<<<<<<<<<<<<
+ * 
+ * 	@property
+ */
+  __pyx_v_self->viewing = 1;
+
+  /* "jdwp.pyx":708
+ * 		self.unview()
+ * 
+ * 	def borrow(self, data):             # <<<<<<<<<<<<<<
+ * 		'''
+ * 		like prepareUnpack, but unpacks from the memory of data in place,
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.borrow", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":723
+ * 
+ * 	@property
+ * 	def borrowed(self):             # <<<<<<<<<<<<<<
+ * 		'true if the buffer is still using the memory of another object'
+ * 		return bool(self.buf.borrowed)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_8borrowed_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_8borrowed_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_8borrowed___get__(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_8borrowed___get__(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "jdwp.pyx":725
+ * 	def borrowed(self):
+ * 		'true if the buffer is still using the memory of another object'
+ * 		return bool(self.buf.borrowed)             # <<<<<<<<<<<<<<
+ * 
+ * 	def pack(self, fmt, *args):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_uint8_t(__pyx_v_self->buf.borrowed); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 725, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 725, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyBool_FromLong((!(!__pyx_t_2))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 725, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":723
+ * 
+ * 	@property
+ * 	def borrowed(self):             # <<<<<<<<<<<<<<
+ * 		'true if the buffer is still using the memory of another object'
+ * 		return bool(self.buf.borrowed)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.borrowed.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":727
+ * 		return bool(self.buf.borrowed)
+ * 
+ * 	def pack(self, fmt, *args):             # <<<<<<<<<<<<<<
+ * 		'replaces the contents of the buffer with the values; returns them'
+ * 		self.buf.len = 0
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_81pack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_80pack[] = "replaces the contents of the buffer with the values; returns them";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_81pack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_fmt = 0;
+  PyObject *__pyx_v_args = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pack (wrapper)", 0);
+  if (PyTuple_GET_SIZE(__pyx_args) > 1) {
+    __pyx_v_args = PyTuple_GetSlice(__pyx_args, 1, PyTuple_GET_SIZE(__pyx_args));
+    if (unlikely(!__pyx_v_args)) {
+      __Pyx_RefNannyFinishContext();
+      return NULL;
+    }
+    __Pyx_GOTREF(__pyx_v_args);
+  } else {
+    __pyx_v_args = __pyx_empty_tuple; __Pyx_INCREF(__pyx_empty_tuple);
+  }
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fmt,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        default:
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_fmt)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t used_pos_args = (pos_args < 1) ? pos_args : 1;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, used_pos_args, "pack") < 0)) __PYX_ERR(0, 727, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) < 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_fmt = values[0];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pack", 0, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 727, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_args); __pyx_v_args = 0;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_80pack(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), __pyx_v_fmt, __pyx_v_args);
+
+  /* function exit code */
+  __Pyx_XDECREF(__pyx_v_args);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_80pack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt, PyObject *__pyx_v_args) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack", 0);
+
+  /* "jdwp.pyx":729
+ * 	def pack(self, fmt, *args):
+ * 		'replaces the contents of the buffer with the values; returns them'
+ * 		self.buf.len = 0             # <<<<<<<<<<<<<<
+ * 		self.buf.ofs = 0
+ * 		self.format(fmt).append(self, args)
+ */
+  __pyx_v_self->buf.len = 0;
+
+  /* "jdwp.pyx":730
+ * 		'replaces the contents of the buffer with the values; returns them'
+ * 		self.buf.len = 0
+ * 		self.buf.ofs = 0             # <<<<<<<<<<<<<<
+ * 		self.format(fmt).append(self, args)
+ * 		return self.data()
+ */
+  __pyx_v_self->buf.ofs = 0;
+
+  /* "jdwp.pyx":731
+ * 		self.buf.len = 0
+ * 		self.buf.ofs = 0
+ * 		self.format(fmt).append(self, args)             # <<<<<<<<<<<<<<
+ * 		return self.data()
+ * 
+ */
+  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)__pyx_v_self->__pyx_vtab)->format(__pyx_v_self, __pyx_v_fmt, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 731, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_t_1)->__pyx_vtab)->append(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_t_1), __pyx_v_self, __pyx_v_args); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 731, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":732
+ * 		self.buf.ofs = 0
+ * 		self.format(fmt).append(self, args)
+ * 		return self.data()             # <<<<<<<<<<<<<<
+ * 
+ * 	def ipack(self, fmt, *args):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_data); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 732, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 732, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":727
+ * 		return bool(self.buf.borrowed)
+ * 
+ * 	def pack(self, fmt, *args):             # <<<<<<<<<<<<<<
+ * 		'replaces the contents of the buffer with the values; returns them'
+ * 		self.buf.len = 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":734
+ * 		return self.data()
+ * 
+ * 	def ipack(self, fmt, *args):             # <<<<<<<<<<<<<<
+ * 		'appends the values to the contents of the buffer'
+ * 		self.format(fmt).append(self, args)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_83ipack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_82ipack[] = "appends the values to the contents of the buffer";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_83ipack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_fmt = 0;
+  PyObject *__pyx_v_args = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("ipack (wrapper)", 0);
+  if (PyTuple_GET_SIZE(__pyx_args) > 1) {
+    __pyx_v_args = PyTuple_GetSlice(__pyx_args, 1, PyTuple_GET_SIZE(__pyx_args));
+    if (unlikely(!__pyx_v_args)) {
+      __Pyx_RefNannyFinishContext();
+      return NULL;
+    }
+    __Pyx_GOTREF(__pyx_v_args);
+  } else {
+    __pyx_v_args = __pyx_empty_tuple; __Pyx_INCREF(__pyx_empty_tuple);
+  }
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fmt,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        default:
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_fmt)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t used_pos_args = (pos_args < 1) ? pos_args : 1;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, used_pos_args, "ipack") < 0)) __PYX_ERR(0, 734, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) < 1) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+    }
+    __pyx_v_fmt = values[0];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("ipack", 0, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 734, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_args); __pyx_v_args = 0;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.ipack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_82ipack(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), __pyx_v_fmt, __pyx_v_args);
+
+  /* function exit code */
+  __Pyx_XDECREF(__pyx_v_args);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_82ipack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt, PyObject *__pyx_v_args) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("ipack", 0);
+
+  /* "jdwp.pyx":736
+ * 	def ipack(self, fmt, *args):
+ * 		'appends the values to the contents of the buffer'
+ * 		self.format(fmt).append(self, args)             # <<<<<<<<<<<<<<
+ * 		return self.data()
+ * 
+ */
+  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)__pyx_v_self->__pyx_vtab)->format(__pyx_v_self, __pyx_v_fmt, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 736, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_t_1)->__pyx_vtab)->append(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_t_1), __pyx_v_self, __pyx_v_args); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 736, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":737
+ * 		'appends the values to the contents of the buffer'
+ * 		self.format(fmt).append(self, args)
+ * 		return self.data()             # <<<<<<<<<<<<<<
+ * 
+ * 	def unpack(self, fmt, data = None):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_data); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 737, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 737, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":734
+ * 		return self.data()
+ * 
+ * 	def ipack(self, fmt, *args):             # <<<<<<<<<<<<<<
+ * 		'appends the values to the contents of the buffer'
+ * 		self.format(fmt).append(self, args)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.ipack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "jdwp.pyx":739
+ * 		return self.data()
+ * 
+ * 	def unpack(self, fmt, data = None):             # <<<<<<<<<<<<<<
+ * 		'returns a list of values unpacked from the buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_85unpack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4jdwp_10JdwpBuffer_84unpack[] = "returns a list of values unpacked from the buffer";
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_85unpack(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_fmt = 0;
+  PyObject *__pyx_v_data = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unpack (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fmt,&__pyx_n_s_data,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_fmt)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_data);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "unpack") < 0)) __PYX_ERR(0, 739, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_fmt = values[0];
+    __pyx_v_data = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("unpack", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 739, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_84unpack(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), __pyx_v_fmt, __pyx_v_data);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_84unpack(struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, PyObject *__pyx_v_fmt, PyObject *__pyx_v_data) {
+  struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v_f = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unpack", 0);
+
+  /* "jdwp.pyx":741
+ * 	def unpack(self, fmt, data = None):
+ * 		'returns a list of values unpacked from the buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)             # <<<<<<<<<<<<<<
+ * 		if f is None:
+ * 			f = self.format(fmt)
+ */
+  if (unlikely(__pyx_v_self->formats == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 741, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyDict_GetItemDefault(__pyx_v_self->formats, __pyx_v_fmt, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 741, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_4jdwp_JdwpFormat))))) __PYX_ERR(0, 741, __pyx_L1_error)
+  __pyx_v_f = ((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "jdwp.pyx":742
+ * 		'returns a list of values unpacked from the buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ * 		if f is None:             # <<<<<<<<<<<<<<
+ * 			f = self.format(fmt)
+ * 		if data is not None:
+ */
+  __pyx_t_2 = (((PyObject *)__pyx_v_f) == Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "jdwp.pyx":743
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ * 		if f is None:
+ * 			f = self.format(fmt)             # <<<<<<<<<<<<<<
+ * 		if data is not None:
+ * 			self.prepareUnpack(data)
+ */
+    __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_4jdwp_JdwpBuffer *)__pyx_v_self->__pyx_vtab)->format(__pyx_v_self, __pyx_v_fmt, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 743, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_f, ((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "jdwp.pyx":742
+ * 		'returns a list of values unpacked from the buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ * 		if f is None:             # <<<<<<<<<<<<<<
+ * 			f = self.format(fmt)
+ * 		if data is not None:
+ */
+  }
+
+  /* "jdwp.pyx":744
+ * 		if f is None:
+ * 			f = self.format(fmt)
+ * 		if data is not None:             # <<<<<<<<<<<<<<
+ * 			self.prepareUnpack(data)
+ * 		return f.decode(&self.buf, 1)
+ */
+  __pyx_t_3 = (__pyx_v_data != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "jdwp.pyx":745
+ * 			f = self.format(fmt)
+ * 		if data is not None:
+ * 			self.prepareUnpack(data)             # <<<<<<<<<<<<<<
+ * 		return f.decode(&self.buf, 1)
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_prepareUnpack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 745, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_v_data) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_data);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 745, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "jdwp.pyx":744
+ * 		if f is None:
+ * 			f = self.format(fmt)
+ * 		if data is not None:             # <<<<<<<<<<<<<<
+ * 			self.prepareUnpack(data)
+ * 		return f.decode(&self.buf, 1)
+ */
+  }
+
+  /* "jdwp.pyx":746
+ * 		if data is not None:
+ * 			self.prepareUnpack(data)
+ * 		return f.decode(&self.buf, 1)             # <<<<<<<<<<<<<<
+ * 
+ * 	# def pack(self, fmt, *args):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_4jdwp_JdwpFormat *)__pyx_v_f->__pyx_vtab)->decode(__pyx_v_f, (&__pyx_v_self->buf), 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 746, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "jdwp.pyx":739
+ * 		return self.data()
+ * 
+ * 	def unpack(self, fmt, data = None):             # <<<<<<<<<<<<<<
+ * 		'returns a list of values unpacked from the buffer'
+ * 		cdef JdwpFormat f = self.formats.get(fmt)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.unpack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_f);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_87__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_87__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_86__reduce_cython__(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_86__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_89__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_4jdwp_10JdwpBuffer_89__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4jdwp_10JdwpBuffer_88__setstate_cython__(((struct __pyx_obj_4jdwp_JdwpBuffer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp_10JdwpBuffer_88__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_4jdwp_JdwpBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("jdwp.JdwpBuffer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __pyx_unpickle_JdwpFormat(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4jdwp_1__pyx_unpickle_JdwpFormat(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_4jdwp_1__pyx_unpickle_JdwpFormat = {"__pyx_unpickle_JdwpFormat", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_1__pyx_unpickle_JdwpFormat, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_4jdwp_1__pyx_unpickle_JdwpFormat(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_JdwpFormat (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_type,&__pyx_n_s_pyx_checksum,&__pyx_n_s_pyx_state,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_type)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_checksum)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_JdwpFormat", 1, 3, 3, 1); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_pyx_state)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_JdwpFormat", 1, 3, 3, 2); __PYX_ERR(1, 1, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__pyx_unpickle_JdwpFormat") < 0)) __PYX_ERR(1, 1, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyInt_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 1, __pyx_L3_error)
+    __pyx_v___pyx_state = values[2];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_JdwpFormat", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 1, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("jdwp.__pyx_unpickle_JdwpFormat", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_4jdwp___pyx_unpickle_JdwpFormat(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4jdwp___pyx_unpickle_JdwpFormat(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_PickleError = 0;
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_JdwpFormat", 0);
+
+  /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x2c82c07, 0xb4a3a74, 0xa570970):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2c82c07, 0xb4a3a74, 0xa570970) = (count, format, size, widths))" % __pyx_checksum)
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_t_1, __pyx_tuple__5, Py_NE)); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":5
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x2c82c07, 0xb4a3a74, 0xa570970):
+ *         from pickle import PickleError as __pyx_PickleError             # <<<<<<<<<<<<<<
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2c82c07, 0xb4a3a74, 0xa570970) = (count, format, size, widths))" % __pyx_checksum)
+ *     __pyx_result = JdwpFormat.__new__(__pyx_type)
+ */
+    __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_n_s_PickleError);
+    __Pyx_GIVEREF(__pyx_n_s_PickleError);
+    PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_PickleError);
+    __pyx_t_4 = __Pyx_Import(__pyx_n_s_pickle, __pyx_t_1, -1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_PickleError); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 5, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_1);
+    __pyx_v___pyx_PickleError = __pyx_t_1;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":6
+ *     if __pyx_checksum not in (0x2c82c07, 0xb4a3a74, 0xa570970):
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2c82c07, 0xb4a3a74, 0xa570970) = (count, format, size, widths))" % __pyx_checksum)             # <<<<<<<<<<<<<<
+ *     __pyx_result = JdwpFormat.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_v___pyx_checksum); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyString_Format(__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v___pyx_PickleError);
+    __pyx_t_1 = __pyx_v___pyx_PickleError; __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 6, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(1, 6, __pyx_L1_error)
+
+    /* "(tree fragment)":4
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ *     if __pyx_checksum not in (0x2c82c07, 0xb4a3a74, 0xa570970):             # <<<<<<<<<<<<<<
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2c82c07, 0xb4a3a74, 0xa570970) = (count, format, size, widths))" % __pyx_checksum)
+ */
+  }
+
+  /* "(tree fragment)":7
+ *         from pickle import PickleError as __pyx_PickleError
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2c82c07, 0xb4a3a74, 0xa570970) = (count, format, size, widths))" % __pyx_checksum)
+ *     __pyx_result = JdwpFormat.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_JdwpFormat__set_state(<JdwpFormat> __pyx_result, __pyx_state)
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_4jdwp_JdwpFormat), __pyx_n_s_new); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_5, __pyx_v___pyx_type) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v___pyx_type);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2c82c07, 0xb4a3a74, 0xa570970) = (count, format, size, widths))" % __pyx_checksum)
+ *     __pyx_result = JdwpFormat.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_JdwpFormat__set_state(<JdwpFormat> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  __pyx_t_3 = (__pyx_v___pyx_state != Py_None);
+  __pyx_t_2 = (__pyx_t_3 != 0);
+  if (__pyx_t_2) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = JdwpFormat.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_JdwpFormat__set_state(<JdwpFormat> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_JdwpFormat__set_state(JdwpFormat __pyx_result, tuple __pyx_state):
+ */
+    if (!(likely(PyTuple_CheckExact(__pyx_v___pyx_state))||((__pyx_v___pyx_state) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_v___pyx_state)->tp_name), 0))) __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_4jdwp___pyx_unpickle_JdwpFormat__set_state(((struct __pyx_obj_4jdwp_JdwpFormat *)__pyx_v___pyx_result), ((PyObject*)__pyx_v___pyx_state)); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "(tree fragment)":8
+ *         raise __pyx_PickleError("Incompatible checksums (0x%x vs (0x2c82c07, 0xb4a3a74, 0xa570970) = (count, format, size, widths))" % __pyx_checksum)
+ *     __pyx_result = JdwpFormat.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_JdwpFormat__set_state(<JdwpFormat> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ */
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_JdwpFormat__set_state(<JdwpFormat> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_JdwpFormat__set_state(JdwpFormat __pyx_result, tuple __pyx_state):
+ *     __pyx_result.count = __pyx_state[0]; __pyx_result.format = __pyx_state[1]; __pyx_result.size = __pyx_state[2]; __pyx_result.widths = __pyx_state[3]
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_JdwpFormat(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("jdwp.__pyx_unpickle_JdwpFormat", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_PickleError);
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_JdwpFormat__set_state(<JdwpFormat> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_JdwpFormat__set_state(JdwpFormat __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.count = __pyx_state[0]; __pyx_result.format = __pyx_state[1]; __pyx_result.size = __pyx_state[2]; __pyx_result.widths = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ */
+
+static PyObject *__pyx_f_4jdwp___pyx_unpickle_JdwpFormat__set_state(struct __pyx_obj_4jdwp_JdwpFormat *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_JdwpFormat__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_JdwpFormat__set_state(JdwpFormat __pyx_result, tuple __pyx_state):
+ *     __pyx_result.count = __pyx_state[0]; __pyx_result.format = __pyx_state[1]; __pyx_result.size = __pyx_state[2]; __pyx_result.widths = __pyx_state[3]             # <<<<<<<<<<<<<<
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[4])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->count = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->format);
+  __Pyx_DECREF(__pyx_v___pyx_result->format);
+  __pyx_v___pyx_result->format = __pyx_t_1;
+  __pyx_t_1 = 0;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 2, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v___pyx_result->size = __pyx_t_2;
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(1, 12, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->widths);
+  __Pyx_DECREF(__pyx_v___pyx_result->widths);
+  __pyx_v___pyx_result->widths = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_JdwpFormat__set_state(JdwpFormat __pyx_result, tuple __pyx_state):
+ *     __pyx_result.count = __pyx_state[0]; __pyx_result.format = __pyx_state[1]; __pyx_result.size = __pyx_state[2]; __pyx_result.widths = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[4])
+ */
+  if (unlikely(__pyx_v___pyx_state == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(1, 13, __pyx_L1_error)
+  }
+  __pyx_t_4 = PyTuple_GET_SIZE(__pyx_v___pyx_state); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_5 = ((__pyx_t_4 > 4) != 0);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_3 = __pyx_t_5;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_5 = __Pyx_HasAttr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __pyx_t_6 = (__pyx_t_5 != 0);
+  __pyx_t_3 = __pyx_t_6;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "(tree fragment)":14
+ *     __pyx_result.count = __pyx_state[0]; __pyx_result.format = __pyx_state[1]; __pyx_result.size = __pyx_state[2]; __pyx_result.widths = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ *         __pyx_result.__dict__.update(__pyx_state[4])             # <<<<<<<<<<<<<<
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v___pyx_result), __pyx_n_s_dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_update); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(1, 14, __pyx_L1_error)
+    }
+    __pyx_t_7 = __Pyx_GetItemInt_Tuple(__pyx_v___pyx_state, 4, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_9 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_9)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_9);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_9) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_9, __pyx_t_7) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_7);
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 14, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "(tree fragment)":13
+ * cdef __pyx_unpickle_JdwpFormat__set_state(JdwpFormat __pyx_result, tuple __pyx_state):
+ *     __pyx_result.count = __pyx_state[0]; __pyx_result.format = __pyx_state[1]; __pyx_result.size = __pyx_state[2]; __pyx_result.widths = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):             # <<<<<<<<<<<<<<
+ *         __pyx_result.__dict__.update(__pyx_state[4])
+ */
+  }
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_JdwpFormat__set_state(<JdwpFormat> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_JdwpFormat__set_state(JdwpFormat __pyx_result, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     __pyx_result.count = __pyx_state[0]; __pyx_result.format = __pyx_state[1]; __pyx_result.size = __pyx_state[2]; __pyx_result.widths = __pyx_state[3]
+ *     if len(__pyx_state) > 4 and hasattr(__pyx_result, '__dict__'):
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("jdwp.__pyx_unpickle_JdwpFormat__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_4jdwp_JdwpFormat __pyx_vtable_4jdwp_JdwpFormat;
+
+static PyObject *__pyx_tp_new_4jdwp_JdwpFormat(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_4jdwp_JdwpFormat *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_4jdwp_JdwpFormat *)o);
+  p->__pyx_vtab = __pyx_vtabptr_4jdwp_JdwpFormat;
+  p->format = Py_None; Py_INCREF(Py_None);
+  p->widths = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_4jdwp_JdwpFormat(PyObject *o) {
+  struct __pyx_obj_4jdwp_JdwpFormat *p = (struct __pyx_obj_4jdwp_JdwpFormat *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->format);
+  Py_CLEAR(p->widths);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_4jdwp_JdwpFormat(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_4jdwp_JdwpFormat *p = (struct __pyx_obj_4jdwp_JdwpFormat *)o;
+  if (p->format) {
+    e = (*v)(p->format, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_4jdwp_JdwpFormat(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_4jdwp_JdwpFormat *p = (struct __pyx_obj_4jdwp_JdwpFormat *)o;
+  tmp = ((PyObject*)p->format);
+  p->format = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_4jdwp_10JdwpFormat_format(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_4jdwp_10JdwpFormat_6format_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_4jdwp_10JdwpFormat_size(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_4jdwp_10JdwpFormat_4size_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_4jdwp_10JdwpFormat_count(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_4jdwp_10JdwpFormat_5count_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_4jdwp_JdwpFormat[] = {
+  {"pack", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpFormat_5pack, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4jdwp_10JdwpFormat_4pack},
+  {"packInto", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpFormat_7packInto, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4jdwp_10JdwpFormat_6packInto},
+  {"writeInto", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpFormat_9writeInto, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4jdwp_10JdwpFormat_8writeInto},
+  {"unpack", (PyCFunction)__pyx_pw_4jdwp_10JdwpFormat_11unpack, METH_O, __pyx_doc_4jdwp_10JdwpFormat_10unpack},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_4jdwp_10JdwpFormat_13__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_4jdwp_10JdwpFormat_15__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_4jdwp_JdwpFormat[] = {
+  {(char *)"format", __pyx_getprop_4jdwp_10JdwpFormat_format, 0, (char *)0, 0},
+  {(char *)"size", __pyx_getprop_4jdwp_10JdwpFormat_size, 0, (char *)0, 0},
+  {(char *)"count", __pyx_getprop_4jdwp_10JdwpFormat_count, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_4jdwp_JdwpFormat = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "jdwp.JdwpFormat", /*tp_name*/
+  sizeof(struct __pyx_obj_4jdwp_JdwpFormat), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_4jdwp_JdwpFormat, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  __pyx_pw_4jdwp_10JdwpFormat_3__repr__, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  "\n\tA JdwpFormat is a format string compiled for a configuration of ID sizes,\n\tlike struct.Struct; the width of every field is worked out once, so\n\tpacking and unpacking are a single pass with no format dispatch.\n\tJdwpBuffer.format returns the compiled format for a buffer's sizes.\n\t", /*tp_doc*/
+  __pyx_tp_traverse_4jdwp_JdwpFormat, /*tp_traverse*/
+  __pyx_tp_clear_4jdwp_JdwpFormat, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_4jdwp_JdwpFormat, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_4jdwp_JdwpFormat, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_4jdwp_10JdwpFormat_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_4jdwp_JdwpFormat, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_4jdwp_JdwpBuffer __pyx_vtable_4jdwp_JdwpBuffer;
+
+static PyObject *__pyx_tp_new_4jdwp_JdwpBuffer(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_4jdwp_JdwpBuffer *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_4jdwp_JdwpBuffer *)o);
+  p->__pyx_vtab = __pyx_vtabptr_4jdwp_JdwpBuffer;
+  p->formats = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  p->view.obj = NULL;
+  if (unlikely(__pyx_pw_4jdwp_10JdwpBuffer_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_4jdwp_JdwpBuffer(PyObject *o) {
+  struct __pyx_obj_4jdwp_JdwpBuffer *p = (struct __pyx_obj_4jdwp_JdwpBuffer *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_4jdwp_10JdwpBuffer_3__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  Py_CLEAR(p->formats);
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static int __pyx_tp_traverse_4jdwp_JdwpBuffer(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_4jdwp_JdwpBuffer *p = (struct __pyx_obj_4jdwp_JdwpBuffer *)o;
+  if (p->formats) {
+    e = (*v)(p->formats, a); if (e) return e;
+  }
+  if (p->view.obj) {
+    e = (*v)(p->view.obj, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_4jdwp_JdwpBuffer(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_4jdwp_JdwpBuffer *p = (struct __pyx_obj_4jdwp_JdwpBuffer *)o;
+  tmp = ((PyObject*)p->formats);
+  p->formats = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  Py_CLEAR(p->view.obj);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_4jdwp_10JdwpBuffer_borrowed(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_4jdwp_10JdwpBuffer_8borrowed_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_4jdwp_JdwpBuffer[] = {
+  {"packU8", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_7packU8, METH_O, 0},
+  {"packU16", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_9packU16, METH_O, 0},
+  {"packU32", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_11packU32, METH_O, 0},
+  {"packU64", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_13packU64, METH_O, 0},
+  {"packInt", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_15packInt, METH_O, 0},
+  {"packLong", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_17packLong, METH_O, 0},
+  {"packObjectId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_19packObjectId, METH_O, 0},
+  {"packFieldId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_21packFieldId, METH_O, 0},
+  {"packMethodId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_23packMethodId, METH_O, 0},
+  {"packTypeId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_25packTypeId, METH_O, 0},
+  {"packFrameId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_27packFrameId, METH_O, 0},
+  {"unpackU8", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_29unpackU8, METH_NOARGS, 0},
+  {"unpackU16", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_31unpackU16, METH_NOARGS, 0},
+  {"unpackU32", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_33unpackU32, METH_NOARGS, 0},
+  {"unpackU64", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_35unpackU64, METH_NOARGS, 0},
+  {"unpackInt", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_37unpackInt, METH_NOARGS, 0},
+  {"unpackFloat", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_39unpackFloat, METH_NOARGS, 0},
+  {"unpackDouble", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_41unpackDouble, METH_NOARGS, 0},
+  {"unpackLong", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_43unpackLong, METH_NOARGS, 0},
+  {"unpackObjectId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_45unpackObjectId, METH_NOARGS, 0},
+  {"unpackMethodId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_47unpackMethodId, METH_NOARGS, 0},
+  {"unpackFrameId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_49unpackFrameId, METH_NOARGS, 0},
+  {"unpackFieldId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_51unpackFieldId, METH_NOARGS, 0},
+  {"unpackTypeId", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_53unpackTypeId, METH_NOARGS, 0},
+  {"unpackArray", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpBuffer_55unpackArray, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4jdwp_10JdwpBuffer_54unpackArray},
+  {"unpackTaggedValues", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_57unpackTaggedValues, METH_O, __pyx_doc_4jdwp_10JdwpBuffer_56unpackTaggedValues},
+  {"unpackClassTable", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_59unpackClassTable, METH_O, __pyx_doc_4jdwp_10JdwpBuffer_58unpackClassTable},
+  {"unpackStr", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_61unpackStr, METH_NOARGS, 0},
+  {"packStr", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_63packStr, METH_O, 0},
+  {"config", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpBuffer_65config, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4jdwp_10JdwpBuffer_64config},
+  {"format", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_67format, METH_O, __pyx_doc_4jdwp_10JdwpBuffer_66format},
+  {"data", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_69data, METH_NOARGS, 0},
+  {"writeInto", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpBuffer_71writeInto, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4jdwp_10JdwpBuffer_70writeInto},
+  {"reset", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_73reset, METH_NOARGS, __pyx_doc_4jdwp_10JdwpBuffer_72reset},
+  {"preparePack", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpBuffer_75preparePack, METH_VARARGS|METH_KEYWORDS, 0},
+  {"prepareUnpack", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_77prepareUnpack, METH_O, 0},
+  {"borrow", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_79borrow, METH_O, __pyx_doc_4jdwp_10JdwpBuffer_78borrow},
+  {"pack", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpBuffer_81pack, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4jdwp_10JdwpBuffer_80pack},
+  {"ipack", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpBuffer_83ipack, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4jdwp_10JdwpBuffer_82ipack},
+  {"unpack", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4jdwp_10JdwpBuffer_85unpack, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4jdwp_10JdwpBuffer_84unpack},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_87__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_4jdwp_10JdwpBuffer_89__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_4jdwp_JdwpBuffer[] = {
+  {(char *)"borrowed", __pyx_getprop_4jdwp_10JdwpBuffer_borrowed, 0, (char *)"true if the buffer is still using the memory of another object", 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PySequenceMethods __pyx_tp_as_sequence_JdwpBuffer = {
+  __pyx_pw_4jdwp_10JdwpBuffer_5__len__, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  0, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_JdwpBuffer = {
+  __pyx_pw_4jdwp_10JdwpBuffer_5__len__, /*mp_length*/
+  0, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+static PyTypeObject __pyx_type_4jdwp_JdwpBuffer = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "jdwp.JdwpBuffer", /*tp_name*/
+  sizeof(struct __pyx_obj_4jdwp_JdwpBuffer), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_4jdwp_JdwpBuffer, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  &__pyx_tp_as_sequence_JdwpBuffer, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_JdwpBuffer, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_4jdwp_JdwpBuffer, /*tp_traverse*/
+  __pyx_tp_clear_4jdwp_JdwpBuffer, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_4jdwp_JdwpBuffer, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_4jdwp_JdwpBuffer, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_4jdwp_JdwpBuffer, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_jdwp(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_jdwp},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "jdwp",
+    0, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_s_, __pyx_k_, sizeof(__pyx_k_), 0, 0, 1, 0},
+  {&__pyx_n_s_ARRAY_BYTESWAP, __pyx_k_ARRAY_BYTESWAP, sizeof(__pyx_k_ARRAY_BYTESWAP), 0, 0, 1, 1},
+  {&__pyx_n_s_ARRAY_TYPECODES, __pyx_k_ARRAY_TYPECODES, sizeof(__pyx_k_ARRAY_TYPECODES), 0, 0, 1, 1},
+  {&__pyx_n_s_ARRAY_WIDTHS, __pyx_k_ARRAY_WIDTHS, sizeof(__pyx_k_ARRAY_WIDTHS), 0, 0, 1, 1},
+  {&__pyx_n_s_B, __pyx_k_B, sizeof(__pyx_k_B), 0, 0, 1, 1},
+  {&__pyx_n_s_FORMAT_CACHE, __pyx_k_FORMAT_CACHE, sizeof(__pyx_k_FORMAT_CACHE), 0, 0, 1, 1},
+  {&__pyx_n_s_H, __pyx_k_H, sizeof(__pyx_k_H), 0, 0, 1, 1},
+  {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
+  {&__pyx_n_s_JdwpBuffer, __pyx_k_JdwpBuffer, sizeof(__pyx_k_JdwpBuffer), 0, 0, 1, 1},
+  {&__pyx_n_s_JdwpError, __pyx_k_JdwpError, sizeof(__pyx_k_JdwpError), 0, 0, 1, 1},
+  {&__pyx_n_s_JdwpError___init, __pyx_k_JdwpError___init, sizeof(__pyx_k_JdwpError___init), 0, 0, 1, 1},
+  {&__pyx_n_s_JdwpError___str, __pyx_k_JdwpError___str, sizeof(__pyx_k_JdwpError___str), 0, 0, 1, 1},
+  {&__pyx_n_s_JdwpFormat, __pyx_k_JdwpFormat, sizeof(__pyx_k_JdwpFormat), 0, 0, 1, 1},
+  {&__pyx_kp_s_JdwpFormat_r, __pyx_k_JdwpFormat_r, sizeof(__pyx_k_JdwpFormat_r), 0, 0, 1, 0},
+  {&__pyx_n_s_L, __pyx_k_L, sizeof(__pyx_k_L), 0, 0, 1, 1},
+  {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_TID_TYPECODE, __pyx_k_TID_TYPECODE, sizeof(__pyx_k_TID_TYPECODE), 0, 0, 1, 1},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_kp_s__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 0, 1, 0},
+  {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
+  {&__pyx_n_s_buf, __pyx_k_buf, sizeof(__pyx_k_buf), 0, 0, 1, 1},
+  {&__pyx_n_s_byteorder, __pyx_k_byteorder, sizeof(__pyx_k_byteorder), 0, 0, 1, 1},
+  {&__pyx_n_s_byteswap, __pyx_k_byteswap, sizeof(__pyx_k_byteswap), 0, 0, 1, 1},
+  {&__pyx_n_s_chr, __pyx_k_chr, sizeof(__pyx_k_chr), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_code, __pyx_k_code, sizeof(__pyx_k_code), 0, 0, 1, 1},
+  {&__pyx_n_s_count, __pyx_k_count, sizeof(__pyx_k_count), 0, 0, 1, 1},
+  {&__pyx_n_s_d, __pyx_k_d, sizeof(__pyx_k_d), 0, 0, 1, 1},
+  {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_doc, __pyx_k_doc, sizeof(__pyx_k_doc), 0, 0, 1, 1},
+  {&__pyx_n_s_f, __pyx_k_f, sizeof(__pyx_k_f), 0, 0, 1, 1},
+  {&__pyx_n_s_fSz, __pyx_k_fSz, sizeof(__pyx_k_fSz), 0, 0, 1, 1},
+  {&__pyx_n_s_fmt, __pyx_k_fmt, sizeof(__pyx_k_fmt), 0, 0, 1, 1},
+  {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
+  {&__pyx_n_s_fromstring, __pyx_k_fromstring, sizeof(__pyx_k_fromstring), 0, 0, 1, 1},
+  {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_h, __pyx_k_h, sizeof(__pyx_k_h), 0, 0, 1, 1},
+  {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+  {&__pyx_kp_s_iQ, __pyx_k_iQ, sizeof(__pyx_k_iQ), 0, 0, 1, 0},
+  {&__pyx_kp_s_i_bytes_do_not_fit_at_offset_i, __pyx_k_i_bytes_do_not_fit_at_offset_i, sizeof(__pyx_k_i_bytes_do_not_fit_at_offset_i), 0, 0, 1, 0},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
+  {&__pyx_kp_s_iq, __pyx_k_iq, sizeof(__pyx_k_iq), 0, 0, 1, 0},
+  {&__pyx_n_s_itemsize, __pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 0, 1, 1},
+  {&__pyx_n_s_jdwp, __pyx_k_jdwp, sizeof(__pyx_k_jdwp), 0, 0, 1, 1},
+  {&__pyx_kp_s_jdwp_error_s_s, __pyx_k_jdwp_error_s_s, sizeof(__pyx_k_jdwp_error_s_s), 0, 0, 1, 0},
+  {&__pyx_kp_s_jdwp_pyx, __pyx_k_jdwp_pyx, sizeof(__pyx_k_jdwp_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_l, __pyx_k_l, sizeof(__pyx_k_l), 0, 0, 1, 1},
+  {&__pyx_n_s_little, __pyx_k_little, sizeof(__pyx_k_little), 0, 0, 1, 1},
+  {&__pyx_n_s_mSz, __pyx_k_mSz, sizeof(__pyx_k_mSz), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_mesg, __pyx_k_mesg, sizeof(__pyx_k_mesg), 0, 0, 1, 1},
+  {&__pyx_n_s_metaclass, __pyx_k_metaclass, sizeof(__pyx_k_metaclass), 0, 0, 1, 1},
+  {&__pyx_n_s_module, __pyx_k_module, sizeof(__pyx_k_module), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+  {&__pyx_n_s_oSz, __pyx_k_oSz, sizeof(__pyx_k_oSz), 0, 0, 1, 1},
+  {&__pyx_n_s_offset, __pyx_k_offset, sizeof(__pyx_k_offset), 0, 0, 1, 1},
+  {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
+  {&__pyx_n_s_prepare, __pyx_k_prepare, sizeof(__pyx_k_prepare), 0, 0, 1, 1},
+  {&__pyx_n_s_prepareUnpack, __pyx_k_prepareUnpack, sizeof(__pyx_k_prepareUnpack), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_type, __pyx_k_pyx_type, sizeof(__pyx_k_pyx_type), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_unpickle_JdwpFormat, __pyx_k_pyx_unpickle_JdwpFormat, sizeof(__pyx_k_pyx_unpickle_JdwpFormat), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_qualname, __pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 0, 1, 1},
+  {&__pyx_kp_s_r_expects_i_values_not_i, __pyx_k_r_expects_i_values_not_i, sizeof(__pyx_k_r_expects_i_values_not_i), 0, 0, 1, 0},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_sSz, __pyx_k_sSz, sizeof(__pyx_k_sSz), 0, 0, 1, 1},
+  {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_str, __pyx_k_str, sizeof(__pyx_k_str), 0, 0, 1, 1},
+  {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+  {&__pyx_n_s_struct, __pyx_k_struct, sizeof(__pyx_k_struct), 0, 0, 1, 1},
+  {&__pyx_n_s_sys, __pyx_k_sys, sizeof(__pyx_k_sys), 0, 0, 1, 1},
+  {&__pyx_n_s_sz, __pyx_k_sz, sizeof(__pyx_k_sz), 0, 0, 1, 1},
+  {&__pyx_n_s_tSz, __pyx_k_tSz, sizeof(__pyx_k_tSz), 0, 0, 1, 1},
+  {&__pyx_n_s_tag, __pyx_k_tag, sizeof(__pyx_k_tag), 0, 0, 1, 1},
+  {&__pyx_n_s_target, __pyx_k_target, sizeof(__pyx_k_target), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_unichr, __pyx_k_unichr, sizeof(__pyx_k_unichr), 0, 0, 1, 1},
+  {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
+  {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 139, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 240, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 336, __pyx_L1_error)
+  __pyx_builtin_chr = __Pyx_GetBuiltinName(__pyx_n_s_chr); if (!__pyx_builtin_chr) __PYX_ERR(0, 530, __pyx_L1_error)
+  __pyx_builtin_unichr = __Pyx_GetBuiltinName(__pyx_n_s_unichr); if (!__pyx_builtin_unichr) __PYX_ERR(0, 530, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_tuple__5 = PyTuple_Pack(3, __pyx_int_46672903, __pyx_int_189414004, __pyx_int_173476208); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "jdwp.pyx":82
+ * 
+ * class JdwpError(Exception):
+ * 	def __init__(self, code):             # <<<<<<<<<<<<<<
+ * 		self.code = code
+ * 		self.mesg = jdwp_en_errors[code]
+ */
+  __pyx_tuple__6 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_code); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 82, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_codeobj__7 = (PyObject*)__Pyx_PyCode_New(2, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_jdwp_pyx, __pyx_n_s_init, 82, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__7)) __PYX_ERR(0, 82, __pyx_L1_error)
+
+  /* "jdwp.pyx":86
+ * 		self.mesg = jdwp_en_errors[code]
+ * 
+ * 	def __str__(self):             # <<<<<<<<<<<<<<
+ * 		return "jdwp-error (%s): %s" % (self.code, self.mesg)
+ * 
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_codeobj__9 = (PyObject*)__Pyx_PyCode_New(1, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__8, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_jdwp_pyx, __pyx_n_s_str, 86, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__9)) __PYX_ERR(0, 86, __pyx_L1_error)
+
+  /* "jdwp.pyx":175
+ * ARRAY_TYPECODES = {
+ * 	ord('C'): 'H', ord('S'): 'h', ord('I'): 'i', ord('F'): 'f',
+ * 	ord('D'): 'd', ord('J'): 'l' if array('l').itemsize == 8 else None,             # <<<<<<<<<<<<<<
+ * }
+ * 
+ */
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_n_s_l); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+
+  /* "jdwp.pyx":183
+ * # the array.array typecode holding type ids in a class table, or None for a
+ * # list where the platform has no eight byte unsigned typecode.
+ * TID_TYPECODE = 'L' if array('L').itemsize == 8 else None             # <<<<<<<<<<<<<<
+ * 
+ * cdef dict format_cache(jdwp_buffer* buf):
+ */
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_n_s_L); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_JdwpFormat(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_tuple__12 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(3, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_JdwpFormat, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  __pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_8 = PyInt_FromLong(8); if (unlikely(!__pyx_int_8)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_66 = PyInt_FromLong(66); if (unlikely(!__pyx_int_66)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_67 = PyInt_FromLong(67); if (unlikely(!__pyx_int_67)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_68 = PyInt_FromLong(68); if (unlikely(!__pyx_int_68)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_70 = PyInt_FromLong(70); if (unlikely(!__pyx_int_70)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_73 = PyInt_FromLong(73); if (unlikely(!__pyx_int_73)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_74 = PyInt_FromLong(74); if (unlikely(!__pyx_int_74)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_83 = PyInt_FromLong(83); if (unlikely(!__pyx_int_83)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_90 = PyInt_FromLong(90); if (unlikely(!__pyx_int_90)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1024 = PyInt_FromLong(1024); if (unlikely(!__pyx_int_1024)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_46672903 = PyInt_FromLong(46672903L); if (unlikely(!__pyx_int_46672903)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_173476208 = PyInt_FromLong(173476208L); if (unlikely(!__pyx_int_173476208)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_189414004 = PyInt_FromLong(189414004L); if (unlikely(!__pyx_int_189414004)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_18446744073709551616 = PyInt_FromString((char *)"18446744073709551616", 0, 0); if (unlikely(!__pyx_int_18446744073709551616)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_4jdwp_JdwpFormat = &__pyx_vtable_4jdwp_JdwpFormat;
+  __pyx_vtable_4jdwp_JdwpFormat.measure = (Py_ssize_t (*)(struct __pyx_obj_4jdwp_JdwpFormat *, PyObject *))__pyx_f_4jdwp_10JdwpFormat_measure;
+  __pyx_vtable_4jdwp_JdwpFormat.encode = (int (*)(struct __pyx_obj_4jdwp_JdwpFormat *, unsigned char *, PyObject *))__pyx_f_4jdwp_10JdwpFormat_encode;
+  __pyx_vtable_4jdwp_JdwpFormat.decode = (PyObject *(*)(struct __pyx_obj_4jdwp_JdwpFormat *, jdwp_buffer *, int))__pyx_f_4jdwp_10JdwpFormat_decode;
+  __pyx_vtable_4jdwp_JdwpFormat.append = (int (*)(struct __pyx_obj_4jdwp_JdwpFormat *, struct __pyx_obj_4jdwp_JdwpBuffer *, PyObject *))__pyx_f_4jdwp_10JdwpFormat_append;
+  if (PyType_Ready(&__pyx_type_4jdwp_JdwpFormat) < 0) __PYX_ERR(0, 192, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_4jdwp_JdwpFormat.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_4jdwp_JdwpFormat.tp_dictoffset && __pyx_type_4jdwp_JdwpFormat.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_4jdwp_JdwpFormat.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_4jdwp_JdwpFormat.tp_dict, __pyx_vtabptr_4jdwp_JdwpFormat) < 0) __PYX_ERR(0, 192, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_JdwpFormat, (PyObject *)&__pyx_type_4jdwp_JdwpFormat) < 0) __PYX_ERR(0, 192, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_4jdwp_JdwpFormat) < 0) __PYX_ERR(0, 192, __pyx_L1_error)
+  __pyx_ptype_4jdwp_JdwpFormat = &__pyx_type_4jdwp_JdwpFormat;
+  __pyx_vtabptr_4jdwp_JdwpBuffer = &__pyx_vtable_4jdwp_JdwpBuffer;
+  __pyx_vtable_4jdwp_JdwpBuffer.unview = (PyObject *(*)(struct __pyx_obj_4jdwp_JdwpBuffer *))__pyx_f_4jdwp_10JdwpBuffer_unview;
+  __pyx_vtable_4jdwp_JdwpBuffer.format = (struct __pyx_obj_4jdwp_JdwpFormat *(*)(struct __pyx_obj_4jdwp_JdwpBuffer *, PyObject *, int __pyx_skip_dispatch))__pyx_f_4jdwp_10JdwpBuffer_format;
+  if (PyType_Ready(&__pyx_type_4jdwp_JdwpBuffer) < 0) __PYX_ERR(0, 348, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_4jdwp_JdwpBuffer.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_4jdwp_JdwpBuffer.tp_dictoffset && __pyx_type_4jdwp_JdwpBuffer.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_4jdwp_JdwpBuffer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_4jdwp_JdwpBuffer.tp_dict, __pyx_vtabptr_4jdwp_JdwpBuffer) < 0) __PYX_ERR(0, 348, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_JdwpBuffer, (PyObject *)&__pyx_type_4jdwp_JdwpBuffer) < 0) __PYX_ERR(0, 348, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_4jdwp_JdwpBuffer) < 0) __PYX_ERR(0, 348, __pyx_L1_error)
+  __pyx_ptype_4jdwp_JdwpBuffer = &__pyx_type_4jdwp_JdwpBuffer;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initjdwp(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initjdwp(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_jdwp(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_jdwp(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_jdwp(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'jdwp' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_jdwp(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("jdwp", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_jdwp) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "jdwp")) {
+      if (unlikely(PyDict_SetItemString(modules, "jdwp", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "jdwp.pyx":19
+ * from cpython.list cimport PyList_New, PyList_SET_ITEM
+ * from libc.string cimport memcpy
+ * from array import array             # <<<<<<<<<<<<<<
+ * import struct, sys
+ * 
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_array);
+  __Pyx_GIVEREF(__pyx_n_s_array);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_array);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_array, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_array); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_array, __pyx_t_1) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":20
+ * from libc.string cimport memcpy
+ * from array import array
+ * import struct, sys             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from "wire.h":
+ */
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_struct, 0, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_struct, __pyx_t_2) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_sys, 0, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sys, __pyx_t_2) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":81
+ * 	int jdwp_unpack_str( jdwp_buffer* buf, uint32_t *size, char** data )
+ * 
+ * class JdwpError(Exception):             # <<<<<<<<<<<<<<
+ * 	def __init__(self, code):
+ * 		self.code = code
+ */
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+  __Pyx_GIVEREF(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+  __pyx_t_1 = __Pyx_CalculateMetaclass(NULL, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_Py3MetaclassPrepare(__pyx_t_1, __pyx_t_2, __pyx_n_s_JdwpError, __pyx_n_s_JdwpError, (PyObject *) NULL, __pyx_n_s_jdwp, (PyObject *) NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+
+  /* "jdwp.pyx":82
+ * 
+ * class JdwpError(Exception):
+ * 	def __init__(self, code):             # <<<<<<<<<<<<<<
+ * 		self.code = code
+ * 		self.mesg = jdwp_en_errors[code]
+ */
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_4jdwp_9JdwpError_1__init__, 0, __pyx_n_s_JdwpError___init, NULL, __pyx_n_s_jdwp, __pyx_d, ((PyObject *)__pyx_codeobj__7)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 82, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (__Pyx_SetNameInClass(__pyx_t_3, __pyx_n_s_init, __pyx_t_4) < 0) __PYX_ERR(0, 82, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "jdwp.pyx":86
+ * 		self.mesg = jdwp_en_errors[code]
+ * 
+ * 	def __str__(self):             # <<<<<<<<<<<<<<
+ * 		return "jdwp-error (%s): %s" % (self.code, self.mesg)
+ * 
+ */
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_4jdwp_9JdwpError_3__str__, 0, __pyx_n_s_JdwpError___str, NULL, __pyx_n_s_jdwp, __pyx_d, ((PyObject *)__pyx_codeobj__9)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (__Pyx_SetNameInClass(__pyx_t_3, __pyx_n_s_str, __pyx_t_4) < 0) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "jdwp.pyx":81
+ * 	int jdwp_unpack_str( jdwp_buffer* buf, uint32_t *size, char** data )
+ * 
+ * class JdwpError(Exception):             # <<<<<<<<<<<<<<
+ * 	def __init__(self, code):
+ * 		self.code = code
+ */
+  __pyx_t_4 = __Pyx_Py3ClassCreate(__pyx_t_1, __pyx_n_s_JdwpError, __pyx_t_2, __pyx_t_3, NULL, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_JdwpError, __pyx_t_4) < 0) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":163
+ * 
+ * # compiled formats, by format string, for each configuration of ID sizes
+ * FORMAT_CACHE = {}             # <<<<<<<<<<<<<<
+ * 
+ * # the width of each primitive array element type, by tag
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_FORMAT_CACHE, __pyx_t_2) < 0) __PYX_ERR(0, 163, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":167
+ * # the width of each primitive array element type, by tag
+ * ARRAY_WIDTHS = {
+ * 	ord('B'): 1, ord('Z'): 1, ord('C'): 2, ord('S'): 2,             # <<<<<<<<<<<<<<
+ * 	ord('I'): 4, ord('F'): 4, ord('J'): 8, ord('D'): 8,
+ * }
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 167, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_66, __pyx_int_1) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_90, __pyx_int_1) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_67, __pyx_int_2) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_83, __pyx_int_2) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_73, __pyx_int_4) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_70, __pyx_int_4) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_74, __pyx_int_8) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_68, __pyx_int_8) < 0) __PYX_ERR(0, 167, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ARRAY_WIDTHS, __pyx_t_2) < 0) __PYX_ERR(0, 166, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":174
+ * # where the platform has no eight byte typecode.
+ * ARRAY_TYPECODES = {
+ * 	ord('C'): 'H', ord('S'): 'h', ord('I'): 'i', ord('F'): 'f',             # <<<<<<<<<<<<<<
+ * 	ord('D'): 'd', ord('J'): 'l' if array('l').itemsize == 8 else None,
+ * }
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_67, __pyx_n_s_H) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_83, __pyx_n_s_h) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_73, __pyx_n_s_i) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_70, __pyx_n_s_f) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_68, __pyx_n_s_d) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+
+  /* "jdwp.pyx":175
+ * ARRAY_TYPECODES = {
+ * 	ord('C'): 'H', ord('S'): 'h', ord('I'): 'i', ord('F'): 'f',
+ * 	ord('D'): 'd', ord('J'): 'l' if array('l').itemsize == 8 else None,             # <<<<<<<<<<<<<<
+ * }
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_array); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_itemsize); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_t_3, __pyx_int_8, 8, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 175, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_5) {
+    __Pyx_INCREF(__pyx_n_s_l);
+    __pyx_t_1 = __pyx_n_s_l;
+  } else {
+    __Pyx_INCREF(Py_None);
+    __pyx_t_1 = Py_None;
+  }
+  if (PyDict_SetItem(__pyx_t_2, __pyx_int_74, __pyx_t_1) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ARRAY_TYPECODES, __pyx_t_2) < 0) __PYX_ERR(0, 173, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":179
+ * 
+ * # JDWP is big-endian; array.array is native.
+ * ARRAY_BYTESWAP = sys.byteorder == 'little'             # <<<<<<<<<<<<<<
+ * 
+ * # the array.array typecode holding type ids in a class table, or None for a
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_sys); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_byteorder); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_n_s_little, Py_EQ); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ARRAY_BYTESWAP, __pyx_t_2) < 0) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":183
+ * # the array.array typecode holding type ids in a class table, or None for a
+ * # list where the platform has no eight byte unsigned typecode.
+ * TID_TYPECODE = 'L' if array('L').itemsize == 8 else None             # <<<<<<<<<<<<<<
+ * 
+ * cdef dict format_cache(jdwp_buffer* buf):
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_array); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_itemsize); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyInt_EqObjC(__pyx_t_1, __pyx_int_8, 8, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_5 < 0)) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_5) {
+    __Pyx_INCREF(__pyx_n_s_L);
+    __pyx_t_2 = __pyx_n_s_L;
+  } else {
+    __Pyx_INCREF(Py_None);
+    __pyx_t_2 = Py_None;
+  }
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_TID_TYPECODE, __pyx_t_2) < 0) __PYX_ERR(0, 183, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":1
+ * def __pyx_unpickle_JdwpFormat(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_PickleError
+ *     cdef object __pyx_result
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_4jdwp_1__pyx_unpickle_JdwpFormat, NULL, __pyx_n_s_jdwp); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_JdwpFormat, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "jdwp.pyx":1
+ * ## Copyright 2011, IOActive, Inc. All rights reserved.             # <<<<<<<<<<<<<<
+ * ##
+ * ## AndBug is free software: you can redistribute it and/or modify it under
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init jdwp", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init jdwp");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* PyObjectSetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_setattro))
+        return tp->tp_setattro(obj, attr_name, value);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_setattr))
+        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
+#endif
+    return PyObject_SetAttr(obj, attr_name, value);
+}
+#endif
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
     if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* UnicodeAsUCS4 */
+static CYTHON_INLINE Py_UCS4 __Pyx_PyUnicode_AsPy_UCS4(PyObject* x) {
+   Py_ssize_t length;
+   #if CYTHON_PEP393_ENABLED
+   length = PyUnicode_GET_LENGTH(x);
+   if (likely(length == 1)) {
+       return PyUnicode_READ_CHAR(x, 0);
+   }
+   #else
+   length = PyUnicode_GET_SIZE(x);
+   if (likely(length == 1)) {
+       return PyUnicode_AS_UNICODE(x)[0];
+   }
+   #if Py_UNICODE_SIZE == 2
+   else if (PyUnicode_GET_SIZE(x) == 2) {
+       Py_UCS4 high_val = PyUnicode_AS_UNICODE(x)[0];
+       if (high_val >= 0xD800 && high_val <= 0xDBFF) {
+           Py_UCS4 low_val = PyUnicode_AS_UNICODE(x)[1];
+           if (low_val >= 0xDC00 && low_val <= 0xDFFF) {
+               return 0x10000 + (((high_val & ((1<<10)-1)) << 10) | (low_val & ((1<<10)-1)));
+           }
+       }
+   }
+   #endif
+   #endif
+   PyErr_Format(PyExc_ValueError,
+                "only single character unicode strings can be converted to Py_UCS4, "
+                "got length %" CYTHON_FORMAT_SSIZE_T "d", length);
+   return (Py_UCS4)-1;
+}
+
+/* object_ord */
+static long __Pyx__PyObject_Ord(PyObject* c) {
+    Py_ssize_t size;
+    if (PyBytes_Check(c)) {
+        size = PyBytes_GET_SIZE(c);
+        if (likely(size == 1)) {
+            return (unsigned char) PyBytes_AS_STRING(c)[0];
+        }
+#if PY_MAJOR_VERSION < 3
+    } else if (PyUnicode_Check(c)) {
+        return (long)__Pyx_PyUnicode_AsPy_UCS4(c);
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    } else if (PyByteArray_Check(c)) {
+        size = PyByteArray_GET_SIZE(c);
+        if (likely(size == 1)) {
+            return (unsigned char) PyByteArray_AS_STRING(c)[0];
+        }
+#endif
+    } else {
+        PyErr_Format(PyExc_TypeError,
+            "ord() expected string of length 1, but %.200s found", Py_TYPE(c)->tp_name);
+        return (long)(Py_UCS4)-1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "ord() expected a character, but string of length %zd found", size);
+    return (long)(Py_UCS4)-1;
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kwdict,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kwdict, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    while (PyDict_Next(kwdict, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if ((!kw_allowed) && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+    #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = __Pyx_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* PyIntCompare */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_EqObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED long inplace) {
+    if (op1 == op2) {
+        Py_RETURN_TRUE;
+    }
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long a = PyInt_AS_LONG(op1);
+        if (a == b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        int unequal;
+        unsigned long uintval;
+        Py_ssize_t size = Py_SIZE(op1);
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        if (intval == 0) {
+            if (size == 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+        } else if (intval < 0) {
+            if (size >= 0)
+                Py_RETURN_FALSE;
+            intval = -intval;
+            size = -size;
+        } else {
+            if (size <= 0)
+                Py_RETURN_FALSE;
+        }
+        uintval = (unsigned long) intval;
+#if PyLong_SHIFT * 4 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 4)) {
+            unequal = (size != 5) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[4] != ((uintval >> (4 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 3 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 3)) {
+            unequal = (size != 4) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 2 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 2)) {
+            unequal = (size != 3) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 1 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 1)) {
+            unequal = (size != 2) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+            unequal = (size != 1) || (((unsigned long) digits[0]) != (uintval & (unsigned long) PyLong_MASK));
+        if (unequal == 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+        if ((double)a == (double)b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    return (
+        PyObject_RichCompare(op1, op2, Py_EQ));
+}
+
+/* ObjectGetItem */
+#if CYTHON_USE_TYPE_SLOTS
+static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
+    PyObject *runerr = NULL;
+    Py_ssize_t key_value;
+    PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
+    if (unlikely(!(m && m->sq_item))) {
+        PyErr_Format(PyExc_TypeError, "'%.200s' object is not subscriptable", Py_TYPE(obj)->tp_name);
+        return NULL;
+    }
+    key_value = __Pyx_PyIndex_AsSsize_t(index);
+    if (likely(key_value != -1 || !(runerr = PyErr_Occurred()))) {
+        return __Pyx_GetItemInt_Fast(obj, key_value, 0, 1, 1);
+    }
+    if (PyErr_GivenExceptionMatches(runerr, PyExc_OverflowError)) {
+        PyErr_Clear();
+        PyErr_Format(PyExc_IndexError, "cannot fit '%.200s' into an index-sized integer", Py_TYPE(index)->tp_name);
+    }
+    return NULL;
+}
+static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
+    PyMappingMethods *m = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(m && m->mp_subscript)) {
+        return m->mp_subscript(obj, key);
+    }
+    return __Pyx_PyObject_GetIndex(obj, key);
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* Intern */
+static PyObject* __Pyx_Intern(PyObject* s) {
+    if (!(likely(PyString_CheckExact(s)))) {
+        PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "str", Py_TYPE(s)->tp_name);
+        return 0;
+    }
+    Py_INCREF(s);
+    #if PY_MAJOR_VERSION >= 3
+    PyUnicode_InternInPlace(&s);
+    #else
+    PyString_InternInPlace(&s);
+    #endif
+    return s;
+}
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* UnpackUnboundCMethod */
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+    PyObject *method;
+    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
+    if (unlikely(!method))
+        return -1;
+    target->method = method;
+#if CYTHON_COMPILING_IN_CPYTHON
+    #if PY_MAJOR_VERSION >= 3
+    if (likely(__Pyx_TypeCheck(method, &PyMethodDescr_Type)))
+    #endif
+    {
+        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
+        target->func = descr->d_method->ml_meth;
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_STACKLESS);
+    }
+#endif
+    return 0;
+}
+
+/* CallUnboundCMethod1 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    if (likely(cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return (*(cfunc->func))(self, arg);
+        } else if (PY_VERSION_HEX >= 0x030600B1 && flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+                return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, &arg, 1);
+            #else
+                return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+            #endif
+        } else if (PY_VERSION_HEX >= 0x030700A0 && flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+        }
+    }
+    return __Pyx__CallUnboundCMethod1(cfunc, self, arg);
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(1);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 1, arg);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(2, self, arg);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* CallUnboundCMethod2 */
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030600B1
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2) {
+    if (likely(cfunc->func)) {
+        PyObject *args[2] = {arg1, arg2};
+        if (cfunc->flag == METH_FASTCALL) {
+            #if PY_VERSION_HEX >= 0x030700A0
+            return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, args, 2);
+            #else
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+            #endif
+        }
+        #if PY_VERSION_HEX >= 0x030700A0
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, 2, NULL);
+        #endif
+    }
+    return __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2);
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2){
+    PyObject *args, *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        args = PyTuple_New(2);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 0, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 1, arg2);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
+        else
+            result = (*cfunc->func)(self, args);
+    } else {
+        args = PyTuple_New(3);
+        if (unlikely(!args)) goto bad;
+        Py_INCREF(self);
+        PyTuple_SET_ITEM(args, 0, self);
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 1, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 2, arg2);
+        result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+    }
+#else
+    args = PyTuple_Pack(3, self, arg1, arg2);
+    if (unlikely(!args)) goto bad;
+    result = __Pyx_PyObject_Call(cfunc->method, args, NULL);
+#endif
+bad:
+    Py_XDECREF(args);
+    return result;
+}
+
+/* dict_getitem_default */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
+    PyObject* value;
+#if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (unlikely(PyErr_Occurred()))
+            return NULL;
+        value = default_value;
+    }
+    Py_INCREF(value);
+    if ((1));
+#else
+    if (PyString_CheckExact(key) || PyUnicode_CheckExact(key) || PyInt_CheckExact(key)) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            value = default_value;
+        }
+        Py_INCREF(value);
+    }
+#endif
+    else {
+        if (default_value == Py_None)
+            value = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyDict_Type_get, d, key);
+        else
+            value = __Pyx_CallUnboundCMethod2(&__pyx_umethod_PyDict_Type_get, d, key, default_value);
+    }
+    return value;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* HasAttr */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (unlikely(!r)) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* CalculateMetaclass */
+static PyObject *__Pyx_CalculateMetaclass(PyTypeObject *metaclass, PyObject *bases) {
+    Py_ssize_t i, nbases = PyTuple_GET_SIZE(bases);
+    for (i=0; i < nbases; i++) {
+        PyTypeObject *tmptype;
+        PyObject *tmp = PyTuple_GET_ITEM(bases, i);
+        tmptype = Py_TYPE(tmp);
+#if PY_MAJOR_VERSION < 3
+        if (tmptype == &PyClass_Type)
+            continue;
+#endif
+        if (!metaclass) {
+            metaclass = tmptype;
+            continue;
+        }
+        if (PyType_IsSubtype(metaclass, tmptype))
+            continue;
+        if (PyType_IsSubtype(tmptype, metaclass)) {
+            metaclass = tmptype;
+            continue;
+        }
+        PyErr_SetString(PyExc_TypeError,
+                        "metaclass conflict: "
+                        "the metaclass of a derived class "
+                        "must be a (non-strict) subclass "
+                        "of the metaclasses of all its bases");
+        return NULL;
+    }
+    if (!metaclass) {
+#if PY_MAJOR_VERSION < 3
+        metaclass = &PyClass_Type;
+#else
+        metaclass = &PyType_Type;
+#endif
+    }
+    Py_INCREF((PyObject*) metaclass);
+    return (PyObject*) metaclass;
+}
+
+/* FetchCommonType */
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+    PyObject* fake_module;
+    PyTypeObject* cached_type = NULL;
+    fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
+    if (!fake_module) return NULL;
+    Py_INCREF(fake_module);
+    cached_type = (PyTypeObject*) PyObject_GetAttrString(fake_module, type->tp_name);
+    if (cached_type) {
+        if (!PyType_Check((PyObject*)cached_type)) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s is not a type object",
+                type->tp_name);
+            goto bad;
+        }
+        if (cached_type->tp_basicsize != type->tp_basicsize) {
+            PyErr_Format(PyExc_TypeError,
+                "Shared Cython type %.200s has the wrong size, try recompiling",
+                type->tp_name);
+            goto bad;
+        }
+    } else {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) goto bad;
+        PyErr_Clear();
+        if (PyType_Ready(type) < 0) goto bad;
+        if (PyObject_SetAttrString(fake_module, type->tp_name, (PyObject*) type) < 0)
+            goto bad;
+        Py_INCREF(type);
+        cached_type = type;
+    }
+done:
+    Py_DECREF(fake_module);
+    return cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+
+/* CythonFunctionShared */
+#include <structmember.h>
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *closure)
+{
+    if (unlikely(op->func_doc == NULL)) {
+        if (op->func.m_ml->ml_doc) {
+#if PY_MAJOR_VERSION >= 3
+            op->func_doc = PyUnicode_FromString(op->func.m_ml->ml_doc);
+#else
+            op->func_doc = PyString_FromString(op->func.m_ml->ml_doc);
+#endif
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp = op->func_doc;
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    op->func_doc = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if PY_MAJOR_VERSION >= 3
+        op->func_name = PyUnicode_InternFromString(op->func.m_ml->ml_name);
+#else
+        op->func_name = PyString_InternFromString(op->func.m_ml->ml_name);
+#endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_name;
+    Py_INCREF(value);
+    op->func_name = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_qualname);
+    return op->func_qualname;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    tmp = op->func_qualname;
+    Py_INCREF(value);
+    op->func_qualname = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_self(__pyx_CyFunctionObject *m, CYTHON_UNUSED void *closure)
+{
+    PyObject *self;
+    self = m->func_closure;
+    if (self == NULL)
+        self = Py_None;
+    Py_INCREF(self);
+    return self;
+}
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+static int
+__Pyx_CyFunction_set_dict(__pyx_CyFunctionObject *op, PyObject *value, CYTHON_UNUSED void *context)
+{
+    PyObject *tmp;
+    if (unlikely(value == NULL)) {
+        PyErr_SetString(PyExc_TypeError,
+               "function's dictionary may not be deleted");
+        return -1;
+    }
+    if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+               "setting function's dictionary to a non-dict");
+        return -1;
+    }
+    tmp = op->func_dict;
+    Py_INCREF(value);
+    op->func_dict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(CYTHON_UNUSED __pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyTuple_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_tuple;
+    op->defaults_tuple = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value) {
+        value = Py_None;
+    } else if (value != Py_None && !PyDict_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    Py_INCREF(value);
+    tmp = op->defaults_kwdict;
+    op->defaults_kwdict = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (__Pyx_CyFunction_init_defaults(op) < 0) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, CYTHON_UNUSED void *context) {
+    PyObject* tmp;
+    if (!value || value == Py_None) {
         value = NULL;
-    if (tb == Py_None)
-        tb = NULL;
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    if (tb && !PyTraceBack_Check(tb)) {
+    } else if (!PyDict_Check(value)) {
         PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    Py_XINCREF(value);
+    tmp = op->func_annotations;
+    op->func_annotations = value;
+    Py_XDECREF(tmp);
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, CYTHON_UNUSED void *context) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {(char *) "func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {(char *) "func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {(char *) "__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+    {(char *) "__self__", (getter)__Pyx_CyFunction_get_self, 0, 0, 0},
+    {(char *) "func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)__Pyx_CyFunction_set_dict, 0, 0},
+    {(char *) "func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {(char *) "func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {(char *) "func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {(char *) "func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {(char *) "__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {(char *) "__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+    {(char *) "__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), PY_WRITE_RESTRICTED, 0},
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, CYTHON_UNUSED PyObject *args)
+{
+#if PY_MAJOR_VERSION >= 3
+    Py_INCREF(m->func_qualname);
+    return m->func_qualname;
+#else
+    return PyString_FromString(m->func.m_ml->ml_name);
+#endif
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if PY_VERSION_HEX < 0x030500A0
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func.m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    if (unlikely(op == NULL))
+        return NULL;
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+    op->func.m_ml = ml;
+    op->func.m_self = (PyObject *) op;
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+    Py_XINCREF(module);
+    op->func.m_module = module;
+    op->func_dict = NULL;
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+    op->func_classobj = NULL;
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults_pyobjects = 0;
+    op->defaults_size = 0;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+    Py_CLEAR(m->func.m_module);
+    Py_CLEAR(m->func_dict);
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+    Py_CLEAR(m->func_classobj);
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_XDECREF(pydefaults[i]);
+        PyObject_Free(m->defaults);
+        m->defaults = NULL;
+    }
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    PyObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    Py_VISIT(m->func_closure);
+    Py_VISIT(m->func.m_module);
+    Py_VISIT(m->func_dict);
+    Py_VISIT(m->func_name);
+    Py_VISIT(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    Py_VISIT(m->func_code);
+    Py_VISIT(m->func_classobj);
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    if (m->defaults) {
+        PyObject **pydefaults = __Pyx_CyFunction_Defaults(PyObject *, m);
+        int i;
+        for (i = 0; i < m->defaults_pyobjects; i++)
+            Py_VISIT(pydefaults[i]);
+    }
+    return 0;
+}
+static PyObject *__Pyx_CyFunction_descr_get(PyObject *func, PyObject *obj, PyObject *type)
+{
+#if PY_MAJOR_VERSION < 3
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    if (m->flags & __Pyx_CYFUNCTION_STATICMETHOD) {
+        Py_INCREF(func);
+        return func;
+    }
+    if (m->flags & __Pyx_CYFUNCTION_CLASSMETHOD) {
+        if (type == NULL)
+            type = (PyObject *)(Py_TYPE(obj));
+        return __Pyx_PyMethod_New(func, type, (PyObject *)(Py_TYPE(type)));
+    }
+    if (obj == Py_None)
+        obj = NULL;
+#endif
+    return __Pyx_PyMethod_New(func, obj, type);
+}
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+{
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+#else
+    return PyString_FromFormat("<cyfunction %s at %p>",
+                               PyString_AsString(op->func_qualname), (void *)op);
+#endif
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    Py_ssize_t size;
+    switch (f->m_ml->ml_flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void*)meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes no arguments (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+            size = PyTuple_GET_SIZE(arg);
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            PyErr_Format(PyExc_TypeError,
+                "%.200s() takes exactly one argument (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                f->m_ml->ml_name, size);
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags in "
+                        "__Pyx_CyFunction_Call. METH_OLDARGS is no "
+                        "longer supported!");
+        return NULL;
+    }
+    PyErr_Format(PyExc_TypeError, "%.200s() takes no keyword arguments",
+                 f->m_ml->ml_name);
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    return __Pyx_CyFunction_CallMethod(func, ((PyCFunctionObject*)func)->m_self, arg, kw);
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+        argc = PyTuple_GET_SIZE(args);
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+#if PY_MAJOR_VERSION > 2
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+#else
+            PyErr_SetString(PyExc_TypeError,
+                            "unbound method needs an argument");
+#endif
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+static PyTypeObject __pyx_CyFunctionType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+    (destructor) __Pyx_CyFunction_dealloc,
+    0,
+    0,
+    0,
+#if PY_MAJOR_VERSION < 3
+    0,
+#else
+    0,
+#endif
+    (reprfunc) __Pyx_CyFunction_repr,
+    0,
+    0,
+    0,
+    0,
+    __Pyx_CyFunction_CallAsMethod,
+    0,
+    0,
+    0,
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    0,
+    (traverseproc) __Pyx_CyFunction_traverse,
+    (inquiry) __Pyx_CyFunction_clear,
+    0,
+#if PY_VERSION_HEX < 0x030500A0
+    offsetof(__pyx_CyFunctionObject, func_weakreflist),
+#else
+    offsetof(PyCFunctionObject, m_weakreflist),
+#endif
+    0,
+    0,
+    __pyx_CyFunction_methods,
+    __pyx_CyFunction_members,
+    __pyx_CyFunction_getsets,
+    0,
+    0,
+    __Pyx_CyFunction_descr_get,
+    0,
+    offsetof(__pyx_CyFunctionObject, func_dict),
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
+#endif
+};
+static int __pyx_CyFunction_init(void) {
+    __pyx_CyFunctionType = __Pyx_FetchCommonType(&__pyx_CyFunctionType_type);
+    if (unlikely(__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE void *__Pyx_CyFunction_InitDefaults(PyObject *func, size_t size, int pyobjects) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_Malloc(size);
+    if (unlikely(!m->defaults))
+        return PyErr_NoMemory();
+    memset(m->defaults, 0, size);
+    m->defaults_pyobjects = pyobjects;
+    m->defaults_size = size;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+
+/* Py3ClassCreate */
+static PyObject *__Pyx_Py3MetaclassPrepare(PyObject *metaclass, PyObject *bases, PyObject *name,
+                                           PyObject *qualname, PyObject *mkw, PyObject *modname, PyObject *doc) {
+    PyObject *ns;
+    if (metaclass) {
+        PyObject *prep = __Pyx_PyObject_GetAttrStr(metaclass, __pyx_n_s_prepare);
+        if (prep) {
+            PyObject *pargs = PyTuple_Pack(2, name, bases);
+            if (unlikely(!pargs)) {
+                Py_DECREF(prep);
+                return NULL;
+            }
+            ns = PyObject_Call(prep, pargs, mkw);
+            Py_DECREF(prep);
+            Py_DECREF(pargs);
+        } else {
+            if (unlikely(!PyErr_ExceptionMatches(PyExc_AttributeError)))
+                return NULL;
+            PyErr_Clear();
+            ns = PyDict_New();
+        }
+    } else {
+        ns = PyDict_New();
+    }
+    if (unlikely(!ns))
+        return NULL;
+    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_module, modname) < 0)) goto bad;
+    if (unlikely(PyObject_SetItem(ns, __pyx_n_s_qualname, qualname) < 0)) goto bad;
+    if (unlikely(doc && PyObject_SetItem(ns, __pyx_n_s_doc, doc) < 0)) goto bad;
+    return ns;
+bad:
+    Py_DECREF(ns);
+    return NULL;
+}
+static PyObject *__Pyx_Py3ClassCreate(PyObject *metaclass, PyObject *name, PyObject *bases,
+                                      PyObject *dict, PyObject *mkw,
+                                      int calculate_metaclass, int allow_py2_metaclass) {
+    PyObject *result, *margs;
+    PyObject *owned_metaclass = NULL;
+    if (allow_py2_metaclass) {
+        owned_metaclass = PyObject_GetItem(dict, __pyx_n_s_metaclass);
+        if (owned_metaclass) {
+            metaclass = owned_metaclass;
+        } else if (likely(PyErr_ExceptionMatches(PyExc_KeyError))) {
+            PyErr_Clear();
+        } else {
+            return NULL;
+        }
+    }
+    if (calculate_metaclass && (!metaclass || PyType_Check(metaclass))) {
+        metaclass = __Pyx_CalculateMetaclass((PyTypeObject*) metaclass, bases);
+        Py_XDECREF(owned_metaclass);
+        if (unlikely(!metaclass))
+            return NULL;
+        owned_metaclass = metaclass;
+    }
+    margs = PyTuple_Pack(3, name, bases, dict);
+    if (unlikely(!margs)) {
+        result = NULL;
+    } else {
+        result = PyObject_Call(metaclass, margs, mkw);
+        Py_DECREF(margs);
+    }
+    Py_XDECREF(owned_metaclass);
+    return result;
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE uint8_t __Pyx_PyInt_As_uint8_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint8_t neg_one = (uint8_t) -1, const_zero = (uint8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(uint8_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(uint8_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (uint8_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (uint8_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(uint8_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(uint8_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint8_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint8_t) >= 2 * PyLong_SHIFT) {
+                            return (uint8_t) (((((uint8_t)digits[1]) << PyLong_SHIFT) | (uint8_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(uint8_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint8_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint8_t) >= 3 * PyLong_SHIFT) {
+                            return (uint8_t) (((((((uint8_t)digits[2]) << PyLong_SHIFT) | (uint8_t)digits[1]) << PyLong_SHIFT) | (uint8_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(uint8_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint8_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint8_t) >= 4 * PyLong_SHIFT) {
+                            return (uint8_t) (((((((((uint8_t)digits[3]) << PyLong_SHIFT) | (uint8_t)digits[2]) << PyLong_SHIFT) | (uint8_t)digits[1]) << PyLong_SHIFT) | (uint8_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (uint8_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(uint8_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint8_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(uint8_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint8_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (uint8_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(uint8_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(uint8_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(uint8_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint8_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint8_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint8_t) (((uint8_t)-1)*(((((uint8_t)digits[1]) << PyLong_SHIFT) | (uint8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(uint8_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint8_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint8_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint8_t) ((((((uint8_t)digits[1]) << PyLong_SHIFT) | (uint8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(uint8_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint8_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint8_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint8_t) (((uint8_t)-1)*(((((((uint8_t)digits[2]) << PyLong_SHIFT) | (uint8_t)digits[1]) << PyLong_SHIFT) | (uint8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(uint8_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint8_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint8_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint8_t) ((((((((uint8_t)digits[2]) << PyLong_SHIFT) | (uint8_t)digits[1]) << PyLong_SHIFT) | (uint8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(uint8_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint8_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint8_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint8_t) (((uint8_t)-1)*(((((((((uint8_t)digits[3]) << PyLong_SHIFT) | (uint8_t)digits[2]) << PyLong_SHIFT) | (uint8_t)digits[1]) << PyLong_SHIFT) | (uint8_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(uint8_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint8_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint8_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint8_t) ((((((((((uint8_t)digits[3]) << PyLong_SHIFT) | (uint8_t)digits[2]) << PyLong_SHIFT) | (uint8_t)digits[1]) << PyLong_SHIFT) | (uint8_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(uint8_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint8_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(uint8_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint8_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            uint8_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (uint8_t) -1;
+        }
+    } else {
+        uint8_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (uint8_t) -1;
+        val = __Pyx_PyInt_As_uint8_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to uint8_t");
+    return (uint8_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to uint8_t");
+    return (uint8_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE uint16_t __Pyx_PyInt_As_uint16_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint16_t neg_one = (uint16_t) -1, const_zero = (uint16_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(uint16_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(uint16_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (uint16_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (uint16_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(uint16_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(uint16_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) >= 2 * PyLong_SHIFT) {
+                            return (uint16_t) (((((uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(uint16_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) >= 3 * PyLong_SHIFT) {
+                            return (uint16_t) (((((((uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(uint16_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) >= 4 * PyLong_SHIFT) {
+                            return (uint16_t) (((((((((uint16_t)digits[3]) << PyLong_SHIFT) | (uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (uint16_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(uint16_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(uint16_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (uint16_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(uint16_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(uint16_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(uint16_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint16_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint16_t) (((uint16_t)-1)*(((((uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(uint16_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint16_t) ((((((uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(uint16_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint16_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint16_t) (((uint16_t)-1)*(((((((uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(uint16_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint16_t) ((((((((uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(uint16_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint16_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint16_t) (((uint16_t)-1)*(((((((((uint16_t)digits[3]) << PyLong_SHIFT) | (uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(uint16_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint16_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint16_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint16_t) ((((((((((uint16_t)digits[3]) << PyLong_SHIFT) | (uint16_t)digits[2]) << PyLong_SHIFT) | (uint16_t)digits[1]) << PyLong_SHIFT) | (uint16_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(uint16_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(uint16_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint16_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            uint16_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (uint16_t) -1;
+        }
+    } else {
+        uint16_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (uint16_t) -1;
+        val = __Pyx_PyInt_As_uint16_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to uint16_t");
+    return (uint16_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to uint16_t");
+    return (uint16_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE uint32_t __Pyx_PyInt_As_uint32_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint32_t neg_one = (uint32_t) -1, const_zero = (uint32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(uint32_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(uint32_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (uint32_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (uint32_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(uint32_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(uint32_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint32_t) >= 2 * PyLong_SHIFT) {
+                            return (uint32_t) (((((uint32_t)digits[1]) << PyLong_SHIFT) | (uint32_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(uint32_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint32_t) >= 3 * PyLong_SHIFT) {
+                            return (uint32_t) (((((((uint32_t)digits[2]) << PyLong_SHIFT) | (uint32_t)digits[1]) << PyLong_SHIFT) | (uint32_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(uint32_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint32_t) >= 4 * PyLong_SHIFT) {
+                            return (uint32_t) (((((((((uint32_t)digits[3]) << PyLong_SHIFT) | (uint32_t)digits[2]) << PyLong_SHIFT) | (uint32_t)digits[1]) << PyLong_SHIFT) | (uint32_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (uint32_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(uint32_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint32_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(uint32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint32_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (uint32_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(uint32_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(uint32_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(uint32_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint32_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint32_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint32_t) (((uint32_t)-1)*(((((uint32_t)digits[1]) << PyLong_SHIFT) | (uint32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(uint32_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint32_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint32_t) ((((((uint32_t)digits[1]) << PyLong_SHIFT) | (uint32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(uint32_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint32_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint32_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint32_t) (((uint32_t)-1)*(((((((uint32_t)digits[2]) << PyLong_SHIFT) | (uint32_t)digits[1]) << PyLong_SHIFT) | (uint32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(uint32_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint32_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint32_t) ((((((((uint32_t)digits[2]) << PyLong_SHIFT) | (uint32_t)digits[1]) << PyLong_SHIFT) | (uint32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(uint32_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint32_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint32_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint32_t) (((uint32_t)-1)*(((((((((uint32_t)digits[3]) << PyLong_SHIFT) | (uint32_t)digits[2]) << PyLong_SHIFT) | (uint32_t)digits[1]) << PyLong_SHIFT) | (uint32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(uint32_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint32_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint32_t) ((((((((((uint32_t)digits[3]) << PyLong_SHIFT) | (uint32_t)digits[2]) << PyLong_SHIFT) | (uint32_t)digits[1]) << PyLong_SHIFT) | (uint32_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(uint32_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint32_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(uint32_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint32_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            uint32_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (uint32_t) -1;
+        }
+    } else {
+        uint32_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (uint32_t) -1;
+        val = __Pyx_PyInt_As_uint32_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to uint32_t");
+    return (uint32_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to uint32_t");
+    return (uint32_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE uint64_t __Pyx_PyInt_As_uint64_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint64_t neg_one = (uint64_t) -1, const_zero = (uint64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(uint64_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(uint64_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (uint64_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (uint64_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(uint64_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(uint64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint64_t) >= 2 * PyLong_SHIFT) {
+                            return (uint64_t) (((((uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(uint64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint64_t) >= 3 * PyLong_SHIFT) {
+                            return (uint64_t) (((((((uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(uint64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint64_t) >= 4 * PyLong_SHIFT) {
+                            return (uint64_t) (((((((((uint64_t)digits[3]) << PyLong_SHIFT) | (uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (uint64_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(uint64_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint64_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(uint64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint64_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (uint64_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(uint64_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(uint64_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(uint64_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint64_t) (((uint64_t)-1)*(((((uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(uint64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (uint64_t) ((((((uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(uint64_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint64_t) (((uint64_t)-1)*(((((((uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(uint64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (uint64_t) ((((((((uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(uint64_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint64_t) (((uint64_t)-1)*(((((((((uint64_t)digits[3]) << PyLong_SHIFT) | (uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(uint64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(uint64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(uint64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (uint64_t) ((((((((((uint64_t)digits[3]) << PyLong_SHIFT) | (uint64_t)digits[2]) << PyLong_SHIFT) | (uint64_t)digits[1]) << PyLong_SHIFT) | (uint64_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(uint64_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint64_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(uint64_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(uint64_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            uint64_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (uint64_t) -1;
+        }
+    } else {
+        uint64_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (uint64_t) -1;
+        val = __Pyx_PyInt_As_uint64_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to uint64_t");
+    return (uint64_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to uint64_t");
+    return (uint64_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int32_t __Pyx_PyInt_As_int32_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int32_t neg_one = (int32_t) -1, const_zero = (int32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int32_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int32_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int32_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int32_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int32_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int32_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) >= 2 * PyLong_SHIFT) {
+                            return (int32_t) (((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int32_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) >= 3 * PyLong_SHIFT) {
+                            return (int32_t) (((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int32_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) >= 4 * PyLong_SHIFT) {
+                            return (int32_t) (((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int32_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int32_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int32_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int32_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int32_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int32_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int32_t) (((int32_t)-1)*(((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int32_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int32_t) ((((((int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int32_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int32_t) (((int32_t)-1)*(((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int32_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int32_t) ((((((((int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int32_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int32_t) (((int32_t)-1)*(((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int32_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int32_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int32_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int32_t) ((((((((((int32_t)digits[3]) << PyLong_SHIFT) | (int32_t)digits[2]) << PyLong_SHIFT) | (int32_t)digits[1]) << PyLong_SHIFT) | (int32_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int32_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int32_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int32_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int32_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int32_t) -1;
+        }
+    } else {
+        int32_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int32_t) -1;
+        val = __Pyx_PyInt_As_int32_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int32_t");
+    return (int32_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int32_t");
+    return (int32_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int64_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int64_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int64_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 2 * PyLong_SHIFT) {
+                            return (int64_t) (((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 3 * PyLong_SHIFT) {
+                            return (int64_t) (((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 4 * PyLong_SHIFT) {
+                            return (int64_t) (((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int64_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int64_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int64_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) ((((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int64_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int64_t) -1;
+        }
+    } else {
+        int64_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int64_t) -1;
+        val = __Pyx_PyInt_As_int64_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int64_t");
+    return (int64_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int64_t");
+    return (int64_t) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint8_t(uint8_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint8_t neg_one = (uint8_t) -1, const_zero = (uint8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint8_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(uint8_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint8_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(uint8_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint8_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
     }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
     {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(uint8_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
         }
-        /* Normalize to raise <class>, <instance> */
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) type->ob_type;
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
     }
-    PyErr_Restore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
+                                     little, !is_unsigned);
+    }
 }
 
-static int __Pyx_GetStarArgs(
-    PyObject **args, 
-    PyObject **kwds,
-    char *kwd_list[], 
-    Py_ssize_t nargs,
-    PyObject **args2, 
-    PyObject **kwds2,
-    char rqd_kwds[])
-{
-    PyObject *x = 0, *args1 = 0, *kwds1 = 0;
-    int i;
-    char **p;
-    
-    if (args2)
-        *args2 = 0;
-    if (kwds2)
-        *kwds2 = 0;
-    
-    if (args2) {
-        args1 = PyTuple_GetSlice(*args, 0, nargs);
-        if (!args1)
-            goto bad;
-        *args2 = PyTuple_GetSlice(*args, nargs, PyTuple_GET_SIZE(*args));
-        if (!*args2)
-            goto bad;
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint16_t(uint16_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint16_t neg_one = (uint16_t) -1, const_zero = (uint16_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint16_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(uint16_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint16_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(uint16_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint16_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
     }
-    else if (PyTuple_GET_SIZE(*args) > nargs) {
-        int m = nargs;
-        int n = PyTuple_GET_SIZE(*args);
-        PyErr_Format(PyExc_TypeError,
-            "function takes at most %d positional arguments (%d given)",
-                m, n);
-        goto bad;
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(uint16_t),
+                                     little, !is_unsigned);
     }
-    else {
-        args1 = *args;
-        Py_INCREF(args1);
-    }
-    
-    if (rqd_kwds && !*kwds)
-            for (i = 0, p = kwd_list; *p; i++, p++)
-                if (rqd_kwds[i])
-                    goto missing_kwarg;
-    
-    if (kwds2) {
-        if (*kwds) {
-            kwds1 = PyDict_New();
-            if (!kwds1)
-                goto bad;
-            *kwds2 = PyDict_Copy(*kwds);
-            if (!*kwds2)
-                goto bad;
-            for (i = 0, p = kwd_list; *p; i++, p++) {
-                x = PyDict_GetItemString(*kwds, *p);
-                if (x) {
-                    if (PyDict_SetItemString(kwds1, *p, x) < 0)
-                        goto bad;
-                    if (PyDict_DelItemString(*kwds2, *p) < 0)
-                        goto bad;
-                }
-                else if (rqd_kwds && rqd_kwds[i])
-                    goto missing_kwarg;
-            }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint32_t(uint32_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint32_t neg_one = (uint32_t) -1, const_zero = (uint32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint32_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(uint32_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
         }
-        else {
-            *kwds2 = PyDict_New();
-            if (!*kwds2)
-                goto bad;
+    } else {
+        if (sizeof(uint32_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint32_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(uint32_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_uint64_t(uint64_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const uint64_t neg_one = (uint64_t) -1, const_zero = (uint64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(uint64_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(uint64_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(uint64_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(uint64_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(uint64_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int32_t(int32_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int32_t neg_one = (int32_t) -1, const_zero = (int32_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int32_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int32_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int32_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int32_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int32_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int32_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int64_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int64_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int64_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int64_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int8_t(int8_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int8_t neg_one = (int8_t) -1, const_zero = (int8_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int8_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int8_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int8_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int8_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int8_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int8_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int16_t(int16_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int16_t neg_one = (int16_t) -1, const_zero = (int16_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int16_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int16_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int16_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int16_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int16_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int16_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_char(unsigned char value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned char neg_one = (unsigned char) -1, const_zero = (unsigned char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned char) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(unsigned char) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned char) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned char) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned char) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned char),
+                                     little, !is_unsigned);
+    }
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
         }
     }
-    else {
-        kwds1 = *kwds;
-        Py_XINCREF(kwds1);
-        if (rqd_kwds && *kwds)
-            for (i = 0, p = kwd_list; *p; i++, p++)
-                if (rqd_kwds[i] && !PyDict_GetItemString(*kwds, *p))
-                        goto missing_kwarg;
-    }
-    
-    *args = args1;
-    *kwds = kwds1;
     return 0;
-missing_kwarg:
-    PyErr_Format(PyExc_TypeError,
-        "required keyword argument '%s' is missing", *p);
-bad:
-    Py_XDECREF(args1);
-    Py_XDECREF(kwds1);
-    if (args2) {
-        Py_XDECREF(*args2);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
     }
-    if (kwds2) {
-        Py_XDECREF(*kwds2);
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
     }
-    return -1;
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
 }
 
+/* InitStrings */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
-        *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
         if (!*t->p)
             return -1;
-        if (t->i)
-            PyString_InternInPlace(t->p);
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
         ++t;
     }
     return 0;
 }
 
-static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
-    PyObject *pycobj = 0;
-    int result;
-    
-    pycobj = PyCObject_FromVoidPtr(vtable, 0);
-    if (!pycobj)
-        goto bad;
-    if (PyDict_SetItemString(dict, "__pyx_vtable__", pycobj) < 0)
-        goto bad;
-    result = 0;
-    goto done;
-
-bad:
-    result = -1;
-done:
-    Py_XDECREF(pycobj);
-    return result;
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
 }
-
-static PyObject *__Pyx_CreateClass(
-    PyObject *bases, PyObject *dict, PyObject *name, char *modname)
-{
-    PyObject *py_modname;
-    PyObject *result = 0;
-    
-    py_modname = PyString_FromString(modname);
-    if (!py_modname)
-        goto bad;
-    if (PyDict_SetItemString(dict, "__module__", py_modname) < 0)
-        goto bad;
-    result = PyClass_New(bases, dict, name);
-bad:
-    Py_XDECREF(py_modname);
-    return result;
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
 }
 
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
 
-static void __Pyx_AddTraceback(char *funcname) {
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    PyObject *py_globals = 0;
-    PyObject *empty_tuple = 0;
-    PyObject *empty_string = 0;
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-    
-    py_srcfile = PyString_FromString(__pyx_filename);
-    if (!py_srcfile) goto bad;
-    py_funcname = PyString_FromString(funcname);
-    if (!py_funcname) goto bad;
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    empty_tuple = PyTuple_New(0);
-    if (!empty_tuple) goto bad;
-    empty_string = PyString_FromString("");
-    if (!empty_string) goto bad;
-    py_code = PyCode_New(
-        0,            /*int argcount,*/
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        empty_string, /*PyObject *code,*/
-        empty_tuple,  /*PyObject *consts,*/
-        empty_tuple,  /*PyObject *names,*/
-        empty_tuple,  /*PyObject *varnames,*/
-        empty_tuple,  /*PyObject *freevars,*/
-        empty_tuple,  /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        __pyx_lineno,   /*int firstlineno,*/
-        empty_string  /*PyObject *lnotab*/
-    );
-    if (!py_code) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_Get(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = __pyx_lineno;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(empty_tuple);
-    Py_XDECREF(empty_string);
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
+#endif /* Py_PYTHON_H */
@@ -12,11 +12,20 @@
 ## You should have received a copy of the GNU Lesser General Public License
 ## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
 
+from cpython.ref cimport Py_INCREF
+from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
+from cpython.list cimport PyList_New, PyList_SET_ITEM
+from libc.string cimport memcpy
+from array import array
+import struct, sys
+
 cdef extern from "wire.h":
 	ctypedef unsigned char uint8_t
 	ctypedef unsigned short uint16_t
 	ctypedef unsigned int uint32_t
 	ctypedef unsigned long long uint64_t
+	ctypedef signed char int8_t
+	ctypedef short int16_t
 	ctypedef int int32_t
 	ctypedef long long int64_t
 	ctypedef struct jdwp_buffer:
@@ -25,12 +34,17 @@ cdef extern from "wire.h":
 		uint8_t oSz
 		uint8_t tSz
 		uint8_t sSz
+		uint8_t borrowed
 		int ofs, len, cap
 		char* data
 	char* jdwp_en_errors[]
+	int JDWP_SZ_UNSUPPORTED
+	int JDWP_OP_UNSUPPORTED
+	int JDWP_NEED_LEN
 
 	int jdwp_config( jdwp_buffer* buf, uint8_t fSz, uint8_t mSz, uint8_t oSz, uint8_t tSz, uint8_t sSz )
 	int jdwp_prepare( jdwp_buffer* buf, char* data, int len )
+	int jdwp_borrow( jdwp_buffer* buf, char* data, int len )
 	int jdwp_expand( jdwp_buffer* buf, int len )
 	void jdwp_purge( jdwp_buffer* buf )
 	int jdwp_pack( jdwp_buffer* buf, char format, uint64_t value )
@@ -81,20 +95,277 @@ cdef extern from "Python.h":
 	object PyInt_FromLong(long l)
 	object PyLong_FromLongLong(long long l)
 	object PyString_FromStringAndSize(char *s, Py_ssize_t len)
+	char* PyString_AS_STRING(object s)
 	char* PyString_AsString(object s)
 	Py_ssize_t PyString_Size(object s)
 	int PyInt_GetMax()
-	object PyList_New(Py_ssize_t sz)
-	int PyList_SetItem(object lst, Py_ssize_t index, object item)
+	ctypedef struct Py_buffer:
+		void* buf
+		Py_ssize_t len
+	int PyBUF_SIMPLE
+	int PyBUF_WRITABLE
+	int PyObject_GetBuffer(object obj, Py_buffer* view, int flags) except -1
+	void PyBuffer_Release(Py_buffer* view)
+
+cdef uint64_t wrap64(object val) except? 0:
+	# negative values, such as a frame count of -1, are packed as their two's
+	# complement rather than overflowing the conversion to uint64_t.
+	if val < 0:
+		val = val + 0x10000000000000000
+	return val
+
+cdef extern from "arpa/inet.h":
+	uint16_t ntohs(uint16_t v)
+	uint32_t ntohl(uint32_t v)
+
+cdef inline uint64_t read_be(unsigned char* p, int w):
+	# the widths ids are negotiated at are read with a single load and byte
+	# swap each, rather than a byte at a time
+	cdef uint16_t v16
+	cdef uint32_t v32
+	cdef uint64_t v = 0
+	cdef int i
+	if w == 8:
+		memcpy(&v32, p, 4)
+		v = ntohl(v32)
+		memcpy(&v32, p + 4, 4)
+		return (v << 32) | ntohl(v32)
+	elif w == 4:
+		memcpy(&v32, p, 4)
+		return ntohl(v32)
+	elif w == 2:
+		memcpy(&v16, p, 2)
+		return ntohs(v16)
+	for i in range(w):
+		v = (v << 8) | p[i]
+	return v
+
+cdef inline object take_str(unsigned char** pp, unsigned char* end):
+	# unpacks a length-prefixed string at *pp, advancing past it
+	cdef unsigned char* p = pp[0]
+	cdef uint32_t n
+	if end - p < 4:
+		raise JdwpError(JDWP_NEED_LEN)
+	n = read_be(p, 4)
+	p += 4
+	if <uint32_t>(end - p) < n:
+		raise JdwpError(JDWP_NEED_LEN)
+	pp[0] = p + n
+	return PyString_FromStringAndSize(<char*>p, n)
+
+cdef inline void write_be(unsigned char* p, int w, uint64_t v):
+	cdef int i
+	for i in range(w - 1, -1, -1):
+		p[i] = v & 0xFF
+		v >>= 8
+
+# compiled formats, by format string, for each configuration of ID sizes
+FORMAT_CACHE = {}
+
+# the width of each primitive array element type, by tag
+ARRAY_WIDTHS = {
+	ord('B'): 1, ord('Z'): 1, ord('C'): 2, ord('S'): 2,
+	ord('I'): 4, ord('F'): 4, ord('J'): 8, ord('D'): 8,
+}
+
+# the array.array typecode holding each wider element type; None for longs
+# where the platform has no eight byte typecode.
+ARRAY_TYPECODES = {
+	ord('C'): 'H', ord('S'): 'h', ord('I'): 'i', ord('F'): 'f',
+	ord('D'): 'd', ord('J'): 'l' if array('l').itemsize == 8 else None,
+}
+
+# JDWP is big-endian; array.array is native.
+ARRAY_BYTESWAP = sys.byteorder == 'little'
+
+# the array.array typecode holding type ids in a class table, or None for a
+# list where the platform has no eight byte unsigned typecode.
+TID_TYPECODE = 'L' if array('L').itemsize == 8 else None
+
+cdef dict format_cache(jdwp_buffer* buf):
+	key = (buf.fSz, buf.mSz, buf.oSz, buf.tSz, buf.sSz)
+	formats = FORMAT_CACHE.get(key)
+	if formats is None:
+		formats = FORMAT_CACHE[key] = {}
+	return formats
+
+cdef class JdwpFormat:
+	'''
+	A JdwpFormat is a format string compiled for a configuration of ID sizes,
+	like struct.Struct; the width of every field is worked out once, so
+	packing and unpacking are a single pass with no format dispatch.
+	JdwpBuffer.format returns the compiled format for a buffer's sizes.
+	'''
+	cdef readonly object format
+	cdef readonly int size    # of the fixed fields; strings add their length
+	cdef readonly int count
+	cdef bytes widths         # per field; zero for strings
+
+	def __init__(self, fmt, fSz=8, mSz=8, oSz=8, tSz=8, sSz=8):
+		cdef jdwp_buffer cfg
+		cdef int w
+		cfg.fSz = fSz
+		cfg.mSz = mSz
+		cfg.oSz = oSz
+		cfg.tSz = tSz
+		cfg.sSz = sSz
+
+		widths = []
+		self.size = 0
+		for op in fmt:
+			if op == '$':
+				w = 0
+				self.size += 4
+			else:
+				w = jdwp_size(&cfg, ord(op))
+				if w == 0:
+					raise JdwpError(JDWP_OP_UNSUPPORTED)
+				if w not in (1, 2, 4, 8):
+					raise JdwpError(JDWP_SZ_UNSUPPORTED)
+				self.size += w
+			widths.append(w)
+
+		self.format = fmt
+		self.count = len(fmt)
+		self.widths = bytes(bytearray(widths))
+
+	def __repr__(self):
+		return '<JdwpFormat %r>' % self.format
+
+	cdef Py_ssize_t measure(self, tuple args) except -1:
+		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+		cdef Py_ssize_t sz = self.size
+		cdef int i
+		if len(args) != self.count:
+			raise TypeError('%r expects %i values, not %i' % (
+				self.format, self.count, len(args)
+			))
+		for i in range(self.count):
+			if widths[i] == 0:
+				sz += PyString_Size(args[i])
+		return sz
+
+	cdef int encode(self, unsigned char* p, tuple args) except -1:
+		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+		cdef int i, w
+		cdef Py_ssize_t n
+		for i in range(self.count):
+			w = widths[i]
+			val = args[i]
+			if w == 0:
+				n = PyString_Size(val)
+				write_be(p, 4, n)
+				memcpy(p + 4, PyString_AS_STRING(val), n)
+				p += 4 + n
+			else:
+				write_be(p, w, wrap64(val))
+				p += w
+		return 0
+
+	cdef decode(self, jdwp_buffer* buf, bint as_list):
+		cdef unsigned char* widths = <unsigned char*>PyString_AS_STRING(self.widths)
+		cdef unsigned char* p
+		cdef unsigned char* end
+		cdef int i, w
+		cdef uint64_t n
+
+		if buf.data == NULL:
+			raise JdwpError(JDWP_NEED_LEN)
+		p = <unsigned char*>buf.data + buf.ofs
+		end = <unsigned char*>buf.data + buf.len
+		if end - p < self.size:
+			raise JdwpError(JDWP_NEED_LEN)
+
+		vals = PyList_New(self.count) if as_list else PyTuple_New(self.count)
+		for i in range(self.count):
+			w = widths[i]
+			if w == 0:
+				if end - p < 4:
+					raise JdwpError(JDWP_NEED_LEN)
+				n = read_be(p, 4)
+				p += 4
+				if <uint64_t>(end - p) < n:
+					raise JdwpError(JDWP_NEED_LEN)
+				val = PyString_FromStringAndSize(<char*>p, n)
+				p += n
+			else:
+				if end - p < w:
+					raise JdwpError(JDWP_NEED_LEN)
+				val = <long long>read_be(p, w)
+				p += w
+			Py_INCREF(val)
+			if as_list:
+				PyList_SET_ITEM(vals, i, val)
+			else:
+				PyTuple_SET_ITEM(vals, i, val)
+
+		buf.ofs = p - <unsigned char*>buf.data
+		return vals
+
+	def pack(self, *args):
+		'returns the values packed as a string'
+		cdef Py_ssize_t sz = self.measure(args)
+		data = PyString_FromStringAndSize(NULL, sz)
+		self.encode(<unsigned char*>PyString_AS_STRING(data), args)
+		return data
+
+	cdef int append(self, JdwpBuffer buf, tuple args) except -1:
+		cdef Py_ssize_t sz = self.measure(args)
+		if buf.buf.data == NULL:
+			einz( jdwp_prepare(&buf.buf, NULL, sz) )
+		else:
+			einz( jdwp_expand(&buf.buf, sz) )
+		self.encode(<unsigned char*>buf.buf.data + buf.buf.len, args)
+		buf.buf.len += sz
+		return 0
+
+	def packInto(self, JdwpBuffer buf, *args):
+		'appends the values to the contents of buf'
+		self.append(buf, args)
+
+	def writeInto(self, target, Py_ssize_t offset, *args):
+		'''
+		packs the values into the writable buffer target at offset, like
+		struct.Struct.pack_into; returns the offset after them
+		'''
+		cdef Py_buffer view
+		cdef Py_ssize_t sz = self.measure(args)
+		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+		try:
+			if offset < 0 or view.len - offset < sz:
+				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+					sz, offset, view.len
+				))
+			self.encode(<unsigned char*>view.buf + offset, args)
+		finally:
+			PyBuffer_Release(&view)
+		return offset + sz
+
+	def unpack(self, JdwpBuffer buf):
+		'returns a tuple of values unpacked from buf, advancing past them'
+		return self.decode(&buf.buf, 0)
 
 cdef class JdwpBuffer:
 	cdef jdwp_buffer buf
+	cdef dict formats
+	cdef Py_buffer view       # of the object borrowed from, while viewing
+	cdef bint viewing
 
 	def __cinit__(self):
 		self.buf.data = NULL;
+		self.formats = format_cache(&self.buf)
 
 	def __dealloc__(self):
 		jdwp_purge(&self.buf)
+		self.unview()
+
+	def __len__(self):
+		return self.buf.len - self.buf.ofs
+
+	cdef unview(self):
+		if self.viewing:
+			self.viewing = 0
+			PyBuffer_Release(&self.view)
 		
 	def packU8( self, uint8_t byte):
 		einz( jdwp_pack_u8(&self.buf, byte) )
@@ -142,12 +413,16 @@ cdef class JdwpBuffer:
 		return <int32_t>x
 	def unpackFloat(self):
 		cdef uint32_t x
+		cdef float f
 		einz( jdwp_unpack_u32(&self.buf, &x) )
-		return <float>x
+		memcpy(&f, &x, 4)
+		return f
 	def unpackDouble(self):
-		cdef uint32_t x
-		einz( jdwp_unpack_u32(&self.buf, &x) )
-		return <double>x
+		cdef uint64_t x
+		cdef double d
+		einz( jdwp_unpack_u64(&self.buf, &x) )
+		memcpy(&d, &x, 8)
+		return d
 
 	def unpackLong(self):
 		cdef uint64_t x
@@ -175,6 +450,167 @@ cdef class JdwpBuffer:
 		einz( jdwp_unpack_type_id(&self.buf, &x) )
 		return x
 
+	def unpackArray(self, tag, uint32_t count):
+		'''
+		unpacks count untagged primitives of the type tag, as found in an
+		ArrayReference.GetValues reply; byte and boolean elements are
+		returned as a string, others as an array.array
+		'''
+		cdef Py_ssize_t sz
+		if not isinstance(tag, (int, long)):
+			tag = ord(tag)
+		w = ARRAY_WIDTHS.get(tag)
+		if w is None:
+			raise JdwpError(JDWP_OP_UNSUPPORTED)
+		sz = count * w
+		if self.buf.len - self.buf.ofs < sz:
+			raise JdwpError(JDWP_NEED_LEN)
+		raw = PyString_FromStringAndSize(self.buf.data + self.buf.ofs, sz)
+		self.buf.ofs += sz
+		if w == 1:
+			return raw
+
+		code = ARRAY_TYPECODES[tag]
+		if code is None:
+			return struct.unpack('>%iq' % count, raw)
+		arr = array(code)
+		arr.fromstring(raw)
+		if ARRAY_BYTESWAP:
+			arr.byteswap()
+		return arr
+
+	def unpackTaggedValues(self, uint32_t count):
+		'''
+		unpacks count tagged values, as found in GetValues replies, returning
+		a list of (tag, value) tuples; primitives are decoded to Python
+		values, while objects of every kind are left as their object ids
+		'''
+		cdef unsigned char* p = <unsigned char*>self.buf.data + self.buf.ofs
+		cdef unsigned char* end = <unsigned char*>self.buf.data + self.buf.len
+		cdef unsigned char tag
+		cdef uint32_t i, w
+		cdef uint64_t v
+		cdef float f
+		cdef double d
+		cdef uint32_t v32
+
+		if self.buf.data == NULL:
+			raise JdwpError(JDWP_NEED_LEN)
+		vals = PyList_New(count)
+		for i in range(count):
+			if p >= end:
+				raise JdwpError(JDWP_NEED_LEN)
+			tag = p[0]
+			p += 1
+			if tag == c'B' or tag == c'Z':
+				w = 1
+			elif tag == c'C' or tag == c'S':
+				w = 2
+			elif tag == c'I' or tag == c'F':
+				w = 4
+			elif tag == c'J' or tag == c'D':
+				w = 8
+			elif tag == c'V':
+				w = 0
+			elif (tag == c'L' or tag == c's' or tag == c'[' or tag == c't' or
+					tag == c'g' or tag == c'l' or tag == c'c'):
+				w = self.buf.oSz
+			else:
+				raise JdwpError(JDWP_OP_UNSUPPORTED)
+			if <uint32_t>(end - p) < w:
+				raise JdwpError(JDWP_NEED_LEN)
+			v = read_be(p, w)
+			p += w
+
+			if tag == c'B':
+				val = <int8_t>v
+			elif tag == c'Z':
+				val = v != 0
+			elif tag == c'C':
+				val = chr(v) if v < 256 else unichr(v)
+			elif tag == c'S':
+				val = <int16_t>v
+			elif tag == c'I':
+				val = <int32_t>v
+			elif tag == c'F':
+				v32 = <uint32_t>v
+				memcpy(&f, &v32, 4)
+				val = f
+			elif tag == c'J':
+				val = <int64_t>v
+			elif tag == c'D':
+				memcpy(&d, &v, 8)
+				val = d
+			elif tag == c'V':
+				val = None
+			else:
+				val = v
+
+			item = (tag, val)
+			Py_INCREF(item)
+			PyList_SET_ITEM(vals, i, item)
+
+		self.buf.ofs = p - <unsigned char*>self.buf.data
+		return vals
+
+	def unpackClassTable(self, uint32_t count):
+		'''
+		unpacks count class records, as in an AllClassesWithGeneric reply,
+		into the parallel sequences (tags, tids, jnis, gens, flags); tags,
+		flags and, where an unsigned long holds them, type ids are returned
+		as array.arrays, and signatures are interned
+		'''
+		cdef unsigned char* p = <unsigned char*>self.buf.data + self.buf.ofs
+		cdef unsigned char* end = <unsigned char*>self.buf.data + self.buf.len
+		cdef int tsz = self.buf.tSz
+		cdef uint32_t i
+		cdef char* ctags
+		cdef uint64_t* ctids
+		cdef int32_t* cflags
+
+		if self.buf.data == NULL:
+			raise JdwpError(JDWP_NEED_LEN)
+		if end - p < <int64_t>count * (tsz + 13):
+			raise JdwpError(JDWP_NEED_LEN)
+
+		rawtags = PyString_FromStringAndSize(NULL, count)
+		rawtids = PyString_FromStringAndSize(NULL, count * 8)
+		rawflags = PyString_FromStringAndSize(NULL, count * 4)
+		ctags = PyString_AS_STRING(rawtags)
+		ctids = <uint64_t*>PyString_AS_STRING(rawtids)
+		cflags = <int32_t*>PyString_AS_STRING(rawflags)
+		jnis = PyList_New(count)
+		gens = PyList_New(count)
+
+		for i in range(count):
+			if end - p < tsz + 5:
+				raise JdwpError(JDWP_NEED_LEN)
+			ctags[i] = p[0]
+			ctids[i] = read_be(p + 1, tsz)
+			p += tsz + 1
+			val = intern(take_str(&p, end))
+			Py_INCREF(val)
+			PyList_SET_ITEM(jnis, i, val)
+			val = take_str(&p, end)
+			Py_INCREF(val)
+			PyList_SET_ITEM(gens, i, val)
+			if end - p < 4:
+				raise JdwpError(JDWP_NEED_LEN)
+			cflags[i] = <int32_t>read_be(p, 4)
+			p += 4
+
+		self.buf.ofs = p - <unsigned char*>self.buf.data
+		tags = array('B')
+		tags.fromstring(rawtags)
+		flags = array('i')
+		flags.fromstring(rawflags)
+		if TID_TYPECODE is None:
+			tids = list(struct.unpack('=%iQ' % count, rawtids))
+		else:
+			tids = array(TID_TYPECODE)
+			tids.fromstring(rawtids)
+		return tags, tids, jnis, gens, flags
+
 	def unpackStr(self):
 		cdef uint32_t sz
 		cdef char* str
@@ -190,33 +626,30 @@ cdef class JdwpBuffer:
 
 				
 	def config(self, fSz = None, mSz = None, oSz = None, tSz = None, sSz = None):
-		if fSz is not None: self.buf.fSz = fSz
-		if mSz is not None: self.buf.mSz = mSz
-		if oSz is not None: self.buf.oSz = oSz
-		if tSz is not None: self.buf.tSz = tSz
-		if sSz is not None: self.buf.sSz = sSz
-
-	cdef size(self, fmt, args):
-		cdef int i
-		cdef int sz
-		cdef char op
-		cdef char* cfmt
-		cfmt = fmt
-
-		sz = 0
-
-		for 0 <= i < len(fmt):
-			val = args[i]
-			op = cfmt[i]
-			if op == c'$':
-				sz += 4 + len(val)
-			else:
-				inc = jdwp_size(&self.buf, op)
-				if inc == 0: 
-					raise JdwpError(2)
-				sz += inc
-
-		return sz
+		'''
+		sets the id sizes; sizes that are omitted are unchanged.  The codec
+		chooses id decoders specialised for the sizes here, once, rather
+		than on every id unpacked
+		'''
+		cdef jdwp_buffer* b = &self.buf
+		code = jdwp_config(
+			b, b.fSz if fSz is None else fSz, b.mSz if mSz is None else mSz,
+			b.oSz if oSz is None else oSz, b.tSz if tSz is None else tSz,
+			b.sSz if sSz is None else sSz
+		)
+		self.formats = format_cache(&self.buf)
+		einz( code )
+
+	cpdef JdwpFormat format(self, fmt):
+		'returns fmt compiled for the ID sizes of this buffer'
+		cdef JdwpFormat f = self.formats.get(fmt)
+		if f is None:
+			f = JdwpFormat(
+				fmt, self.buf.fSz, self.buf.mSz, self.buf.oSz, self.buf.tSz,
+				self.buf.sSz
+			)
+			self.formats[fmt] = f
+		return f
 
 	def data(self):
 		cdef char* str
@@ -229,89 +662,88 @@ cdef class JdwpBuffer:
 		len = self.buf.len
 		return PyString_FromStringAndSize(str, len)
 
+	def writeInto(self, target, Py_ssize_t offset = 0):
+		'''
+		copies the contents of the buffer into the writable buffer target at
+		offset, without an intermediate string; returns the offset after them
+		'''
+		cdef Py_buffer view
+		cdef Py_ssize_t sz = self.buf.len - self.buf.ofs
+		PyObject_GetBuffer(target, &view, PyBUF_WRITABLE)
+		try:
+			if offset < 0 or view.len - offset < sz:
+				raise ValueError('%i bytes do not fit at offset %i of %i' % (
+					sz, offset, view.len
+				))
+			if sz:
+				memcpy(<char*>view.buf + offset, self.buf.data + self.buf.ofs, sz)
+		finally:
+			PyBuffer_Release(&view)
+		return offset + sz
+
+	def reset(self):
+		'empties the buffer for reuse, keeping its memory unless borrowed'
+		if self.buf.borrowed:
+			jdwp_purge(&self.buf)
+		self.buf.ofs = 0
+		self.buf.len = 0
+		self.unview()
+
 	def preparePack(self, sz = 1024):
 		jdwp_prepare(&self.buf, NULL, sz)	
-
-	def prepareUnpack(self, str):
-		cdef char* cstr
-		cdef Py_ssize_t sz
-
-		cstr = PyString_AsString(str)
-		sz = PyString_Size(str)
-		jdwp_prepare(&self.buf, cstr, sz)				
+		self.unview()
+
+	def prepareUnpack(self, data):
+		cdef Py_buffer view
+
+		# accepts strings, bytearrays, memoryviews or any other object
+		# supporting the buffer protocol, without an intermediate string.
+		PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+		try:
+			einz( jdwp_prepare(&self.buf, <char*>view.buf, view.len) )
+		finally:
+			PyBuffer_Release(&view)
+		self.unview()
+
+	def borrow(self, data):
+		'''
+		like prepareUnpack, but unpacks from the memory of data in place,
+		holding a reference to it rather than copying it; data must not be
+		changed while the buffer uses it, and is copied if the buffer is
+		later packed into
+		'''
+		cdef Py_buffer view
+		PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+		jdwp_borrow(&self.buf, <char*>view.buf, view.len)
+		self.unview()
+		self.view = view
+		self.viewing = 1
+
+	@property
+	def borrowed(self):
+		'true if the buffer is still using the memory of another object'
+		return bool(self.buf.borrowed)
 
 	def pack(self, fmt, *args):
-		cdef char* cfmt
-		cdef uint64_t val
-		cdef int i
-		cdef char op
-
-		cfmt = PyString_AsString(fmt)
-		sz = self.size(cfmt, args)
-		self.preparePack(sz)
-		for 0 <= i < len(fmt):
-			op = cfmt[i]
-			if op == c'$':
-				self.packStr(args[i])
-			else:
-				val = args[i]
-				jdwp_pack( &self.buf, op, val ) #TODO: dispatch on op
-			#TODO: HANDLE-ERROR
-		return PyString_FromStringAndSize(self.buf.data, sz)
-	
+		'replaces the contents of the buffer with the values; returns them'
+		self.buf.len = 0
+		self.buf.ofs = 0
+		self.format(fmt).append(self, args)
+		return self.data()
+
 	def ipack(self, fmt, *args):
-		cdef char* cfmt
-		cdef uint64_t val
-		cdef int i
-		cdef char op
-
-		cfmt = PyString_AsString(fmt)
-		sz = self.size(cfmt, args)
-		jdwp_expand(&self.buf, sz)
-		for 0 <= i < len(fmt):
-			op = cfmt[i]
-			if op == c'$':
-				self.packStr(args[i])
-			else:
-				val = args[i]
-				jdwp_pack( &self.buf, op, val ) #TODO: dispatch on op
-			#TODO: HANDLE-ERROR
-		return PyString_FromStringAndSize(self.buf.data, sz)
-	
-	def unpack(self, fmt, data = None):
-		cdef char* cfmt
-		cdef uint64_t v64
-		cdef uint32_t v32
-		cdef int imax
-		cdef int i
-		cdef char op
-		cdef object val
+		'appends the values to the contents of the buffer'
+		self.format(fmt).append(self, args)
+		return self.data()
 
+	def unpack(self, fmt, data = None):
+		'returns a list of values unpacked from the buffer'
+		cdef JdwpFormat f = self.formats.get(fmt)
+		if f is None:
+			f = self.format(fmt)
 		if data is not None:
 			self.prepareUnpack(data)
-
-		cfmt = PyString_AsString(fmt)
-		vals = [None,] * len(fmt)
-		imax = PyInt_GetMax()
-
-		for 0 <= i < len(fmt):
-			v64 = 0
-			op = cfmt[i]
-			if op == c'$':
-				val = self.unpackStr()
-			else:
-				jdwp_unpack(&self.buf, cfmt[i], &v64) #TODO: dispatch on op		
-				
-				if v64 > imax:
-					val = PyLong_FromLongLong(v64)
-				elif v64 < -imax:
-					val = PyLong_FromLongLong(v64)
-				else:
-					val = PyInt_FromLong(v64)
-				
-			vals[i] = val
-
-		return vals
+		return f.decode(&self.buf, 1)
 
 	# def pack(self, fmt, *args):
 	# 	cdef char* cfmt
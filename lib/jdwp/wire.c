@@ -57,9 +57,23 @@ char *jdwp_en_errors[] = {
 #define REQUIRE_CAP(n) if (jdwp_expand(buf, (n))) return JDWP_HEAP_FAULT;
 #define REQUIRE_LEN(n) if ((buf->len - buf->ofs) < n) return JDWP_NEED_LEN;
 
+// copies borrowed data to the heap, with room for cap bytes
+static int jdwp_own( jdwp_buffer* buf, int cap ){
+	if (cap < buf->len) cap = buf->len;
+	if (cap < 256) cap = 256;
+	char* data = malloc(cap);
+	if (data == NULL) return JDWP_HEAP_FAULT;
+	memcpy(data, buf->data, buf->len);
+	buf->data = data;
+	buf->cap = cap;
+	buf->borrowed = 0;
+	return 0;
+}
+
 int jdwp_expand( jdwp_buffer* buf, int req ){
 	int cap = buf->cap;
 	req += buf->len;
+	if (buf->borrowed) return jdwp_own(buf, req);
 	if (req < cap) return 0; // we'll be fine.
 	if (cap < 256) cap = 256; // jumps up to 256 bytes to reduce flutter
 again:
@@ -171,9 +185,74 @@ int jdwp_unpack_id( jdwp_buffer* buf, uint64_t* id, uint8_t sz ){
 	}
 }
 
+static int jdwp_unpack_id1( jdwp_buffer* buf, uint64_t* id ){
+	REQUIRE_LEN(1);
+	*id = (uint8_t)buf->data[buf->ofs];
+	buf->ofs += 1;
+	return 0;
+}
+
+static int jdwp_unpack_id2( jdwp_buffer* buf, uint64_t* id ){
+	uint16_t v;
+	REQUIRE_LEN(2);
+	memcpy(&v, buf->data + buf->ofs, 2);
+	*id = ntohs(v);
+	buf->ofs += 2;
+	return 0;
+}
+
+static int jdwp_unpack_id4( jdwp_buffer* buf, uint64_t* id ){
+	uint32_t v;
+	REQUIRE_LEN(4);
+	memcpy(&v, buf->data + buf->ofs, 4);
+	*id = ntohl(v);
+	buf->ofs += 4;
+	return 0;
+}
+
+static int jdwp_unpack_id8( jdwp_buffer* buf, uint64_t* id ){
+	uint64_t v;
+	REQUIRE_LEN(8);
+	memcpy(&v, buf->data + buf->ofs, 8);
+	*id = ntohll(v);
+	buf->ofs += 8;
+	return 0;
+}
+
+static jdwp_id_unpacker jdwp_id_unpacker_for( uint8_t sz ){
+	switch (sz){
+	case 1: return jdwp_unpack_id1;
+	case 2: return jdwp_unpack_id2;
+	case 4: return jdwp_unpack_id4;
+	case 8: return jdwp_unpack_id8;
+	default: return NULL;
+	}
+}
+
+int jdwp_config( jdwp_buffer* buf, uint8_t fSz, uint8_t mSz, uint8_t oSz, uint8_t tSz, uint8_t sSz ){
+	buf->fSz = fSz;
+	buf->mSz = mSz;
+	buf->oSz = oSz;
+	buf->tSz = tSz;
+	buf->sSz = sSz;
+	buf->unpack_fid = jdwp_id_unpacker_for(fSz);
+	buf->unpack_mid = jdwp_id_unpacker_for(mSz);
+	buf->unpack_oid = jdwp_id_unpacker_for(oSz);
+	buf->unpack_tid = jdwp_id_unpacker_for(tSz);
+	buf->unpack_sid = jdwp_id_unpacker_for(sSz);
+	// the sizes are still set, so that the error is also raised on use
+	if (!(buf->unpack_fid && buf->unpack_mid && buf->unpack_oid &&
+		  buf->unpack_tid && buf->unpack_sid)) return JDWP_SZ_UNSUPPORTED;
+	return 0;
+}
+
 int jdwp_prepare( jdwp_buffer* buf, char* data, int len ){
+	if (buf->borrowed){
+		buf->data = NULL;
+		buf->borrowed = 0;
+	}
 	if (buf->data == NULL){
-		buf->data = malloc(len);
+		buf->data = malloc(len ? len : 1); // empty packets are common
 	}else if (len > buf->cap){
 		buf->data = realloc(buf->data, len);
 	}; // we do not collapse the heap, ever.. call it a character flaw.
@@ -190,10 +269,21 @@ int jdwp_prepare( jdwp_buffer* buf, char* data, int len ){
 	return 0;
 }
 
+int jdwp_borrow( jdwp_buffer* buf, char* data, int len ){
+	jdwp_purge(buf);
+	buf->data = data;
+	buf->borrowed = 1;
+	buf->len = buf->cap = len;
+	buf->ofs = 0;
+	return 0;
+}
+
 void jdwp_purge( jdwp_buffer* buf ){
 	if (buf->data == NULL) return;
-	free(buf->data);
+	if (!buf->borrowed) free(buf->data);
 	buf->data = NULL;
+	buf->borrowed = 0;
+	buf->ofs = buf->len = buf->cap = 0;
 }
 
 int jdwp_pack( jdwp_buffer* buf, char format, uint64_t value ){
@@ -240,15 +330,15 @@ int jdwp_unpack( jdwp_buffer* buf, char format, uint64_t *value ){
 	case 'l':
 		return jdwp_unpack_u64(buf, value);
 	case 'o':
-		return jdwp_unpack_id(buf, value, buf->oSz);
+		return jdwp_unpack_object_id(buf, value);
 	case 't':
-		return jdwp_unpack_id(buf, value, buf->tSz);
+		return jdwp_unpack_type_id(buf, value);
 	case 'f':
-		return jdwp_unpack_id(buf, value, buf->fSz);
+		return jdwp_unpack_field_id(buf, value);
 	case 's':
-		return jdwp_unpack_id(buf, value, buf->sSz);
+		return jdwp_unpack_frame_id(buf, value);
 	case 'm':
-		return jdwp_unpack_id(buf, value, buf->mSz);
+		return jdwp_unpack_method_id(buf, value);
 	default:
 		return JDWP_OP_UNSUPPORTED;
 	}
@@ -299,18 +389,23 @@ int jdwp_pack_frame_id( jdwp_buffer* buf, uint64_t id ){
 	return jdwp_pack_id( buf, id, buf->sSz );
 }
 int jdwp_unpack_object_id( jdwp_buffer* buf, uint64_t* id ){
+	if (buf->unpack_oid) return buf->unpack_oid( buf, id );
 	return jdwp_unpack_id( buf, id, buf->oSz );
 }
 int jdwp_unpack_field_id( jdwp_buffer* buf, uint64_t* id ){
+	if (buf->unpack_fid) return buf->unpack_fid( buf, id );
 	return jdwp_unpack_id( buf, id, buf->fSz );
 }
 int jdwp_unpack_method_id( jdwp_buffer* buf, uint64_t* id ){
+	if (buf->unpack_mid) return buf->unpack_mid( buf, id );
 	return jdwp_unpack_id( buf, id, buf->mSz ); 
 }
 int jdwp_unpack_type_id( jdwp_buffer* buf, uint64_t* id ){
+	if (buf->unpack_tid) return buf->unpack_tid( buf, id );
 	return jdwp_unpack_id( buf, id, buf->tSz );
 }
 int jdwp_unpack_frame_id( jdwp_buffer* buf, uint64_t* id ){
+	if (buf->unpack_sid) return buf->unpack_sid( buf, id );
 	return jdwp_unpack_id( buf, id, buf->sSz );
 }
 
@@ -44,20 +44,37 @@
 
 extern char* jdwp_en_errors[];
 
+struct jdwp_buffer;
+
+/** unpacks an identifier of a size fixed by the routine */
+typedef int (*jdwp_id_unpacker)( struct jdwp_buffer* buf, uint64_t* id );
+
 /** represents an active JDWP buffer and associated state */
-typedef struct {
+typedef struct jdwp_buffer {
 	uint8_t fSz;
 	uint8_t mSz;
 	uint8_t oSz;
 	uint8_t tSz;
 	uint8_t sSz;
+	uint8_t borrowed; // data belongs to someone else, and must not be freed
 	int ofs, len, cap;
 	char* data;
+	// chosen by jdwp_config for each id size; if NULL, jdwp_unpack_id is used
+	jdwp_id_unpacker unpack_fid, unpack_mid, unpack_oid, unpack_tid, unpack_sid;
 } jdwp_buffer;
 
+/** sets the id sizes of the buffer, selecting an unpacking routine specialised for each */
+int jdwp_config( jdwp_buffer* buf, uint8_t fSz, uint8_t mSz, uint8_t oSz, uint8_t tSz, uint8_t sSz );
+
 /** creates a new buffer, backed by a copy of len bytes from data, which may be NULL */
 int jdwp_prepare( jdwp_buffer* buf, char* data, int len );
 
+/** points the buffer at len bytes of data, without copying; the first write copies them to the heap */
+int jdwp_borrow( jdwp_buffer* buf, char* data, int len );
+
+/** ensures the buffer has room for len more bytes, beyond its contents */
+int jdwp_expand( jdwp_buffer* buf, int len );
+
 /** purges the associated heap memory from a jdwp_buffer */
 void jdwp_purge( jdwp_buffer* buf );
 
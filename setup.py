@@ -13,8 +13,9 @@
 ## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
 
 from distutils.core import setup, Extension, Command
+from distutils.errors import DistutilsError
 
-# Used by TestCommand and CleanCommand
+# Used by TestCommand, BenchCommand and CleanCommand
 from unittest import TextTestRunner, TestLoader
 from glob import glob
 from os.path import splitext, basename, join as pjoin, walk
@@ -42,6 +43,112 @@ class TestCommand(Command):
         t = TextTestRunner(verbosity = 1)
         t.run(tests)
 
+class BenchCommand(Command):
+    user_options = [
+        ('output=', 'o', 'write the results as JSON to this file'),
+        ('only=', None, 'run only scenarios whose names contain this'),
+        ('baseline=', 'b', 'fail if throughput falls below this JSON report'),
+        ('tolerance=', None, 'the fraction below the baseline allowed [0.3]'),
+        ('runs=', None, 'runs of each scenario, whose median is kept [1]'),
+    ]
+
+    def initialize_options(self):
+        self._dir = os.getcwd()
+        self.output = None
+        self.only = None
+        self.baseline = None
+        self.tolerance = 0.3
+        self.runs = 1
+
+    def finalize_options(self):
+        self.tolerance = float(self.tolerance)
+        self.runs = int(self.runs)
+
+    def run(self):
+        import bench, json, sys, time
+
+        scenarios = [ ]
+        for b in sorted(glob(pjoin(self._dir, 'bench', '*.py'))):
+            if b.endswith('__init__.py'):
+                continue
+            name = '.'.join(['bench', splitext(basename(b))[0]])
+            mod = __import__(name, fromlist = ['*'])
+            funcs = [
+                f for k, f in vars(mod).items() if k.startswith('bench_')
+            ]
+            funcs.sort(key = lambda f: f.func_code.co_firstlineno)
+            scenarios.extend(funcs)
+
+        results = { }
+        for func in scenarios:
+            name = func.__name__[6:]
+            if self.only and self.only not in name:
+                continue
+            res = bench.median_of(func, self.runs)
+            results[name] = res
+            print '%s: %s' % (name, json.dumps(res, sort_keys = True))
+
+        report = json.dumps({
+            'time': time.time(),
+            'python': sys.version.split()[0],
+            'results': results
+        }, indent = 2, sort_keys = True)
+        if self.output:
+            with open(self.output, 'w') as f:
+                f.write(report + '\n')
+        else:
+            print report
+
+        if self.baseline:
+            self.compare(results)
+
+    def compare(self, results):
+        '''
+        fails if any throughput, or the median over the cases of a scenario,
+        is too far below that in the baseline.  Each throughput is divided
+        by the speed of the machine, the ratio of the reference of the
+        scenario to that in the baseline, where both have one
+        '''
+        import json, bench
+        with open(self.baseline) as f:
+            baseline = json.load(f)['results']
+
+        failures = [ ]
+        floor = 1 - self.tolerance
+        for name, res in sorted(results.items()):
+            base = baseline.get(name, { })
+            rates = res.get('throughput', { })
+            keys = sorted(k for k in rates if k in base.get('throughput', { }))
+            if not keys: continue
+            speed = 1.0
+            if res.get('reference') and base.get('reference'):
+                speed = res['reference'] / base['reference']
+            ratios = dict(
+                (key, rates[key] / base['throughput'][key] / speed)
+                for key in keys
+            )
+            mid = bench.median(ratios.values())
+            print '%s: %.2f of the baseline, the machine at %.2f' % (
+                name, mid, speed
+            )
+            if mid < floor:
+                failures.append('%s: the median at %.2f of the baseline' % (
+                    name, mid
+                ))
+            for key in keys:
+                if ratios[key] < floor:
+                    failures.append('%s: %s: %.0f/s, below %.0f/s' % (
+                        name, key, rates[key],
+                        base['throughput'][key] * speed * floor
+                    ))
+
+        for failure in failures:
+            print '!!', failure
+        if failures:
+            raise DistutilsError(
+                '%i measurements fell below the baseline' % len(failures)
+            )
+
 class CleanCommand(Command):
 	# From: http://da44en.wordpress.com/2002/11/22/using-distutils/
     user_options = [ ]
@@ -81,6 +188,7 @@ setup(
 	ext_modules = [jdwp],
 	cmdclass = { 
 		'test' : TestCommand, 
+		'bench' : BenchCommand,
 		'clean' : CleanCommand 
 	},
     scripts = ['andbug']
@@ -0,0 +1,89 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under
+## the terms of version 3 of the GNU Lesser General Public License as
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+from andbug.aio import Connection, Session, Return, RequestError, spawn, run
+from andbug.proto import HANDSHAKE_MSG, IDSZ_REQ
+from unittest import TestCase, main as test_main
+from threading import Thread
+import socket
+
+IDSZ_RES = (
+	'\x00\x00\x00\x1F\x00\x00\x00\x01\x80\x00\x00'
+	'\x00\x00\x00\x08' '\x00\x00\x00\x08' '\x00\x00\x00\x08'
+	'\x00\x00\x00\x08' '\x00\x00\x00\x08'
+)
+
+def recvall(sock, sz):
+	data = ''
+	while len(data) < sz:
+		pkt = sock.recv(sz - len(data))
+		if not pkt: raise EOFError()
+		data += pkt
+	return data
+
+def peer(sock, replies):
+	'a scripted debuggee; answers requests in order with replies'
+	try:
+		assert recvall(sock, len(HANDSHAKE_MSG)) == HANDSHAKE_MSG
+		sock.sendall(HANDSHAKE_MSG)
+		assert recvall(sock, len(IDSZ_REQ)) == IDSZ_REQ
+		sock.sendall(IDSZ_RES)
+		for error, body in replies:
+			head = recvall(sock, 11)
+			size = int(head[:4].encode('hex'), 16)
+			recvall(sock, size - 11)
+			sock.sendall(
+				('%08x' % (len(body) + 11)).decode('hex') + head[4:8] +
+				'\x80' + ('%04x' % error).decode('hex') + body
+			)
+	except EOFError:
+		pass
+	finally:
+		sock.close()
+
+def start_peer(*replies):
+	a, b = socket.socketpair()
+	t = Thread(target=peer, args=(b, replies))
+	t.daemon = True
+	t.start()
+	return a
+
+class TestAio(TestCase):
+	def test_session(self):
+		sock = start_peer(
+			(0, ''),
+			(0, '\x00\x00\x00\x02' + '\x00' * 7 + '\x01' + '\x00' * 7 + '\x02'),
+			(0, '\x00\x00\x00\x04main'),
+			(0, '\x00\x00\x00\x05other'),
+			(13, ''),
+		)
+		map = {}
+		sess = Session(Connection(sock, map))
+
+		def script():
+			sizes = yield sess.start()
+			yield sess.suspend()
+			tids = yield sess.threads()
+			names = yield list(sess.threadName(tid) for tid in tids)
+			try:
+				yield sess.resume()
+			except RequestError as err:
+				raise Return((sizes, tids, names, err.code))
+
+		res = run(spawn(script()), map)
+		self.assertEqual(([8] * 5, [1, 2], ['main', 'other'], 13), res)
+		sess.conn.close()
+
+if __name__ == '__main__':
+	test_main()
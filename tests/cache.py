@@ -0,0 +1,49 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under
+## the terms of version 3 of the GNU Lesser General Public License as
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from andbug.cache import MetadataCache, build_key
+from unittest import TestCase, main as test_main
+from tempfile import mkdtemp
+from shutil import rmtree
+
+class TestMetadataCache(TestCase):
+	def setUp(self):
+		self.root = mkdtemp()
+
+	def tearDown(self):
+		rmtree(self.root)
+
+	def test_persist(self):
+		build = build_key('com.example', 12)
+		cache = MetadataCache(self.root, build)
+		self.assertEqual(None, cache.get('La;', 'lines', ('m', '()V')))
+		cache.put('La;', 'lines', ('m', '()V'), (0, 9, [(0, 1), (4, 2)]))
+		cache.put('La;', 'lines', ('n', '()V'), (0, 9, [(0, 3)]))
+		unflushed = MetadataCache(self.root, build)
+		self.assertEqual(None, unflushed.get('La;', 'lines', ('m', '()V')))
+		cache.flush()
+		cache = MetadataCache(self.root, build)
+		self.assertEqual(
+			(0, 9, [(0, 1), (4, 2)]), cache.get('La;', 'lines', ('m', '()V'))
+		)
+		self.assertEqual((1, 0), (cache.hits, cache.misses))
+		other = MetadataCache(self.root, build_key('com.example', 13))
+		self.assertEqual(None, other.get('La;', 'lines', ('m', '()V')))
+		cache.clear()
+		cache = MetadataCache(self.root, build)
+		self.assertEqual(None, cache.get('La;', 'lines', ('m', '()V')))
+
+if __name__ == '__main__':
+	test_main()
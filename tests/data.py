@@ -0,0 +1,52 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under
+## the terms of version 3 of the GNU Lesser General Public License as
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+from andbug.data import pool
+from unittest import TestCase, main as test_main
+
+class Item(object):
+	def __init__(self, n):
+		self.n = n
+
+class TestPool(TestCase):
+	def test_pool(self):
+		gone = []
+		p = pool(2, gone.extend)
+		a = p(Item, 1)
+		self.assertTrue(a is p(Item, 1))
+		del a
+		for n in (2, 3, 4):
+			p(Item, n)
+		self.assertEqual([], gone)
+		p(Item, 5)
+		self.assertEqual({(Item, 1): 2, (Item, 2): 1}, dict(gone))
+
+	def test_pool_revived(self):
+		'an ident pooled again before its collection is processed'
+		gone = []
+		p = pool(2, gone.extend)
+		p(Item, 1)
+		p(Item, 1)
+		for n in (2, 3, 4):
+			p(Item, n)
+		self.assertEqual(2, len(p.dead))
+		with p.lock:
+			a = p.find((Item, 1))
+		del a
+		for n in (5, 6, 7, 8):
+			p(Item, n)
+		self.assertEqual(3, dict(gone)[(Item, 1)])
+
+if __name__ == '__main__':
+	test_main()
@@ -60,6 +60,117 @@ class TestJdwp(TestCase):
 			"\0\0\0\0\0\0\0\1"
 		), 0, 1, 1, 1, 1)
 
+	def test_format(self):
+		buf = newbuf()
+		fmt = buf.format('1tm8')
+		self.assertTrue(fmt is buf.format('1tm8'))
+		self.assertEqual((15, 4), (fmt.size, fmt.count))
+		data = fmt.pack(1, 2, 3, -1)
+		self.assertEqual(data, buf.pack('1tm8', 1, 2, 3, -1))
+		buf.prepareUnpack(data + '\0\1')
+		self.assertEqual((1, 2, 3, -1), fmt.unpack(buf))
+		self.assertEqual([1], buf.unpack('2'))
+
+		fmt = buf.format('l$$$ii')
+		data = fmt.pack(5, 'this', 'I', '', 7, 2)
+		buf.prepareUnpack(data)
+		self.assertEqual((5, 'this', 'I', '', 7, 2), fmt.unpack(buf))
+		buf.prepareUnpack(data[:-1])
+		self.assertRaises(andbug.jdwp.JdwpError, fmt.unpack, buf)
+		self.assertRaises(TypeError, fmt.pack, 5)
+
+	def test_format_into(self):
+		buf = newbuf()
+		buf.pack('1', 7)
+		buf.format('o$').packInto(buf, 1, 'ab')
+		buf.ipack('t', 2)
+		self.assertEqual("\7\0\1\0\0\0\2ab\0\0\0\2", buf.data())
+
+	def test_unpack_array(self):
+		buf = newbuf()
+		buf.prepareUnpack(
+			'\1\0\1' '\0\x41\x26\x3a' '\xff\xff\xff\xfe\0\0\0\7'
+			'\xbf\xf0\0\0\0\0\0\0'
+		)
+		self.assertEqual('\1\0\1', buf.unpackArray('B', 3))
+		chars = buf.unpackArray('C', 2)
+		self.assertEqual(('H', [0x41, 0x263a]), (chars.typecode, list(chars)))
+		self.assertEqual([-2, 7], list(buf.unpackArray(ord('I'), 2)))
+		self.assertEqual([-1.0], list(buf.unpackArray('D', 1)))
+		self.assertRaises(andbug.jdwp.JdwpError, buf.unpackArray, 'B', 1)
+		self.assertRaises(andbug.jdwp.JdwpError, buf.unpackArray, 'L', 0)
+
+	def test_unpack_tagged(self):
+		buf = andbug.jdwp.JdwpBuffer()
+		buf.config(8,8,8,8,8)
+		buf.prepareUnpack(
+			'B\xfe' 'Z\1' 'C\x26\x3a' 'S\xff\xfe' 'I\xff\xff\xff\xff'
+			'D\xbf\xf0\0\0\0\0\0\0' 'V' 's\0\0\0\0\0\0\0\5'
+			'L\0\0\0\0\0\0\0\0' 'F\x3f\xc0\0\0'
+		)
+		self.assertEqual([
+			(ord('B'), -2), (ord('Z'), True), (ord('C'), u'\u263a'),
+			(ord('S'), -2), (ord('I'), -1), (ord('D'), -1.0), (ord('V'), None),
+			(ord('s'), 5), (ord('L'), 0), (ord('F'), 1.5)
+		], buf.unpackTaggedValues(10))
+		buf.prepareUnpack('I\0\0')
+		self.assertRaises(andbug.jdwp.JdwpError, buf.unpackTaggedValues, 1)
+		buf.prepareUnpack('Q\0')
+		self.assertRaises(andbug.jdwp.JdwpError, buf.unpackTaggedValues, 1)
+
+	def test_borrow(self):
+		data = '\0\0\0\7\0\0\0\2ab'
+		buf = newbuf()
+		buf.borrow(data)
+		self.assertTrue(buf.borrowed)
+		self.assertEqual([7, 'ab'], buf.unpack('i$'))
+		buf.borrow(bytearray(data))
+		buf.packU8(1)
+		self.assertFalse(buf.borrowed)
+		self.assertEqual(data + '\1', buf.data())
+		self.assertEqual('\0\0\0\7\0\0\0\2ab', data)
+
+	def test_write_into(self):
+		buf = newbuf()
+		buf.pack('1o', 7, 1)
+		target = bytearray(8)
+		self.assertEqual(4, buf.writeInto(target, 1))
+		self.assertEqual('\0\7\0\1\0\0\0\0', str(target))
+		fmt = buf.format('2$')
+		self.assertEqual(8, fmt.writeInto(target, 1, 2, 'x'))
+		self.assertEqual('\0\0\2\0\0\0\1x', str(target))
+		self.assertRaises(ValueError, buf.writeInto, target, 6)
+		self.assertRaises(ValueError, fmt.writeInto, target, 2, 2, 'x')
+
+	def test_config(self):
+		buf = andbug.jdwp.JdwpBuffer()
+		buf.config(4,4,4,4,4)
+		buf.prepareUnpack('\0\0\0\1\xff\xff\xff\xfe\0\0\0\0\0\0\0\3')
+		self.assertEqual(1, buf.unpackObjectId())
+		self.assertEqual(0xfffffffe, buf.unpackMethodId())
+		buf.config(tSz=8)
+		self.assertEqual(3, buf.unpackTypeId())
+		buf.prepareUnpack('\x12\x34\x56')
+		buf.config(1,2,2,4,8)
+		self.assertEqual((0x12, 0x3456), (buf.unpackFieldId(), buf.unpackMethodId()))
+		self.assertRaises(andbug.jdwp.JdwpError, buf.unpackTypeId)
+		self.assertRaises(andbug.jdwp.JdwpError, buf.config, 3)
+
+	def test_unpack_class_table(self):
+		buf = newbuf()
+		buf.prepareUnpack(
+			'\1\0\0\0\7\0\0\0\3LA;\0\0\0\0\0\0\0\7'
+			'\3\0\0\0\x09\0\0\0\2[B\0\0\0\1x\xff\xff\xff\xff'
+		)
+		tags, tids, jnis, gens, flags = buf.unpackClassTable(2)
+		self.assertEqual([1, 3], list(tags))
+		self.assertEqual([7, 9], list(tids))
+		self.assertEqual((['LA;', '[B'], ['', 'x']), (jnis, gens))
+		self.assertTrue(jnis[0] is intern('LA;'))
+		self.assertEqual([7, -1], list(flags))
+		buf.prepareUnpack('\1\0\0\0\7\0\0\0\3LA;')
+		self.assertRaises(andbug.jdwp.JdwpError, buf.unpackClassTable, 1)
+
 	def test_incr_pack(self):
 		buf = newbuf()
 		buf.packU8(1)
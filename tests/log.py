@@ -13,6 +13,7 @@
 ## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
 
 from andbug.log import LogReader, LogWriter, LogEvent
+from andbug.log import PacketReader, PacketWriter
 from unittest import TestCase, main as test_main
 from cStringIO import StringIO
 import sys
@@ -36,5 +37,17 @@ class TestLog(TestCase):
 		log( 1, "<<<", "META", "" )
 		log( 2, ">>>", "META", "the quick brown fox" )
 
+	def test_packets(self):
+		o = StringIO()
+		w = PacketWriter(o)
+		w.writePacket('>', 'the quick', 1.5)
+		w.writePacket('<', '', 2.5)
+		w.writePacket('<', 'brown fox', 3.5)
+		r = PacketReader(StringIO(o.getvalue()))
+		self.assertEqual([
+			(1.5, '>', 'the quick'), (2.5, '<', ''), (3.5, '<', 'brown fox')
+		], list(r))
+		self.assertRaises(ValueError, PacketReader, StringIO('nonsense'))
+
 if __name__ == '__main__':
 	test_main()
\ No newline at end of file
@@ -12,7 +12,8 @@
 ## You should have received a copy of the GNU Lesser General Public License
 ## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
 
-from andbug.options import parse_cpath, parse_mquery
+from andbug.options import parse_cpath, parse_mquery, parse_cquery
+from andbug.options import compile_glob
 from unittest import TestCase, main as test_main
 
 class TestOptions(TestCase):
@@ -39,5 +40,23 @@ class TestOptions(TestCase):
         case('abc.xyz',   'foo()I',   ('Labc/xyz;', 'foo', '()I'))
         case('Labc/xyz;', 'foo(DD)I', ('Labc/xyz;', 'foo', '(DD)I'))
         
+    def test_glob(self):
+        prefix, rx = compile_glob('Lcom/example/**;')
+        self.assertEqual('Lcom/example/', prefix)
+        self.assertTrue(rx.match('Lcom/example/a/B;'))
+        self.assertFalse(rx.match('Lcom/examples/B;'))
+        prefix, rx = compile_glob('Lcom/example/*;')
+        self.assertTrue(rx.match('Lcom/example/B;'))
+        self.assertFalse(rx.match('Lcom/example/a/B;'))
+        self.assertEqual('Lcom/example/*;', parse_cquery('com.example.*'))
+        self.assertEqual('L**Activity;', parse_cquery('*Activity'))
+        self.assertEqual('L**Activity;', parse_cquery('**Activity'))
+        prefix, rx = compile_glob(parse_cquery('*Activity'))
+        self.assertTrue(rx.match('Lcom/example/MainActivity;'))
+        self.assertEqual(
+            'Lcom/example/*Activity;', parse_cquery('com.example.*Activity')
+        )
+        self.assertEqual('Labc;', parse_cquery('abc'))
+
 if __name__ == '__main__':
     test_main()
\ No newline at end of file
@@ -12,10 +12,15 @@
 ## You should have received a copy of the GNU Lesser General Public License
 ## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
 
-from andbug.proto import Connection, HANDSHAKE_MSG, IDSZ_REQ
+from andbug.proto import Connection, HANDSHAKE_MSG, IDSZ_REQ, gather
+from andbug.proto import SocketReader, Replayer, EOF
+from andbug.proto import HEADER_STRUCT, LARGE_PACKET_SIZE
+from andbug.log import PacketReader, PacketWriter
+from andbug.stats import Stats
 from unittest import TestCase, main as test_main
 from cStringIO import StringIO
-import sys
+from threading import Condition
+import sys, socket
 
 IDSZ_RES = (
 	'\x00\x00\x00\x1F' # Length
@@ -44,9 +49,56 @@ class IoHarness:
 		return self.readbuf.read(length)
 
 	def write(self, data):
+		data = memoryview(data).tobytes()
 		exp = self.writebuf.read(len(data))
 		self.test.assertEqual(exp, data)
 
+class PeerHarness:
+	'like IoHarness, but replies only become readable once requested'
+	def __init__(self, test, convo):
+		self.test = test
+		self.convo = list(convo)
+		self.written = ''
+		self.readable = ''
+		self.closed = False
+		self.writes = 0
+		self.cond = Condition()
+
+	def read(self, length):
+		with self.cond:
+			while len(self.readable) < length and not self.closed:
+				self.cond.wait()
+			data = self.readable[:length]
+			self.readable = self.readable[length:]
+			return data
+
+	def write(self, data):
+		self.writes += 1
+		with self.cond:
+			self.written += memoryview(data).tobytes()
+			while self.convo and self.written.startswith(self.convo[0][0]):
+				req, res = self.convo.pop(0)
+				self.written = self.written[len(req):]
+				self.readable += res
+			self.cond.notifyAll()
+
+	def close(self):
+		with self.cond:
+			self.closed = True
+			self.cond.notifyAll()
+
+def req(ident, body=''):
+	return (
+		'\x00\x00\x00' + chr(11 + len(body)) +
+		'\x00\x00\x00' + chr(ident) + '\x00\x42\x42' + body
+	)
+
+def res(ident, body=''):
+	return (
+		'\x00\x00\x00' + chr(11 + len(body)) +
+		'\x00\x00\x00' + chr(ident) + '\x80\x00\x00' + body
+	)
+
 def make_conn(harness):
 	conn = Connection(harness.read, harness.write)
 	conn.start()
@@ -75,5 +127,193 @@ class TestConnection(TestCase):
 		p = make_conn(h)
 		self.assertEqual(True, p.initialized)
 
+	def test_request_async(self):
+		h = PeerHarness( self, [
+			(HANDSHAKE_MSG, HANDSHAKE_MSG),
+			(IDSZ_REQ, IDSZ_RES),
+			(req(3), ''),
+			(req(5), ''),
+			(req(7), res(5, 'b') + res(3, 'a') + res(7, 'c')),
+		])
+		p = Connection(h.read, h.write, inflight=3)
+		p.start()
+		replies = list(p.request_async(0x4242) for i in range(3))
+		results = gather(replies, 5)
+		h.close()
+		self.assertEqual([0, 0, 0], list(code for code, buf in results))
+		self.assertEqual(
+			[ord('a'), ord('b'), ord('c')],
+			list(buf.unpackU8() for code, buf in results)
+		)
+		self.assertTrue(all(reply.done() for reply in replies))
+
+	def test_request_batch(self):
+		h = PeerHarness( self, [
+			(HANDSHAKE_MSG, HANDSHAKE_MSG),
+			(IDSZ_REQ, IDSZ_RES),
+			(req(3, 'x') + req(5, 'yy'), res(3, 'a') + res(5, 'b')),
+			(req(7, 'z'), res(7, 'c')),
+		])
+		p = Connection(h.read, h.write, inflight=2)
+		p.start()
+		writes = h.writes
+		replies = p.request_batch(
+			[(0x4242, 'x'), (0x4242, 'yy'), (0x4242, 'z')]
+		)
+		results = gather(replies, 5)
+		h.close()
+		self.assertEqual(writes + 2, h.writes)
+		self.assertEqual(
+			[ord('a'), ord('b'), ord('c')],
+			list(buf.unpackU8() for code, buf in results)
+		)
+
+	def test_write_failure(self):
+		h = PeerHarness( self, [
+			(HANDSHAKE_MSG, HANDSHAKE_MSG),
+			(IDSZ_REQ, IDSZ_RES),
+			(req(9), res(9, 'a')),
+		])
+		broken = []
+		def write(data):
+			if broken:
+				raise socket.error('broken pipe')
+			h.write(data)
+		p = Connection(h.read, write, inflight=2)
+		p.start()
+		broken.append(True)
+		self.assertRaises(socket.error, p.request_async, 0x4242)
+		self.assertRaises(
+			socket.error, p.request_batch, [(0x4242, ''), (0x4242, '')]
+		)
+		broken.pop()
+		# every slot of the window is free again
+		self.assertTrue(p.inflight.acquire(False))
+		self.assertTrue(p.inflight.acquire(False))
+		p.inflight.release()
+		p.inflight.release()
+		code, buf = p.request(0x4242, '', 5)
+		h.close()
+		self.assertEqual(ord('a'), buf.unpackU8())
+		self.assertEqual({}, p.qmap)
+
+	def test_stats(self):
+		h = PeerHarness( self, [
+			(HANDSHAKE_MSG, HANDSHAKE_MSG),
+			(IDSZ_REQ, IDSZ_RES),
+			(req(3, 'xy'), res(3, 'abc')),
+		])
+		p = make_conn(h)
+		p.stats = Stats()
+		p.request(0x4242, 'xy', 5)
+		h.close()
+		cmd, = p.stats.summary()
+		self.assertEqual((0x4242, 1, 13, 14, 1), (
+			cmd.code, cmd.count, cmd.sent, cmd.received, sum(cmd.histogram)
+		))
+		self.assertEqual((1, 13, 14), p.stats.totals())
+
+	def test_buffer_pool(self):
+		h = PeerHarness( self, [
+			(HANDSHAKE_MSG, HANDSHAKE_MSG),
+			(IDSZ_REQ, IDSZ_RES),
+			(req(3, 'xy'), res(3, 'abc')),
+		])
+		p = make_conn(h)
+		p.stats = Stats()
+		buf = p.buffer()
+		buf.packU16(0x7879)
+		code, reply = p.request(0x4242, buf, 5)
+		h.close()
+		self.assertEqual('abc', reply.data())
+		# the request buffer is pooled once written, and may already have
+		# been taken for the response
+		self.assertTrue(reply is buf or p.buffers == [buf])
+		p.release(reply)
+		self.assertTrue(p.buffer() is reply)
+		self.assertEqual('', reply.data())
+		self.assertEqual(3, p.stats.pool_hits + p.stats.pool_misses)
+		self.assertTrue(0 < p.stats.pool_rate < 1)
+
+	def test_record_replay(self):
+		h = PeerHarness( self, [
+			(HANDSHAKE_MSG, HANDSHAKE_MSG),
+			(IDSZ_REQ, IDSZ_RES),
+			(req(3, 'x') + req(5, 'y'), res(5, 'b') + res(3, 'a')),
+		])
+		o = StringIO()
+		p = Connection(h.read, h.write)
+		p.recorder = PacketWriter(o)
+		p.start()
+		gather(p.request_batch([(0x4242, 'x'), (0x4242, 'y')]), 5)
+		h.close()
+		p.join(5)
+
+		packets = list(PacketReader(StringIO(o.getvalue())))
+		self.assertEqual(
+			['>', '<', '>', '>', '<', '<'],
+			list(direction for now, direction, data in packets)
+		)
+		r = Replayer(packets)
+		p = Connection(r, r.write)
+		p.start()
+		results = gather(p.request_batch([(0x4242, 'x'), (0x4242, 'y')]), 5)
+		self.assertEqual(
+			[ord('a'), ord('b')],
+			list(buf.unpackU8() for code, buf in results)
+		)
+
+class TestSocketReader(TestCase):
+	def test_packets(self):
+		a, b = socket.socketpair()
+		try:
+			r = SocketReader(a, size=16)
+			b.sendall(HANDSHAKE_MSG + IDSZ_RES + SAMPLE_REQ + SAMPLE_RES)
+			self.assertEqual(HANDSHAKE_MSG, r(len(HANDSHAKE_MSG)))
+			size, ident, flags, code, body = r.packet()
+			self.assertEqual((20, 1, 0x80, 0), (size, ident, flags, code))
+			self.assertEqual(IDSZ_RES[11:], body.tobytes())
+			self.assertEqual((0, 3, 0, 0x4242), r.packet()[:4])
+			size, ident, flags, code, body = r.packet()
+			self.assertEqual((0, 3, 0x80, 0), (size, ident, flags, code))
+			self.assertEqual(0, len(body))
+			b.close()
+			self.assertRaises(EOF, r.packet)
+		finally:
+			a.close()
+
+	def test_large_packets(self):
+		a, b = socket.socketpair()
+		try:
+			r = SocketReader(a, size=16)
+			body = 'x' * (LARGE_PACKET_SIZE + 1)
+			b.sendall(
+				HEADER_STRUCT.pack(len(body) + 11, 9, 0x80, 0) + body + SAMPLE_RES
+			)
+			size, ident, flags, code, data = r.packet()
+			self.assertEqual((len(body), 9), (size, ident))
+			self.assertTrue(isinstance(data, bytearray))
+			self.assertEqual(body, str(data))
+			self.assertEqual((0, 3, 0x80, 0), r.packet()[:4])
+		finally:
+			a.close()
+			b.close()
+
+	def test_large_packets_traced(self):
+		a, b = socket.socketpair()
+		stdout = sys.stdout
+		try:
+			r = SocketReader(a, trace=True, size=16)
+			body = 'x' * (LARGE_PACKET_SIZE + 1)
+			b.sendall(HEADER_STRUCT.pack(len(body) + 11, 9, 0x80, 0) + body)
+			sys.stdout = StringIO()
+			size, ident, flags, code, data = r.packet()
+			self.assertEqual(body, str(data))
+			self.assertTrue(repr(body) in sys.stdout.getvalue())
+		finally:
+			sys.stdout = stdout
+			a.close()
+			b.close()
+
 if __name__ == '__main__':
 	test_main()
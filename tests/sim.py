@@ -0,0 +1,339 @@
+## Copyright 2011, IOActive, Inc. All rights reserved.
+##
+## AndBug is free software: you can redistribute it and/or modify it under
+## the terms of version 3 of the GNU Lesser General Public License as
+## published by the Free Software Foundation.
+##
+## AndBug is distributed in the hope that it will be useful, but WITHOUT ANY
+## WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+## FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License for
+## more details.
+##
+## You should have received a copy of the GNU Lesser General Public License
+## along with AndBug.  If not, see <http://www.gnu.org/licenses/>.
+
+from andbug.sim import Simulator, SYSTEM_CLASSES
+from andbug.sim import CLASS_BASE, OBJECT_BASE, METHOD_BASE
+from andbug.vm import Session, Object, Location
+from andbug.vm import unpack_value, unpack_values, pack_value
+from andbug.data import loaded
+from andbug.cache import MetadataCache, build_key
+import andbug.proto
+from unittest import TestCase, main as test_main
+from Queue import Queue
+import re
+from time import time, sleep
+from tempfile import mkdtemp
+from shutil import rmtree
+
+def wait_for(cond, timeout=5):
+	'waits for events to be processed by the session'
+	until = time() + timeout
+	while not cond():
+		if time() > until:
+			raise AssertionError('timed out')
+		sleep(0.01)
+
+class TestSimulator(TestCase):
+	def setUp(self):
+		self.sim = Simulator(
+			classes=50, methods=3, threads=4, depth=5,
+			event_rate=1000, event_limit=20
+		)
+
+	def tearDown(self):
+		self.sim.close()
+
+	def test_classes(self):
+		sess = Session(self.sim.connect())
+		classes = sess.classes().items
+		self.assertEqual(50 + len(SYSTEM_CLASSES), len(classes))
+		self.assertEqual(SYSTEM_CLASSES[0], classes[0].jni)
+		c = sess.classes('Lsim/p0/C10;')[0]
+		self.assertEqual(['m0', 'm1', 'm2'], list(m.name for m in c.methodList))
+		m = c.methodList[1]
+		self.assertEqual(0, m.firstLoc.loc)
+		self.assertEqual(31, m.lastLoc.loc)
+		self.assertEqual(range(101, 109), sorted(m.lineTable.keys()))
+		self.assertEqual(
+			['this', 'count', 'label', 'flag'], list(s.name for s in m.slots)
+		)
+		self.assertEqual(['total'], c.statics.keys())
+
+	def test_class_table(self):
+		sess = Session(self.sim.connect())
+		table = sess.classTable
+		c, = sess.classes('Lsim/p0/C10;')
+		self.assertEqual(1, len(table) - table.items.count(None))
+		self.assertTrue(c is table[table.find('Lsim/p0/C10;')[0]])
+		self.assertEqual(len(table), len(list(table)))
+		self.assertEqual([], sess.classes('Lnothing;').items)
+
+	def test_class_queries(self):
+		sess = Session(self.sim.connect())
+		seq = sess.classes('Lsim/p0/C1*;')
+		self.assertEqual(10, len(seq))
+		self.assertEqual(
+			['Lsim/p0/C10;', 'Lsim/p0/C11;'], list(c.jni for c in seq[:2])
+		)
+		table = sess.classTable
+		self.assertEqual(len(table), table.items.count(None) + 2)
+		self.assertEqual(50, len(sess.classes('Lsim/**;')))
+		self.assertEqual(0, len(sess.classes('Lsim/*;')))
+		seq = sess.classes(re.compile(r'Lsim/p0/C\d;'))
+		self.assertEqual(6, len(seq))
+		c = seq[0]
+		self.assertEqual(['m1'], list(m.name for m in c.methods('m1')))
+		self.assertEqual(3, len(c.methods('m*')))
+		self.assertEqual(
+			['m0', 'm2'], list(m.name for m in c.methods(re.compile('m[02]')))
+		)
+
+	def test_prefetch(self):
+		sess = Session(self.sim.connect())
+		classes = sess.classes('Lsim/p0/*;')
+		stats = sess.collectStats()
+		sess.prefetch(classes, slots=True, fields=True)
+		counts = dict((k, v.count) for k, v in stats.commands.items())
+		self.assertEqual({
+			0x020e: 50, 0x020f: 50, 0x0601: 150, 0x0605: 150
+		}, counts)
+		for c in classes:
+			self.assertEqual(['total'], list(
+				f.name for f in c.fieldList if f.static
+			))
+			for m in c.methodList:
+				self.assertEqual(0, m.firstLoc.loc)
+				self.assertEqual(4, len(m.slots))
+		self.assertEqual(counts, dict(
+			(k, v.count) for k, v in stats.commands.items()
+		))
+
+	def test_classes_by_signature(self):
+		sess = Session(self.sim.connect())
+		stats = sess.collectStats()
+		c, = sess.classes('Lsim/p0/C10;')
+		self.assertEqual(['total'], c.statics.keys())
+		self.assertEqual([c], sess.classes('Lsim/p0/C10;').items)
+		self.assertEqual(1, stats.commands[0x0102].count)
+		self.assertFalse(0x0114 in stats.commands)
+		self.sim.unloadClass(10)
+		wait_for(lambda: 'Lsim/p0/C10;' not in sess.classCache)
+		self.assertEqual([], sess.classes('Lsim/p0/C10;').items)
+
+	def test_class_events(self):
+		sess = Session(self.sim.connect())
+		table = sess.classTable
+		count = len(table)
+		self.sim.prepareClasses(2)
+		wait_for(lambda: len(table) == count + 2)
+		jni = self.sim.classJni(count + 1)
+		c, = sess.classes(jni)
+		self.assertEqual(jni, c.jni)
+		self.assertEqual(['m0', 'm1', 'm2'], list(m.name for m in c.methodList))
+		seq = sess.classes('Lsim/p0/C1*;')
+		self.sim.unloadClass(10)
+		wait_for(lambda: len(table) == count + 1)
+		self.assertEqual([], sess.classes('Lsim/p0/C10;').items)
+		self.assertEqual(jni, sess.classes(jni)[0].jni)
+		self.assertEqual(
+			list('Lsim/p0/C1%i;' % i for i in range(10)),
+			list(c.jni for c in seq)
+		)
+		self.assertEqual(9, len(sess.classes('Lsim/p0/C1*;')))
+		self.assertFalse('Lsim/p0/C10;' in table.signatures())
+
+	def test_metadata_cache(self):
+		root = mkdtemp()
+		try:
+			for i in range(2):
+				cache = MetadataCache(root, build_key('sim', 1))
+				sess = Session(self.sim.connect(), cache)
+				stats = sess.collectStats()
+				c, = sess.classes('Lsim/p0/C10;')
+				m = c.methodList[1]
+				self.assertEqual(range(101, 109), sorted(m.lineTable.keys()))
+				self.assertEqual(
+					['this', 'count', 'label', 'flag'],
+					list(s.name for s in m.slots)
+				)
+				sess.flush()
+			self.assertEqual(2, cache.hits)
+			self.assertFalse(0x0601 in stats.commands)
+			self.assertFalse(0x0605 in stats.commands)
+		finally:
+			rmtree(root)
+
+	def test_threads(self):
+		sess = Session(self.sim.connect())
+		sess.suspend()
+		threads = sess.threads().items
+		self.assertEqual(4, len(threads))
+		self.assertEqual('<1> main', threads[0].name)
+		self.assertEqual((1, 1), threads[0].status)
+		self.assertEqual(1, len(sess.threads('<2> Thread-1').items))
+		frames = threads[2].frames.items
+		self.assertEqual(5, len(frames))
+		vals = frames[1].values
+		self.assertEqual(['count', 'flag', 'label', 'this'], sorted(vals))
+		cls = frames[1].loc.klass.tid - CLASS_BASE
+		self.assertEqual('label %i' % cls, str(vals['label']))
+		self.assertEqual(cls, vals['count'])
+		sess.resume()
+
+	def test_suspend_epoch(self):
+		sess = Session(self.sim.connect())
+		stats = sess.collectStats()
+		t = sess.threads()[1]
+		t.name, t.name
+		self.assertEqual(2, stats.commands[0x0b01].count)
+		sess.suspend()
+		str(t), str(t)
+		frames = t.frames
+		self.assertTrue(frames is t.frames)
+		frames[1].values, frames[1].values
+		self.assertEqual(
+			[3, 1, 1, 1], list(stats.commands[code].count
+				for code in (0x0b01, 0x0b04, 0x0b06, 0x1001))
+		)
+		sess.resume()
+		self.assertFalse(frames is t.frames)
+		self.assertEqual(2, stats.commands[0x0b06].count)
+		t.suspend()
+		t.frames, t.frames
+		sess.threads()[2].frames
+		self.assertEqual(4, stats.commands[0x0b06].count)
+		t.resume()
+		t.frames
+		self.assertEqual(5, stats.commands[0x0b06].count)
+		sess.suspend()
+		t.frames
+		t.resume()
+		t.frames, t.frames
+		self.assertEqual(8, stats.commands[0x0b06].count)
+		sess.resume()
+		sess.suspend()
+		t.suspend()
+		sess.resume()
+		t.frames, t.frames
+		self.assertEqual(9, stats.commands[0x0b06].count)
+		t.resume()
+		t.frames
+		self.assertEqual(10, stats.commands[0x0b06].count)
+
+	def test_composite_suspend(self):
+		sess = Session(self.sim.connect())
+		t = sess.threads()[0]
+		buf = sess.conn.buffer()
+		evt = (2, 7, t.tid, 1, CLASS_BASE, METHOD_BASE, 0)
+		buf.pack('1i' + '1io1tm8' * 2, 1, 2, *(evt + evt))
+		buf.prepareUnpack(buf.data())
+		sess.processEvent(0, buf)
+		stats = sess.collectStats()
+		t.frames, t.frames
+		self.assertEqual(1, stats.commands[0x0b06].count)
+		t.resume()
+		t.frames
+		self.assertEqual(2, stats.commands[0x0b06].count)
+
+	def test_pool(self):
+		sess = Session(self.sim.connect(), poolSize=16)
+		obj = sess.pool(Object, sess, OBJECT_BASE)
+		for i in range(1, 1001):
+			sess.pool(Object, sess, OBJECT_BASE + i)
+		self.assertTrue(obj is sess.pool(Object, sess, OBJECT_BASE))
+		self.assertTrue(len(sess.pool) < 100)
+		stats = sess.collectStats()
+		sess.pool(Object, sess, OBJECT_BASE + 1)
+		self.assertFalse(0x010E in stats.commands)
+		sess.threads()
+		self.assertEqual(1, stats.commands[0x010E].count)
+		chan = self.sim.channels[-1]
+		wait_for(lambda: len(chan.disposed) + len(sess.pool) > 1000)
+		self.assertEqual(1, max(count for oid, count in chan.disposed))
+		self.assertFalse((OBJECT_BASE, 1) in chan.disposed)
+
+	def test_slots(self):
+		sess = Session(self.sim.connect())
+		c, = sess.classes('Lsim/p0/C10;')
+		m = c.methodList[1]
+		self.assertFalse(hasattr(m, '__dict__'))
+		self.assertFalse(loaded(m, 'slots'))
+		self.assertEqual(4, len(m.slots))
+		self.assertTrue(loaded(m, 'slots'))
+		self.assertFalse(hasattr(m.slots[0], '__dict__'))
+
+	def test_line_table(self):
+		sess = Session(self.sim.connect())
+		c, = sess.classes('Lsim/p0/C10;')
+		m = c.methodList[1]
+		table = m.lineTable
+		self.assertEqual(8, len(table))
+		self.assertEqual(101, m.firstLoc.line)
+		self.assertEqual(108, m.lastLoc.line)
+		self.assertEqual(102, sess.pool(Location, sess, c.tid, m.mid, 6).line)
+		self.assertEqual([8], list(table.codeIndices(103)))
+		self.assertEqual(8, table[103].loc)
+		self.assertEqual(None, table.get(99))
+		self.assertEqual(None, table.line(-1))
+
+	def test_slot_table(self):
+		sess = Session(self.sim.connect())
+		c, = sess.classes('Lsim/p0/C10;')
+		m = c.methodList[1]
+		loc = sess.pool(Location, sess, c.tid, m.mid, 6)
+		self.assertEqual(
+			['this', 'count', 'label', 'flag'], list(s.name for s in loc.slots)
+		)
+		self.assertTrue(loc.slots is m.slotTable.visible(6))
+		self.assertEqual(2, loc.slot('label').index)
+		self.assertEqual(None, loc.slot('nothing'))
+		self.assertEqual((), m.slotTable.visible(m.lastLoc.loc + 2))
+		self.assertEqual((), m.slotTable.visible(-1))
+
+	def test_byte_values(self):
+		sess = Session(self.sim.connect())
+		buf = sess.conn.buffer()
+		pack_value(sess, buf, -2, 'B')
+		pack_value(sess, buf, 127, 'B')
+		data = buf.data()
+		self.assertEqual('B\xfeB\x7f', data)
+		buf.prepareUnpack(data)
+		self.assertEqual([-2, 127], [unpack_value(sess, buf) for i in (0, 1)])
+		buf.prepareUnpack(data)
+		self.assertEqual([-2, 127], unpack_values(sess, buf, 2))
+
+	def test_arrays(self):
+		sess = Session(self.sim.connect())
+		t = sess.threads()[0]
+		obj = t.frames[0].values['this']
+		data = obj.fields['data']
+		self.assertEqual('[B', data.jni)
+		self.assertEqual(1024, len(data))
+		self.assertEqual('\x02\x03\x04', data.getSlice(2, 5))
+		self.assertEqual('', data.getSlice(3, 3))
+		self.assertEqual(''.join(map(chr, range(256))) * 4, data.getSlice())
+
+	def test_events(self):
+		sess = Session(self.sim.connect())
+		c = sess.classes('Lsim/p0/C7;')[0]
+		q = Queue()
+		c.methodList[0].firstLoc.hook(queue=q)
+		for i in range(20):
+			t, loc = q.get(timeout=5)
+			self.assertEqual(c.tid, loc.tid)
+
+	def test_errors(self):
+		conn = self.sim.connect()
+		code, buf = conn.request(0x0b01, conn.buffer().pack('o', 1))
+		self.assertEqual(10, code)
+		code, buf = conn.request(0x7f7f)
+		self.assertEqual(99, code)
+
+	def test_listen(self):
+		port = self.sim.listen()
+		sess = Session(andbug.proto.connect(port))
+		self.assertEqual(4, len(sess.threads()))
+
+if __name__ == '__main__':
+	test_main()